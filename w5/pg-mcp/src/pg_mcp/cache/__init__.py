@@ -1,11 +1,15 @@
 """Caching layer for database schemas.
 
 This package provides caching functionality to improve performance by
-reducing repeated schema introspection queries.
+reducing repeated schema introspection queries, LLM calls and query
+executions.
 """
 
+from pg_mcp.cache.query_cache import LRUCache, QueryCache
 from pg_mcp.cache.schema_cache import SchemaCache
 
 __all__ = [
+    "LRUCache",
+    "QueryCache",
     "SchemaCache",
 ]
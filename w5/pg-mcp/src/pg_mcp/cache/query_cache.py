@@ -0,0 +1,307 @@
+"""Question and result caching layer.
+
+This module provides a size-bounded LRU cache with per-entry TTL and the
+QueryCache built on it, which remembers the SQL generated for a question and,
+optionally, the result of executing a SQL statement. Repeated questions can
+then be answered without LLM calls or database round trips.
+"""
+
+import hashlib
+import re
+import time
+import unicodedata
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Generic, TypeVar
+
+from pydantic import BaseModel, Field
+
+from pg_mcp.config.settings import QueryCacheConfig
+from pg_mcp.models.query import QueryResult, ValidationResult
+from pg_mcp.models.schema import DatabaseSchema
+from pg_mcp.observability.metrics import MetricsCollector
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+# ASCII and full-width question marks, exclamation marks, full stops and semicolons
+_TRAILING_PUNCTUATION = "?\uff1f!\uff01.\u3002;\uff1b"
+
+
+class LRUCache(Generic[K, V]):
+    """Size-bounded least-recently-used cache with optional per-entry TTL.
+
+    Example:
+        >>> cache: LRUCache[str, int] = LRUCache(max_size=2)
+        >>> cache.put("a", 1, ttl=60)
+        >>> cache.get("a")
+        1
+    """
+
+    def __init__(self, max_size: int, clock: Callable[[], float] = time.monotonic) -> None:
+        """Initialize LRU cache.
+
+        Args:
+            max_size: Maximum number of entries; the least recently used
+                entry is evicted when it is exceeded.
+            clock: Monotonic time source in seconds (injectable for tests).
+
+        Raises:
+            ValueError: If max_size is less than 1.
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be >= 1")
+
+        self.max_size = max_size
+        self._clock = clock
+        self._entries: OrderedDict[K, tuple[float | None, V]] = OrderedDict()
+
+    def get(self, key: K) -> V | None:
+        """Get a value and mark it as recently used.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            V | None: Cached value, or None if absent or expired.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at is not None and self._clock() >= expires_at:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: K, value: V, ttl: float | None = None) -> None:
+        """Store a value, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key.
+            value: Value to store.
+            ttl: Time to live in seconds, or None for no expiry.
+        """
+        expires_at = self._clock() + ttl if ttl is not None else None
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: K) -> V | None:
+        """Remove an entry.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            V | None: Removed value, or None if absent (expired values included).
+        """
+        entry = self._entries.pop(key, None)
+        return entry[1] if entry is not None else None
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        """Get the number of entries, including expired ones not yet evicted."""
+        return len(self._entries)
+
+
+class CachedSQL(BaseModel):
+    """SQL previously generated and validated for a question."""
+
+    sql: str = Field(..., description="Generated SQL")
+    validation: ValidationResult = Field(..., description="Validation result of the SQL")
+
+
+class CachedResult(BaseModel):
+    """Result of a previously executed SQL statement."""
+
+    result: QueryResult = Field(..., description="Query result")
+    confidence: int = Field(..., ge=0, le=100, description="Result confidence score")
+
+
+def normalize_question(question: str) -> str:
+    """Normalize a question for cache lookups.
+
+    Applies Unicode NFKC normalization (folding full-width characters),
+    lower-cases, collapses whitespace and strips trailing punctuation.
+
+    Args:
+        question: Natural language question.
+
+    Returns:
+        str: Normalized question.
+
+    Example:
+        >>> normalize_question("  How many   USERS? ")
+        'how many users'
+    """
+    normalized = unicodedata.normalize("NFKC", question).lower()
+    normalized = _WHITESPACE_PATTERN.sub(" ", normalized).strip()
+    return normalized.rstrip(_TRAILING_PUNCTUATION).rstrip()
+
+
+class QueryCache:
+    """Layered cache for question→SQL and SQL→result lookups.
+
+    Question→SQL entries are keyed by database, schema version and normalized
+    question, so they are naturally invalidated when the schema changes. The
+    schema version is a content hash computed once per schema object.
+    SQL→result entries are keyed by database and SQL text and expire after a
+    per-database TTL; the result cache is disabled unless a TTL is set.
+
+    Example:
+        >>> cache = QueryCache(QueryCacheConfig(result_ttl=60))
+        >>> cache.put_sql("mydb", schema, "How many users?", sql, validation)
+        >>> cache.get_sql("mydb", schema, "how many users")
+        CachedSQL(sql='SELECT COUNT(*) FROM users', ...)
+    """
+
+    def __init__(
+        self,
+        config: QueryCacheConfig,
+        metrics: MetricsCollector | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize query cache.
+
+        Args:
+            config: Query cache configuration.
+            metrics: Optional metrics collector for hit/miss counters.
+            clock: Monotonic time source in seconds (injectable for tests).
+        """
+        self.config = config
+        self.metrics = metrics
+        self._sql_cache: LRUCache[tuple[str, str, str], CachedSQL] = LRUCache(
+            config.sql_max_size, clock=clock
+        )
+        self._result_cache: LRUCache[tuple[str, str], CachedResult] = LRUCache(
+            config.result_max_size, clock=clock
+        )
+        self._schema_versions: dict[str, tuple[DatabaseSchema, str]] = {}
+
+    def get_sql(self, database: str, schema: DatabaseSchema, question: str) -> CachedSQL | None:
+        """Look up the SQL generated for a question.
+
+        Args:
+            database: Database name.
+            schema: Current schema of the database.
+            question: Natural language question.
+
+        Returns:
+            CachedSQL | None: Cached SQL, or None on a miss or when disabled.
+        """
+        if not self.config.enabled:
+            return None
+
+        cached = self._sql_cache.get(self._sql_key(database, schema, question))
+        self._record("sql", database, hit=cached is not None)
+        return cached
+
+    def put_sql(
+        self,
+        database: str,
+        schema: DatabaseSchema,
+        question: str,
+        sql: str,
+        validation: ValidationResult,
+    ) -> None:
+        """Remember the SQL generated for a question.
+
+        Args:
+            database: Database name.
+            schema: Schema the SQL was generated against.
+            question: Natural language question.
+            sql: Generated and validated SQL.
+            validation: Validation result of the SQL.
+        """
+        if not self.config.enabled:
+            return
+
+        self._sql_cache.put(
+            self._sql_key(database, schema, question),
+            CachedSQL(sql=sql, validation=validation),
+            ttl=self.config.sql_ttl,
+        )
+
+    def get_result(self, database: str, sql: str) -> CachedResult | None:
+        """Look up the result of a SQL statement.
+
+        Args:
+            database: Database name.
+            sql: SQL statement.
+
+        Returns:
+            CachedResult | None: Cached result, or None on a miss or when the
+                result cache is disabled for the database.
+        """
+        if not self.config.enabled or self._result_ttl(database) <= 0:
+            return None
+
+        cached = self._result_cache.get((database, sql))
+        self._record("result", database, hit=cached is not None)
+        return cached
+
+    def put_result(self, database: str, sql: str, result: QueryResult, confidence: int) -> None:
+        """Remember the result of a SQL statement.
+
+        Args:
+            database: Database name.
+            sql: SQL statement.
+            result: Query result.
+            confidence: Result confidence score.
+        """
+        ttl = self._result_ttl(database)
+        if not self.config.enabled or ttl <= 0:
+            return
+
+        self._result_cache.put(
+            (database, sql), CachedResult(result=result, confidence=confidence), ttl=ttl
+        )
+
+    def clear(self) -> None:
+        """Remove all cached questions and results."""
+        self._sql_cache.clear()
+        self._result_cache.clear()
+        self._schema_versions.clear()
+
+    def _sql_key(
+        self, database: str, schema: DatabaseSchema, question: str
+    ) -> tuple[str, str, str]:
+        """Build the question→SQL cache key."""
+        return (database, self._schema_version(database, schema), normalize_question(question))
+
+    def _schema_version(self, database: str, schema: DatabaseSchema) -> str:
+        """Get the content hash of a schema, computing it once per schema object.
+
+        Row estimates are left out so that statistics updates alone do not
+        invalidate cached SQL.
+        """
+        cached = self._schema_versions.get(database)
+        if cached is not None and cached[0] is schema:
+            return cached[1]
+
+        content = schema.model_dump_json(exclude={"tables": {"__all__": {"row_count_estimate"}}})
+        version = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        self._schema_versions[database] = (schema, version)
+        return version
+
+    def _result_ttl(self, database: str) -> float:
+        """Get the result cache TTL for a database."""
+        return self.config.result_ttl_by_database.get(database, self.config.result_ttl)
+
+    def _record(self, cache: str, database: str, hit: bool) -> None:
+        """Record a cache hit or miss."""
+        if self.metrics is None:
+            return
+        if hit:
+            self.metrics.increment_query_cache_hit(cache, database)
+        else:
+            self.metrics.increment_query_cache_miss(cache, database)
@@ -11,9 +11,11 @@ from datetime import UTC, datetime
 
 from asyncpg import Pool
 
+from pg_mcp.cache.snapshot import SchemaSnapshot, read_snapshot, snapshot_path, write_snapshot
 from pg_mcp.config.settings import CacheConfig
-from pg_mcp.db.introspection import SchemaIntrospector
-from pg_mcp.models.schema import DatabaseSchema
+from pg_mcp.db.introspection import CatalogChanges, RelationSignature, SchemaIntrospector
+from pg_mcp.db.pool import background_use
+from pg_mcp.models.schema import DatabaseSchema, TableInfo
 
 logger = logging.getLogger(__name__)
 
@@ -22,7 +24,10 @@ class SchemaCache:
     """Schema cache manager with TTL and auto-refresh capabilities.
 
     This class manages cached database schemas with configurable TTL and
-    supports automatic background refresh.
+    supports automatic background refresh. When a snapshot directory is
+    configured, every loaded schema is also persisted to disk so that a
+    restarted server can serve it immediately while revalidating it in the
+    background.
 
     Attributes:
         config: Cache configuration.
@@ -43,7 +48,9 @@ class SchemaCache:
         self.config = config
         self._cache: dict[str, DatabaseSchema] = {}
         self._cache_timestamps: dict[str, datetime] = {}
+        self._catalog_states: dict[str, tuple[str, dict[int, RelationSignature]]] = {}
         self._refresh_task: asyncio.Task[None] | None = None
+        self._revalidation_tasks: dict[str, asyncio.Task[None]] = {}
         self._stop_refresh = False
 
     def get(self, database_name: str) -> DatabaseSchema | None:
@@ -101,15 +108,129 @@ class SchemaCache:
             >>> schema = await cache.load("mydb", pool)
             >>> print(f"Loaded {len(schema.tables)} tables")
         """
-        introspector = SchemaIntrospector(pool, database_name)
+        introspector = self._create_introspector(database_name, pool)
+
+        # Capture the catalog state before introspecting so that DDL running
+        # concurrently is picked up by the next incremental refresh.
+        catalog_state = None
+        if self.config.enabled and self.config.incremental_refresh:
+            catalog_state = await introspector.get_catalog_state()
+
         schema = await introspector.introspect()
 
         if self.config.enabled:
             self._cache[database_name] = schema
             self._cache_timestamps[database_name] = datetime.now(UTC)
+            if catalog_state is not None:
+                self._catalog_states[database_name] = catalog_state
+            else:
+                self._catalog_states.pop(database_name, None)
+            await self._save_snapshot(database_name)
 
         return schema
 
+    async def load_snapshot(self, database_name: str) -> DatabaseSchema | None:
+        """Load a schema from its on-disk snapshot into the cache.
+
+        The snapshot is served as a fresh cache entry. Call
+        :meth:`start_revalidation` afterwards to reconcile it with the live
+        catalog.
+
+        Args:
+            database_name: Name of the database.
+
+        Returns:
+            DatabaseSchema | None: Snapshot schema, or None if snapshots are
+                disabled or no usable snapshot exists.
+
+        Example:
+            >>> schema = await cache.load_snapshot("mydb")
+            >>> if schema is None:
+            ...     schema = await cache.load("mydb", pool)
+            ... else:
+            ...     cache.start_revalidation("mydb", pool)
+        """
+        if not self.config.enabled or self.config.snapshot_dir is None:
+            return None
+
+        path = snapshot_path(self.config.snapshot_dir, database_name)
+        snapshot = await asyncio.to_thread(read_snapshot, path)
+        if snapshot is None:
+            return None
+
+        self._cache[database_name] = snapshot.database_schema
+        self._cache_timestamps[database_name] = datetime.now(UTC)
+        if snapshot.fingerprint is not None:
+            self._catalog_states[database_name] = (snapshot.fingerprint, snapshot.signatures)
+        else:
+            self._catalog_states.pop(database_name, None)
+
+        logger.info(
+            "Loaded schema snapshot for %s taken at %s",
+            database_name,
+            snapshot.created_at.isoformat(),
+        )
+        return snapshot.database_schema
+
+    def start_revalidation(self, database_name: str, pool: Pool) -> None:
+        """Revalidate a cached schema against the live catalog in the background.
+
+        The cached schema keeps being served until the refresh completes.
+        Failures are logged and leave the cached schema in place.
+
+        Args:
+            database_name: Name of the database.
+            pool: Connection pool for the database.
+
+        Example:
+            >>> cache.start_revalidation("mydb", pool)
+        """
+        task = self._revalidation_tasks.get(database_name)
+        if task is not None and not task.done():
+            return
+
+        self._revalidation_tasks[database_name] = asyncio.create_task(
+            self._revalidate(database_name, pool)
+        )
+
+    async def _revalidate(self, database_name: str, pool: Pool) -> None:
+        """Refresh a schema loaded from a snapshot, logging any failure.
+
+        Args:
+            database_name: Name of the database.
+            pool: Connection pool for the database.
+        """
+        try:
+            with background_use():
+                await self.refresh(database_name, pool)
+            logger.info("Schema snapshot for %s revalidated", database_name)
+        except Exception as e:
+            logger.exception("Error revalidating schema snapshot for %s: %s", database_name, e)
+
+    async def _save_snapshot(self, database_name: str) -> None:
+        """Persist the cached schema and catalog state of a database.
+
+        Write failures are logged and otherwise ignored; the snapshot is only
+        an optimization for the next startup.
+
+        Args:
+            database_name: Name of the database.
+        """
+        if self.config.snapshot_dir is None or database_name not in self._cache:
+            return
+
+        fingerprint, signatures = self._catalog_states.get(database_name, (None, {}))
+        snapshot = SchemaSnapshot(
+            fingerprint=fingerprint,
+            signatures=signatures,
+            database_schema=self._cache[database_name],
+        )
+        path = snapshot_path(self.config.snapshot_dir, database_name)
+        try:
+            await asyncio.to_thread(write_snapshot, path, snapshot)
+        except OSError as e:
+            logger.warning("Could not write schema snapshot %s: %s", path, e)
+
     async def refresh(
         self,
         database_name: str,
@@ -117,7 +238,10 @@ class SchemaCache:
     ) -> None:
         """Refresh schema cache for a specific database.
 
-        This method reloads the schema and updates the cache.
+        When incremental refresh is enabled and the database was loaded with
+        a catalog state, only relations whose catalog signature changed are
+        re-introspected and patched into the cached schema. Otherwise, or if
+        the incremental refresh fails, the schema is reloaded in full.
 
         Args:
             database_name: Name of the database to refresh.
@@ -126,8 +250,177 @@ class SchemaCache:
         Example:
             >>> await cache.refresh("mydb", pool)
         """
+        if (
+            self.config.incremental_refresh
+            and database_name in self._cache
+            and database_name in self._catalog_states
+        ):
+            try:
+                await self._refresh_incremental(database_name, pool)
+                return
+            except Exception as e:
+                logger.warning(
+                    "Incremental schema refresh failed for %s, reloading in full: %s",
+                    database_name,
+                    e,
+                )
+
         await self.load(database_name, pool)
 
+    async def _refresh_incremental(self, database_name: str, pool: Pool) -> None:
+        """Patch the cached schema with relations changed since the last refresh.
+
+        If the catalog is unchanged, only the row estimates are refreshed.
+
+        Args:
+            database_name: Name of the database to refresh.
+            pool: Connection pool for the database.
+        """
+        fingerprint, signatures = self._catalog_states[database_name]
+        introspector = self._create_introspector(database_name, pool)
+        changes = await introspector.introspect_changes(fingerprint, signatures)
+
+        if changes is not None:
+            schema = self._apply_changes(self._cache[database_name], signatures, changes)
+            self._cache[database_name] = schema
+            self._catalog_states[database_name] = (changes.fingerprint, changes.signatures)
+            await self._save_snapshot(database_name)
+            logger.info(
+                "Incrementally refreshed schema for %s: %d relations re-introspected, %d removed",
+                database_name,
+                len(changes.changed),
+                len(signatures.keys() - changes.signatures.keys()),
+            )
+        else:
+            # No DDL, but statistics may have moved since the last refresh
+            estimates = await introspector.get_row_estimates()
+            updated = self._apply_row_estimates(self._cache[database_name], signatures, estimates)
+            if updated is not None:
+                schema, new_signatures = updated
+                self._cache[database_name] = schema
+                self._catalog_states[database_name] = (fingerprint, new_signatures)
+                await self._save_snapshot(database_name)
+
+        self._cache_timestamps[database_name] = datetime.now(UTC)
+
+    @staticmethod
+    def _apply_row_estimates(
+        schema: DatabaseSchema,
+        signatures: dict[int, RelationSignature],
+        estimates: dict[int, int],
+    ) -> tuple[DatabaseSchema, dict[int, RelationSignature]] | None:
+        """Build a new schema and signatures with updated row estimates.
+
+        Args:
+            schema: Currently cached schema.
+            signatures: Relation signatures the cached schema was built from.
+            estimates: Current row estimates keyed by relation OID.
+
+        Returns:
+            tuple | None: (schema, signatures) with the new estimates, or None
+                if no estimate changed.
+        """
+        changed = {
+            oid: estimate
+            for oid, estimate in estimates.items()
+            if oid in signatures and signatures[oid].row_count_estimate != estimate
+        }
+        if not changed:
+            return None
+
+        by_name = {
+            (signatures[oid].schema_name, signatures[oid].table_name): estimate
+            for oid, estimate in changed.items()
+        }
+        tables = [
+            table.model_copy(
+                update={"row_count_estimate": by_name[(table.schema_name, table.table_name)]}
+            )
+            if (table.schema_name, table.table_name) in by_name
+            else table
+            for table in schema.tables
+        ]
+        new_signatures = {
+            oid: (
+                signature.model_copy(update={"row_count_estimate": changed[oid]})
+                if oid in changed
+                else signature
+            )
+            for oid, signature in signatures.items()
+        }
+        # A new object rather than model_copy, so memoized prompt sections
+        # are not carried over from the previous schema
+        new_schema = DatabaseSchema(
+            database_name=schema.database_name,
+            tables=tables,
+            enum_types=schema.enum_types,
+            version=schema.version,
+        )
+        return new_schema, new_signatures
+
+    @staticmethod
+    def _apply_changes(
+        schema: DatabaseSchema,
+        signatures: dict[int, RelationSignature],
+        changes: CatalogChanges,
+    ) -> DatabaseSchema:
+        """Build a new schema from a cached schema and detected catalog changes.
+
+        The cached schema is not modified, so readers holding it keep a
+        consistent view. Unchanged relations are reused as they are, apart from
+        an updated row estimate.
+
+        Args:
+            schema: Currently cached schema.
+            signatures: Relation signatures the cached schema was built from.
+            changes: Changes returned by the introspector.
+
+        Returns:
+            DatabaseSchema: Patched schema in full introspection order.
+
+        Raises:
+            KeyError: If an unchanged relation is missing from the cached schema.
+        """
+        cached = {(table.schema_name, table.table_name): table for table in schema.tables}
+
+        tables: list[TableInfo] = []
+        for oid, signature in changes.signatures.items():
+            table = changes.changed.get(oid)
+            if table is None:
+                previous = signatures[oid]
+                table = cached[(previous.schema_name, previous.table_name)]
+                if table.row_count_estimate != signature.row_count_estimate:
+                    table = table.model_copy(
+                        update={"row_count_estimate": signature.row_count_estimate}
+                    )
+            tables.append(table)
+
+        # A new object rather than model_copy, so memoized prompt sections
+        # are not carried over from the previous schema
+        return DatabaseSchema(
+            database_name=schema.database_name,
+            tables=tables,
+            enum_types=changes.enum_types,
+            version=schema.version,
+        )
+
+    def _create_introspector(self, database_name: str, pool: Pool) -> SchemaIntrospector:
+        """Create a schema introspector configured from the cache settings.
+
+        Args:
+            database_name: Name of the database to introspect.
+            pool: Connection pool for the database.
+
+        Returns:
+            SchemaIntrospector: Configured introspector.
+        """
+        return SchemaIntrospector(
+            pool,
+            database_name,
+            bulk=self.config.bulk_introspection,
+            concurrency=self.config.introspection_concurrency,
+        )
+
     async def start_auto_refresh(
         self,
         interval_minutes: int,
@@ -136,7 +429,9 @@ class SchemaCache:
         """Start automatic background schema refresh.
 
         This method starts a background task that periodically refreshes
-        all cached schemas.
+        all cached schemas. Schemas of databases whose managed pool is
+        closed (see :class:`~pg_mcp.db.pool.PoolManager`) are skipped until
+        the pool is reopened.
 
         Args:
             interval_minutes: Refresh interval in minutes.
@@ -159,7 +454,8 @@ class SchemaCache:
     async def stop_auto_refresh(self) -> None:
         """Stop automatic refresh task.
 
-        This method immediately cancels the background refresh task if running.
+        This method immediately cancels the background refresh task and any
+        pending snapshot revalidation.
 
         Example:
             >>> await cache.stop_auto_refresh()
@@ -174,6 +470,13 @@ class SchemaCache:
                 await self._refresh_task
             logger.debug("Auto-refresh task cancelled")
 
+        for task in self._revalidation_tasks.values():
+            task.cancel()
+        for task in self._revalidation_tasks.values():
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._revalidation_tasks.clear()
+
     async def _auto_refresh_loop(
         self,
         interval_minutes: int,
@@ -195,11 +498,13 @@ class SchemaCache:
                 if self._stop_refresh:
                     break
 
-                # Refresh all cached schemas
+                # Refresh the cached schemas of open pools; pools closed while
+                # idle are not reopened, and refreshes do not keep them open
                 for database_name, pool in pools.items():
-                    if database_name in self._cache:
-                        with contextlib.suppress(Exception):
-                            await self.refresh(database_name, pool)
+                    if database_name not in self._cache or not getattr(pool, "is_open", True):
+                        continue
+                    with contextlib.suppress(Exception), background_use():
+                        await self.refresh(database_name, pool)
 
             except asyncio.CancelledError:
                 break
@@ -241,9 +546,11 @@ class SchemaCache:
         if database_name is None:
             self._cache.clear()
             self._cache_timestamps.clear()
+            self._catalog_states.clear()
         else:
             self._cache.pop(database_name, None)
             self._cache_timestamps.pop(database_name, None)
+            self._catalog_states.pop(database_name, None)
 
     def get_cached_databases(self) -> list[str]:
         """Get list of currently cached database names.
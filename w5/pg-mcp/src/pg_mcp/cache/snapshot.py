@@ -0,0 +1,118 @@
+"""On-disk schema snapshots.
+
+This module persists introspected database schemas together with the catalog
+state they were built from, so that a restarted server can serve a schema
+immediately and revalidate it in the background instead of blocking startup
+on a full introspection.
+"""
+
+import gzip
+import logging
+import os
+import re
+from datetime import UTC, datetime
+from pathlib import Path
+
+from pydantic import BaseModel, Field, ValidationError
+
+from pg_mcp.db.introspection import RelationSignature
+from pg_mcp.models.schema import DatabaseSchema
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever DatabaseSchema or RelationSignature change incompatibly.
+# Snapshots with a different version are ignored and rebuilt.
+SNAPSHOT_FORMAT_VERSION = 1
+
+
+class SchemaSnapshot(BaseModel):
+    """Persisted schema with the catalog state it was introspected from."""
+
+    format_version: int = Field(
+        default=SNAPSHOT_FORMAT_VERSION, description="Snapshot format version"
+    )
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(UTC), description="When the snapshot was taken"
+    )
+    fingerprint: str | None = Field(None, description="Catalog fingerprint, if captured")
+    signatures: dict[int, RelationSignature] = Field(
+        default_factory=dict, description="Relation signatures keyed by OID"
+    )
+    database_schema: DatabaseSchema = Field(..., description="Introspected database schema")
+
+
+def snapshot_path(directory: Path, database_name: str) -> Path:
+    """Get the snapshot file path for a database.
+
+    Args:
+        directory: Snapshot directory.
+        database_name: Name of the database.
+
+    Returns:
+        Path: Path of the snapshot file.
+    """
+    safe_name = re.sub(r"[^A-Za-z0-9_.-]", "_", database_name)
+    return directory / f"{safe_name}.schema.json.gz"
+
+
+def write_snapshot(path: Path, snapshot: SchemaSnapshot) -> None:
+    """Write a snapshot atomically as gzip-compressed JSON.
+
+    The snapshot is written to a temporary file in the same directory and
+    renamed into place, so readers never see a partially written file.
+
+    Args:
+        path: Destination file path.
+        snapshot: Snapshot to write.
+
+    Raises:
+        OSError: If the file cannot be written.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with gzip.open(tmp_path, "wb", compresslevel=6) as f:
+            f.write(snapshot.model_dump_json().encode("utf-8"))
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def read_snapshot(path: Path) -> SchemaSnapshot | None:
+    """Read a snapshot written by :func:`write_snapshot`.
+
+    Missing, unreadable, corrupt and outdated snapshots are treated as
+    absent so that callers fall back to a full introspection.
+
+    Args:
+        path: Snapshot file path.
+
+    Returns:
+        SchemaSnapshot | None: Snapshot if it exists and matches the current
+            format version, None otherwise.
+    """
+    try:
+        with gzip.open(path, "rb") as f:
+            data = f.read()
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        logger.warning("Could not read schema snapshot %s: %s", path, e)
+        return None
+
+    try:
+        snapshot = SchemaSnapshot.model_validate_json(data)
+    except ValidationError as e:
+        logger.warning("Ignoring invalid schema snapshot %s: %s", path, e)
+        return None
+
+    if snapshot.format_version != SNAPSHOT_FORMAT_VERSION:
+        logger.info(
+            "Ignoring schema snapshot %s with format version %d (expected %d)",
+            path,
+            snapshot.format_version,
+            SNAPSHOT_FORMAT_VERSION,
+        )
+        return None
+
+    return snapshot
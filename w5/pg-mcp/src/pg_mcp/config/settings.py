@@ -5,10 +5,11 @@ and type safety. Configuration is loaded from environment variables with
 sensible defaults.
 """
 
-from typing import Literal
+from pathlib import Path
+from typing import Annotated, Literal
 
-from pydantic import Field, SecretStr, field_validator
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic import Field, SecretStr, field_validator, model_validator
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
 
 
 class DatabaseConfig(BaseSettings):
@@ -31,6 +32,38 @@ class DatabaseConfig(BaseSettings):
     command_timeout: float = Field(
         default=30.0, ge=1.0, le=300.0, description="Command execution timeout in seconds"
     )
+    statement_cache_size: int = Field(
+        default=0,
+        ge=0,
+        le=10000,
+        description="Extra prepared statements asyncpg caches per pooled connection for "
+        "queries repeated with identical text; also sizes the repeated statement tracker "
+        "(0 disables the tracker)",
+    )
+    # NoDecode: the environment value is a comma-separated list, not JSON
+    additional_names: Annotated[list[str], NoDecode] = Field(
+        default_factory=list,
+        description="Further databases on the same server, served with the same credentials "
+        "and pool settings",
+    )
+
+    @field_validator("additional_names", mode="before")
+    @classmethod
+    def parse_additional_names(cls, v: str | list[str]) -> list[str]:
+        """Parse comma-separated string or list."""
+        if isinstance(v, str):
+            return [n.strip() for n in v.split(",") if n.strip()]
+        return v
+
+    def all_databases(self) -> list["DatabaseConfig"]:
+        """Get the configuration of every served database.
+
+        Returns:
+            list[DatabaseConfig]: This database followed by one copy per
+                additional name, without duplicates.
+        """
+        names = dict.fromkeys([self.name, *self.additional_names])
+        return [self.model_copy(update={"name": name, "additional_names": []}) for name in names]
 
     @property
     def dsn(self) -> str:
@@ -100,7 +133,26 @@ class SecurityConfig(BaseSettings):
     allow_explain: bool = Field(
         default=False, description="Allow EXPLAIN statements for query plan analysis"
     )
+    validation_cache_size: int = Field(
+        default=512,
+        ge=0,
+        le=100000,
+        description="Parsed SQL statements and validation verdicts to cache (0 disables)",
+    )
+    validation_executor: Literal["none", "thread", "process"] = Field(
+        default="none",
+        description="Pool that SQL validation runs on instead of the event loop "
+        "('none' validates inline)",
+    )
+    validation_workers: int = Field(
+        default=2, ge=1, le=64, description="Number of validation executor workers"
+    )
     max_rows: int = Field(default=10000, ge=1, le=100000, description="Maximum rows to return")
+    count_total_rows: bool = Field(
+        default=False,
+        description="Count all rows of truncated results on the server (runs the query to "
+        "completion); otherwise only whether more than max_rows exist is reported",
+    )
     max_execution_time: float = Field(
         default=30.0, ge=1.0, le=300.0, description="Maximum query execution time in seconds"
     )
@@ -159,6 +211,24 @@ class ValidationConfig(BaseSettings):
     confidence_threshold: int = Field(
         default=70, ge=0, le=100, description="Minimum confidence for acceptable results"
     )
+    background: bool = Field(
+        default=False,
+        description="Return results immediately and validate them in the background; the "
+        "confidence is then retrieved with the get_result_validation tool",
+    )
+    background_max_results: int = Field(
+        default=1000, ge=1, le=100000, description="Background validations kept for retrieval"
+    )
+    background_result_ttl: float = Field(
+        default=600.0,
+        ge=1.0,
+        description="Seconds a background validation stays retrievable",
+    )
+    skip_scalar_aggregates: bool = Field(
+        default=False,
+        description="Skip validation of single-row results of aggregate queries without "
+        "GROUP BY (e.g. counts), reporting full confidence",
+    )
 
 
 class CacheConfig(BaseSettings):
@@ -171,6 +241,82 @@ class CacheConfig(BaseSettings):
     )
     max_size: int = Field(default=100, ge=1, le=1000, description="Maximum cache entries")
     enabled: bool = Field(default=True, description="Enable schema caching")
+    bulk_introspection: bool = Field(
+        default=True,
+        description="Introspect all relations with a fixed number of catalog queries "
+        "instead of per-table queries",
+    )
+    introspection_concurrency: int = Field(
+        default=1,
+        ge=1,
+        le=100,
+        description="Maximum pool connections used concurrently for bulk introspection; "
+        "keep below DATABASE_MAX_POOL_SIZE to leave room for live queries",
+    )
+    incremental_refresh: bool = Field(
+        default=True,
+        description="On refresh, re-introspect only relations whose catalog signature "
+        "changed instead of the whole schema",
+    )
+    snapshot_dir: Path | None = Field(
+        default=None,
+        description="Directory for on-disk schema snapshots; when set, startup serves "
+        "the snapshot and revalidates it in the background",
+    )
+
+
+class QueryCacheConfig(BaseSettings):
+    """Question→SQL and SQL→result cache configuration."""
+
+    model_config = SettingsConfigDict(env_prefix="QUERY_CACHE_")
+
+    enabled: bool = Field(default=True, description="Enable question and result caching")
+    sql_max_size: int = Field(
+        default=1000, ge=1, le=100000, description="Maximum cached question→SQL entries"
+    )
+    sql_ttl: float = Field(
+        default=3600.0, ge=1.0, le=604800.0, description="Question→SQL cache TTL in seconds"
+    )
+    result_max_size: int = Field(
+        default=100, ge=1, le=10000, description="Maximum cached SQL→result entries"
+    )
+    result_ttl: float = Field(
+        default=0.0,
+        ge=0.0,
+        le=86400.0,
+        description="SQL→result cache TTL in seconds; 0 disables result caching",
+    )
+    result_ttl_by_database: dict[str, float] = Field(
+        default_factory=dict,
+        description="Per-database overrides of result_ttl, e.g. '{\"analytics\": 300}'",
+    )
+
+
+class SchemaContextConfig(BaseSettings):
+    """Schema context pruning configuration for SQL generation prompts."""
+
+    model_config = SettingsConfigDict(env_prefix="SCHEMA_CONTEXT_")
+
+    pruning_enabled: bool = Field(
+        default=True,
+        description="Send only the tables most relevant to the question when the full "
+        "schema exceeds the token budget",
+    )
+    max_tokens: int = Field(
+        default=8000,
+        ge=500,
+        le=200000,
+        description="Approximate token budget for table descriptions in the prompt",
+    )
+    max_tables: int = Field(
+        default=30, ge=1, le=1000, description="Maximum number of tables after pruning"
+    )
+    fk_expansion_depth: int = Field(
+        default=1,
+        ge=0,
+        le=3,
+        description="Foreign key hops used to pull in tables related to matched tables",
+    )
 
 
 class ResilienceConfig(BaseSettings):
@@ -185,6 +331,154 @@ class ResilienceConfig(BaseSettings):
     circuit_breaker_timeout: float = Field(
         default=60.0, ge=10.0, le=300.0, description="Circuit breaker timeout in seconds"
     )
+    circuit_breaker_half_open_max_calls: int = Field(
+        default=1,
+        ge=1,
+        le=100,
+        description="Probe requests a half-open circuit breaker admits; it closes once all "
+        "of them succeeded",
+    )
+    speculative_candidates: int = Field(
+        default=1,
+        ge=1,
+        le=8,
+        description="SQL candidates generated concurrently per attempt; the first that "
+        "passes validation wins (1 disables speculation)",
+    )
+    speculative_temperature_step: float = Field(
+        default=0.3,
+        ge=0.0,
+        le=1.0,
+        description="Temperature increase of each further speculative candidate",
+    )
+    explain_dry_run: bool = Field(
+        default=False,
+        description="Require generated SQL to be planned by EXPLAIN before it is accepted",
+    )
+    max_plan_cost: float = Field(
+        default=0.0,
+        ge=0.0,
+        description="Reject generated SQL whose EXPLAIN total cost exceeds this (0 disables)",
+    )
+    max_plan_rows: float = Field(
+        default=0.0,
+        ge=0.0,
+        description="Reject generated SQL whose EXPLAIN row estimate exceeds this (0 disables)",
+    )
+
+
+class RateLimitConfig(BaseSettings):
+    """Concurrency and throughput limits for database queries and LLM calls."""
+
+    model_config = SettingsConfigDict(env_prefix="RATE_LIMIT_")
+
+    max_concurrent_queries: int = Field(
+        default=10,
+        ge=1,
+        le=1000,
+        description="Maximum concurrent database queries (initial limit when adaptive)",
+    )
+    max_concurrent_llm: int = Field(
+        default=5, ge=1, le=1000, description="Maximum concurrent LLM API calls"
+    )
+    llm_requests_per_minute: float = Field(
+        default=0.0, ge=0.0, description="LLM requests allowed per minute (0 disables)"
+    )
+    llm_tokens_per_minute: float = Field(
+        default=0.0, ge=0.0, description="LLM tokens allowed per minute (0 disables)"
+    )
+    llm_tokens_per_request: int = Field(
+        default=2000,
+        ge=1,
+        le=1_000_000,
+        description="Tokens reserved per LLM call until actual usage has been observed",
+    )
+    adaptive_queries: bool = Field(
+        default=False,
+        description="Adapt the query concurrency limit to observed latency (AIMD)",
+    )
+    adaptive_min_queries: int = Field(
+        default=2, ge=1, le=1000, description="Lowest adaptive query concurrency limit"
+    )
+    adaptive_max_queries: int = Field(
+        default=50, ge=1, le=1000, description="Highest adaptive query concurrency limit"
+    )
+    adaptive_target_latency: float = Field(
+        default=1.0,
+        gt=0.0,
+        le=300.0,
+        description="Query latency in seconds above which the adaptive limit backs off",
+    )
+    adaptive_backoff_ratio: float = Field(
+        default=0.9,
+        ge=0.5,
+        lt=1.0,
+        description="Factor applied to the adaptive limit when a query is too slow",
+    )
+
+    fair_queueing: bool = Field(
+        default=False,
+        description="Admit waiting queries and LLM calls by priority class and weighted fair "
+        "share of their client and database instead of in arrival order",
+    )
+    # NoDecode: the environment values are comma-separated lists, not JSON
+    priority_order: Annotated[list[str], NoDecode] = Field(
+        default_factory=lambda: ["sql", "result"],
+        description="Priority classes (request return types), highest priority first",
+    )
+    client_weights: Annotated[dict[str, float], NoDecode] = Field(
+        default_factory=dict,
+        description="Fair share weight per client or session, as name=weight pairs (default 1)",
+    )
+    database_weights: Annotated[dict[str, float], NoDecode] = Field(
+        default_factory=dict,
+        description="Fair share weight per database, as name=weight pairs (default 1)",
+    )
+
+    @field_validator("priority_order", mode="before")
+    @classmethod
+    def parse_priority_order(cls, v: str | list[str]) -> list[str]:
+        """Parse comma-separated string or list."""
+        if isinstance(v, str):
+            return [p.strip() for p in v.split(",") if p.strip()]
+        return v
+
+    @field_validator("client_weights", "database_weights", mode="before")
+    @classmethod
+    def parse_weights(cls, v: str | dict[str, float]) -> dict[str, float]:
+        """Parse comma-separated name=weight pairs or a mapping."""
+        if isinstance(v, str):
+            pairs = (item.split("=", 1) for item in v.split(",") if item.strip())
+            v = {name.strip(): float(weight) for name, weight in pairs}
+        if any(weight <= 0 for weight in v.values()):
+            raise ValueError("weights must be > 0")
+        return v
+
+    @model_validator(mode="after")
+    def check_adaptive_bounds(self) -> "RateLimitConfig":
+        """Ensure the adaptive limit bounds are ordered."""
+        if self.adaptive_min_queries > self.adaptive_max_queries:
+            raise ValueError("adaptive_min_queries must not exceed adaptive_max_queries")
+        return self
+
+
+class PoolManagerConfig(BaseSettings):
+    """Connection pool management across databases."""
+
+    model_config = SettingsConfigDict(env_prefix="POOL_")
+
+    prewarm: bool = Field(
+        default=True,
+        description="Create all pools concurrently at startup; otherwise on first use",
+    )
+    max_total_connections: int = Field(
+        default=200, ge=1, le=10000, description="Maximum connections across all pools"
+    )
+    idle_ttl: float = Field(
+        default=0.0,
+        ge=0.0,
+        description="Seconds without use after which a pool is closed (0 keeps pools open)",
+    )
 
 
 class ObservabilityConfig(BaseSettings):
@@ -218,11 +512,15 @@ class Settings(BaseSettings):
 
     # Nested configurations
     database: DatabaseConfig = Field(default_factory=DatabaseConfig)
+    pool: PoolManagerConfig = Field(default_factory=PoolManagerConfig)
     openai: OpenAIConfig = Field(default_factory=OpenAIConfig)
     security: SecurityConfig = Field(default_factory=SecurityConfig)
     validation: ValidationConfig = Field(default_factory=ValidationConfig)
     cache: CacheConfig = Field(default_factory=CacheConfig)
+    query_cache: QueryCacheConfig = Field(default_factory=QueryCacheConfig)
+    schema_context: SchemaContextConfig = Field(default_factory=SchemaContextConfig)
     resilience: ResilienceConfig = Field(default_factory=ResilienceConfig)
+    rate_limit: RateLimitConfig = Field(default_factory=RateLimitConfig)
     observability: ObservabilityConfig = Field(default_factory=ObservabilityConfig)
 
     @property
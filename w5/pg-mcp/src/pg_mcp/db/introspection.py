@@ -5,9 +5,12 @@ extracting comprehensive metadata about tables, columns, constraints, indexes,
 and custom types.
 """
 
+import asyncio
+import math
 
 from asyncpg import Pool
 from asyncpg.connection import Connection
+from pydantic import BaseModel, Field
 
 from pg_mcp.models.schema import (
     ColumnInfo,
@@ -18,6 +21,102 @@ from pg_mcp.models.schema import (
     TableInfo,
 )
 
+# Cheap whole-catalog fingerprint. Every DDL statement inserts or updates rows
+# in at least one of these catalogs, which changes a row count or raises the
+# highest xmin. Statistics are left out: VACUUM and ANALYZE update reltuples
+# in place, and including them would change the fingerprint after every
+# autovacuum run. Row estimates are refreshed with ROW_ESTIMATES_QUERY instead.
+CATALOG_FINGERPRINT_QUERY = """
+    SELECT md5(concat_ws('|',
+        (SELECT count(*) || ':' || coalesce(max(xmin::text::bigint), 0)
+                || ':' || coalesce(sum(relnatts), 0) FROM pg_class),
+        (SELECT count(*) || ':' || coalesce(max(xmin::text::bigint), 0) FROM pg_attribute),
+        (SELECT count(*) || ':' || coalesce(max(xmin::text::bigint), 0) FROM pg_attrdef),
+        (SELECT count(*) || ':' || coalesce(max(xmin::text::bigint), 0) FROM pg_constraint),
+        (SELECT count(*) || ':' || coalesce(max(xmin::text::bigint), 0) FROM pg_index),
+        (SELECT count(*) || ':' || coalesce(max(xmin::text::bigint), 0) FROM pg_description),
+        (SELECT count(*) || ':' || coalesce(max(xmin::text::bigint), 0) FROM pg_type),
+        (SELECT count(*) || ':' || coalesce(max(xmin::text::bigint), 0) FROM pg_enum)
+    ))
+"""
+
+# Per-relation signature over the xmin of every catalog row that contributes
+# to a TableInfo. Foreign keys also include the referenced relation's pg_class
+# row so that renaming a referenced table invalidates the referencing one.
+RELATION_SIGNATURES_QUERY = """
+    SELECT
+        c.oid AS oid,
+        n.nspname AS schema_name,
+        c.relname AS table_name,
+        c.reltuples::bigint AS row_count_estimate,
+        md5(concat_ws('|',
+            c.xmin::text,
+            (SELECT string_agg(a.xmin::text, ',' ORDER BY a.attnum)
+             FROM pg_attribute a
+             WHERE a.attrelid = c.oid AND a.attnum > 0),
+            (SELECT string_agg(ad.xmin::text, ',' ORDER BY ad.adnum)
+             FROM pg_attrdef ad
+             WHERE ad.adrelid = c.oid),
+            (SELECT string_agg(con.xmin::text || ':' || coalesce(ref.xmin::text, ''),
+                               ',' ORDER BY con.oid)
+             FROM pg_constraint con
+             LEFT JOIN pg_class ref ON ref.oid = con.confrelid
+             WHERE con.conrelid = c.oid),
+            (SELECT string_agg(i.xmin::text || ':' || ic.xmin::text, ',' ORDER BY i.indexrelid)
+             FROM pg_index i
+             JOIN pg_class ic ON ic.oid = i.indexrelid
+             WHERE i.indrelid = c.oid),
+            (SELECT string_agg(d.xmin::text, ',' ORDER BY d.objsubid)
+             FROM pg_description d
+             WHERE d.objoid = c.oid AND d.classoid = 'pg_class'::regclass)
+        )) AS signature
+    FROM pg_class c
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    WHERE c.relkind IN ('r', 'v')
+      AND n.nspname NOT IN ('pg_catalog', 'information_schema', 'pg_toast')
+    ORDER BY c.relkind = 'v', n.nspname, c.relname
+"""
+
+# Row estimates of all user tables and views, without any catalog signatures
+ROW_ESTIMATES_QUERY = """
+    SELECT c.oid AS oid, c.reltuples::bigint AS row_count_estimate
+    FROM pg_class c
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    WHERE c.relkind IN ('r', 'v')
+      AND n.nspname NOT IN ('pg_catalog', 'information_schema', 'pg_toast')
+"""
+
+
+class RelationSignature(BaseModel):
+    """Catalog signature of a single table or view.
+
+    The signature changes whenever the relation's columns, defaults,
+    constraints, indexes or comments change. Row estimates are tracked
+    separately so that statistics updates do not force re-introspection.
+    """
+
+    schema_name: str = Field(..., description="Schema name")
+    table_name: str = Field(..., description="Table or view name")
+    signature: str = Field(..., description="Hash over the relation's catalog rows")
+    row_count_estimate: int = Field(default=0, description="Estimated number of rows")
+
+
+class CatalogChanges(BaseModel):
+    """Changes detected between two catalog fingerprints.
+
+    Attributes:
+        fingerprint: New whole-catalog fingerprint.
+        signatures: New signatures of all relations keyed by OID, in the
+            same order as relations appear in a full introspection.
+        changed: Re-introspected relations keyed by OID (new or altered).
+        enum_types: Current enum types.
+    """
+
+    fingerprint: str
+    signatures: dict[int, RelationSignature]
+    changed: dict[int, TableInfo]
+    enum_types: list[EnumTypeInfo]
+
 
 class SchemaIntrospector:
     """PostgreSQL schema introspection service.
@@ -30,15 +129,32 @@ class SchemaIntrospector:
         database_name: Name of the database being introspected.
     """
 
-    def __init__(self, pool: Pool, database_name: str):
+    def __init__(
+        self,
+        pool: Pool,
+        database_name: str,
+        bulk: bool = True,
+        concurrency: int = 1,
+    ):
         """Initialize schema introspector.
 
         Args:
             pool: asyncpg connection pool.
             database_name: Name of the database to introspect.
+            bulk: Fetch catalog metadata for all relations in a fixed number of
+                queries instead of issuing per-table queries.
+            concurrency: Maximum number of pool connections used at once for
+                bulk introspection. Values above 1 split relations by schema
+                (and large schemas into table chunks) and introspect the
+                chunks concurrently.
         """
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+
         self.pool = pool
         self.database_name = database_name
+        self.bulk = bulk
+        self.concurrency = concurrency
 
     async def introspect(self) -> DatabaseSchema:
         """Execute complete schema introspection.
@@ -54,10 +170,21 @@ class SchemaIntrospector:
             >>> schema = await introspector.introspect()
             >>> print(f"Found {len(schema.tables)} tables")
         """
+        if self.bulk and self.concurrency > 1:
+            return await self._introspect_parallel()
+
         async with self.pool.acquire() as conn:
-            # Get PostgreSQL version
-            version_result = await conn.fetchval("SELECT version()")
-            version = version_result.split(",")[0] if version_result else None
+            version = await self._get_version(conn)
+
+            if self.bulk:
+                tables = await self._introspect_bulk(conn)
+                enum_types = await self._get_enum_types(conn)
+                return DatabaseSchema(
+                    database_name=self.database_name,
+                    tables=tables,
+                    enum_types=enum_types,
+                    version=version,
+                )
 
             # Fetch all schema components concurrently
             tables = await self._get_tables(conn)
@@ -91,6 +218,374 @@ class SchemaIntrospector:
                 version=version,
             )
 
+    async def get_catalog_state(self) -> tuple[str, dict[int, RelationSignature]]:
+        """Fingerprint the catalog and sign every relation.
+
+        Call this before :meth:`introspect` so that any DDL running
+        concurrently with the introspection is detected by the next
+        :meth:`introspect_changes`.
+
+        Returns:
+            tuple[str, dict[int, RelationSignature]]: Whole-catalog fingerprint
+                and relation signatures keyed by OID.
+
+        Example:
+            >>> fingerprint, signatures = await introspector.get_catalog_state()
+            >>> schema = await introspector.introspect()
+        """
+        async with self.pool.acquire() as conn:
+            fingerprint = await conn.fetchval(CATALOG_FINGERPRINT_QUERY)
+            signatures = await self._get_relation_signatures(conn)
+        return fingerprint, signatures
+
+    async def introspect_changes(
+        self,
+        fingerprint: str,
+        signatures: dict[int, RelationSignature],
+    ) -> CatalogChanges | None:
+        """Re-introspect only the relations changed since a previous catalog state.
+
+        The whole-catalog fingerprint is checked first, which costs a single
+        one-row query. Only when it differs are relation signatures compared
+        and the new or altered relations introspected with the bulk queries.
+
+        Args:
+            fingerprint: Fingerprint from a previous :meth:`get_catalog_state`
+                or :meth:`introspect_changes` call.
+            signatures: Relation signatures from the same call.
+
+        Returns:
+            CatalogChanges | None: Detected changes, or None if the catalog
+                fingerprint is unchanged.
+
+        Example:
+            >>> changes = await introspector.introspect_changes(fingerprint, signatures)
+            >>> if changes is not None:
+            ...     print(f"{len(changes.changed)} relations changed")
+        """
+        async with self.pool.acquire() as conn:
+            new_fingerprint = await conn.fetchval(CATALOG_FINGERPRINT_QUERY)
+            if new_fingerprint == fingerprint:
+                return None
+
+            new_signatures = await self._get_relation_signatures(conn)
+            changed_oids = [
+                oid
+                for oid, sig in new_signatures.items()
+                if oid not in signatures or signatures[oid].signature != sig.signature
+            ]
+
+            changed: dict[int, TableInfo] = {}
+            if changed_oids:
+                changed = await self._get_relations(conn, changed_oids)
+                await self._populate_relations(conn, changed)
+
+            enum_types = await self._get_enum_types(conn)
+
+        return CatalogChanges(
+            fingerprint=new_fingerprint,
+            signatures=new_signatures,
+            changed=changed,
+            enum_types=enum_types,
+        )
+
+    async def get_row_estimates(self) -> dict[int, int]:
+        """Get the current row estimates of all relations.
+
+        Statistics updates do not change the catalog fingerprint, so callers
+        refresh row estimates with this single query when nothing else changed.
+
+        Returns:
+            dict[int, int]: Row estimates keyed by relation OID.
+
+        Example:
+            >>> estimates = await introspector.get_row_estimates()
+        """
+        async with self.pool.acquire() as conn:
+            rows = await conn.fetch(ROW_ESTIMATES_QUERY)
+
+        return {
+            row["oid"]: (
+                int(row["row_count_estimate"]) if row["row_count_estimate"] is not None else 0
+            )
+            for row in rows
+        }
+
+    async def _get_relation_signatures(self, conn: Connection) -> dict[int, RelationSignature]:
+        """Get catalog signatures of all user tables and views.
+
+        Args:
+            conn: Database connection.
+
+        Returns:
+            dict[int, RelationSignature]: Signatures keyed by relation OID,
+                ordered with tables first and then views.
+        """
+        rows = await conn.fetch(RELATION_SIGNATURES_QUERY)
+
+        return {
+            row["oid"]: RelationSignature(
+                schema_name=row["schema_name"],
+                table_name=row["table_name"],
+                signature=row["signature"],
+                row_count_estimate=(
+                    int(row["row_count_estimate"]) if row["row_count_estimate"] is not None else 0
+                ),
+            )
+            for row in rows
+        }
+
+    async def _introspect_bulk(self, conn: Connection) -> list[TableInfo]:
+        """Introspect all tables and views with a fixed number of catalog queries.
+
+        Relations are listed once, then columns, foreign keys and indexes are
+        fetched for every relation at once and assembled in memory. The number
+        of round trips does not depend on the number of tables.
+
+        Args:
+            conn: Database connection.
+
+        Returns:
+            list[TableInfo]: Tables followed by views, each sorted by schema and name.
+        """
+        relations = await self._get_relations(conn)
+        await self._populate_relations(conn, relations)
+        return list(relations.values())
+
+    async def _introspect_parallel(self) -> DatabaseSchema:
+        """Introspect relations in chunks spread over several pool connections.
+
+        Relations, enum types and the server version are listed on a single
+        connection, which is released before the chunks are populated. At most
+        ``concurrency`` connections are held at the same time.
+
+        Returns:
+            DatabaseSchema: Complete database schema information.
+        """
+        async with self.pool.acquire() as conn:
+            version = await self._get_version(conn)
+            relations = await self._get_relations(conn)
+            enum_types = await self._get_enum_types(conn)
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def populate(chunk: dict[int, TableInfo]) -> None:
+            async with semaphore, self.pool.acquire() as chunk_conn:
+                await self._populate_relations(chunk_conn, chunk)
+
+        await asyncio.gather(*(populate(chunk) for chunk in self._partition(relations)))
+
+        return DatabaseSchema(
+            database_name=self.database_name,
+            tables=list(relations.values()),
+            enum_types=enum_types,
+            version=version,
+        )
+
+    def _partition(self, relations: dict[int, TableInfo]) -> list[dict[int, TableInfo]]:
+        """Split relations into chunks for concurrent introspection.
+
+        Relations are grouped by schema. Schemas larger than an even share of
+        all relations are split further so that a single-schema database still
+        spreads across ``concurrency`` connections.
+
+        Args:
+            relations: Relations keyed by OID.
+
+        Returns:
+            list[dict[int, TableInfo]]: Non-empty chunks covering every relation.
+        """
+        by_schema: dict[str, dict[int, TableInfo]] = {}
+        for oid, table in relations.items():
+            by_schema.setdefault(table.schema_name, {})[oid] = table
+
+        chunk_size = max(1, math.ceil(len(relations) / self.concurrency))
+        chunks: list[dict[int, TableInfo]] = []
+        for schema_relations in by_schema.values():
+            items = list(schema_relations.items())
+            for i in range(0, len(items), chunk_size):
+                chunks.append(dict(items[i : i + chunk_size]))
+
+        return chunks
+
+    async def _get_version(self, conn: Connection) -> str | None:
+        """Get the PostgreSQL server version.
+
+        Args:
+            conn: Database connection.
+
+        Returns:
+            str | None: Version string without build details.
+        """
+        version_result = await conn.fetchval("SELECT version()")
+        return version_result.split(",")[0] if version_result else None
+
+    async def _get_relations(
+        self, conn: Connection, oids: list[int] | None = None
+    ) -> dict[int, TableInfo]:
+        """Get user tables and views keyed by relation OID.
+
+        Args:
+            conn: Database connection.
+            oids: Restrict the result to these relation OIDs. All relations
+                are returned when None.
+
+        Returns:
+            dict[int, TableInfo]: Relations without columns, constraints or indexes,
+                ordered with tables first and then views.
+        """
+        query = """
+            SELECT
+                c.oid AS oid,
+                n.nspname AS schema_name,
+                c.relname AS table_name,
+                obj_description(c.oid, 'pg_class') AS comment,
+                c.reltuples::bigint AS row_count_estimate
+            FROM pg_class c
+            JOIN pg_namespace n ON n.oid = c.relnamespace
+            WHERE c.relkind IN ('r', 'v')
+              AND n.nspname NOT IN ('pg_catalog', 'information_schema', 'pg_toast')
+              AND ($1::oid[] IS NULL OR c.oid = ANY($1::oid[]))
+            ORDER BY c.relkind = 'v', n.nspname, c.relname
+        """
+
+        rows = await conn.fetch(query, oids)
+
+        return {
+            row["oid"]: TableInfo(
+                schema_name=row["schema_name"],
+                table_name=row["table_name"],
+                comment=row["comment"],
+                row_count_estimate=(
+                    int(row["row_count_estimate"]) if row["row_count_estimate"] is not None else 0
+                ),
+            )
+            for row in rows
+        }
+
+    async def _populate_relations(self, conn: Connection, relations: dict[int, TableInfo]) -> None:
+        """Fill in columns, foreign keys and indexes for a set of relations.
+
+        Each catalog is queried once for all given relation OIDs.
+
+        Args:
+            conn: Database connection.
+            relations: Relations keyed by OID; updated in place.
+        """
+        if not relations:
+            return
+
+        oids = list(relations.keys())
+
+        column_rows = await conn.fetch(
+            """
+            SELECT
+                a.attrelid AS oid,
+                a.attname AS column_name,
+                pg_catalog.format_type(a.atttypid, a.atttypmod) AS data_type,
+                NOT a.attnotnull AS is_nullable,
+                pg_get_expr(ad.adbin, ad.adrelid) AS default_value,
+                col_description(a.attrelid, a.attnum) AS comment,
+                EXISTS(
+                    SELECT 1
+                    FROM pg_index i
+                    WHERE i.indrelid = a.attrelid
+                      AND i.indisprimary
+                      AND a.attnum = ANY(i.indkey)
+                ) AS is_primary_key,
+                EXISTS(
+                    SELECT 1
+                    FROM pg_constraint con
+                    WHERE con.conrelid = a.attrelid
+                      AND con.contype = 'u'  -- unique constraint
+                      AND a.attnum = ANY(con.conkey)
+                ) AS is_unique
+            FROM pg_attribute a
+            LEFT JOIN pg_attrdef ad ON a.attrelid = ad.adrelid AND a.attnum = ad.adnum
+            WHERE a.attrelid = ANY($1::oid[])
+              AND a.attnum > 0
+              AND NOT a.attisdropped
+            ORDER BY a.attrelid, a.attnum
+            """,
+            oids,
+        )
+        for row in column_rows:
+            relations[row["oid"]].columns.append(
+                ColumnInfo(
+                    name=row["column_name"],
+                    data_type=row["data_type"],
+                    is_nullable=row["is_nullable"],
+                    default_value=row["default_value"],
+                    is_primary_key=row["is_primary_key"],
+                    is_unique=row["is_unique"],
+                    comment=row["comment"],
+                )
+            )
+
+        fk_rows = await conn.fetch(
+            """
+            SELECT
+                con.conrelid AS oid,
+                con.conname AS constraint_name,
+                a.attname AS column_name,
+                ref_c.relname AS referenced_table,
+                ref_a.attname AS referenced_column
+            FROM pg_constraint con
+            JOIN pg_attribute a
+                ON a.attrelid = con.conrelid AND a.attnum = ANY(con.conkey)
+            JOIN pg_class ref_c ON con.confrelid = ref_c.oid
+            JOIN pg_attribute ref_a
+                ON ref_a.attrelid = ref_c.oid
+                AND ref_a.attnum = ANY(con.confkey)
+            WHERE con.conrelid = ANY($1::oid[])
+              AND con.contype = 'f'  -- foreign key
+            ORDER BY con.conrelid, con.conname, a.attnum, ref_a.attnum
+            """,
+            oids,
+        )
+        for row in fk_rows:
+            relations[row["oid"]].foreign_keys.append(
+                ForeignKeyInfo(
+                    constraint_name=row["constraint_name"],
+                    column_name=row["column_name"],
+                    referenced_table=row["referenced_table"],
+                    referenced_column=row["referenced_column"],
+                )
+            )
+
+        index_rows = await conn.fetch(
+            """
+            SELECT
+                idx.indrelid AS oid,
+                i.relname AS index_name,
+                idx.indisunique AS is_unique,
+                am.amname AS index_type,
+                ARRAY(
+                    SELECT a.attname
+                    FROM pg_attribute a
+                    WHERE a.attrelid = idx.indrelid
+                      AND a.attnum = ANY(idx.indkey)
+                    ORDER BY array_position(idx.indkey, a.attnum)
+                ) AS columns
+            FROM pg_index idx
+            JOIN pg_class i ON i.oid = idx.indexrelid
+            JOIN pg_am am ON i.relam = am.oid
+            WHERE idx.indrelid = ANY($1::oid[])
+              AND NOT idx.indisprimary  -- exclude primary key indexes
+            ORDER BY idx.indrelid, i.relname
+            """,
+            oids,
+        )
+        for row in index_rows:
+            relations[row["oid"]].indexes.append(
+                IndexInfo(
+                    name=row["index_name"],
+                    columns=list(row["columns"]),
+                    is_unique=row["is_unique"],
+                    index_type=row["index_type"],
+                )
+            )
+
     async def _get_tables(self, conn: Connection) -> list[TableInfo]:
         """Get all user tables (excluding system tables).
 
@@ -1,21 +1,74 @@
 """Database connection pool management.
 
 This module provides utilities for creating and managing asyncpg connection
-pools for PostgreSQL databases.
+pools for PostgreSQL databases, and the PoolManager that serves many
+databases with lazily created pools under a shared connection limit.
 """
 
+import asyncio
+import contextvars
+import logging
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from contextlib import AbstractAsyncContextManager, asynccontextmanager, contextmanager, suppress
+from typing import cast
+
 import asyncpg
-from asyncpg import Pool
+from asyncpg import Connection, Pool
+
+from pg_mcp.config.settings import DatabaseConfig, PoolManagerConfig
+from pg_mcp.models.errors import DatabaseError
+from pg_mcp.observability.metrics import MetricsCollector
+
+logger = logging.getLogger(__name__)
+
+# asyncpg's default statement cache size, kept as headroom for the other
+# statements (introspection, session setup) sharing the per-connection cache
+_DEFAULT_STATEMENT_CACHE_SIZE = 100
+
+# Whether connections acquired in the current context count as use of their pool
+_background_var: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "pool_background", default=False
+)
 
-from pg_mcp.config.settings import DatabaseConfig
+
+@contextmanager
+def background_use() -> Iterator[None]:
+    """Context manager for work that must not keep idle pools open.
+
+    Connections that :class:`PoolManager` hands out inside the context do not
+    count as use of their pool, so background work such as schema refreshes
+    does not hold off idle eviction.
+
+    Example:
+        >>> with background_use():
+        ...     await cache.refresh("mydb", manager.pools["mydb"])
+    """
+    token = _background_var.set(True)
+    try:
+        yield
+    finally:
+        _background_var.reset(token)
 
 
-async def create_pool(config: DatabaseConfig) -> Pool:
+async def create_pool(
+    config: DatabaseConfig,
+    server_settings: dict[str, str] | None = None,
+) -> Pool:
     """Create a connection pool for a single database.
 
     Args:
         config: Database configuration containing connection parameters
             and pool settings.
+        server_settings: Optional PostgreSQL settings applied once when each
+            pooled connection is opened (e.g. from
+            ``pg_mcp.services.sql_executor.build_session_settings``). They
+            become session defaults, so they survive the ``RESET ALL`` that
+            asyncpg issues when a connection is released.
+
+    The per-connection statement cache of asyncpg is enlarged by
+    ``config.statement_cache_size`` so that statements reused by the
+    executor are not evicted by other queries.
 
     Returns:
         Pool: An asyncpg connection pool instance.
@@ -39,6 +92,8 @@ async def create_pool(config: DatabaseConfig) -> Pool:
         max_size=config.max_pool_size,
         timeout=config.pool_timeout,
         command_timeout=config.command_timeout,
+        server_settings=server_settings,
+        statement_cache_size=_DEFAULT_STATEMENT_CACHE_SIZE + config.statement_cache_size,
     )
 
     if pool is None:
@@ -79,42 +134,380 @@ async def create_pools(configs: list[DatabaseConfig]) -> dict[str, Pool]:
     return pools
 
 
-async def close_pools(pools: dict[str, Pool], timeout: float = 10.0) -> None:
+async def close_pools(pools: dict[str, Pool], timeout: float = 10.0) -> None:  # noqa: ASYNC109
     """Close all connection pools gracefully.
 
-    This function closes all pools and waits for all connections to be
-    released properly. If graceful shutdown takes too long, it will
-    forcefully terminate the pools.
+    All pools are closed concurrently and waited for until a single deadline,
+    so shutdown takes as long as the slowest pool rather than the sum of all
+    pools. Pools that have not closed by the deadline, or fail to close, are
+    forcefully terminated.
 
     Args:
         pools: Dictionary mapping database names to their pools.
-        timeout: Maximum time in seconds to wait for graceful shutdown
-            before forcing termination. Default: 10.0 seconds.
+        timeout: Maximum time in seconds to wait for all pools to close
+            gracefully before forcing termination. Default: 10.0 seconds.
 
     Example:
         >>> pools = await create_pools(configs)
         >>> # ... use pools ...
         >>> await close_pools(pools, timeout=5.0)
     """
-    import asyncio
-    import logging
+    if not pools:
+        return
 
-    logger = logging.getLogger(__name__)
+    tasks = {asyncio.create_task(pool.close()): db_name for db_name, pool in pools.items()}
+    done, pending = await asyncio.wait(tasks, timeout=timeout)
 
-    for db_name, pool in pools.items():
-        try:
-            # Try graceful close with timeout
-            await asyncio.wait_for(pool.close(), timeout=timeout)
+    for task in done:
+        db_name = tasks[task]
+        error = task.exception()
+        if error is None:
             logger.info(f"Connection pool for '{db_name}' closed gracefully")
-        except asyncio.TimeoutError:
-            # Force termination if graceful close times out
+        else:
+            # Log error and force termination; the other pools are unaffected
+            logger.error(f"Error closing pool for '{db_name}': {error!s}")
+            pools[db_name].terminate()
+
+    for task in pending:
+        task.cancel()
+    # Let cancelled closes unwind before terminating their connections
+    await asyncio.gather(*pending, return_exceptions=True)
+    for task in pending:
+        db_name = tasks[task]
+        logger.warning(f"Graceful close timed out for '{db_name}', forcing termination")
+        pools[db_name].terminate()
+        logger.info(f"Connection pool for '{db_name}' terminated")
+
+
+class _PoolEntry:
+    """Pool state of one database managed by PoolManager."""
+
+    def __init__(self, config: DatabaseConfig) -> None:
+        self.config = config
+        self.pool: Pool | None = None
+        # Connections reserved against the total limit (max size of the pool)
+        self.reserved = 0
+        self.in_use = 0
+        self.last_used = 0.0
+        self.lock = asyncio.Lock()
+
+
+class ManagedPool:
+    """Pool of one database that is opened by its PoolManager on first use.
+
+    Exposes the parts of the asyncpg Pool interface used by executors,
+    introspection and health checks, so it can be passed wherever a pool is
+    expected.
+
+    Example:
+        >>> pool = manager.pools["mydb"]
+        >>> async with pool.acquire() as conn:
+        ...     await conn.fetch("SELECT 1")
+    """
+
+    def __init__(self, manager: "PoolManager", name: str) -> None:
+        """Initialize managed pool.
+
+        Args:
+            manager: Owning pool manager.
+            name: Database name.
+        """
+        self._manager = manager
+        self.name = name
+
+    def acquire(self) -> AbstractAsyncContextManager[Connection]:
+        """Acquire a connection, opening the pool first if necessary."""
+        return self._manager.acquire(self.name)
+
+    @property
+    def is_open(self) -> bool:
+        """Whether the underlying asyncpg pool currently exists."""
+        return self._manager.is_open(self.name)
+
+    def get_size(self) -> int:
+        """Get the current number of connections (0 while closed)."""
+        pool = self._manager._entries[self.name].pool
+        return pool.get_size() if pool is not None else 0
+
+    def get_idle_size(self) -> int:
+        """Get the current number of idle connections (0 while closed)."""
+        pool = self._manager._entries[self.name].pool
+        return pool.get_idle_size() if pool is not None else 0
+
+
+class PoolManager:
+    """Connection pools for many databases with a shared connection limit.
+
+    Pools are created on first use, or concurrently by :meth:`prewarm`. Every
+    pool reserves its maximum size against ``max_total_connections``; when a
+    new pool does not fit, least recently used idle pools are closed, and if
+    that is not enough the new pool is created smaller. Pools unused for
+    ``idle_ttl`` seconds are closed by a background task and reopened on
+    demand. Connections in use are exported per database to
+    ``MetricsCollector.db_connections_active``.
+
+    Example:
+        >>> manager = PoolManager(settings.database.all_databases(), settings.pool)
+        >>> await manager.prewarm()
+        >>> async with manager.acquire("mydb") as conn:
+        ...     await conn.fetch("SELECT 1")
+        >>> await manager.close()
+    """
+
+    def __init__(
+        self,
+        configs: list[DatabaseConfig],
+        config: PoolManagerConfig,
+        server_settings: dict[str, str] | None = None,
+        metrics: MetricsCollector | None = None,
+        pool_factory: Callable[..., Awaitable[Pool]] = create_pool,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize pool manager.
+
+        Args:
+            configs: Configuration of every served database.
+            config: Pool management configuration.
+            server_settings: Optional PostgreSQL settings for every connection
+                (see :func:`create_pool`).
+            metrics: Optional metrics collector for connection counts.
+            pool_factory: Pool constructor (injectable for tests).
+            clock: Monotonic time source in seconds (injectable for tests).
+        """
+        self.config = config
+        self.server_settings = server_settings
+        self.metrics = metrics
+        self._pool_factory = pool_factory
+        self._clock = clock
+        self._entries = {c.name: _PoolEntry(c) for c in configs}
+        self._eviction_task: asyncio.Task[None] | None = None
+        self.pools: dict[str, ManagedPool] = {
+            name: ManagedPool(self, name) for name in self._entries
+        }
+
+    def is_open(self, name: str) -> bool:
+        """Check whether the pool of a database currently exists.
+
+        Args:
+            name: Database name.
+
+        Returns:
+            bool: True if the pool is open.
+        """
+        entry = self._entries.get(name)
+        return entry is not None and entry.pool is not None
+
+    @property
+    def total_reserved(self) -> int:
+        """Connections reserved by open pools against the total limit."""
+        return sum(entry.reserved for entry in self._entries.values())
+
+    async def prewarm(self) -> None:
+        """Create the pools of all databases concurrently.
+
+        Raises:
+            asyncpg.PostgresError: If a database cannot be connected to.
+            DatabaseError: If the total connection limit is exhausted.
+        """
+        await asyncio.gather(*(self.get_pool(name) for name in self._entries))
+
+    async def get_pool(self, name: str) -> Pool:
+        """Get the pool of a database, creating it if necessary.
+
+        Args:
+            name: Database name.
+
+        Returns:
+            Pool: Open asyncpg pool.
+
+        Raises:
+            DatabaseError: If the database is unknown or the total connection
+                limit leaves no room for another pool.
+            asyncpg.PostgresError: If the database cannot be connected to.
+        """
+        entry = self._entries.get(name)
+        if entry is None:
+            raise DatabaseError(
+                message=f"Database '{name}' is not configured",
+                details={"database": name, "available_databases": list(self._entries)},
+            )
+        if entry.pool is not None:
+            return entry.pool
+
+        evicted: dict[str, Pool] = {}
+        try:
+            async with entry.lock:
+                if entry.pool is not None:
+                    return entry.pool
+
+                config, evicted = self._reserve(entry)
+                for evicted_name in evicted:
+                    logger.info(f"Closing idle pool for '{evicted_name}' to make room for '{name}'")
+
+                try:
+                    entry.pool = await self._pool_factory(
+                        config, server_settings=self.server_settings
+                    )
+                except BaseException:
+                    entry.reserved = 0
+                    raise
+                entry.last_used = self._clock()
+                logger.info(
+                    f"Created connection pool for database '{name}'",
+                    extra={"min_size": config.min_pool_size, "max_size": config.max_pool_size},
+                )
+                return entry.pool
+        finally:
+            # Detached pools no longer count against the limit; closing them
+            # outside the lock keeps other callers from waiting on the close
+            if evicted:
+                await close_pools(evicted)
+
+    @asynccontextmanager
+    async def acquire(self, name: str) -> AsyncIterator[Connection]:
+        """Acquire a connection to a database.
+
+        Args:
+            name: Database name.
+
+        Yields:
+            Connection: Pooled connection, released on exit.
+
+        Raises:
+            DatabaseError: If the pool cannot be created (see :meth:`get_pool`).
+        """
+        pool = await self.get_pool(name)
+        entry = self._entries[name]
+        entry.in_use += 1
+        self._export(name, entry)
+        try:
+            async with pool.acquire() as connection:
+                yield connection
+        finally:
+            entry.in_use -= 1
+            if not _background_var.get():
+                entry.last_used = self._clock()
+            self._export(name, entry)
+
+    async def evict_idle(self) -> list[str]:
+        """Close pools that have not been used for ``idle_ttl`` seconds.
+
+        Returns:
+            list[str]: Names of the databases whose pools were closed.
+        """
+        if self.config.idle_ttl <= 0:
+            return []
+
+        now = self._clock()
+        evicted = {
+            name: self._detach(entry)
+            for name, entry in self._entries.items()
+            if entry.pool is not None
+            and entry.in_use == 0
+            and now - entry.last_used >= self.config.idle_ttl
+        }
+        if evicted:
+            logger.info(f"Closing idle connection pools: {', '.join(evicted)}")
+            await close_pools(evicted)
+        return list(evicted)
+
+    def start_idle_eviction(self) -> None:
+        """Start the background task closing idle pools, if a TTL is configured."""
+        if self.config.idle_ttl <= 0 or self._eviction_task is not None:
+            return
+        self._eviction_task = asyncio.create_task(self._eviction_loop())
+
+    async def close(self, timeout: float = 10.0) -> None:  # noqa: ASYNC109
+        """Stop idle eviction and close all open pools.
+
+        Args:
+            timeout: Maximum time in seconds to wait for graceful shutdown
+                (see :func:`close_pools`).
+        """
+        if self._eviction_task is not None:
+            self._eviction_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._eviction_task
+            self._eviction_task = None
+
+        open_pools = {
+            name: self._detach(entry)
+            for name, entry in self._entries.items()
+            if entry.pool is not None
+        }
+        await close_pools(open_pools, timeout=timeout)
+
+    async def _eviction_loop(self) -> None:
+        """Periodically close idle pools."""
+        interval = min(self.config.idle_ttl / 2, 60.0)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.evict_idle()
+            except Exception as e:
+                logger.error(f"Error closing idle connection pools: {e!s}")
+
+    def _reserve(self, entry: _PoolEntry) -> tuple[DatabaseConfig, dict[str, Pool]]:
+        """Reserve connections for a new pool, detaching idle pools if needed.
+
+        Returns:
+            tuple: (config, evicted), the configuration to create the pool
+                with and the detached pools that must be closed.
+
+        Raises:
+            DatabaseError: If no connection is left for the new pool.
+        """
+        limit = self.config.max_total_connections
+        wanted = entry.config.max_pool_size
+        evicted: dict[str, Pool] = {}
+
+        idle = sorted(
+            (
+                (name, other)
+                for name, other in self._entries.items()
+                if other.pool is not None and other.in_use == 0
+            ),
+            key=lambda item: item[1].last_used,
+        )
+        for name, other in idle:
+            if self.total_reserved + wanted <= limit:
+                break
+            evicted[name] = self._detach(other)
+
+        available = limit - self.total_reserved
+        if available < 1:
+            raise DatabaseError(
+                message=(
+                    f"Connection limit of {limit} across all databases reached; "
+                    f"cannot open a pool for '{entry.config.name}'"
+                ),
+                details={"database": entry.config.name, "max_total_connections": limit},
+            )
+
+        config = entry.config
+        if wanted > available:
             logger.warning(
-                f"Graceful close timed out for '{db_name}', forcing termination"
+                f"Shrinking pool for '{config.name}' to {available} connections "
+                f"to stay within the limit of {limit}"
+            )
+            config = config.model_copy(
+                update={
+                    "max_pool_size": available,
+                    "min_pool_size": min(config.min_pool_size, available),
+                }
             )
-            pool.terminate()
-            logger.info(f"Connection pool for '{db_name}' terminated")
-        except Exception as e:
-            # Log error but continue closing other pools
-            logger.error(f"Error closing pool for '{db_name}': {e!s}")
-            # Force terminate on error
-            pool.terminate()
+        entry.reserved = config.max_pool_size
+        return config, evicted
+
+    def _detach(self, entry: _PoolEntry) -> Pool:
+        """Mark the open pool of an entry as closed and return it for closing."""
+        pool = cast("Pool", entry.pool)
+        entry.pool = None
+        entry.reserved = 0
+        self._export(entry.config.name, entry)
+        return pool
+
+    def _export(self, name: str, entry: _PoolEntry) -> None:
+        """Export the number of connections in use of a database."""
+        if self.metrics is not None:
+            self.metrics.set_db_connections_active(name, entry.in_use)
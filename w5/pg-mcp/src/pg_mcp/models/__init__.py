@@ -20,7 +20,9 @@ from pg_mcp.models.query import (
     QueryRequest,
     QueryResponse,
     QueryResult,
+    ResultFormat,
     ReturnType,
+    TokenUsage,
     ValidationResult,
 )
 from pg_mcp.models.schema import (
@@ -41,11 +43,13 @@ __all__ = [
     "EnumTypeInfo",
     "DatabaseSchema",
     # Query models
+    "ResultFormat",
     "ReturnType",
     "QueryRequest",
     "ValidationResult",
     "QueryResult",
     "QueryResponse",
+    "TokenUsage",
     # Error models
     "ErrorCode",
     "ErrorDetail",
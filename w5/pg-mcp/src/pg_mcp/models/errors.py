@@ -218,6 +218,19 @@ class ExecutionTimeoutError(PgMcpError):
         super().__init__(message=message, code=ErrorCode.EXECUTION_TIMEOUT, details=details)
 
 
+class QueryCostExceededError(PgMcpError):
+    """Exception raised when the planner's estimate for a query exceeds the limits."""
+
+    def __init__(self, message: str, details: dict[str, Any] | None = None) -> None:
+        """Initialize query cost error.
+
+        Args:
+            message: Error message describing the exceeded limit.
+            details: Optional estimate details (e.g., cost, rows, limits).
+        """
+        super().__init__(message=message, code=ErrorCode.RESOURCE_EXHAUSTED, details=details)
+
+
 class RateLimitExceededError(PgMcpError):
     """Exception raised when rate limit is exceeded."""
 
@@ -4,6 +4,8 @@ This module defines data models for query requests from clients and
 responses containing query results or errors.
 """
 
+import base64
+import json
 from enum import StrEnum
 from typing import Any
 
@@ -17,6 +19,14 @@ class ReturnType(StrEnum):
     RESULT = "result"  # Execute and return query results
 
 
+class ResultFormat(StrEnum):
+    """Wire format of query result data."""
+
+    ROWS = "rows"  # One dict per row
+    COLUMNAR = "columnar"  # Column names once plus one value array per column
+    ARROW_IPC_BASE64 = "arrow_ipc_base64"  # Base64 Arrow IPC stream (requires pyarrow)
+
+
 class QueryRequest(BaseModel):
     """Query request from client containing natural language question."""
 
@@ -32,6 +42,9 @@ class QueryRequest(BaseModel):
     return_type: ReturnType = Field(
         default=ReturnType.RESULT, description="Whether to return SQL or execute and return results"
     )
+    client_id: str | None = Field(
+        None, description="Client or session identifier, used for fair scheduling"
+    )
 
     @field_validator("question")
     @classmethod
@@ -127,13 +140,108 @@ class QueryResult(BaseModel):
             return len(info.data["rows"])
         return v
 
-    def to_dict(self) -> dict[str, Any]:
+    def to_dict(self, result_format: ResultFormat = ResultFormat.ROWS) -> dict[str, Any]:
         """Convert result to dictionary.
 
+        Args:
+            result_format: Wire format of the row data. ``rows`` keeps one
+                dict per row; ``columnar`` replaces ``rows`` with ``data``, a
+                list of value arrays in column order; ``arrow_ipc_base64``
+                replaces ``rows`` with ``arrow_ipc_base64``, a base64 encoded
+                Arrow IPC stream.
+
         Returns:
             dict: Dictionary representation of query result.
+
+        Raises:
+            ImportError: If the Arrow format is requested without pyarrow.
+
+        Example:
+            >>> result.to_dict(ResultFormat.COLUMNAR)
+            {'columns': ['id', 'name'], 'data': [[1, 2], ['Alice', 'Bob']], ...}
         """
-        return self.model_dump()
+        if result_format == ResultFormat.ROWS:
+            return self.model_dump()
+
+        result: dict[str, Any] = {
+            "columns": list(self.columns),
+            "row_count": self.row_count,
+            "execution_time_ms": self.execution_time_ms,
+            "format": result_format.value,
+        }
+        if result_format == ResultFormat.COLUMNAR:
+            result["data"] = self.to_columns()
+        else:
+            result["arrow_ipc_base64"] = base64.b64encode(self.to_arrow_ipc()).decode("ascii")
+        return result
+
+    def to_columns(self) -> list[list[Any]]:
+        """Get the row data as one value list per column.
+
+        Returns:
+            list: Value lists in the order of ``columns``.
+        """
+        return [[row.get(column) for row in self.rows] for column in self.columns]
+
+    def to_arrow_ipc(self) -> bytes:
+        """Encode the row data as an Arrow IPC stream.
+
+        Column types are inferred by Arrow from the serialized values, so
+        temporal and UUID columns arrive as strings and numerics as doubles.
+        Columns whose values have no common Arrow type (e.g. JSON columns
+        holding both numbers and objects) arrive as strings, with values that
+        are not strings JSON-encoded.
+
+        Returns:
+            bytes: Arrow IPC stream containing a single record batch.
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+        """
+        import pyarrow as pa  # optional dependency, see pg-mcp[arrow]
+
+        arrays = []
+        for values in self.to_columns():
+            try:
+                arrays.append(pa.array(values))
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                arrays.append(
+                    pa.array(
+                        [v if v is None or isinstance(v, str) else json.dumps(v) for v in values],
+                        type=pa.string(),
+                    )
+                )
+        table = pa.Table.from_arrays(arrays, names=list(self.columns))
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return bytes(sink.getvalue())
+
+
+class TokenUsage(BaseModel):
+    """LLM token usage reported by the API, accumulated over calls."""
+
+    prompt_tokens: int = Field(default=0, ge=0, description="Tokens sent in prompts")
+    completion_tokens: int = Field(default=0, ge=0, description="Tokens generated in completions")
+
+    @property
+    def total_tokens(self) -> int:
+        """Get the sum of prompt and completion tokens.
+
+        Returns:
+            int: Total tokens.
+        """
+        return self.prompt_tokens + self.completion_tokens
+
+    def add(self, prompt_tokens: int, completion_tokens: int) -> None:
+        """Add the usage of one call.
+
+        Args:
+            prompt_tokens: Prompt tokens of the call.
+            completion_tokens: Completion tokens of the call.
+        """
+        self.prompt_tokens += prompt_tokens
+        self.completion_tokens += completion_tokens
 
 
 class ErrorDetail(BaseModel):
@@ -155,16 +263,36 @@ class QueryResponse(BaseModel):
     confidence: int = Field(
         default=100, ge=0, le=100, description="Confidence score of generated SQL (0-100)"
     )
-    tokens_used: int | None = Field(None, ge=0, description="LLM tokens used for generation")
+    tokens_used: int | None = Field(
+        None,
+        ge=0,
+        description="LLM tokens used for SQL generation (all attempts) and synchronous result "
+        "validation, as reported by the API",
+    )
+    request_id: str | None = Field(None, description="Request ID for tracing and follow-up calls")
+    confidence_pending: bool = Field(
+        default=False,
+        description="Whether results are still being validated in the background; confidence "
+        "is provisional until retrieved by request_id",
+    )
 
-    def to_dict(self) -> dict[str, Any]:
+    def to_dict(self, result_format: ResultFormat = ResultFormat.ROWS) -> dict[str, Any]:
         """Convert response to dictionary for MCP tool return.
 
+        Args:
+            result_format: Wire format of the result data, see
+                :meth:`QueryResult.to_dict`.
+
         Returns:
             dict: Dictionary representation compatible with MCP protocol.
+
+        Raises:
+            ImportError: If the Arrow format is requested without pyarrow.
         """
         # Use model_dump but ensure tokens_used is always present
         result = self.model_dump(exclude_none=False)
+        if self.data is not None and result_format != ResultFormat.ROWS:
+            result["data"] = self.data.to_dict(result_format)
 
         # Ensure tokens_used is always present (use 0 if None)
         if result.get("tokens_used") is None:
@@ -6,7 +6,7 @@ including tables, columns, foreign keys, indexes, and enum types.
 
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class ColumnInfo(BaseModel):
@@ -162,14 +162,52 @@ class EnumTypeInfo(BaseModel):
         return f"  - {self.type_name}: {values}"
 
 
+class _PromptSectionMemo:
+    """Rendered table prompt sections keyed by id(table).
+
+    The table is stored alongside its section so that its id cannot be reused
+    by another object while cached. Memos always compare equal, so they do not
+    affect the equality of the schemas holding them.
+    """
+
+    __slots__ = ("sections",)
+
+    def __init__(self) -> None:
+        self.sections: dict[int, tuple[TableInfo, str]] = {}
+
+    def get(self, table: TableInfo) -> str:
+        """Get the rendered section of a table, rendering it on first use."""
+        cached = self.sections.get(id(table))
+        if cached is not None and cached[0] is table:
+            return cached[1]
+
+        section = table.to_prompt_section()
+        self.sections[id(table)] = (table, section)
+        return section
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _PromptSectionMemo)
+
+    __hash__ = None  # type: ignore[assignment]
+
+
 class DatabaseSchema(BaseModel):
-    """Complete database schema information."""
+    """Complete database schema information.
+
+    Rendered table prompt sections are memoized on the schema object, so a
+    schema loaded once renders each table once no matter how many prompts
+    are built from it. Copies made with ``model_copy`` (for example a schema
+    pruned to fewer tables) share the memo; a reloaded schema starts empty.
+    Tables must not be mutated after their section has been rendered.
+    """
 
     database_name: str = Field(..., description="Database name")
     tables: list[TableInfo] = Field(default_factory=list, description="Database tables")
     enum_types: list[EnumTypeInfo] = Field(default_factory=list, description="Custom enum types")
     version: str | None = Field(None, description="PostgreSQL version")
 
+    _prompt_sections: _PromptSectionMemo = PrivateAttr(default_factory=_PromptSectionMemo)
+
     def get_table(self, table_name: str, schema_name: str = "public") -> TableInfo | None:
         """Find table by name.
 
@@ -206,11 +244,22 @@ class DatabaseSchema(BaseModel):
 
         if self.tables:
             lines.append("\n=== Tables ===")
-            for table in self.tables:
-                lines.append(table.to_prompt_section())
+            memo = self._prompt_sections
+            lines.extend(memo.get(table) for table in self.tables)
 
         return "\n".join(lines)
 
+    def get_table_prompt_section(self, table: TableInfo) -> str:
+        """Get the prompt section of a table, rendering it at most once.
+
+        Args:
+            table: Table belonging to this schema.
+
+        Returns:
+            str: Same text as ``table.to_prompt_section()``.
+        """
+        return self._prompt_sections.get(table)
+
     def to_dict(self) -> dict[str, Any]:
         """Convert schema to dictionary representation.
 
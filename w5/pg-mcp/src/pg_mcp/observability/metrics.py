@@ -6,6 +6,9 @@ tracking query requests, LLM calls, database operations, and system health.
 
 from prometheus_client import Counter, Gauge, Histogram, start_http_server
 
+# Gauge values of circuit breaker states
+_CIRCUIT_BREAKER_STATES = {"closed": 0, "half_open": 1, "open": 2}
+
 
 class MetricsCollector:
     """Centralized metrics collector using Prometheus client.
@@ -75,6 +78,19 @@ class MetricsCollector:
             labelnames=["operation"],
         )
 
+        self.llm_prompt_tokens: Histogram = Histogram(
+            "pg_mcp_llm_prompt_tokens",
+            "Prompt tokens per query request, summed over its LLM API calls",
+            buckets=(250, 500, 1000, 2000, 4000, 8000, 16000, 32000, 64000, 128000),
+        )
+
+        self.schema_context_tokens: Histogram = Histogram(
+            "pg_mcp_schema_context_tokens",
+            "Estimated schema context tokens per SQL generation prompt",
+            labelnames=["stage"],
+            buckets=(500, 1000, 2000, 4000, 8000, 16000, 32000, 64000, 128000),
+        )
+
         # Security Metrics
         self.sql_rejected: Counter = Counter(
             "pg_mcp_sql_rejected_total",
@@ -102,6 +118,59 @@ class MetricsCollector:
             labelnames=["database"],
         )
 
+        self.query_cache_hits: Counter = Counter(
+            "pg_mcp_query_cache_hits_total",
+            "Total number of question/result cache hits",
+            labelnames=["cache", "database"],
+        )
+
+        self.query_cache_misses: Counter = Counter(
+            "pg_mcp_query_cache_misses_total",
+            "Total number of question/result cache misses",
+            labelnames=["cache", "database"],
+        )
+
+        self.statement_cache_hits: Counter = Counter(
+            "pg_mcp_statement_cache_hits_total",
+            "Total number of queries whose normalized SQL was executed before",
+            labelnames=["database"],
+        )
+
+        self.statement_cache_misses: Counter = Counter(
+            "pg_mcp_statement_cache_misses_total",
+            "Total number of queries whose normalized SQL was not executed before",
+            labelnames=["database"],
+        )
+
+        # Validation Executor Metrics
+        self.validation_queue_depth: Gauge = Gauge(
+            "pg_mcp_validation_queue_depth",
+            "SQL validations waiting for or running on the validation executor",
+            labelnames=["executor"],
+        )
+
+        self.validation_duration: Histogram = Histogram(
+            "pg_mcp_validation_duration_seconds",
+            "SQL validation execution time on the validation executor in seconds",
+            labelnames=["executor"],
+            buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+        )
+
+        # Fair Queue Metrics
+        self.queue_wait: Histogram = Histogram(
+            "pg_mcp_queue_wait_seconds",
+            "Time waiting in the fair queue for a rate limiter slot in seconds",
+            labelnames=["resource", "priority"],
+            buckets=(0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+        )
+
+        # Circuit Breaker Metrics
+        self.circuit_breaker_state: Gauge = Gauge(
+            "pg_mcp_circuit_breaker_state",
+            "Circuit breaker state per dependency (0=closed, 1=half_open, 2=open)",
+            labelnames=["dependency"],
+        )
+
     def start_metrics_server(self, port: int) -> None:
         """Start the Prometheus metrics HTTP server.
 
@@ -150,6 +219,24 @@ class MetricsCollector:
         """
         self.llm_tokens_used.labels(operation=operation).inc(tokens)
 
+    def observe_llm_prompt_tokens(self, tokens: int) -> None:
+        """Record the prompt tokens of a query request.
+
+        Args:
+            tokens: Prompt tokens the API reported, summed over the request's
+                LLM calls (retries, candidates and result validation).
+        """
+        self.llm_prompt_tokens.observe(tokens)
+
+    def observe_schema_context_tokens(self, stage: str, tokens: int) -> None:
+        """Record schema context size in a SQL generation prompt.
+
+        Args:
+            stage: "full" for the complete schema, "pruned" for what was sent.
+            tokens: Estimated number of tokens.
+        """
+        self.schema_context_tokens.labels(stage=stage).observe(tokens)
+
     def increment_sql_rejected(self, reason: str) -> None:
         """Increment SQL rejection counter.
 
@@ -184,6 +271,77 @@ class MetricsCollector:
         """
         self.schema_cache_age.labels(database=database).set(age_seconds)
 
+    def increment_query_cache_hit(self, cache: str, database: str) -> None:
+        """Increment query cache hit counter.
+
+        Args:
+            cache: Cache layer ("sql" for question→SQL, "result" for SQL→result).
+            database: Database name.
+        """
+        self.query_cache_hits.labels(cache=cache, database=database).inc()
+
+    def increment_query_cache_miss(self, cache: str, database: str) -> None:
+        """Increment query cache miss counter.
+
+        Args:
+            cache: Cache layer ("sql" for question→SQL, "result" for SQL→result).
+            database: Database name.
+        """
+        self.query_cache_misses.labels(cache=cache, database=database).inc()
+
+    def increment_statement_cache_hit(self, database: str) -> None:
+        """Increment repeated statement counter.
+
+        Args:
+            database: Database name.
+        """
+        self.statement_cache_hits.labels(database=database).inc()
+
+    def increment_statement_cache_miss(self, database: str) -> None:
+        """Increment new statement counter.
+
+        Args:
+            database: Database name.
+        """
+        self.statement_cache_misses.labels(database=database).inc()
+
+    def set_validation_queue_depth(self, executor: str, depth: int) -> None:
+        """Set the number of validations pending on the validation executor.
+
+        Args:
+            executor: Executor kind ("thread" or "process").
+            depth: Number of submitted, unfinished validations.
+        """
+        self.validation_queue_depth.labels(executor=executor).set(depth)
+
+    def observe_validation_duration(self, executor: str, duration: float) -> None:
+        """Record SQL validation execution time on the validation executor.
+
+        Args:
+            executor: Executor kind ("thread" or "process").
+            duration: Execution time in seconds, excluding queueing.
+        """
+        self.validation_duration.labels(executor=executor).observe(duration)
+
+    def observe_queue_wait(self, resource: str, priority: str, duration: float) -> None:
+        """Record time spent waiting in a fair queue.
+
+        Args:
+            resource: Resource behind the queue ("queries" or "llm").
+            priority: Priority class of the request.
+            duration: Wait time in seconds until a rate limiter slot was held.
+        """
+        self.queue_wait.labels(resource=resource, priority=priority).observe(duration)
+
+    def set_circuit_breaker_state(self, dependency: str, state: str) -> None:
+        """Set the state of a circuit breaker.
+
+        Args:
+            dependency: Dependency protected by the breaker (e.g. "database:mydb").
+            state: Breaker state ("closed", "half_open" or "open").
+        """
+        self.circuit_breaker_state.labels(dependency=dependency).set(_CIRCUIT_BREAKER_STATES[state])
+
     def reset_all_metrics(self) -> None:
         """Reset all metrics to initial state.
 
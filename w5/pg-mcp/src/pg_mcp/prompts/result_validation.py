@@ -39,7 +39,7 @@ def build_validation_prompt(
     question: str,
     sql: str,
     results: list[dict[str, Any]],
-    row_count: int,
+    row_count: int | None,
 ) -> str:
     """Build validation prompt for result verification.
 
@@ -51,7 +51,8 @@ def build_validation_prompt(
         question: The user's original natural language question.
         sql: The SQL query that was executed.
         results: Sample of query results (limited number of rows).
-        row_count: Total number of rows in the complete result set.
+        row_count: Total number of rows in the complete result set, or None
+            if the result was truncated and the total is unknown.
 
     Returns:
         str: Formatted validation prompt ready for LLM consumption.
@@ -64,6 +65,7 @@ def build_validation_prompt(
         ...     row_count=1
         ... )
     """
+    total = f"{row_count}" if row_count is not None else "more than the returned"
     # Format results as JSON for better readability
     results_preview = json.dumps(results, ensure_ascii=False, indent=2, default=str)
 
@@ -77,7 +79,7 @@ def build_validation_prompt(
         sql,
         "```",
         "",
-        f"## Results (showing {len(results)} of {row_count} rows):",
+        f"## Results (showing {len(results)} of {total} rows):",
         "```json",
         results_preview,
         "```",
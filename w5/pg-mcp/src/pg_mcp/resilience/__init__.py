@@ -1,11 +1,25 @@
 """Resilience components for fault tolerance and rate limiting."""
 
-from pg_mcp.resilience.circuit_breaker import CircuitBreaker, CircuitState
-from pg_mcp.resilience.rate_limiter import MultiRateLimiter, RateLimiter
+from pg_mcp.resilience.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    CircuitState,
+)
+from pg_mcp.resilience.rate_limiter import (
+    AdaptiveConcurrencyLimiter,
+    MultiRateLimiter,
+    RateLimiter,
+    TokenBucketLimiter,
+    TokenReservation,
+)
 
 __all__ = [
     "CircuitBreaker",
+    "CircuitBreakerRegistry",
     "CircuitState",
     "RateLimiter",
     "MultiRateLimiter",
+    "AdaptiveConcurrencyLimiter",
+    "TokenBucketLimiter",
+    "TokenReservation",
 ]
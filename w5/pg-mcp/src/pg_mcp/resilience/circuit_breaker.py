@@ -1,20 +1,26 @@
 """Circuit breaker implementation for fault tolerance.
 
 This module provides a circuit breaker pattern implementation that prevents
-cascading failures by stopping requests to failing services temporarily.
+cascading failures by stopping requests to failing services temporarily, and
+a registry holding one circuit breaker per dependency, so that a failing
+dependency is isolated from healthy ones.
 
 State transitions:
     CLOSED -> OPEN: When failure count exceeds threshold
     OPEN -> HALF_OPEN: After recovery timeout expires
-    HALF_OPEN -> CLOSED: On successful request
+    HALF_OPEN -> CLOSED: When all admitted probe requests succeeded
     HALF_OPEN -> OPEN: On failed request
 """
 
 import time
+from collections.abc import Callable
 from enum import StrEnum, auto
 from threading import Lock
 from typing import Any
 
+from pg_mcp.config.settings import ResilienceConfig
+from pg_mcp.observability.metrics import MetricsCollector
+
 
 class CircuitState(StrEnum):
     """Circuit breaker states."""
@@ -29,7 +35,10 @@ class CircuitBreaker:
 
     The circuit breaker tracks failures and automatically opens when failures
     exceed a threshold. After a recovery timeout, it enters half-open state
-    to test if the service has recovered.
+    to test if the service has recovered: only a limited number of probe
+    requests are let through, and the circuit closes once all of them
+    succeeded. Probes that are never reported (e.g. because the request was
+    abandoned) are given up after another recovery timeout.
 
     Example:
         >>> breaker = CircuitBreaker(failure_threshold=5, recovery_timeout=60.0)
@@ -49,26 +58,47 @@ class CircuitBreaker:
         self,
         failure_threshold: int = 5,
         recovery_timeout: float = 60.0,
+        half_open_max_calls: int = 1,
+        name: str = "",
+        on_state_change: Callable[[str, CircuitState], None] | None = None,
+        clock: Callable[[], float] = time.time,
     ) -> None:
         """Initialize circuit breaker.
 
         Args:
             failure_threshold: Number of consecutive failures before opening circuit.
             recovery_timeout: Seconds to wait before attempting recovery (OPEN -> HALF_OPEN).
+            half_open_max_calls: Number of probe requests admitted in HALF_OPEN
+                state; the circuit closes when all of them succeeded.
+            name: Name of the protected dependency, passed to on_state_change.
+            on_state_change: Optional callback invoked with the name and the
+                new state whenever the state changes.
+            clock: Time source in seconds (injectable for tests).
         """
         if failure_threshold < 1:
             raise ValueError("failure_threshold must be >= 1")
         if recovery_timeout < 0:
             raise ValueError("recovery_timeout must be >= 0")
+        if half_open_max_calls < 1:
+            raise ValueError("half_open_max_calls must be >= 1")
 
+        self.name = name
         self._failure_threshold = failure_threshold
         self._recovery_timeout = recovery_timeout
+        self._half_open_max_calls = half_open_max_calls
+        self._on_state_change = on_state_change
+        self._clock = clock
 
         # State tracking
         self._state = CircuitState.CLOSED
         self._failure_count = 0
         self._last_failure_time: float | None = None
 
+        # Probe tracking in HALF_OPEN state
+        self._half_open_calls = 0
+        self._half_open_successes = 0
+        self._last_probe_time: float | None = None
+
         # Thread safety
         self._lock = Lock()
 
@@ -98,27 +128,47 @@ class CircuitBreaker:
 
         This method should be called before making a request to the protected service.
         It automatically transitions from OPEN to HALF_OPEN after recovery timeout.
+        In HALF_OPEN state, an allowed request counts as a probe and must be
+        reported with record_success() or record_failure().
 
         Returns:
-            True if request should proceed, False if circuit is open.
+            True if request should proceed, False if circuit is open or all
+            probes of the HALF_OPEN state are in flight.
         """
         with self._lock:
             self._update_state()
-            return self._state in (CircuitState.CLOSED, CircuitState.HALF_OPEN)
+            if self._state == CircuitState.CLOSED:
+                return True
+            if self._state == CircuitState.OPEN:
+                return False
+
+            if (
+                self._last_probe_time is not None
+                and self._clock() - self._last_probe_time >= self._recovery_timeout
+            ):
+                # Probes went unreported, admit new ones
+                self._half_open_calls = self._half_open_successes
+            if self._half_open_calls >= self._half_open_max_calls:
+                return False
+            self._half_open_calls += 1
+            self._last_probe_time = self._clock()
+            return True
 
     def record_success(self) -> None:
         """Record a successful request.
 
-        In HALF_OPEN state, this closes the circuit. In CLOSED state,
-        it resets the failure counter.
+        In HALF_OPEN state, this closes the circuit once all admitted probes
+        succeeded. In CLOSED state, it resets the failure counter.
         """
         with self._lock:
             self._failure_count = 0
             self._last_failure_time = None
 
             if self._state == CircuitState.HALF_OPEN:
-                # Recovery confirmed, close the circuit
-                self._state = CircuitState.CLOSED
+                self._half_open_successes += 1
+                if self._half_open_successes >= self._half_open_max_calls:
+                    # Recovery confirmed, close the circuit
+                    self._set_state(CircuitState.CLOSED)
 
     def record_failure(self) -> None:
         """Record a failed request.
@@ -128,17 +178,17 @@ class CircuitBreaker:
         """
         with self._lock:
             self._failure_count += 1
-            self._last_failure_time = time.time()
+            self._last_failure_time = self._clock()
 
             if self._state == CircuitState.HALF_OPEN:
                 # Recovery failed, reopen circuit
-                self._state = CircuitState.OPEN
+                self._set_state(CircuitState.OPEN)
             elif (
                 self._state == CircuitState.CLOSED
                 and self._failure_count >= self._failure_threshold
             ):
                 # Check if we should open circuit
-                self._state = CircuitState.OPEN
+                self._set_state(CircuitState.OPEN)
 
     def reset(self) -> None:
         """Manually reset the circuit breaker to CLOSED state.
@@ -147,7 +197,7 @@ class CircuitBreaker:
         administrative override.
         """
         with self._lock:
-            self._state = CircuitState.CLOSED
+            self._set_state(CircuitState.CLOSED)
             self._failure_count = 0
             self._last_failure_time = None
 
@@ -158,10 +208,25 @@ class CircuitBreaker:
         Must be called with lock held.
         """
         if self._state == CircuitState.OPEN and self._last_failure_time is not None:
-            elapsed = time.time() - self._last_failure_time
+            elapsed = self._clock() - self._last_failure_time
             if elapsed >= self._recovery_timeout:
                 # Try recovery
-                self._state = CircuitState.HALF_OPEN
+                self._set_state(CircuitState.HALF_OPEN)
+
+    def _set_state(self, state: CircuitState) -> None:
+        """Change state, starting over with probes, and report the change.
+
+        Must be called with lock held.
+        """
+        self._half_open_calls = 0
+        self._half_open_successes = 0
+        self._last_probe_time = None
+        if state == self._state:
+            return
+
+        self._state = state
+        if self._on_state_change is not None:
+            self._on_state_change(self.name, state)
 
     def get_stats(self) -> dict[str, Any]:
         """Get circuit breaker statistics.
@@ -177,6 +242,8 @@ class CircuitBreaker:
                 "failure_threshold": self._failure_threshold,
                 "recovery_timeout": self._recovery_timeout,
                 "last_failure_time": self._last_failure_time,
+                "half_open_max_calls": self._half_open_max_calls,
+                "half_open_calls": self._half_open_calls,
             }
 
     def __repr__(self) -> str:
@@ -190,3 +257,109 @@ class CircuitBreaker:
                 f"CircuitBreaker(state={self._state}, "
                 f"failures={self._failure_count}/{self._failure_threshold})"
             )
+
+
+class CircuitBreakerRegistry:
+    """Circuit breakers keyed by the dependency they protect.
+
+    Breakers are created on first use with the same settings, so that every
+    dependency (e.g. "llm_generation" or "database:sales") trips on its own
+    failures only. State changes are exported as a Prometheus gauge.
+
+    Example:
+        >>> breakers = CircuitBreakerRegistry(failure_threshold=5, recovery_timeout=60.0)
+        >>> breaker = breakers.get(CircuitBreakerRegistry.database("sales"))
+        >>> if not breaker.allow_request():
+        ...     raise ServiceUnavailableError()
+    """
+
+    LLM_GENERATION = "llm_generation"
+    LLM_VALIDATION = "llm_validation"
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 60.0,
+        half_open_max_calls: int = 1,
+        metrics: MetricsCollector | None = None,
+    ) -> None:
+        """Initialize circuit breaker registry.
+
+        Args:
+            failure_threshold: Consecutive failures before a breaker opens.
+            recovery_timeout: Seconds before an open breaker admits probes.
+            half_open_max_calls: Probe requests admitted in HALF_OPEN state.
+            metrics: Optional metrics collector for breaker states.
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.metrics = metrics
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    @classmethod
+    def from_config(
+        cls, config: ResilienceConfig, metrics: MetricsCollector | None = None
+    ) -> "CircuitBreakerRegistry":
+        """Create a registry from the resilience configuration.
+
+        Args:
+            config: Resilience configuration.
+            metrics: Optional metrics collector for breaker states.
+
+        Returns:
+            CircuitBreakerRegistry: Configured registry.
+        """
+        return cls(
+            failure_threshold=config.circuit_breaker_threshold,
+            recovery_timeout=config.circuit_breaker_timeout,
+            half_open_max_calls=config.circuit_breaker_half_open_max_calls,
+            metrics=metrics,
+        )
+
+    @staticmethod
+    def database(name: str) -> str:
+        """Get the dependency name of a database.
+
+        Args:
+            name: Database name.
+
+        Returns:
+            str: Dependency name of the database's connection pool.
+        """
+        return f"database:{name}"
+
+    def get(self, dependency: str) -> CircuitBreaker:
+        """Get the circuit breaker of a dependency, creating it on first use.
+
+        Args:
+            dependency: Dependency name.
+
+        Returns:
+            CircuitBreaker: Breaker of the dependency.
+        """
+        breaker = self._breakers.get(dependency)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                failure_threshold=self.failure_threshold,
+                recovery_timeout=self.recovery_timeout,
+                half_open_max_calls=self.half_open_max_calls,
+                name=dependency,
+                on_state_change=self._export_state,
+            )
+            self._breakers[dependency] = breaker
+            self._export_state(dependency, CircuitState.CLOSED)
+        return breaker
+
+    def get_all_stats(self) -> dict[str, dict[str, Any]]:
+        """Get statistics of all circuit breakers.
+
+        Returns:
+            Dictionary mapping dependency names to breaker statistics.
+        """
+        return {name: breaker.get_stats() for name, breaker in self._breakers.items()}
+
+    def _export_state(self, dependency: str, state: CircuitState) -> None:
+        """Report a breaker state to the metrics collector."""
+        if self.metrics is not None:
+            self.metrics.set_circuit_breaker_state(dependency, state)
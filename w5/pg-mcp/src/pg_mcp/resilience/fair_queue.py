@@ -0,0 +1,248 @@
+"""Weighted fair queueing in front of the rate limiters.
+
+This module provides the FairQueue class that decides which waiting request
+may next compete for a rate limiter slot. Requests are grouped into flows by
+client and target database; flows share the limiter in proportion to their
+weights, and requests of a higher priority class always go first. The flow of
+the current request travels in a context variable, so the code between the
+request entry point and the limiters does not have to pass it along.
+"""
+
+import asyncio
+import contextvars
+import heapq
+import itertools
+import time
+from collections.abc import AsyncIterator, Callable, Iterator, Mapping, Sequence
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, NamedTuple
+
+from pg_mcp.observability.metrics import MetricsCollector
+
+
+class Flow(NamedTuple):
+    """Scheduling identity of a request.
+
+    Attributes:
+        client: Client or session identifier.
+        database: Target database name.
+        priority: Priority class name (e.g. the request's return type).
+    """
+
+    client: str = ""
+    database: str = ""
+    priority: str = ""
+
+
+# Flow of the request being processed in the current context
+_flow_var: contextvars.ContextVar[Flow | None] = contextvars.ContextVar("flow", default=None)
+
+
+def get_current_flow() -> Flow:
+    """Get the flow of the current request.
+
+    Returns:
+        Current flow, or an anonymous flow outside of a flow context.
+    """
+    return _flow_var.get() or Flow()
+
+
+def set_current_flow(flow: Flow) -> contextvars.Token[Flow | None]:
+    """Set the flow of the current request.
+
+    Args:
+        flow: Flow of the request.
+
+    Returns:
+        Token for restoring the previous flow with reset_current_flow().
+    """
+    return _flow_var.set(flow)
+
+
+def reset_current_flow(token: contextvars.Token[Flow | None]) -> None:
+    """Restore the flow that was current before set_current_flow().
+
+    Args:
+        token: Token returned by set_current_flow().
+    """
+    _flow_var.reset(token)
+
+
+@contextmanager
+def flow_context(flow: Flow) -> Iterator[Flow]:
+    """Context manager scheduling the enclosed work as part of a flow.
+
+    Tasks created inside the context inherit the flow.
+
+    Args:
+        flow: Flow of the request.
+
+    Yields:
+        The flow.
+
+    Example:
+        >>> with flow_context(Flow(client="alice", database="sales", priority="sql")):
+        ...     await orchestrator_work()
+    """
+    token = set_current_flow(flow)
+    try:
+        yield flow
+    finally:
+        reset_current_flow(token)
+
+
+class FairQueue:
+    """Start-time fair queue admitting one request at a time to a resource.
+
+    Only the request holding the turn waits on the resource behind the queue;
+    it passes the turn on once it has a slot (or gave up), so the resource
+    is handed out in the queue's order rather than in arrival order. Waiting
+    requests are ordered by priority class, then by virtual finish time: each
+    request of a flow with weight w advances the flow's finish time by 1/w,
+    starting no earlier than the current virtual time, so a busy flow cannot
+    push an idle one back and flows progress in proportion to their weights.
+
+    Example:
+        >>> queue = FairQueue("queries", priority_order=["sql", "result"])
+        >>> async with queue.turn(Flow("alice", "sales", "sql"), timeout=30.0):
+        ...     await limiter.acquire()
+    """
+
+    def __init__(
+        self,
+        resource: str,
+        priority_order: Sequence[str] = (),
+        client_weights: Mapping[str, float] | None = None,
+        database_weights: Mapping[str, float] | None = None,
+        metrics: MetricsCollector | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize fair queue.
+
+        Args:
+            resource: Name of the resource behind the queue, used as metric label.
+            priority_order: Priority class names, highest priority first;
+                unknown classes are served after all listed ones.
+            client_weights: Weight per client (default 1).
+            database_weights: Weight per database (default 1); a flow's weight
+                is the product of its client and database weights.
+            metrics: Optional metrics collector for queue wait times.
+            clock: Monotonic time source in seconds (injectable for tests).
+        """
+        self.resource = resource
+        self.metrics = metrics
+        self._ranks = {name: rank for rank, name in enumerate(priority_order)}
+        self._client_weights = dict(client_weights or {})
+        self._database_weights = dict(database_weights or {})
+        self._clock = clock
+        self._busy = False
+        self._waiters: list[tuple[int, float, int, float, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+        self._virtual_time = 0.0
+        self._finish_times: dict[tuple[str, str], float] = {}
+
+    @property
+    def waiting(self) -> int:
+        """Get number of requests waiting for their turn.
+
+        Returns:
+            Number of waiting requests (including ones given up but not yet purged).
+        """
+        return len(self._waiters)
+
+    def weight(self, flow: Flow) -> float:
+        """Get the weight of a flow.
+
+        Args:
+            flow: Request flow.
+
+        Returns:
+            Product of the flow's client and database weights.
+        """
+        return self._client_weights.get(flow.client, 1.0) * self._database_weights.get(
+            flow.database, 1.0
+        )
+
+    @asynccontextmanager
+    async def turn(
+        self,
+        flow: Flow,
+        *,
+        timeout: float | None = None,  # noqa: ASYNC109
+    ) -> AsyncIterator[None]:
+        """Context manager holding the queue's turn.
+
+        The wait until the turn is handed back is reported as queue wait time.
+
+        Args:
+            flow: Flow of the request.
+            timeout: Optional timeout in seconds for getting the turn.
+
+        Yields:
+            None
+
+        Raises:
+            asyncio.TimeoutError: If timeout is exceeded.
+        """
+        start = self._clock()
+        await self._wait_turn(flow, timeout)
+        try:
+            yield
+        finally:
+            self._pass_turn()
+            if self.metrics is not None:
+                self.metrics.observe_queue_wait(self.resource, flow.priority, self._clock() - start)
+
+    async def _wait_turn(self, flow: Flow, timeout: float | None) -> None:  # noqa: ASYNC109
+        """Wait in the queue until the turn is handed over."""
+        key = (flow.client, flow.database)
+        start_tag = max(self._virtual_time, self._finish_times.get(key, 0.0))
+        finish_tag = start_tag + 1.0 / self.weight(flow)
+        self._finish_times[key] = finish_tag
+
+        # Waiters only queue up while the turn is held
+        if not self._busy:
+            self._busy = True
+            self._virtual_time = start_tag
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        rank = self._ranks.get(flow.priority, len(self._ranks))
+        heapq.heappush(self._waiters, (rank, finish_tag, next(self._sequence), start_tag, waiter))
+        try:
+            async with asyncio.timeout(timeout):
+                await waiter
+        except BaseException:
+            if waiter.done() and not waiter.cancelled():
+                # The turn was handed over as the wait was interrupted
+                self._pass_turn()
+            else:
+                waiter.cancel()
+            raise
+
+    def _pass_turn(self) -> None:
+        """Hand the turn to the next waiting request, or free it."""
+        while self._waiters:
+            _, _, _, start_tag, waiter = heapq.heappop(self._waiters)
+            if not waiter.done():
+                self._virtual_time = max(self._virtual_time, start_tag)
+                waiter.set_result(None)
+                return
+
+        self._busy = False
+        # Flows that are caught up with the virtual time need no entry
+        self._finish_times = {
+            key: finish for key, finish in self._finish_times.items() if finish > self._virtual_time
+        }
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get fair queue statistics.
+
+        Returns:
+            Dictionary containing current metrics.
+        """
+        return {
+            "waiting": self.waiting,
+            "active_flows": len(self._finish_times),
+            "priority_order": list(self._ranks),
+        }
@@ -1,15 +1,25 @@
 """Rate limiting implementation for controlling concurrent access.
 
 This module provides rate limiters that control concurrent access to resources
-using semaphores. It helps prevent resource exhaustion by limiting the number
-of concurrent operations.
+using semaphores, an adaptive (AIMD) concurrency limiter that follows observed
+latency, and a token bucket limiter for provider request and token quotas.
+They help prevent resource exhaustion and upstream throttling.
 """
 
 import asyncio
-from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable
+from contextlib import AsyncExitStack, asynccontextmanager
 from typing import Any
 
+from pg_mcp.config.settings import RateLimitConfig
+from pg_mcp.observability.metrics import MetricsCollector
+from pg_mcp.resilience.fair_queue import FairQueue, get_current_flow
+
+# Weight of the latest sample in running averages
+_EWMA_WEIGHT = 0.2
+
 
 class RateLimiter:
     """Async rate limiter using semaphore for concurrent request control.
@@ -44,7 +54,6 @@ class RateLimiter:
         self._active_count = 0
         self._total_requests = 0
         self._total_rejections = 0
-        self._lock = asyncio.Lock()
 
     @property
     def max_concurrent(self) -> int:
@@ -76,34 +85,30 @@ class RateLimiter:
     async def acquire(self, *, timeout: float | None = None) -> bool:  # noqa: ASYNC109
         """Acquire a slot for concurrent operation.
 
+        Counters are updated synchronously: the limiter is only used from one
+        event loop, and no await happens between reading and writing them.
+        A free slot is taken without suspending the caller.
+
         Args:
             timeout: Optional timeout in seconds. If None, waits indefinitely.
 
         Returns:
             True if slot was acquired, False if timeout occurred.
-
-        Raises:
-            asyncio.TimeoutError: If timeout is exceeded.
         """
-        async with self._lock:
-            self._total_requests += 1
+        self._total_requests += 1
 
-        try:
-            if timeout is not None:
+        if self._semaphore.locked() and timeout is not None:
+            try:
                 async with asyncio.timeout(timeout):
                     await self._semaphore.acquire()
-            else:
-                await self._semaphore.acquire()
-
-            async with self._lock:
-                self._active_count += 1
-
-            return True
-
-        except TimeoutError:
-            async with self._lock:
+            except TimeoutError:
                 self._total_rejections += 1
-            return False
+                return False
+        else:
+            await self._semaphore.acquire()
+
+        self._active_count += 1
+        return True
 
     def release(self) -> None:
         """Release a slot after operation completes.
@@ -111,21 +116,8 @@ class RateLimiter:
         This should be called after acquire() when the operation is complete.
         Use the async context manager to handle this automatically.
         """
+        self._active_count = max(0, self._active_count - 1)
         self._semaphore.release()
-        # Note: We use a try-except here because release() is not async
-        # but we need to update the counter. The counter update is not
-        # critical for correctness.
-        try:
-            loop = asyncio.get_running_loop()
-            _task = loop.create_task(self._decrement_counter())  # noqa: RUF006
-        except RuntimeError:
-            # No event loop running, just decrement directly (testing scenario)
-            self._active_count = max(0, self._active_count - 1)
-
-    async def _decrement_counter(self) -> None:
-        """Decrement active counter (internal helper)."""
-        async with self._lock:
-            self._active_count = max(0, self._active_count - 1)
 
     @asynccontextmanager
     async def __call__(
@@ -194,11 +186,484 @@ class RateLimiter:
         )
 
 
+class AdaptiveConcurrencyLimiter:
+    """Async concurrency limiter whose limit follows observed latency (AIMD).
+
+    Every completed operation reports its latency. While latency stays at or
+    below the target, the limit grows additively by one per limit's worth of
+    operations; when an operation is slower than the target, the limit is
+    multiplied by the backoff ratio, at most once per target latency so that
+    one burst of slow operations counts as a single congestion signal.
+
+    Example:
+        >>> limiter = AdaptiveConcurrencyLimiter(initial_limit=10, target_latency=0.5)
+        >>> async with limiter(timeout=30.0):
+        ...     result = await execute_query()
+    """
+
+    def __init__(
+        self,
+        initial_limit: int,
+        min_limit: int = 1,
+        max_limit: int = 100,
+        target_latency: float = 1.0,
+        backoff_ratio: float = 0.9,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize adaptive concurrency limiter.
+
+        Args:
+            initial_limit: Starting concurrency limit, clamped to the bounds.
+            min_limit: Lowest limit the backoff can reach.
+            max_limit: Highest limit the additive increase can reach.
+            target_latency: Latency in seconds above which an operation
+                signals overload.
+            backoff_ratio: Factor applied to the limit on overload.
+            clock: Monotonic time source in seconds (injectable for tests).
+
+        Raises:
+            ValueError: If the bounds, target latency or backoff ratio are invalid.
+        """
+        if min_limit < 1 or max_limit < min_limit:
+            raise ValueError("limits must satisfy 1 <= min_limit <= max_limit")
+        if target_latency <= 0:
+            raise ValueError("target_latency must be > 0")
+        if not 0 < backoff_ratio < 1:
+            raise ValueError("backoff_ratio must be between 0 and 1")
+
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._target_latency = target_latency
+        self._backoff_ratio = backoff_ratio
+        self._clock = clock
+        self._limit = float(min(max(initial_limit, min_limit), max_limit))
+        self._last_backoff = float("-inf")
+        self._average_latency: float | None = None
+        self._active_count = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._total_requests = 0
+        self._total_rejections = 0
+
+    @property
+    def max_concurrent(self) -> int:
+        """Get the current concurrency limit.
+
+        Returns:
+            Current maximum of concurrent operations.
+        """
+        return int(self._limit)
+
+    @property
+    def active_count(self) -> int:
+        """Get number of currently active operations.
+
+        Returns:
+            Number of active operations.
+        """
+        return self._active_count
+
+    @property
+    def available(self) -> int:
+        """Get number of available slots.
+
+        Returns:
+            Number of available concurrent slots (0 while over a lowered limit).
+        """
+        return max(0, self.max_concurrent - self._active_count)
+
+    async def acquire(self, *, timeout: float | None = None) -> bool:  # noqa: ASYNC109
+        """Acquire a slot for concurrent operation.
+
+        Waiters are served in FIFO order.
+
+        Args:
+            timeout: Optional timeout in seconds. If None, waits indefinitely.
+
+        Returns:
+            True if slot was acquired, False if timeout occurred.
+        """
+        self._total_requests += 1
+        if not self._waiters and self._active_count < self.max_concurrent:
+            self._active_count += 1
+            return True
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            async with asyncio.timeout(timeout):
+                await waiter
+        except BaseException as e:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over as the wait was interrupted
+                self._active_count -= 1
+                self._wake_waiters()
+            elif waiter in self._waiters:
+                # A release may already have dropped the cancelled waiter
+                self._waiters.remove(waiter)
+            if isinstance(e, TimeoutError):
+                self._total_rejections += 1
+                return False
+            raise
+        return True
+
+    def release(self, latency: float | None = None) -> None:
+        """Release a slot and adjust the limit to the operation's latency.
+
+        Args:
+            latency: Duration of the operation in seconds, or None to leave
+                the limit unchanged.
+        """
+        self._active_count = max(0, self._active_count - 1)
+        if latency is not None:
+            self._observe(latency)
+        self._wake_waiters()
+
+    def _observe(self, latency: float) -> None:
+        """Apply additive increase or multiplicative decrease for one sample."""
+        if self._average_latency is None:
+            self._average_latency = latency
+        else:
+            self._average_latency += _EWMA_WEIGHT * (latency - self._average_latency)
+
+        if latency <= self._target_latency:
+            self._limit = min(float(self._max_limit), self._limit + 1.0 / self._limit)
+            return
+
+        now = self._clock()
+        if now - self._last_backoff >= self._target_latency:
+            self._last_backoff = now
+            self._limit = max(float(self._min_limit), self._limit * self._backoff_ratio)
+
+    def _wake_waiters(self) -> None:
+        """Hand free slots to waiters in FIFO order."""
+        while self._waiters and self._active_count < self.max_concurrent:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._active_count += 1
+                waiter.set_result(None)
+
+    @asynccontextmanager
+    async def __call__(
+        self,
+        *,
+        timeout: float | None = None,  # noqa: ASYNC109
+    ) -> AsyncIterator[None]:
+        """Context manager for rate-limited operations, reporting their latency.
+
+        Args:
+            timeout: Optional timeout in seconds.
+
+        Yields:
+            None
+
+        Raises:
+            asyncio.TimeoutError: If timeout is exceeded.
+        """
+        acquired = await self.acquire(timeout=timeout)
+        if not acquired:
+            raise TimeoutError("Rate limiter timeout exceeded")
+
+        start = self._clock()
+        try:
+            yield
+        finally:
+            self.release(latency=self._clock() - start)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get rate limiter statistics.
+
+        Returns:
+            Dictionary containing current metrics.
+        """
+        return {
+            "max_concurrent": self.max_concurrent,
+            "active_count": self._active_count,
+            "available": self.available,
+            "total_requests": self._total_requests,
+            "total_rejections": self._total_rejections,
+            "adaptive": True,
+            "min_limit": self._min_limit,
+            "max_limit": self._max_limit,
+            "target_latency": self._target_latency,
+            "average_latency": self._average_latency,
+        }
+
+    def reset_stats(self) -> None:
+        """Reset statistics counters.
+
+        This does not affect the active operation count or the current limit.
+        """
+        self._total_requests = 0
+        self._total_rejections = 0
+
+    def __repr__(self) -> str:
+        """String representation of adaptive limiter.
+
+        Returns:
+            String describing current state.
+        """
+        return (
+            f"AdaptiveConcurrencyLimiter(limit={self.max_concurrent}, "
+            f"active={self._active_count}, "
+            f"bounds={self._min_limit}..{self._max_limit})"
+        )
+
+
+class TokenBucketLimiter:
+    """Async limiter for request and token throughput per minute.
+
+    Two buckets refill continuously at their per-minute rate and hold at most
+    one minute's worth: one of requests (RPM) and one of tokens (TPM). A rate
+    of 0 disables its bucket. Callers reserve the tokens they expect a call to
+    use and settle the reservation with the actual usage afterwards, so the
+    token bucket tracks what the provider counts; when no estimate is given,
+    the running average of settled usage is reserved. Waiters are served in
+    FIFO order.
+
+    Example:
+        >>> limiter = TokenBucketLimiter(requests_per_minute=500, tokens_per_minute=90000)
+        >>> async with limiter() as reservation:
+        ...     response = await call_llm()
+        ...     reservation.record(response.usage.total_tokens)
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float = 0.0,
+        tokens_per_minute: float = 0.0,
+        default_tokens: int = 1000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize token bucket limiter.
+
+        Args:
+            requests_per_minute: Allowed requests per minute (0 for unlimited).
+            tokens_per_minute: Allowed tokens per minute (0 for unlimited).
+            default_tokens: Tokens reserved per request before any usage has
+                been settled.
+            clock: Monotonic time source in seconds (injectable for tests).
+
+        Raises:
+            ValueError: If a rate is negative or default_tokens is less than 1.
+        """
+        if requests_per_minute < 0 or tokens_per_minute < 0:
+            raise ValueError("rates must be >= 0")
+        if default_tokens < 1:
+            raise ValueError("default_tokens must be >= 1")
+
+        self._requests_per_minute = requests_per_minute
+        self._tokens_per_minute = tokens_per_minute
+        self._clock = clock
+        self._requests = requests_per_minute
+        self._tokens = tokens_per_minute
+        self._updated = clock()
+        self._estimate = float(default_tokens)
+        self._lock = asyncio.Lock()
+        self._total_requests = 0
+        self._total_rejections = 0
+        self._total_tokens = 0
+
+    @property
+    def estimated_tokens(self) -> int:
+        """Get the number of tokens reserved when no estimate is given.
+
+        Returns:
+            Running average of settled token usage per request.
+        """
+        return max(1, round(self._estimate))
+
+    async def acquire(self, tokens: int, *, timeout: float | None = None) -> bool:  # noqa: ASYNC109
+        """Take one request and reserve tokens, waiting for the buckets to refill.
+
+        A reservation larger than the token bucket only waits for a full bucket.
+
+        Args:
+            tokens: Tokens to reserve.
+            timeout: Optional timeout in seconds. If None, waits indefinitely.
+
+        Returns:
+            True if the request was admitted, False if timeout occurred.
+        """
+        self._total_requests += 1
+        if not self._lock.locked() and self._wait_time(tokens) == 0:
+            self._take(tokens)
+            return True
+
+        try:
+            async with asyncio.timeout(timeout), self._lock:
+                # Buckets refill with time, and settled usage can move the
+                # level either way, so re-check after each computed wait
+                while (wait := self._wait_time(tokens)) > 0:  # noqa: ASYNC110
+                    await asyncio.sleep(wait)
+                self._take(tokens)
+        except TimeoutError:
+            self._total_rejections += 1
+            return False
+        return True
+
+    def settle(self, reserved: int, actual: int) -> None:
+        """Replace a reservation with the tokens actually used.
+
+        Args:
+            reserved: Tokens reserved by acquire().
+            actual: Tokens the call used, or 0 to refund a call that failed
+                without usage.
+        """
+        if actual > 0:
+            self._total_tokens += actual
+            self._estimate += _EWMA_WEIGHT * (actual - self._estimate)
+        if self._tokens_per_minute:
+            self._refill()
+            self._tokens = min(self._tokens_per_minute, self._tokens + reserved - actual)
+
+    def _refill(self) -> None:
+        """Add the requests and tokens accrued since the last refill."""
+        now = self._clock()
+        elapsed = now - self._updated
+        self._updated = now
+        if self._requests_per_minute:
+            self._requests = min(
+                self._requests_per_minute,
+                self._requests + elapsed * self._requests_per_minute / 60,
+            )
+        if self._tokens_per_minute:
+            self._tokens = min(
+                self._tokens_per_minute,
+                self._tokens + elapsed * self._tokens_per_minute / 60,
+            )
+
+    def _wait_time(self, tokens: int) -> float:
+        """Get the seconds until both buckets can admit a request, 0 if now."""
+        self._refill()
+        wait = 0.0
+        if self._requests_per_minute and self._requests < 1:
+            wait = (1 - self._requests) * 60 / self._requests_per_minute
+        if self._tokens_per_minute:
+            needed = min(tokens, self._tokens_per_minute)
+            if self._tokens < needed:
+                wait = max(wait, (needed - self._tokens) * 60 / self._tokens_per_minute)
+        return wait
+
+    def _take(self, tokens: int) -> None:
+        """Debit one request and the reserved tokens."""
+        if self._requests_per_minute:
+            self._requests -= 1
+        if self._tokens_per_minute:
+            self._tokens -= tokens
+
+    @asynccontextmanager
+    async def __call__(
+        self,
+        tokens: int | None = None,
+        *,
+        timeout: float | None = None,  # noqa: ASYNC109
+    ) -> AsyncIterator["TokenReservation"]:
+        """Context manager for one rate-limited call.
+
+        Tokens of a call that raises before its usage is recorded are refunded.
+
+        Args:
+            tokens: Tokens to reserve (defaults to estimated_tokens).
+            timeout: Optional timeout in seconds.
+
+        Yields:
+            TokenReservation: Reservation to record the actual usage on.
+
+        Raises:
+            asyncio.TimeoutError: If timeout is exceeded.
+        """
+        reserved = tokens if tokens is not None else self.estimated_tokens
+        if not await self.acquire(reserved, timeout=timeout):
+            raise TimeoutError("Token bucket timeout exceeded")
+
+        reservation = TokenReservation(self, reserved)
+        try:
+            yield reservation
+        except BaseException:
+            reservation.record(0)
+            raise
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get token bucket statistics.
+
+        Returns:
+            Dictionary containing current metrics; available amounts are None
+            for disabled buckets.
+        """
+        self._refill()
+        return {
+            "requests_per_minute": self._requests_per_minute,
+            "tokens_per_minute": self._tokens_per_minute,
+            "available_requests": (int(self._requests) if self._requests_per_minute else None),
+            "available_tokens": int(self._tokens) if self._tokens_per_minute else None,
+            "estimated_tokens_per_request": self.estimated_tokens,
+            "total_requests": self._total_requests,
+            "total_rejections": self._total_rejections,
+            "total_tokens": self._total_tokens,
+        }
+
+    def reset_stats(self) -> None:
+        """Reset statistics counters.
+
+        This does not affect the bucket levels or the usage estimate.
+        """
+        self._total_requests = 0
+        self._total_rejections = 0
+        self._total_tokens = 0
+
+    def __repr__(self) -> str:
+        """String representation of token bucket limiter.
+
+        Returns:
+            String describing current state.
+        """
+        return (
+            f"TokenBucketLimiter(rpm={self._requests_per_minute:g}, "
+            f"tpm={self._tokens_per_minute:g})"
+        )
+
+
+class TokenReservation:
+    """Tokens reserved from a TokenBucketLimiter for one call.
+
+    A reservation without a bucket (when token limiting is disabled) ignores
+    recorded usage.
+    """
+
+    def __init__(self, bucket: TokenBucketLimiter | None = None, tokens: int = 0) -> None:
+        """Initialize token reservation.
+
+        Args:
+            bucket: Bucket the tokens were reserved from.
+            tokens: Reserved tokens.
+        """
+        self.bucket = bucket
+        self.tokens = tokens
+        self._settled = False
+
+    def record(self, actual_tokens: int) -> None:
+        """Settle the reservation with the tokens the call actually used.
+
+        Only the first call has an effect.
+
+        Args:
+            actual_tokens: Prompt and completion tokens reported by the API.
+        """
+        if self._settled or self.bucket is None:
+            return
+        self._settled = True
+        self.bucket.settle(self.tokens, actual_tokens)
+
+
 class MultiRateLimiter:
     """Manages multiple rate limiters for different resource types.
 
     This class provides a convenient way to manage multiple rate limiters
-    for different types of operations (e.g., queries, LLM calls).
+    for different types of operations (e.g., queries, LLM calls). Queries
+    can use an adaptive concurrency limit, and LLM calls can additionally be
+    held to provider request and token quotas. With fair queues, waiting
+    operations are admitted by priority class and weighted fair share of their
+    client and database (see :class:`FairQueue`) instead of in arrival order.
 
     Example:
         >>> limiter = MultiRateLimiter(
@@ -207,7 +672,7 @@ class MultiRateLimiter:
         ... )
         >>> async with limiter.for_queries():
         ...     result = await execute_query()
-        >>> async with limiter.for_llm():
+        >>> async with limiter.for_llm() as reservation:
         ...     sql = await generate_sql()
     """
 
@@ -215,18 +680,85 @@ class MultiRateLimiter:
         self,
         query_limit: int = 10,
         llm_limit: int = 5,
+        adaptive_queries: AdaptiveConcurrencyLimiter | None = None,
+        llm_budget: TokenBucketLimiter | None = None,
+        query_queue: FairQueue | None = None,
+        llm_queue: FairQueue | None = None,
     ) -> None:
         """Initialize multi-rate limiter.
 
         Args:
-            query_limit: Maximum concurrent database queries.
+            query_limit: Maximum concurrent database queries (ignored when
+                adaptive_queries is given).
             llm_limit: Maximum concurrent LLM API calls.
+            adaptive_queries: Optional adaptive limiter for database queries.
+            llm_budget: Optional request and token quota for LLM API calls.
+            query_queue: Optional fair queue ordering waiting queries.
+            llm_queue: Optional fair queue ordering waiting LLM calls.
         """
-        self._query_limiter = RateLimiter(max_concurrent=query_limit)
+        self._query_limiter: RateLimiter | AdaptiveConcurrencyLimiter = (
+            adaptive_queries or RateLimiter(max_concurrent=query_limit)
+        )
         self._llm_limiter = RateLimiter(max_concurrent=llm_limit)
+        self._llm_budget = llm_budget
+        self._query_queue = query_queue
+        self._llm_queue = llm_queue
+
+    @classmethod
+    def from_config(
+        cls, config: RateLimitConfig, metrics: MetricsCollector | None = None
+    ) -> "MultiRateLimiter":
+        """Create the rate limiters described by a configuration.
+
+        Args:
+            config: Rate limiting configuration.
+            metrics: Optional metrics collector for fair queue wait times.
+
+        Returns:
+            MultiRateLimiter: Configured rate limiters.
+        """
+        adaptive_queries = None
+        if config.adaptive_queries:
+            adaptive_queries = AdaptiveConcurrencyLimiter(
+                initial_limit=config.max_concurrent_queries,
+                min_limit=config.adaptive_min_queries,
+                max_limit=config.adaptive_max_queries,
+                target_latency=config.adaptive_target_latency,
+                backoff_ratio=config.adaptive_backoff_ratio,
+            )
+
+        llm_budget = None
+        if config.llm_requests_per_minute or config.llm_tokens_per_minute:
+            llm_budget = TokenBucketLimiter(
+                requests_per_minute=config.llm_requests_per_minute,
+                tokens_per_minute=config.llm_tokens_per_minute,
+                default_tokens=config.llm_tokens_per_request,
+            )
+
+        queues: dict[str, FairQueue] = {}
+        if config.fair_queueing:
+            queues = {
+                resource: FairQueue(
+                    resource,
+                    priority_order=config.priority_order,
+                    client_weights=config.client_weights,
+                    database_weights=config.database_weights,
+                    metrics=metrics,
+                )
+                for resource in ("queries", "llm")
+            }
+
+        return cls(
+            query_limit=config.max_concurrent_queries,
+            llm_limit=config.max_concurrent_llm,
+            adaptive_queries=adaptive_queries,
+            llm_budget=llm_budget,
+            query_queue=queues.get("queries"),
+            llm_queue=queues.get("llm"),
+        )
 
     @property
-    def query_limiter(self) -> RateLimiter:
+    def query_limiter(self) -> RateLimiter | AdaptiveConcurrencyLimiter:
         """Get the query rate limiter.
 
         Returns:
@@ -243,6 +775,15 @@ class MultiRateLimiter:
         """
         return self._llm_limiter
 
+    @property
+    def llm_budget(self) -> TokenBucketLimiter | None:
+        """Get the LLM request and token quota.
+
+        Returns:
+            Token bucket limiter for LLM API calls, or None if disabled.
+        """
+        return self._llm_budget
+
     @asynccontextmanager
     async def for_queries(
         self,
@@ -261,7 +802,9 @@ class MultiRateLimiter:
             >>> async with multi_limiter.for_queries(timeout=30.0):
             ...     result = await execute_query()
         """
-        async with self._query_limiter(timeout=timeout):
+        async with AsyncExitStack() as stack:
+            async with self._queued(self._query_queue, timeout) as remaining:
+                await stack.enter_async_context(self._query_limiter(timeout=remaining()))
             yield
 
     @asynccontextmanager
@@ -269,21 +812,60 @@ class MultiRateLimiter:
         self,
         *,
         timeout: float | None = None,  # noqa: ASYNC109
-    ) -> AsyncIterator[None]:
+        tokens: int | None = None,
+    ) -> AsyncIterator[TokenReservation]:
         """Context manager for rate-limited LLM operations.
 
+        The timeout covers waiting in the fair queue, for the request and
+        token quota and for a concurrency slot together.
+
         Args:
             timeout: Optional timeout in seconds.
+            tokens: Tokens to reserve from the token quota (defaults to the
+                running average of recorded usage).
 
         Yields:
-            None
+            TokenReservation: Reservation to record the call's actual token
+                usage on.
 
         Example:
-            >>> async with multi_limiter.for_llm(timeout=60.0):
+            >>> async with multi_limiter.for_llm(timeout=60.0) as reservation:
             ...     sql = await generate_sql()
+            ...     reservation.record(tokens_used)
         """
-        async with self._llm_limiter(timeout=timeout):
-            yield
+        async with AsyncExitStack() as stack:
+            async with self._queued(self._llm_queue, timeout) as remaining:
+                reservation = TokenReservation()
+                if self._llm_budget is not None:
+                    reservation = await stack.enter_async_context(
+                        self._llm_budget(tokens, timeout=remaining())
+                    )
+                await stack.enter_async_context(self._llm_limiter(timeout=remaining()))
+            yield reservation
+
+    @asynccontextmanager
+    async def _queued(
+        self,
+        queue: FairQueue | None,
+        timeout: float | None,  # noqa: ASYNC109
+    ) -> AsyncIterator[Callable[[], float | None]]:
+        """Hold the fair queue's turn while entering the limiters behind it.
+
+        Yields:
+            Function returning the part of the timeout that is left.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+
+        def remaining() -> float | None:
+            return None if deadline is None else max(0.0, deadline - loop.time())
+
+        if queue is None:
+            yield remaining
+            return
+
+        async with queue.turn(get_current_flow(), timeout=timeout):
+            yield remaining
 
     def get_all_stats(self) -> dict[str, dict[str, Any]]:
         """Get statistics for all rate limiters.
@@ -291,15 +873,24 @@ class MultiRateLimiter:
         Returns:
             Dictionary mapping limiter names to their statistics.
         """
-        return {
+        stats = {
             "queries": self._query_limiter.get_stats(),
             "llm": self._llm_limiter.get_stats(),
         }
+        if self._llm_budget is not None:
+            stats["llm_budget"] = self._llm_budget.get_stats()
+        if self._query_queue is not None:
+            stats["queries_queue"] = self._query_queue.get_stats()
+        if self._llm_queue is not None:
+            stats["llm_queue"] = self._llm_queue.get_stats()
+        return stats
 
     def reset_all_stats(self) -> None:
         """Reset statistics for all rate limiters."""
         self._query_limiter.reset_stats()
         self._llm_limiter.reset_stats()
+        if self._llm_budget is not None:
+            self._llm_budget.reset_stats()
 
     def __repr__(self) -> str:
         """String representation of multi-rate limiter.
@@ -7,33 +7,37 @@ initializing and cleaning up all components.
 
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
+from importlib.util import find_spec
 from typing import Any
 
-from asyncpg import Pool
-from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp import Context, FastMCP
 
+from pg_mcp.cache.query_cache import QueryCache
 from pg_mcp.cache.schema_cache import SchemaCache
 from pg_mcp.config.settings import Settings
-from pg_mcp.db.pool import close_pools, create_pool
-from pg_mcp.models.query import QueryRequest, QueryResponse, ReturnType
+from pg_mcp.db.pool import ManagedPool, PoolManager
+from pg_mcp.models.query import QueryRequest, QueryResponse, ResultFormat, ReturnType
 from pg_mcp.observability.logging import configure_logging, get_logger
 from pg_mcp.observability.metrics import MetricsCollector
 from pg_mcp.resilience.rate_limiter import MultiRateLimiter
 from pg_mcp.services.orchestrator import QueryOrchestrator
 from pg_mcp.services.result_validator import ResultValidator
-from pg_mcp.services.sql_executor import SQLExecutor
+from pg_mcp.services.sql_executor import SQLExecutor, StatementCache, build_session_settings
 from pg_mcp.services.sql_generator import SQLGenerator
 from pg_mcp.services.sql_validator import SQLValidator
+from pg_mcp.services.validation_executor import ValidationExecutor
 
 logger = get_logger(__name__)
 
 # Global state for lifespan management
 _settings: Settings | None = None
-_pools: dict[str, Pool] | None = None
+_pool_manager: PoolManager | None = None
+_pools: dict[str, ManagedPool] | None = None
 _schema_cache: SchemaCache | None = None
 _orchestrator: QueryOrchestrator | None = None
 _metrics: MetricsCollector | None = None
 _rate_limiter: MultiRateLimiter | None = None
+_validation_executor: ValidationExecutor | None = None
 
 
 @asynccontextmanager
@@ -45,8 +49,8 @@ async def lifespan(_app: FastMCP) -> AsyncIterator[None]:  # type: ignore[type-a
     Startup:
         1. Load configuration from Settings
         2. Configure logging
-        3. Create database connection pools
-        4. Load schema cache for all databases
+        3. Create database connection pools (lazily unless prewarm is enabled)
+        4. Load schema cache for all databases (from snapshot when available)
         5. Initialize metrics collector
         6. Create service components (generators, validators, executors)
         7. Initialize resilience components (circuit breaker, rate limiter)
@@ -54,9 +58,11 @@ async def lifespan(_app: FastMCP) -> AsyncIterator[None]:  # type: ignore[type-a
         9. Start metrics HTTP server (optional)
 
     Shutdown:
-        1. Stop schema auto-refresh (if enabled)
-        2. Close all database connection pools
-        3. Stop metrics HTTP server (if running)
+        1. Stop schema auto-refresh and snapshot revalidation
+        2. Cancel background result validations and stop the validation
+           executor (if configured)
+        3. Close all database connection pools
+        4. Stop metrics HTTP server (if running)
 
     Yields:
         None
@@ -67,6 +73,7 @@ async def lifespan(_app: FastMCP) -> AsyncIterator[None]:  # type: ignore[type-a
         ...     pass
     """
     global _settings, _pools, _schema_cache, _orchestrator, _metrics, _rate_limiter
+    global _validation_executor, _pool_manager
 
     logger.info("Starting PostgreSQL MCP Server initialization...")
 
@@ -91,25 +98,45 @@ async def lifespan(_app: FastMCP) -> AsyncIterator[None]:  # type: ignore[type-a
             },
         )
 
+        # Metrics are created first so that pool usage can be exported
+        _metrics = MetricsCollector()
+
         # 3. Create database connection pools
         logger.info("Creating database connection pools...")
-        _pools = {}
-        # Note: For single database configuration, we use the main database config
-        pool = await create_pool(_settings.database)
-        _pools[_settings.database.name] = pool
-        logger.info(
-            f"Created connection pool for database '{_settings.database.name}'",
-            extra={
-                "min_size": _settings.database.min_pool_size,
-                "max_size": _settings.database.max_pool_size,
-            },
+        # Static query session settings are applied once per pooled connection
+        _pool_manager = PoolManager(
+            _settings.database.all_databases(),
+            _settings.pool,
+            server_settings=build_session_settings(_settings.security),
+            metrics=_metrics,
         )
+        if _settings.pool.prewarm:
+            await _pool_manager.prewarm()
+        _pool_manager.start_idle_eviction()
+        _pools = _pool_manager.pools
 
         # 4. Load Schema cache
         logger.info("Initializing schema cache...")
         _schema_cache = SchemaCache(_settings.cache)
 
         for db_name, pool in _pools.items():
+            # Schemas of pools that are not open yet are loaded on first use
+            if not pool.is_open:
+                continue
+
+            # Serve an on-disk snapshot immediately and revalidate it in the
+            # background; fall back to a blocking introspection without one
+            schema = await _schema_cache.load_snapshot(db_name)
+            if schema is not None:
+                _schema_cache.start_revalidation(db_name, pool)
+                logger.info(
+                    f"Schema snapshot loaded for '{db_name}', revalidating in background",
+                    extra={
+                        "tables": len(schema.tables),
+                    },
+                )
+                continue
+
             logger.info(f"Loading schema for database '{db_name}'...")
             schema = await _schema_cache.load(db_name, pool)
             logger.info(
@@ -129,11 +156,7 @@ async def lifespan(_app: FastMCP) -> AsyncIterator[None]:  # type: ignore[type-a
         #         pools=_pools,
         #     )
 
-        # 5. Initialize metrics collector
-        logger.info("Initializing metrics collector...")
-        _metrics = MetricsCollector()
-
-        # Start metrics HTTP server if enabled
+        # 5. Start metrics HTTP server if enabled
         if _settings.observability.metrics_enabled:
             from prometheus_client import start_http_server
 
@@ -144,7 +167,11 @@ async def lifespan(_app: FastMCP) -> AsyncIterator[None]:  # type: ignore[type-a
         logger.info("Initializing service components...")
 
         # SQL Generator
-        sql_generator = SQLGenerator(_settings.openai)
+        sql_generator = SQLGenerator(
+            _settings.openai,
+            schema_context_config=_settings.schema_context,
+            metrics=_metrics,
+        )
 
         # SQL Validator
         sql_validator = SQLValidator(
@@ -154,13 +181,34 @@ async def lifespan(_app: FastMCP) -> AsyncIterator[None]:  # type: ignore[type-a
             allow_explain=_settings.security.allow_explain,
         )
 
+        # Optional pool that keeps CPU-bound SQL parsing off the event loop
+        if _settings.security.validation_executor != "none":
+            _validation_executor = ValidationExecutor(
+                sql_validator,
+                kind=_settings.security.validation_executor,
+                max_workers=_settings.security.validation_workers,
+                metrics=_metrics,
+            )
+
         # SQL Executor (create one per database)
         sql_executors: dict[str, SQLExecutor] = {}
-        for db_name, pool in _pools.items():
+        for db_config in _settings.database.all_databases():
+            db_name = db_config.name
             executor = SQLExecutor(
-                pool=pool,
+                pool=_pools[db_name],
                 security_config=_settings.security,
-                db_config=_settings.database,
+                db_config=db_config,
+                session_preconfigured=True,
+                statement_cache=(
+                    StatementCache(
+                        db_config.statement_cache_size,
+                        normalize=sql_validator.normalize_sql,
+                        metrics=_metrics,
+                        database=db_name,
+                    )
+                    if db_config.statement_cache_size > 0
+                    else None
+                ),
             )
             sql_executors[db_name] = executor
             logger.info(f"Created SQL executor for database '{db_name}'")
@@ -174,12 +222,9 @@ async def lifespan(_app: FastMCP) -> AsyncIterator[None]:  # type: ignore[type-a
         # 7. Initialize resilience components
         logger.info("Initializing resilience components...")
 
-        # Rate Limiter for controlling concurrent operations
-        _rate_limiter = MultiRateLimiter(
-            query_limit=10,  # Can be made configurable
-            llm_limit=5,  # Can be made configurable
-        )
-        # Note: Circuit breaker is instantiated within QueryOrchestrator
+        # Rate Limiter for controlling concurrent operations and LLM quotas
+        _rate_limiter = MultiRateLimiter.from_config(_settings.rate_limit, metrics=_metrics)
+        # Note: Circuit breakers per dependency are instantiated within QueryOrchestrator
 
         # 8. Create QueryOrchestrator
         logger.info("Creating query orchestrator...")
@@ -194,6 +239,8 @@ async def lifespan(_app: FastMCP) -> AsyncIterator[None]:  # type: ignore[type-a
             validation_config=_settings.validation,
             rate_limiter=_rate_limiter,  # Pass rate limiter for concurrency control
             metrics=_metrics,  # Pass metrics collector for observability
+            query_cache=QueryCache(_settings.query_cache, metrics=_metrics),
+            validation_executor=_validation_executor,
         )
 
         logger.info("PostgreSQL MCP Server initialization complete!")
@@ -227,11 +274,18 @@ async def lifespan(_app: FastMCP) -> AsyncIterator[None]:  # type: ignore[type-a
             except Exception as e:
                 logger.warning(f"Error stopping schema auto-refresh: {e!s}")
 
+        if _orchestrator is not None:
+            await _orchestrator.close()
+
+        if _validation_executor is not None:
+            _validation_executor.shutdown()
+            logger.info("Validation executor stopped")
+
         # Close database connection pools with timeout
-        if _pools is not None:
+        if _pool_manager is not None:
             try:
                 # Use 5 second timeout for graceful shutdown
-                await close_pools(_pools, timeout=5.0)
+                await _pool_manager.close(timeout=5.0)
                 logger.info("Database connection pools closed")
             except Exception as e:
                 logger.error(f"Error closing connection pools: {e!s}")
@@ -253,6 +307,7 @@ async def health_check() -> dict[str, Any]:
     - Schema cache status
     - Metrics availability
     - Rate limiter status
+    - Circuit breaker state per dependency (LLM operations and databases)
 
     Returns:
         dict: Health status information with databases, cache, and metrics status
@@ -276,6 +331,10 @@ async def health_check() -> dict[str, Any]:
     overall_healthy = True
 
     for db_name, pool in _pools.items():
+        if not pool.is_open:
+            # Created on first use (or closed after being idle)
+            databases_status[db_name] = {"status": "not_connected"}
+            continue
         try:
             size = pool.get_size()
             free = pool.get_idle_size()
@@ -317,8 +376,42 @@ async def health_check() -> dict[str, Any]:
                 "max": stats["queries"]["max_concurrent"],
                 "active": stats["queries"]["active_count"],
                 "available": stats["queries"]["available"],
+                "adaptive": stats["queries"].get("adaptive", False),
             },
         }
+        if "average_latency" in stats["queries"]:
+            rate_limiter_status["queries"].update(
+                {
+                    "min_limit": stats["queries"]["min_limit"],
+                    "max_limit": stats["queries"]["max_limit"],
+                    "target_latency": stats["queries"]["target_latency"],
+                    "average_latency": stats["queries"]["average_latency"],
+                }
+            )
+        for resource in ("queries", "llm"):
+            if f"{resource}_queue" in stats:
+                rate_limiter_status[resource]["queue"] = stats[f"{resource}_queue"]
+        if "llm_budget" in stats:
+            budget = stats["llm_budget"]
+            rate_limiter_status["llm"].update(
+                {
+                    "requests_per_minute": budget["requests_per_minute"],
+                    "tokens_per_minute": budget["tokens_per_minute"],
+                    "available_requests": budget["available_requests"],
+                    "available_tokens": budget["available_tokens"],
+                    "estimated_tokens_per_request": budget["estimated_tokens_per_request"],
+                }
+            )
+
+    # Check circuit breakers; an open breaker means a dependency is failing
+    circuit_breakers_status = {}
+    for dependency, breaker_stats in _orchestrator.circuit_breakers.get_all_stats().items():
+        circuit_breakers_status[dependency] = {
+            "state": breaker_stats["state"],
+            "failure_count": breaker_stats["failure_count"],
+        }
+        if breaker_stats["state"] == "open":
+            overall_healthy = False
 
     return {
         "status": "healthy" if overall_healthy else "degraded",
@@ -328,14 +421,32 @@ async def health_check() -> dict[str, Any]:
         "schema_cache": schema_cache_status,
         "metrics": metrics_status,
         "rate_limiter": rate_limiter_status,
+        "circuit_breakers": circuit_breakers_status,
     }
 
 
+def _client_id(ctx: Context | None) -> str | None:
+    """Identify the client of a tool call for fair scheduling.
+
+    Uses the client ID sent in the request metadata, falling back to the MCP
+    session so that each connected session is scheduled as its own client.
+    """
+    if ctx is None:
+        return None
+    try:
+        return ctx.client_id or f"session-{id(ctx.session):x}"
+    except ValueError:
+        # Context outside of a request
+        return None
+
+
 @mcp.tool()
 async def query(
     question: str,
     database: str | None = None,
     return_type: str = "result",
+    result_format: str = "rows",
+    ctx: Context | None = None,
 ) -> dict[str, Any]:
     """Execute a natural language query against PostgreSQL database.
 
@@ -359,6 +470,18 @@ async def query(
                 - "sql": Return only the generated SQL query without executing it
                 - "result": Execute the query and return results (default)
 
+        result_format: Format of the result data when return_type is "result".
+            Options:
+                - "rows": One object per row (default)
+                - "columnar": Column names once plus one value array per column
+                  in "data", avoiding repeated column names on large results
+                - "arrow_ipc_base64": Base64 encoded Arrow IPC stream in
+                  "arrow_ipc_base64", for loading straight into dataframes
+                  (requires pyarrow on the server)
+
+        ctx: MCP request context, injected by the server; identifies the
+            client for fair scheduling.
+
     Returns:
         dict: Query response containing:
             - success (bool): Whether the query succeeded
@@ -366,6 +489,9 @@ async def query(
             - data (dict): Query results if executed (columns, rows, row_count, etc.)
             - error (dict): Error information if query failed
             - confidence (int): Confidence score (0-100) for result quality
+            - confidence_pending (bool): Whether results are still being
+              validated in the background (see get_result_validation)
+            - request_id (str): ID for follow-up calls such as get_result_validation
             - tokens_used (int): Number of LLM tokens consumed
 
     Examples:
@@ -412,6 +538,7 @@ async def query(
             "question_length": len(question),
             "database": database,
             "return_type": return_type,
+            "result_format": result_format,
         },
     )
 
@@ -441,12 +568,40 @@ async def query(
             },
         }
 
+    # Validate result_format
+    valid_formats = [f.value for f in ResultFormat]
+    if result_format not in valid_formats:
+        logger.warning(
+            "Invalid result_format provided",
+            extra={"request_id": request_id, "result_format": result_format},
+        )
+        return {
+            "success": False,
+            "error": {
+                "code": "INVALID_PARAMETER",
+                "message": f"Invalid result_format: '{result_format}'. "
+                f"Must be one of: {', '.join(valid_formats)}.",
+                "details": {"result_format": result_format},
+            },
+        }
+    if result_format == ResultFormat.ARROW_IPC_BASE64 and find_spec("pyarrow") is None:
+        return {
+            "success": False,
+            "error": {
+                "code": "INVALID_PARAMETER",
+                "message": "result_format 'arrow_ipc_base64' requires pyarrow on the server "
+                "(install pg-mcp[arrow]).",
+                "details": {"result_format": result_format},
+            },
+        }
+
     # Build request
     try:
         request = QueryRequest(
             question=question,
             database=database,
             return_type=ReturnType(return_type),
+            client_id=_client_id(ctx),
         )
     except Exception as e:
         return {
@@ -477,7 +632,7 @@ async def query(
             },
         )
 
-        result = response.to_dict()
+        result = response.to_dict(ResultFormat(result_format))
         # Ensure tokens_used is always present
         if "tokens_used" not in result:
             result["tokens_used"] = 0
@@ -499,6 +654,46 @@ async def query(
         }
 
 
+@mcp.tool()
+async def get_result_validation(request_id: str) -> dict[str, Any]:
+    """Get the confidence of query results validated in the background.
+
+    With background validation enabled (VALIDATION_BACKGROUND=true), the query
+    tool returns results immediately with confidence_pending set, and the
+    results are checked by the LLM afterwards.
+
+    Args:
+        request_id: The request_id returned by the query tool.
+
+    Returns:
+        dict: Validation state containing:
+            - request_id (str): The requested ID
+            - status (str): "pending", "complete" or "unknown" (never started,
+              not a background validation, or expired)
+            - confidence (int): Confidence score (0-100), once complete
+            - is_acceptable (bool): Whether the confidence meets the
+              configured threshold, once complete
+
+    Example:
+        >>> state = await get_result_validation("7d8e...")
+        >>> print(state["status"], state.get("confidence"))
+    """
+    if _orchestrator is None:
+        return {
+            "success": False,
+            "error": {
+                "code": "SERVER_NOT_INITIALIZED",
+                "message": "Server not initialized properly",
+                "details": None,
+            },
+        }
+
+    state = _orchestrator.get_result_validation(request_id)
+    if state is None:
+        return {"request_id": request_id, "status": "unknown"}
+    return state
+
+
 if __name__ == "__main__":
     """Run the server when executed directly."""
     import anyio
@@ -5,20 +5,26 @@ of the query processing pipeline: SQL generation, validation, execution, and res
 validation. It implements retry logic, error handling, and request tracking.
 """
 
+import asyncio
 import logging
 import uuid
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any
 
 from asyncpg import Pool
 
+from pg_mcp.cache.query_cache import LRUCache, QueryCache
 from pg_mcp.cache.schema_cache import SchemaCache
 from pg_mcp.config.settings import ResilienceConfig, ValidationConfig
 from pg_mcp.observability.metrics import MetricsCollector
 from pg_mcp.models.errors import (
+    DatabaseConnectionError,
     DatabaseError,
     ErrorCode,
     LLMError,
     PgMcpError,
+    QueryCostExceededError,
     RateLimitExceededError,
     SchemaLoadError,
     SecurityViolationError,
@@ -31,17 +37,32 @@ from pg_mcp.models.query import (
     QueryResponse,
     QueryResult,
     ReturnType,
+    TokenUsage,
     ValidationResult,
 )
-from pg_mcp.resilience.circuit_breaker import CircuitBreaker
+from pg_mcp.resilience.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    CircuitState,
+)
+from pg_mcp.resilience.fair_queue import Flow, reset_current_flow, set_current_flow
 from pg_mcp.resilience.rate_limiter import MultiRateLimiter
 from pg_mcp.services.result_validator import ResultValidator
 from pg_mcp.services.sql_executor import SQLExecutor
 from pg_mcp.services.sql_generator import SQLGenerator
 from pg_mcp.services.sql_validator import SQLValidator
+from pg_mcp.services.validation_executor import ValidationExecutor
 
 logger = logging.getLogger(__name__)
 
+# Rejections of generated SQL that are fed back to the LLM on retry
+_CandidateError = SecurityViolationError | SQLParseError | QueryCostExceededError
+
+# SQLSTATE prefixes of errors caused by the database server rather than the query:
+# connection exceptions, insufficient resources, shutdown and recovery (57P0x, but
+# not query_canceled 57014 from statement timeouts), system and internal errors
+_DATABASE_FAILURE_SQLSTATES = ("08", "53", "57P0", "58", "XX")
+
 
 class QueryOrchestrator:
     """Orchestrates the complete query processing pipeline.
@@ -79,6 +100,9 @@ class QueryOrchestrator:
         validation_config: ValidationConfig,
         rate_limiter: MultiRateLimiter | None = None,
         metrics: MetricsCollector | None = None,
+        query_cache: QueryCache | None = None,
+        validation_executor: ValidationExecutor | None = None,
+        circuit_breakers: CircuitBreakerRegistry | None = None,
     ) -> None:
         """Initialize query orchestrator.
 
@@ -93,6 +117,13 @@ class QueryOrchestrator:
             validation_config: Validation configuration including thresholds.
             rate_limiter: Optional rate limiter for controlling concurrent operations.
             metrics: Optional metrics collector for observability.
+            query_cache: Optional question→SQL and SQL→result cache. Cache hits
+                bypass the circuit breaker, rate limiter, LLM and database.
+            validation_executor: Optional thread or process pool that SQL
+                validation runs on instead of the event loop.
+            circuit_breakers: Optional circuit breakers per dependency (LLM
+                generation, LLM result validation and each database); created
+                from resilience_config if not given.
         """
         self.sql_generator = sql_generator
         self.sql_validator = sql_validator
@@ -104,12 +135,29 @@ class QueryOrchestrator:
         self.validation_config = validation_config
         self.rate_limiter = rate_limiter
         self.metrics = metrics or MetricsCollector()
+        self.query_cache = query_cache
+        self.validation_executor = validation_executor
 
-        # Create circuit breaker for LLM calls
-        self.circuit_breaker = CircuitBreaker(
-            failure_threshold=resilience_config.circuit_breaker_threshold,
-            recovery_timeout=resilience_config.circuit_breaker_timeout,
+        # Background result validations by request ID; running ones are also kept
+        # in a set so that eviction from the cache cannot drop them mid-flight
+        self._background_validations: LRUCache[str, asyncio.Task[int]] = LRUCache(
+            validation_config.background_max_results
         )
+        self._running_validations: set[asyncio.Task[int]] = set()
+
+        # Circuit breakers isolating the LLM operations and each database
+        self.circuit_breakers = circuit_breakers or CircuitBreakerRegistry.from_config(
+            resilience_config, metrics=self.metrics
+        )
+
+    @property
+    def circuit_breaker(self) -> CircuitBreaker:
+        """Get the circuit breaker of LLM SQL generation.
+
+        Returns:
+            CircuitBreaker: Breaker of the "llm_generation" dependency.
+        """
+        return self.circuit_breakers.get(CircuitBreakerRegistry.LLM_GENERATION)
 
     async def execute_query(self, request: QueryRequest) -> QueryResponse:
         """Execute complete query flow from question to results.
@@ -118,8 +166,8 @@ class QueryOrchestrator:
         1. Generate request_id for tracking
         2. Resolve and validate database name
         3. Load schema from cache
-        4. Generate and validate SQL with retry logic
-        5. Execute SQL (if return_type == RESULT)
+        4. Generate and validate SQL with retry logic (or reuse cached SQL)
+        5. Execute SQL (if return_type == RESULT, unless the result is cached)
         6. Validate results (optional)
         7. Return structured response
 
@@ -145,6 +193,9 @@ class QueryOrchestrator:
 
         # Start query duration timer
         query_start_time = self._get_current_time_ms()
+        flow_token = None
+        # Token usage of every LLM call made for the request, including failed ones
+        usage = TokenUsage()
 
         try:
             # Step 0: Validate question length
@@ -164,6 +215,18 @@ class QueryOrchestrator:
                 "Resolved database",
                 extra={"request_id": request_id, "database": database_name},
             )
+            # Schedule rate-limited work fairly across clients and databases
+            flow_token = set_current_flow(
+                Flow(
+                    client=request.client_id or "",
+                    database=database_name,
+                    priority=request.return_type.value,
+                )
+            )
+
+            database_breaker = self.circuit_breakers.get(
+                CircuitBreakerRegistry.database(database_name)
+            )
 
             # Step 2: Get schema from cache
             schema = self.schema_cache.get(database_name)
@@ -175,9 +238,13 @@ class QueryOrchestrator:
                         message=f"No connection pool available for database '{database_name}'",
                         details={"database": database_name},
                     )
+                if not database_breaker.allow_request():
+                    raise self._database_unavailable(database_name, database_breaker)
                 try:
                     schema = await self.schema_cache.load(database_name, pool)
+                    database_breaker.record_success()
                 except Exception as e:
+                    database_breaker.record_failure()
                     raise SchemaLoadError(
                         message=f"Failed to load schema for database '{database_name}': {e!s}",
                         details={"database": database_name, "error": str(e)},
@@ -192,12 +259,36 @@ class QueryOrchestrator:
                 },
             )
 
-            # Step 3: Generate and validate SQL with retry logic
-            generated_sql, validation_result, tokens_used = await self._generate_sql_with_retry(
-                question=request.question,
-                schema=schema,
-                request_id=request_id,
+            # Step 3: Generate and validate SQL with retry logic, unless the same
+            # question was already answered against the same schema
+            cached_sql = (
+                self.query_cache.get_sql(database_name, schema, request.question)
+                if self.query_cache is not None
+                else None
             )
+            if cached_sql is not None:
+                generated_sql = cached_sql.sql
+                validation_result = cached_sql.validation
+                logger.info("Using cached SQL for question", extra={"request_id": request_id})
+            else:
+                # Fail fast, before any LLM work, if the database is known to be
+                # down; cached SQL goes on to the result cache instead
+                if (
+                    request.return_type == ReturnType.RESULT
+                    and database_breaker.state == CircuitState.OPEN
+                ):
+                    raise self._database_unavailable(database_name, database_breaker)
+                generated_sql, validation_result, _ = await self._generate_sql_with_retry(
+                    question=request.question,
+                    schema=schema,
+                    request_id=request_id,
+                    sql_executor=self.sql_executors.get(database_name),
+                    usage=usage,
+                )
+                if self.query_cache is not None:
+                    self.query_cache.put_sql(
+                        database_name, schema, request.question, generated_sql, validation_result
+                    )
 
             # Step 4: If return_type is SQL, return early
             if request.return_type == ReturnType.SQL:
@@ -221,10 +312,32 @@ class QueryOrchestrator:
                     data=None,
                     error=None,
                     confidence=sql_confidence,
-                    tokens_used=tokens_used,
+                    tokens_used=usage.total_tokens or None,
+                    request_id=request_id,
+                )
+
+            # Step 5: Execute SQL, or serve a cached result of the same SQL
+            cached_result = (
+                self.query_cache.get_result(database_name, generated_sql)
+                if self.query_cache is not None
+                else None
+            )
+            if cached_result is not None:
+                logger.info("Using cached query result", extra={"request_id": request_id})
+                query_duration_s = (self._get_current_time_ms() - query_start_time) / 1000.0
+                self.metrics.query_requests.labels(status="success", database=database_name).inc()
+                self.metrics.query_duration.observe(query_duration_s)
+                return QueryResponse(
+                    success=True,
+                    generated_sql=generated_sql,
+                    validation=validation_result,
+                    data=cached_result.result,
+                    error=None,
+                    confidence=cached_result.confidence,
+                    tokens_used=usage.total_tokens or None,
+                    request_id=request_id,
                 )
 
-            # Step 5: Execute SQL
             logger.debug("Executing SQL", extra={"request_id": request_id})
             start_time = self._get_current_time_ms()
 
@@ -240,14 +353,18 @@ class QueryOrchestrator:
             if self.rate_limiter is not None:
                 try:
                     async with self.rate_limiter.for_queries(timeout=30.0):
-                        results, total_count = await executor.execute(generated_sql)
+                        results, total_count = await self._execute_guarded(
+                            executor, generated_sql, database_name
+                        )
                 except TimeoutError as e:
                     raise RateLimitExceededError(
                         message="Database query rate limit exceeded, too many concurrent queries",
                         details={"timeout": 30.0},
                     ) from e
             else:
-                results, total_count = await executor.execute(generated_sql)
+                results, total_count = await self._execute_guarded(
+                    executor, generated_sql, database_name
+                )
 
             execution_time_ms = self._get_current_time_ms() - start_time
             logger.info(
@@ -259,16 +376,6 @@ class QueryOrchestrator:
                 },
             )
 
-            # Step 6: Validate results (non-blocking, failures don't fail the request)
-            result_confidence = await self._validate_results_safely(
-                question=request.question,
-                sql=generated_sql,
-                results=results,
-                row_count=total_count,
-                request_id=request_id,
-            )
-
-            # Step 7: Build successful response
             query_result = QueryResult(
                 columns=list(results[0].keys()) if results else [],
                 rows=results,
@@ -276,6 +383,39 @@ class QueryOrchestrator:
                 execution_time_ms=execution_time_ms,
             )
 
+            # Step 6: Validate results (non-blocking, failures don't fail the request),
+            # unless validation is deferred to the background or skipped
+            confidence_pending = False
+            if self._can_skip_result_validation(generated_sql, total_count):
+                result_confidence = 100
+            elif self.validation_config.enabled and self.validation_config.background:
+                confidence_pending = True
+                result_confidence = self.validation_config.confidence_threshold
+                self._start_background_validation(
+                    request_id=request_id,
+                    database=database_name,
+                    question=request.question,
+                    sql=generated_sql,
+                    query_result=query_result,
+                    row_count=total_count,
+                )
+            else:
+                result_confidence = await self._validate_results_safely(
+                    question=request.question,
+                    sql=generated_sql,
+                    results=results,
+                    row_count=total_count,
+                    request_id=request_id,
+                    usage=usage,
+                )
+
+            # Step 7: Build successful response (background validations cache
+            # the result once its confidence is known)
+            if self.query_cache is not None and not confidence_pending:
+                self.query_cache.put_result(
+                    database_name, generated_sql, query_result, result_confidence
+                )
+
             # Record successful query metrics
             query_duration_s = (self._get_current_time_ms() - query_start_time) / 1000.0
             self.metrics.query_requests.labels(status="success", database=database_name).inc()
@@ -288,7 +428,9 @@ class QueryOrchestrator:
                 data=query_result,
                 error=None,
                 confidence=result_confidence,
-                tokens_used=tokens_used,
+                tokens_used=usage.total_tokens or None,
+                request_id=request_id,
+                confidence_pending=confidence_pending,
             )
 
         except PgMcpError as e:
@@ -309,7 +451,7 @@ class QueryOrchestrator:
             self.metrics.query_duration.observe(query_duration_s)
 
             # Record security violations specifically
-            if isinstance(e, (SecurityViolationError, SQLParseError)):
+            if isinstance(e, (SecurityViolationError, SQLParseError, QueryCostExceededError)):
                 self.metrics.sql_rejected.labels(reason=e.code.value).inc()
 
             return QueryResponse(
@@ -323,7 +465,8 @@ class QueryOrchestrator:
                     details=e.details,
                 ),
                 confidence=0,
-                tokens_used=None,
+                tokens_used=usage.total_tokens or None,
+                request_id=request_id,
             )
         except Exception as e:
             # Handle unexpected errors
@@ -352,8 +495,14 @@ class QueryOrchestrator:
                     details={"error_type": type(e).__name__},
                 ),
                 confidence=0,
-                tokens_used=None,
+                tokens_used=usage.total_tokens or None,
+                request_id=request_id,
             )
+        finally:
+            if flow_token is not None:
+                reset_current_flow(flow_token)
+            if usage.prompt_tokens:
+                self.metrics.observe_llm_prompt_tokens(usage.prompt_tokens)
 
     def _resolve_database(self, database: str | None) -> str:
         """Resolve database name from request or auto-select.
@@ -402,18 +551,83 @@ class QueryOrchestrator:
             details={"available_databases": available_dbs},
         )
 
+    async def _execute_guarded(
+        self, executor: SQLExecutor, sql: str, database: str
+    ) -> tuple[list[dict[str, Any]], int | None]:
+        """Execute SQL under the circuit breaker of the database.
+
+        Only errors of the database server itself (connection problems,
+        resource exhaustion, shutdown, ...) count as failures; errors caused
+        by the query, including its timeout, show that the database is
+        responding.
+
+        Args:
+            executor: Executor of the database.
+            sql: SQL to execute.
+            database: Database name.
+
+        Returns:
+            tuple: (results, total_count) as returned by the executor.
+
+        Raises:
+            DatabaseConnectionError: If the database's circuit breaker is open.
+        """
+        breaker = self.circuit_breakers.get(CircuitBreakerRegistry.database(database))
+        if not breaker.allow_request():
+            raise self._database_unavailable(database, breaker)
+
+        try:
+            results = await executor.execute(sql)
+        except Exception as e:
+            if self._is_database_failure(e):
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+            raise
+        breaker.record_success()
+        return results
+
+    @staticmethod
+    def _is_database_failure(error: Exception) -> bool:
+        """Check whether an execution error indicates an unhealthy database.
+
+        Timeouts of slow queries and client-side errors without a SQLSTATE
+        say nothing about the server and are not counted.
+        """
+        if isinstance(error, DatabaseConnectionError):
+            return True
+        if isinstance(error, DatabaseError):
+            sqlstate = error.details.get("error_code")
+            return sqlstate is not None and str(sqlstate).startswith(_DATABASE_FAILURE_SQLSTATES)
+        return False
+
+    @staticmethod
+    def _database_unavailable(database: str, breaker: CircuitBreaker) -> DatabaseConnectionError:
+        """Build the error for a database whose circuit breaker is open."""
+        return DatabaseConnectionError(
+            message=f"Database '{database}' is temporarily unavailable (circuit breaker open)",
+            details={
+                "database": database,
+                "circuit_state": breaker.state,
+                "failure_count": breaker.failure_count,
+            },
+        )
+
     async def _generate_sql_with_retry(
         self,
         question: str,
         schema: Any,
         request_id: str,
+        sql_executor: SQLExecutor | None = None,
+        usage: TokenUsage | None = None,
     ) -> tuple[str, ValidationResult, int | None]:
         """Generate and validate SQL with retry logic on validation failures.
 
         This method implements a retry loop that:
         1. Checks circuit breaker state
-        2. Generates SQL using LLM
-        3. Validates the generated SQL
+        2. Generates SQL using LLM (several candidates concurrently in
+           speculative mode, keeping the first that passes)
+        3. Validates the generated SQL (and plans it with EXPLAIN if enabled)
         4. On validation failure, retries with error feedback
         5. Records success/failure to circuit breaker
 
@@ -421,14 +635,26 @@ class QueryOrchestrator:
             question: User's natural language question.
             schema: Database schema for context.
             request_id: Request ID for tracking.
+            sql_executor: Executor of the target database, used for the
+                optional EXPLAIN dry run.
+            usage: Optional accumulator the reported token usage is added to,
+                also when generation fails.
 
         Returns:
-            tuple: (generated_sql, validation_result, tokens_used)
+            tuple: (generated_sql, validation_result, tokens_used), where
+                tokens_used is the total of usage, summed over all attempts
+                and candidates (None if no usage was reported).
 
         Raises:
             LLMError: If circuit breaker is open or generation fails.
             SecurityViolationError: If SQL fails validation after all retries.
             SQLParseError: If SQL cannot be parsed.
+            QueryCostExceededError: If SQL exceeds the plan cost limits after
+                all retries.
+            DatabaseError: If the EXPLAIN dry run fails for reasons other
+                than the SQL itself.
+            ExecutionTimeoutError: If the EXPLAIN dry run times out.
+            RateLimitExceededError: If no LLM capacity becomes available in time.
 
         Example:
             >>> sql, validation, tokens = await orchestrator._generate_sql_with_retry(
@@ -450,7 +676,9 @@ class QueryOrchestrator:
         previous_sql: str | None = None
         error_feedback: str | None = None
         max_retries = self.resilience_config.max_retries
-        tokens_used: int | None = None
+        # Token usage of every generation call, including rejected candidates
+        if usage is None:
+            usage = TokenUsage()
 
         for attempt in range(max_retries + 1):
             try:
@@ -460,63 +688,30 @@ class QueryOrchestrator:
                         "request_id": request_id,
                         "attempt": attempt + 1,
                         "max_retries": max_retries + 1,
+                        "candidates": self.resilience_config.speculative_candidates,
                     },
                 )
 
-                # Generate SQL with rate limiting and metrics
-                llm_start_time = self._get_current_time_ms()
-                self.metrics.llm_calls.labels(operation="sql_generation").inc()
-
-                if self.rate_limiter is not None:
-                    try:
-                        async with self.rate_limiter.for_llm(timeout=60.0):
-                            generated_sql = await self.sql_generator.generate(
-                                question=question,
-                                schema=schema,
-                                previous_attempt=previous_sql,
-                                error_feedback=error_feedback,
-                            )
-                    except TimeoutError as e:
-                        raise RateLimitExceededError(
-                            message="LLM rate limit exceeded, too many concurrent requests",
-                            details={"timeout": 60.0},
-                        ) from e
+                if self.resilience_config.speculative_candidates > 1:
+                    generated_sql, validation_error = await self._generate_speculatively(
+                        question=question,
+                        schema=schema,
+                        previous_sql=previous_sql,
+                        error_feedback=error_feedback,
+                        sql_executor=sql_executor,
+                        usage=usage,
+                    )
                 else:
-                    generated_sql = await self.sql_generator.generate(
+                    generated_sql = await self._generate_candidate(
                         question=question,
                         schema=schema,
-                        previous_attempt=previous_sql,
+                        previous_sql=previous_sql,
                         error_feedback=error_feedback,
+                        usage=usage,
                     )
+                    validation_error = await self._check_candidate(generated_sql, sql_executor)
 
-                # Record LLM latency
-                llm_duration_s = (self._get_current_time_ms() - llm_start_time) / 1000.0
-                self.metrics.llm_latency.labels(operation="sql_generation").observe(llm_duration_s)
-
-                # Note: tokens_used would come from OpenAI response metadata if available
-                # For now, we don't extract it, but it can be added later
-
-                logger.debug(
-                    "SQL generated",
-                    extra={
-                        "request_id": request_id,
-                        "sql_length": len(generated_sql),
-                    },
-                )
-
-                # Validate SQL using validate_or_raise (maintains existing test compatibility)
-                try:
-                    self.sql_validator.validate_or_raise(generated_sql)
-
-                    # Build validation result - if we got here, validation passed
-                    actual_validation_result = ValidationResult(
-                        is_valid=True,
-                        is_select=True,  # validate_or_raise ensures only SELECT allowed
-                        allows_data_modification=False,
-                        uses_blocked_functions=[],
-                        error_message=None,
-                    )
-                except (SecurityViolationError, SQLParseError) as validation_error:
+                if validation_error is not None:
                     if attempt < max_retries:
                         # Record as failure and retry with feedback
                         logger.warning(
@@ -541,7 +736,16 @@ class QueryOrchestrator:
                                 "error": str(validation_error),
                             },
                         )
-                        raise
+                        raise validation_error
+
+                # Build validation result - if we got here, validation passed
+                actual_validation_result = ValidationResult(
+                    is_valid=True,
+                    is_select=True,  # validate_or_raise ensures only SELECT allowed
+                    allows_data_modification=False,
+                    uses_blocked_functions=[],
+                    error_message=None,
+                )
 
                 # Validation successful
                 self.circuit_breaker.record_success()
@@ -557,10 +761,15 @@ class QueryOrchestrator:
                 )
 
                 # Return actual validation result instead of hardcoded values
-                return generated_sql, actual_validation_result, tokens_used
+                return generated_sql, actual_validation_result, usage.total_tokens or None
 
-            except (LLMError, SecurityViolationError, SQLParseError):
-                # Re-raise known errors
+            except LLMError:
+                # LLM API errors, including timeouts and unavailability
+                self.circuit_breaker.record_failure()
+                raise
+            except PgMcpError:
+                # Re-raise other known errors; rate limits and failures of the EXPLAIN
+                # dry run are not the LLM's fault
                 raise
             except Exception as e:
                 # Unexpected error during generation
@@ -581,13 +790,225 @@ class QueryOrchestrator:
             details={"max_retries": max_retries},
         )
 
+    async def _generate_candidate(
+        self,
+        question: str,
+        schema: Any,
+        previous_sql: str | None,
+        error_feedback: str | None,
+        temperature: float | None = None,
+        usage: TokenUsage | None = None,
+    ) -> str:
+        """Generate one SQL candidate under the LLM rate limiter.
+
+        Args:
+            question: User's natural language question.
+            schema: Database schema for context.
+            previous_sql: SQL of the previous failed attempt, if any.
+            error_feedback: Error of the previous failed attempt, if any.
+            temperature: Sampling temperature (uses the generator's default if None).
+            usage: Optional accumulator the reported token usage is added to.
+
+        Returns:
+            str: Generated SQL.
+
+        Raises:
+            RateLimitExceededError: If no LLM slot becomes available in time.
+            LLMError: If generation fails.
+        """
+        # Generate SQL with rate limiting and metrics
+        llm_start_time = self._get_current_time_ms()
+        self.metrics.llm_calls.labels(operation="sql_generation").inc()
+
+        call_usage = TokenUsage()
+        try:
+            async with self._llm_capacity(call_usage):
+                generated_sql = await self.sql_generator.generate(
+                    question=question,
+                    schema=schema,
+                    previous_attempt=previous_sql,
+                    error_feedback=error_feedback,
+                    temperature=temperature,
+                    usage=call_usage,
+                )
+        finally:
+            # Tokens are spent even if no usable SQL came back
+            self._record_llm_usage("sql_generation", call_usage, usage)
+
+        # Record LLM latency
+        llm_duration_s = (self._get_current_time_ms() - llm_start_time) / 1000.0
+        self.metrics.llm_latency.labels(operation="sql_generation").observe(llm_duration_s)
+
+        logger.debug("SQL generated", extra={"sql_length": len(generated_sql)})
+        return generated_sql
+
+    async def _check_candidate(
+        self, sql: str, sql_executor: SQLExecutor | None
+    ) -> _CandidateError | None:
+        """Validate a SQL candidate and optionally plan it with EXPLAIN.
+
+        The plan is checked against the cost gate (``max_plan_cost`` and
+        ``max_plan_rows``) when one is configured.
+
+        Args:
+            sql: Generated SQL.
+            sql_executor: Executor of the target database, used for the EXPLAIN
+                dry run and cost gate when enabled.
+
+        Returns:
+            _CandidateError | None: Error to feed back to the LLM, or None if
+                the candidate is acceptable.
+
+        Raises:
+            DatabaseError: If the EXPLAIN dry run fails for reasons other than
+                the SQL itself (e.g. connection problems).
+        """
+        # Validate SQL using validate_or_raise (maintains existing test compatibility)
+        try:
+            if self.validation_executor is not None:
+                await self.validation_executor.validate_or_raise(sql)
+            else:
+                self.sql_validator.validate_or_raise(sql)
+        except (SecurityViolationError, SQLParseError) as validation_error:
+            return validation_error
+
+        config = self.resilience_config
+        cost_gate = config.max_plan_cost > 0 or config.max_plan_rows > 0
+        if (config.explain_dry_run or cost_gate) and sql_executor is not None:
+            try:
+                plan = await sql_executor.explain(sql)
+            except DatabaseError as e:
+                # Syntax errors, unknown relations or columns, missing privileges
+                if not str(e.details.get("error_code") or "").startswith("42"):
+                    raise
+                return SQLParseError(
+                    message=f"SQL failed EXPLAIN dry run: {e.details.get('error_message', e)}",
+                    details=e.details,
+                )
+            if cost_gate:
+                return self._check_plan_cost(plan)
+
+        return None
+
+    def _check_plan_cost(self, plan: dict[str, Any]) -> QueryCostExceededError | None:
+        """Compare the planner's estimates of a query with the configured limits.
+
+        Args:
+            plan: Top-level plan node of ``EXPLAIN (FORMAT JSON)``.
+
+        Returns:
+            QueryCostExceededError | None: Error with guidance for the LLM, or
+                None if the query is within the limits.
+        """
+        cost = float(plan.get("Total Cost", 0.0))
+        rows = float(plan.get("Plan Rows", 0.0))
+        max_cost = self.resilience_config.max_plan_cost
+        max_rows = self.resilience_config.max_plan_rows
+
+        exceeded = []
+        if max_cost > 0 and cost > max_cost:
+            exceeded.append(f"estimated cost {cost:.0f} exceeds the limit of {max_cost:.0f}")
+        if max_rows > 0 and rows > max_rows:
+            exceeded.append(f"estimated {rows:.0f} rows exceed the limit of {max_rows:.0f}")
+        if not exceeded:
+            return None
+
+        return QueryCostExceededError(
+            message=(
+                f"Query is too expensive: {'; '.join(exceeded)}. Avoid cross joins, join on "
+                "keys, add selective filters or aggregate instead of returning raw rows."
+            ),
+            details={
+                "estimated_cost": cost,
+                "estimated_rows": rows,
+                "max_plan_cost": max_cost,
+                "max_plan_rows": max_rows,
+            },
+        )
+
+    async def _generate_speculatively(
+        self,
+        question: str,
+        schema: Any,
+        previous_sql: str | None,
+        error_feedback: str | None,
+        sql_executor: SQLExecutor | None,
+        usage: TokenUsage | None = None,
+    ) -> tuple[str, _CandidateError | None]:
+        """Generate several SQL candidates concurrently and keep the first acceptable one.
+
+        Candidates are sampled at increasing temperatures, starting at the
+        generator's configured temperature. As soon as one passes validation
+        (and the EXPLAIN dry run, if enabled), the others are cancelled.
+
+        Args:
+            question: User's natural language question.
+            schema: Database schema for context.
+            previous_sql: SQL of the previous failed attempt, if any.
+            error_feedback: Error of the previous failed attempt, if any.
+            sql_executor: Executor of the target database for the EXPLAIN dry run.
+            usage: Optional accumulator the token usage of all candidates is
+                added to.
+
+        Returns:
+            tuple: (sql, validation_error), the winning candidate with None, or,
+                if every candidate was rejected, the first rejected candidate
+                with its error as feedback for the next attempt.
+
+        Raises:
+            Exception: The first generation error if no candidate could be
+                generated and checked at all.
+        """
+        base_temperature = self.sql_generator.config.temperature
+        step = self.resilience_config.speculative_temperature_step
+
+        async def candidate(
+            temperature: float,
+        ) -> tuple[str, _CandidateError | None]:
+            sql = await self._generate_candidate(
+                question=question,
+                schema=schema,
+                previous_sql=previous_sql,
+                error_feedback=error_feedback,
+                temperature=temperature,
+                usage=usage,
+            )
+            return sql, await self._check_candidate(sql, sql_executor)
+
+        tasks = [
+            asyncio.create_task(candidate(min(base_temperature + i * step, 2.0)))
+            for i in range(self.resilience_config.speculative_candidates)
+        ]
+        rejected: tuple[str, _CandidateError] | None = None
+        failures: list[Exception] = []
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    sql, validation_error = await next_done
+                except Exception as e:
+                    failures.append(e)
+                    continue
+                if validation_error is None:
+                    return sql, None
+                rejected = rejected or (sql, validation_error)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        if rejected is None:
+            # Every candidate failed before it could be checked
+            raise failures[0]
+        return rejected
+
     async def _validate_results_safely(
         self,
         question: str,
         sql: str,
         results: list[dict[str, Any]],
-        row_count: int,
+        row_count: int | None,
         request_id: str,
+        usage: TokenUsage | None = None,
     ) -> int:
         """Validate query results with error handling (non-blocking).
 
@@ -598,8 +1019,10 @@ class QueryOrchestrator:
             question: User's original question.
             sql: Generated SQL query.
             results: Query results.
-            row_count: Total row count.
+            row_count: Total row count, or None if the result was truncated
+                without counting the remaining rows.
             request_id: Request ID for tracking.
+            usage: Optional accumulator the reported token usage is added to.
 
         Returns:
             int: Confidence score (0-100). Returns 100 if validation disabled/fails.
@@ -616,6 +1039,17 @@ class QueryOrchestrator:
         if not self.validation_config.enabled:
             return 100
 
+        breaker = self.circuit_breakers.get(CircuitBreakerRegistry.LLM_VALIDATION)
+        if not breaker.allow_request():
+            logger.warning(
+                "Result validation skipped, circuit breaker open",
+                extra={
+                    "request_id": request_id,
+                    "default_confidence": self.validation_config.confidence_threshold,
+                },
+            )
+            return self.validation_config.confidence_threshold
+
         try:
             logger.debug(
                 "Validating results",
@@ -626,12 +1060,23 @@ class QueryOrchestrator:
             self.metrics.llm_calls.labels(operation="result_validation").inc()
             validation_start_time = self._get_current_time_ms()
 
-            validation_result = await self.result_validator.validate(
-                question=question,
-                sql=sql,
-                results=results,
-                row_count=row_count,
-            )
+            call_usage = TokenUsage()
+            try:
+                async with self._llm_capacity(call_usage):
+                    try:
+                        validation_result = await self.result_validator.validate(
+                            question=question,
+                            sql=sql,
+                            results=results,
+                            row_count=row_count,
+                            usage=call_usage,
+                        )
+                    except Exception:
+                        breaker.record_failure()
+                        raise
+            finally:
+                self._record_llm_usage("result_validation", call_usage, usage)
+            breaker.record_success()
 
             # Record validation LLM latency
             validation_duration_s = (self._get_current_time_ms() - validation_start_time) / 1000.0
@@ -675,6 +1120,139 @@ class QueryOrchestrator:
             # This ensures we don't falsely report high confidence
             return self.validation_config.confidence_threshold
 
+    @asynccontextmanager
+    async def _llm_capacity(self, call_usage: TokenUsage) -> AsyncIterator[None]:
+        """Hold LLM rate limiter capacity for one call.
+
+        The token quota is settled with the usage the API reported for the
+        call, also when the call fails after the API responded; only calls
+        without reported usage get their reserved tokens refunded.
+
+        Args:
+            call_usage: Usage the call reports into.
+
+        Raises:
+            RateLimitExceededError: If no LLM capacity becomes available in time.
+        """
+        if self.rate_limiter is None:
+            yield
+            return
+
+        try:
+            async with self.rate_limiter.for_llm(timeout=60.0) as reservation:
+                try:
+                    yield
+                finally:
+                    if call_usage.total_tokens:
+                        reservation.record(call_usage.total_tokens)
+        except TimeoutError as e:
+            raise RateLimitExceededError(
+                message="LLM rate limit exceeded, no capacity became available in time",
+                details={"timeout": 60.0},
+            ) from e
+
+    def _record_llm_usage(
+        self, operation: str, call_usage: TokenUsage, usage: TokenUsage | None
+    ) -> None:
+        """Report the token usage of one LLM call and add it to a request's total.
+
+        Args:
+            operation: LLM operation ("sql_generation" or "result_validation").
+            call_usage: Usage the API reported for the call.
+            usage: Optional accumulator of the request's usage.
+        """
+        if not call_usage.total_tokens:
+            return
+
+        self.metrics.increment_llm_tokens(operation, call_usage.total_tokens)
+        if usage is not None:
+            usage.add(call_usage.prompt_tokens, call_usage.completion_tokens)
+
+    def get_result_validation(self, request_id: str) -> dict[str, Any] | None:
+        """Get the state of a background result validation.
+
+        Args:
+            request_id: Request ID returned with the query response.
+
+        Returns:
+            dict | None: ``{"request_id", "status": "pending"}`` while running,
+                ``{"request_id", "status": "complete", "confidence",
+                "is_acceptable"}`` once finished, or None if the request ID is
+                unknown or expired.
+
+        Example:
+            >>> state = orchestrator.get_result_validation(response.request_id)
+            >>> if state and state["status"] == "complete":
+            ...     print(state["confidence"])
+        """
+        task = self._background_validations.get(request_id)
+        if task is None:
+            return None
+        if not task.done():
+            return {"request_id": request_id, "status": "pending"}
+
+        confidence = task.result()
+        return {
+            "request_id": request_id,
+            "status": "complete",
+            "confidence": confidence,
+            "is_acceptable": confidence >= self.validation_config.confidence_threshold,
+        }
+
+    async def close(self) -> None:
+        """Cancel background result validations that are still running."""
+        tasks = list(self._running_validations)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _can_skip_result_validation(self, sql: str, row_count: int | None) -> bool:
+        """Check whether a result is simple enough to skip LLM validation.
+
+        Single-row results of aggregate queries without GROUP BY (counts,
+        sums, ...) leave little room for a mismatch the validator could catch.
+        """
+        return (
+            self.validation_config.enabled
+            and self.validation_config.skip_scalar_aggregates
+            and row_count is not None
+            and row_count <= 1
+            and self.sql_validator.is_scalar_aggregate(sql)
+        )
+
+    def _start_background_validation(
+        self,
+        request_id: str,
+        database: str,
+        question: str,
+        sql: str,
+        query_result: QueryResult,
+        row_count: int | None,
+    ) -> None:
+        """Validate results in a background task retrievable by request ID.
+
+        Once the confidence is known, the result is put into the query cache.
+        """
+
+        async def validate() -> int:
+            confidence = await self._validate_results_safely(
+                question=question,
+                sql=sql,
+                results=query_result.rows,
+                row_count=row_count,
+                request_id=request_id,
+            )
+            if self.query_cache is not None:
+                self.query_cache.put_result(database, sql, query_result, confidence)
+            return confidence
+
+        task = asyncio.create_task(validate())
+        self._running_validations.add(task)
+        task.add_done_callback(self._running_validations.discard)
+        self._background_validations.put(
+            request_id, task, ttl=self.validation_config.background_result_ttl
+        )
+
     @staticmethod
     def _get_current_time_ms() -> float:
         """Get current time in milliseconds.
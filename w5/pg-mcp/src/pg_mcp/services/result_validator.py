@@ -11,7 +11,7 @@ from openai import AsyncOpenAI
 
 from pg_mcp.config.settings import OpenAIConfig, ValidationConfig
 from pg_mcp.models.errors import LLMError, LLMTimeoutError, LLMUnavailableError
-from pg_mcp.models.query import ResultValidationResult
+from pg_mcp.models.query import ResultValidationResult, TokenUsage
 from pg_mcp.prompts.result_validation import (
     RESULT_VALIDATION_SYSTEM_PROMPT,
     build_validation_prompt,
@@ -63,7 +63,8 @@ class ResultValidator:
         question: str,
         sql: str,
         results: list[dict[str, Any]],
-        row_count: int,
+        row_count: int | None,
+        usage: TokenUsage | None = None,
     ) -> ResultValidationResult:
         """Validate query results against the user's original question.
 
@@ -75,7 +76,10 @@ class ResultValidator:
             question: The user's original natural language question.
             sql: The SQL query that was executed.
             results: Query results (will be sampled if too large).
-            row_count: Total number of rows in the complete result set.
+            row_count: Total number of rows in the complete result set, or
+                None if the result was truncated and not counted.
+            usage: Optional accumulator the token usage reported by the API is
+                added to, even if the response cannot be used.
 
         Returns:
             ResultValidationResult: Validation result including confidence score,
@@ -128,6 +132,8 @@ class ResultValidator:
                 temperature=0.0,  # Use deterministic output for validation
                 response_format={"type": "json_object"},  # Ensure JSON response
             )
+            if usage is not None and response.usage is not None:
+                usage.add(response.usage.prompt_tokens, response.usage.completion_tokens)
 
             # Extract and parse the response
             if not response.choices:
@@ -0,0 +1,280 @@
+"""Relevance-based schema pruning for SQL generation prompts.
+
+This module provides the SchemaRetriever class that ranks tables by lexical
+relevance to a question (BM25 over table and column names and comments),
+expands the best matches along foreign keys, and keeps only as many tables
+as fit into a configurable token budget.
+"""
+
+import logging
+import math
+import re
+from collections import Counter
+
+from pg_mcp.config.settings import SchemaContextConfig
+from pg_mcp.models.schema import DatabaseSchema, TableInfo
+from pg_mcp.observability.metrics import MetricsCollector
+
+logger = logging.getLogger(__name__)
+
+# BM25 parameters (standard Okapi defaults)
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+# Table names are repeated in the document so that a name match outweighs a
+# match on a single column
+TABLE_NAME_WEIGHT = 3
+
+# Score share passed to a foreign key neighbour per hop
+FK_NEIGHBOUR_DECAY = 0.5
+
+_WORD_PATTERN = re.compile(r"[A-Z]?[a-z]+|[A-Z]+(?![a-z])|\d+|[\u4e00-\u9fff]+")
+_CJK_PATTERN = re.compile(r"[\u4e00-\u9fff]+")
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of LLM tokens in a text.
+
+    Uses the common approximation of four characters per token, which is
+    close enough for budgeting without a model-specific tokenizer.
+
+    Args:
+        text: Text to measure.
+
+    Returns:
+        int: Estimated token count.
+    """
+    return (len(text) + 3) // 4
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into normalized search terms.
+
+    Identifiers are split on underscores and camelCase boundaries, English
+    words are lower-cased and naively singularized, and runs of CJK
+    characters are split into overlapping bigrams.
+
+    Args:
+        text: Text to tokenize.
+
+    Returns:
+        list[str]: Search terms.
+
+    Example:
+        >>> tokenize("orderItems user_addresses")
+        ['order', 'item', 'user', 'address']
+    """
+    terms: list[str] = []
+    for word in _WORD_PATTERN.findall(text):
+        if _CJK_PATTERN.fullmatch(word):
+            if len(word) == 1:
+                terms.append(word)
+            else:
+                terms.extend(word[i : i + 2] for i in range(len(word) - 1))
+            continue
+
+        term = word.lower()
+        if len(term) > 4 and term.endswith("ies"):
+            term = term[:-3] + "y"
+        elif len(term) > 4 and term.endswith(("sses", "xes", "ches", "shes")):
+            term = term[:-2]
+        elif len(term) > 3 and term.endswith("s") and not term.endswith("ss"):
+            term = term[:-1]
+        terms.append(term)
+    return terms
+
+
+class _SchemaIndex:
+    """BM25 index and foreign key graph over the tables of one schema."""
+
+    def __init__(self, schema: DatabaseSchema) -> None:
+        self.tables = schema.tables
+        self.doc_terms: list[Counter[str]] = []
+        self.section_tokens: list[int] = []
+        document_frequency: Counter[str] = Counter()
+
+        for table in self.tables:
+            terms = Counter(self._document_terms(table))
+            self.doc_terms.append(terms)
+            document_frequency.update(terms.keys())
+            self.section_tokens.append(estimate_tokens(schema.get_table_prompt_section(table)))
+
+        self.doc_lengths = [sum(terms.values()) for terms in self.doc_terms]
+        self.avg_doc_length = (
+            sum(self.doc_lengths) / len(self.doc_lengths) if self.doc_lengths else 0.0
+        )
+        total = len(self.tables)
+        self.idf = {
+            term: math.log(1 + (total - df + 0.5) / (df + 0.5))
+            for term, df in document_frequency.items()
+        }
+        self.neighbours = self._build_fk_graph()
+
+    @staticmethod
+    def _document_terms(table: TableInfo) -> list[str]:
+        """Collect the searchable terms of a table."""
+        terms = tokenize(table.table_name) * TABLE_NAME_WEIGHT
+        if table.comment:
+            terms.extend(tokenize(table.comment))
+        for column in table.columns:
+            terms.extend(tokenize(column.name))
+            if column.comment:
+                terms.extend(tokenize(column.comment))
+        return terms
+
+    def _build_fk_graph(self) -> list[set[int]]:
+        """Build an undirected adjacency list of foreign key relationships."""
+        by_name: dict[str, list[int]] = {}
+        for i, table in enumerate(self.tables):
+            by_name.setdefault(table.table_name, []).append(i)
+
+        neighbours: list[set[int]] = [set() for _ in self.tables]
+        for i, table in enumerate(self.tables):
+            for fk in table.foreign_keys:
+                for j in by_name.get(fk.referenced_table, []):
+                    if j != i:
+                        neighbours[i].add(j)
+                        neighbours[j].add(i)
+        return neighbours
+
+    def score(self, query: str) -> list[float]:
+        """Compute the BM25 score of every table for a query."""
+        query_terms = set(tokenize(query))
+        scores = []
+        for terms, length in zip(self.doc_terms, self.doc_lengths, strict=True):
+            score = 0.0
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * length / (self.avg_doc_length or 1.0))
+            for term in query_terms:
+                tf = terms.get(term)
+                if tf:
+                    score += self.idf[term] * tf * (BM25_K1 + 1) / (tf + norm)
+            scores.append(score)
+        return scores
+
+
+class SchemaRetriever:
+    """Selects the tables relevant to a question for the SQL generation prompt.
+
+    The full schema is used as-is when it fits into the token budget, or when
+    no table matches the question at all. Otherwise tables are ranked by BM25
+    score plus a decaying share of the scores of their foreign key
+    neighbours, and the best ones are kept until the budget or the table limit
+    is reached. The selected tables keep their original schema order.
+
+    Example:
+        >>> retriever = SchemaRetriever(SchemaContextConfig(max_tokens=4000))
+        >>> pruned = retriever.prune("Total order value per customer", schema)
+        >>> print([t.table_name for t in pruned.tables])
+    """
+
+    def __init__(
+        self,
+        config: SchemaContextConfig,
+        metrics: MetricsCollector | None = None,
+    ) -> None:
+        """Initialize schema retriever.
+
+        Args:
+            config: Schema context pruning configuration.
+            metrics: Optional metrics collector for prompt size metrics.
+        """
+        self.config = config
+        self.metrics = metrics
+        # Latest index per database, rebuilt when the cached schema object changes
+        self._indexes: dict[str, tuple[DatabaseSchema, _SchemaIndex]] = {}
+
+    def prune(self, query: str, schema: DatabaseSchema) -> DatabaseSchema:
+        """Return a copy of the schema restricted to the tables relevant to a query.
+
+        Args:
+            query: Question text, optionally extended with retry context.
+            schema: Complete database schema.
+
+        Returns:
+            DatabaseSchema: Pruned schema, or the original schema if pruning
+                is disabled, unnecessary or finds no relevant table.
+        """
+        index = self._get_index(schema)
+        full_tokens = sum(index.section_tokens)
+
+        selected = self._select(query, index, full_tokens)
+        if selected is None:
+            self._observe(full_tokens, full_tokens)
+            return schema
+
+        pruned_tokens = sum(index.section_tokens[i] for i in selected)
+        self._observe(full_tokens, pruned_tokens)
+        logger.debug(
+            "Pruned schema context for %s from %d to %d tables (~%d to ~%d tokens)",
+            schema.database_name,
+            len(schema.tables),
+            len(selected),
+            full_tokens,
+            pruned_tokens,
+        )
+        return schema.model_copy(update={"tables": [index.tables[i] for i in selected]})
+
+    def _select(self, query: str, index: _SchemaIndex, full_tokens: int) -> list[int] | None:
+        """Choose table positions to keep, or None to keep the full schema."""
+        if not self.config.pruning_enabled:
+            return None
+        if full_tokens <= self.config.max_tokens and len(index.tables) <= self.config.max_tables:
+            return None
+
+        scores = self._expand(index, index.score(query))
+        ranked = sorted(
+            (i for i, score in enumerate(scores) if score > 0),
+            key=lambda i: scores[i],
+            reverse=True,
+        )
+        if not ranked:
+            logger.debug("No table matches the question; using the full schema context")
+            return None
+
+        selected: list[int] = []
+        used = 0
+        for i in ranked:
+            if len(selected) >= self.config.max_tables:
+                break
+            # Always keep the best match, even if it alone exceeds the budget
+            if selected and used + index.section_tokens[i] > self.config.max_tokens:
+                continue
+            selected.append(i)
+            used += index.section_tokens[i]
+
+        return sorted(selected)
+
+    def _expand(self, index: _SchemaIndex, scores: list[float]) -> list[float]:
+        """Add a decaying share of neighbour scores along foreign keys."""
+        expanded = list(scores)
+        frontier = {i: score for i, score in enumerate(scores) if score > 0}
+        decay = 1.0
+
+        for _ in range(self.config.fk_expansion_depth):
+            decay *= FK_NEIGHBOUR_DECAY
+            boosts: dict[int, float] = {}
+            for i, score in frontier.items():
+                for j in index.neighbours[i]:
+                    boosts[j] = max(boosts.get(j, 0.0), score)
+            for j, boost in boosts.items():
+                expanded[j] += boost * decay
+            frontier = boosts
+
+        return expanded
+
+    def _get_index(self, schema: DatabaseSchema) -> _SchemaIndex:
+        """Get the index for a schema, building it on first use."""
+        cached = self._indexes.get(schema.database_name)
+        if cached is not None and cached[0] is schema:
+            return cached[1]
+
+        index = _SchemaIndex(schema)
+        self._indexes[schema.database_name] = (schema, index)
+        return index
+
+    def _observe(self, full_tokens: int, pruned_tokens: int) -> None:
+        """Record schema context size before and after pruning."""
+        if self.metrics is None:
+            return
+        self.metrics.observe_schema_context_tokens("full", full_tokens)
+        self.metrics.observe_schema_context_tokens("pruned", pruned_tokens)
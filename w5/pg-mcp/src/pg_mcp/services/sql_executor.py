@@ -1,31 +1,323 @@
 """SQL executor for PostgreSQL queries.
 
 This module provides safe SQL execution with session parameter configuration,
-result serialization, and row limiting to prevent memory overflow.
+result serialization, and row limiting to prevent memory overflow. Rows are
+read through a server-side cursor, so no more than ``max_rows + 1`` rows are
+ever transferred to the client, and serialized column by column with a
+converter chosen once per column from its PostgreSQL type. Queries go
+through the prepared statement cache that asyncpg keeps on every pooled
+connection, and repeats of equivalent queries can optionally be tracked.
 """
 
 import asyncio
 import datetime
 import decimal
+import json
+import operator
 import uuid
-from typing import Any
+from collections.abc import Callable, Sequence
+from typing import Any, NamedTuple
 
 import asyncpg
 from asyncpg import Connection, Pool
+from asyncpg.cursor import Cursor
+from asyncpg.types import Attribute
 
+from pg_mcp.cache.query_cache import LRUCache
 from pg_mcp.config.settings import DatabaseConfig, SecurityConfig
-from pg_mcp.models.errors import DatabaseError, ExecutionTimeoutError
+from pg_mcp.models.errors import (
+    DatabaseConnectionError,
+    DatabaseError,
+    ExecutionTimeoutError,
+    SQLParseError,
+)
+from pg_mcp.observability.metrics import MetricsCollector
+
+# Largest row count accepted by MOVE FORWARD (a 32-bit integer)
+_MOVE_FORWARD_MAX = 2**31 - 1
+
+
+def _serialize_value(value: Any) -> Any:
+    """Recursively serialize a single value of unknown type.
+
+    Args:
+        value: Value to serialize.
+
+    Returns:
+        Serialized value that is JSON-compatible.
+    """
+    # Handle None
+    if value is None:
+        return None
+
+    # Handle datetime types
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+
+    # Handle timedelta
+    if isinstance(value, datetime.timedelta):
+        return str(value)
+
+    # Handle Decimal (convert to float)
+    if isinstance(value, decimal.Decimal):
+        return float(value)
+
+    # Handle UUID
+    if isinstance(value, uuid.UUID):
+        return str(value)
+
+    # Handle bytes (convert to hex string)
+    if isinstance(value, bytes):
+        return value.hex()
+
+    # Handle lists and tuples (recursively serialize)
+    if isinstance(value, (list, tuple)):
+        return [_serialize_value(v) for v in value]
+
+    # Handle dicts (recursively serialize values)
+    if isinstance(value, dict):
+        return {k: _serialize_value(v) for k, v in value.items()}
+
+    # Return other types as-is (str, int, float, bool, etc.)
+    return value
+
+
+_to_isoformat = operator.methodcaller("isoformat")
+
+# Converters of non-NULL values for built-in PostgreSQL types by type OID.
+# Types decoded by asyncpg into JSON-compatible values (bool, integers,
+# floats, text, json and jsonb as str, and lists of these for arrays) map to
+# None and are passed through untouched. Types not listed here, including
+# other arrays and composites, use the generic recursive serializer.
+_TYPE_CONVERTERS: dict[int, Callable[[Any], Any] | None] = {
+    16: None,  # bool
+    18: None,  # char
+    19: None,  # name
+    20: None,  # int8
+    21: None,  # int2
+    23: None,  # int4
+    25: None,  # text
+    26: None,  # oid
+    114: None,  # json
+    142: None,  # xml
+    700: None,  # float4
+    701: None,  # float8
+    790: None,  # money
+    1042: None,  # bpchar
+    1043: None,  # varchar
+    3802: None,  # jsonb
+    199: None,  # json[]
+    1000: None,  # bool[]
+    1005: None,  # int2[]
+    1007: None,  # int4[]
+    1009: None,  # text[]
+    1015: None,  # varchar[]
+    1016: None,  # int8[]
+    1021: None,  # float4[]
+    1022: None,  # float8[]
+    3807: None,  # jsonb[]
+    17: bytes.hex,  # bytea
+    1082: _to_isoformat,  # date
+    1083: _to_isoformat,  # time
+    1114: _to_isoformat,  # timestamp
+    1184: _to_isoformat,  # timestamptz
+    1266: _to_isoformat,  # timetz
+    1186: str,  # interval
+    1700: float,  # numeric
+    2950: str,  # uuid
+}
+
+
+def build_session_settings(security_config: SecurityConfig) -> dict[str, str]:
+    """Build the static session settings of query connections.
+
+    The result is meant for the ``server_settings`` of a connection pool, so
+    that every pooled connection starts with the configured statement
+    timeout, search_path and role. Startup settings are the session defaults
+    that ``RESET ALL`` returns to when asyncpg releases a connection.
+
+    Args:
+        security_config: Security configuration.
+
+    Returns:
+        dict[str, str]: PostgreSQL settings by name.
+
+    Raises:
+        DatabaseError: If search_path or readonly_role contain unsafe characters.
+
+    Example:
+        >>> settings = build_session_settings(SecurityConfig(readonly_role="reader"))
+        >>> pool = await create_pool(db_config, server_settings=settings)
+    """
+    search_path, readonly_role = _validated_session_values(security_config)
+    settings = {
+        "statement_timeout": str(int(security_config.max_execution_time * 1000)),
+        "search_path": search_path,
+    }
+    if readonly_role:
+        settings["role"] = readonly_role
+    return settings
+
+
+def _cursor_attributes(cursor: Cursor) -> tuple[Attribute, ...]:
+    """Get the result description of the prepared statement behind a cursor.
+
+    asyncpg has no public accessor for it; the cursor holds the same statement
+    state a ``PreparedStatement`` wraps.
+    """
+    return tuple(cursor._state._get_attributes())
+
+
+def _validated_session_values(security_config: SecurityConfig) -> tuple[str, str | None]:
+    """Validate and return the configured search_path and readonly_role.
+
+    Raises:
+        DatabaseError: If either value contains unsafe characters.
+    """
+    search_path = security_config.safe_search_path
+    # Validate search_path contains only safe characters
+    if not all(c.isalnum() or c in ("_", ",", " ") for c in search_path):
+        raise DatabaseError(
+            message="Invalid search_path configuration",
+            details={"search_path": search_path},
+        )
+
+    readonly_role = security_config.readonly_role
+    # Validate role name contains only safe characters
+    if readonly_role and not all(c.isalnum() or c == "_" for c in readonly_role):
+        raise DatabaseError(
+            message="Invalid readonly_role configuration",
+            details={"readonly_role": readonly_role},
+        )
+    return search_path, readonly_role
+
+
+class CachedStatement(NamedTuple):
+    """Statement text and result description of a previously executed query."""
+
+    sql: str
+    attributes: tuple[Attribute, ...]
+
+
+class StatementCache:
+    """LRU of previously executed statements, keyed by normalized SQL.
+
+    It holds no prepared statements: those live in the statement cache that
+    asyncpg keeps on every pooled connection, keyed by exact query text and
+    enlarged by ``DatabaseConfig.statement_cache_size`` (see
+    :func:`pg_mcp.db.pool.create_pool`). This cache measures how often
+    equivalent queries repeat, across spellings and pooled connections; a hit
+    does not imply that parse and plan were skipped. It also remembers the
+    result description of each statement; an entry whose description no
+    longer matches the executed statement (e.g. after a schema change) is
+    discarded, so the next run counts as a new statement.
+
+    Example:
+        >>> cache = StatementCache(256, normalize=validator.normalize_sql)
+        >>> executor = SQLExecutor(pool, security_config, db_config, statement_cache=cache)
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        normalize: Callable[[str], str] | None = None,
+        metrics: MetricsCollector | None = None,
+        database: str = "",
+    ) -> None:
+        """Initialize statement cache.
+
+        Args:
+            max_size: Maximum number of distinct normalized statements.
+            normalize: SQL normalizer such as ``SQLValidator.normalize_sql``;
+                statements are keyed by exact text when None or when
+                normalization fails.
+            metrics: Optional metrics collector for repeated/new statement
+                counters.
+            database: Database name used as metrics label.
+
+        Raises:
+            ValueError: If max_size is less than 1.
+        """
+        self.normalize = normalize
+        self.metrics = metrics
+        self.database = database
+        self._statements: LRUCache[str, CachedStatement] = LRUCache(max_size)
+        # Memoizes normalization of byte-identical statements
+        self._keys: LRUCache[str, str] = LRUCache(max_size)
+
+    def get(self, sql: str) -> CachedStatement | None:
+        """Look up a previous execution of a SQL query.
+
+        Args:
+            sql: SQL query.
+
+        Returns:
+            CachedStatement | None: Cached statement, or None on a miss.
+        """
+        cached = self._statements.get(self._key(sql))
+        if self.metrics is not None:
+            if cached is not None:
+                self.metrics.increment_statement_cache_hit(self.database)
+            else:
+                self.metrics.increment_statement_cache_miss(self.database)
+        return cached
+
+    def put(self, sql: str, attributes: tuple[Attribute, ...]) -> None:
+        """Remember a SQL query and its result description.
+
+        Args:
+            sql: SQL query as executed.
+            attributes: Result column descriptions.
+        """
+        self._statements.put(self._key(sql), CachedStatement(sql, attributes))
+
+    def discard(self, sql: str) -> None:
+        """Forget the statement of a SQL query, e.g. after a schema change.
+
+        Args:
+            sql: SQL query.
+        """
+        self._statements.pop(self._key(sql))
+
+    def clear(self) -> None:
+        """Remove all cached statements."""
+        self._statements.clear()
+        self._keys.clear()
+
+    def __len__(self) -> int:
+        """Get the number of cached statements."""
+        return len(self._statements)
+
+    def _key(self, sql: str) -> str:
+        """Get the normalized cache key of a SQL query."""
+        if self.normalize is None:
+            return sql
+
+        key = self._keys.get(sql)
+        if key is None:
+            try:
+                key = self.normalize(sql)
+            except SQLParseError:
+                key = sql
+            self._keys.put(sql, key)
+        return key
 
 
 class SQLExecutor:
     """SQL executor using asyncpg with security measures.
 
     This executor ensures safe query execution by:
-    1. Setting session parameters (timeout, search_path, role)
+    1. Setting session parameters (timeout, search_path, role) in at most
+       one round trip
     2. Running queries in read-only transactions
-    3. Limiting the number of returned rows
+    3. Fetching at most max_rows + 1 rows through a server-side cursor
     4. Serializing PostgreSQL-specific data types
 
+    Queries run through asyncpg's per-connection statement cache, so a query
+    repeated with identical text on the same connection is not parsed and
+    planned again. A :class:`StatementCache` additionally tracks repeats of
+    equivalent queries.
+
     Example:
         >>> executor = SQLExecutor(pool, security_config, db_config)
         >>> results, count = await executor.execute("SELECT * FROM users")
@@ -37,6 +329,8 @@ class SQLExecutor:
         pool: Pool,
         security_config: SecurityConfig,
         db_config: DatabaseConfig,
+        session_preconfigured: bool = False,
+        statement_cache: StatementCache | None = None,
     ) -> None:
         """Initialize SQL executor.
 
@@ -44,39 +338,56 @@ class SQLExecutor:
             pool: asyncpg connection pool for database connections.
             security_config: Security configuration including timeouts and limits.
             db_config: Database configuration including connection parameters.
+            session_preconfigured: Whether the pool connections were created
+                with :func:`build_session_settings` for this security
+                configuration. Queries then only set a statement timeout when
+                it differs from the configured one.
+            statement_cache: Optional tracker of repeated statements, usually
+                sized by ``DatabaseConfig.statement_cache_size``.
         """
         self.pool = pool
         self.security_config = security_config
         self.db_config = db_config
+        self.session_preconfigured = session_preconfigured
+        self.statement_cache = statement_cache
 
     async def execute(
         self,
         sql: str,
         timeout: float | None = None,  # noqa: ASYNC109
         max_rows: int | None = None,
-    ) -> tuple[list[dict[str, Any]], int]:
+        count_total: bool | None = None,
+    ) -> tuple[list[dict[str, Any]], int | None]:
         """Execute SQL query with security measures.
 
         This method:
         1. Acquires a connection from the pool
         2. Starts a read-only transaction
         3. Sets session parameters (timeout, search_path, role)
-        4. Executes the query with timeout
-        5. Limits the number of returned rows
+        4. Opens a cursor and fetches at most max_rows + 1 rows with timeout
+        5. Optionally counts the remaining rows on the server
         6. Serializes special PostgreSQL types
 
         Args:
             sql: SQL query to execute (should already be validated).
             timeout: Query timeout in seconds (uses config default if None).
             max_rows: Maximum rows to return (uses config default if None).
+            count_total: Count all rows of a truncated result (uses config
+                default if None). Counting skips over the remaining rows on
+                the server without transferring them, but still runs the
+                query to completion.
 
         Returns:
             tuple: (results, total_row_count) where:
-                - results: List of row dictionaries with serialized values
-                - total_row_count: Total number of rows (before limiting)
+                - results: List of at most max_rows row dictionaries with
+                  serialized values
+                - total_row_count: Total number of rows when the result is
+                  complete or count_total is enabled; None for a truncated
+                  result that was not counted, meaning "more than max_rows"
 
         Raises:
             ExecutionTimeoutError: If query execution exceeds timeout.
+            DatabaseConnectionError: If the database server cannot be reached.
             DatabaseError: If database operation fails.
 
         Example:
@@ -85,11 +396,13 @@ class SQLExecutor:
             ...     timeout=10.0,
             ...     max_rows=1000
             ... )
-            >>> print(f"Retrieved {len(results)} of {count} total rows")
+            >>> print(f"Retrieved {len(results)} of {count or 'more'} total rows")
         """
         # Use configured defaults if not specified
         timeout = timeout or self.security_config.max_execution_time
         max_rows = max_rows or self.security_config.max_rows
+        if count_total is None:
+            count_total = self.security_config.count_total_rows
 
         try:
             async with (
@@ -101,8 +414,8 @@ class SQLExecutor:
 
                 # Execute query with timeout
                 try:
-                    records = await asyncio.wait_for(
-                        connection.fetch(sql),
+                    attributes, records, total_count = await asyncio.wait_for(
+                        self._fetch_bounded(connection, sql, max_rows, count_total),
                         timeout=timeout,
                     )
                 except TimeoutError as e:
@@ -114,18 +427,8 @@ class SQLExecutor:
                         },
                     ) from e
 
-                # Track total count before limiting
-                total_count = len(records)
-
-                # Limit number of returned rows
-                if len(records) > max_rows:
-                    records = records[:max_rows]
-
-                # Convert asyncpg.Record to dict
-                results = [dict(record) for record in records]
-
-                # Serialize special PostgreSQL types
-                results = self._serialize_results(results)
+                # Serialize special PostgreSQL types into row dictionaries
+                results = self._serialize_records(attributes, records)
 
                 return results, total_count
 
@@ -133,6 +436,12 @@ class SQLExecutor:
             # Re-raise timeout errors as-is
             raise
         except asyncpg.PostgresError as e:
+            if (
+                isinstance(e, asyncpg.InvalidCachedStatementError)
+                and self.statement_cache is not None
+            ):
+                # asyncpg dropped its statement; describe the result afresh next time
+                self.statement_cache.discard(sql)
             # Wrap PostgreSQL errors
             raise DatabaseError(
                 message=f"Database query failed: {e!s}",
@@ -142,6 +451,15 @@ class SQLExecutor:
                     "sql": sql[:200],  # Include truncated SQL for debugging
                 },
             ) from e
+        except OSError as e:
+            # The server could not be reached
+            raise DatabaseConnectionError(
+                message=f"Database connection failed: {e!s}",
+                details={
+                    "error_type": type(e).__name__,
+                    "error_message": str(e),
+                },
+            ) from e
         except Exception as e:
             # Catch-all for unexpected errors
             raise DatabaseError(
@@ -152,6 +470,117 @@ class SQLExecutor:
                 },
             ) from e
 
+    async def explain(
+        self,
+        sql: str,
+        timeout: float | None = None,  # noqa: ASYNC109
+    ) -> dict[str, Any]:
+        """Plan a query with EXPLAIN without executing it.
+
+        Runs in a read-only transaction with the same session parameters as
+        :meth:`execute`.
+
+        Args:
+            sql: SQL query to plan (should already be validated).
+            timeout: Planning timeout in seconds (uses config default if None).
+
+        Returns:
+            dict: Top-level plan node of ``EXPLAIN (FORMAT JSON)``, including
+                "Total Cost" and "Plan Rows".
+
+        Raises:
+            ExecutionTimeoutError: If planning exceeds timeout.
+            DatabaseError: If the query cannot be planned.
+
+        Example:
+            >>> plan = await executor.explain("SELECT * FROM users")
+            >>> print(plan["Total Cost"], plan["Plan Rows"])
+        """
+        timeout = timeout or self.security_config.max_execution_time
+
+        try:
+            async with (
+                self.pool.acquire() as connection,
+                connection.transaction(readonly=True),
+            ):
+                await self._set_session_params(connection, timeout)
+                try:
+                    raw_plan = await asyncio.wait_for(
+                        # SQL was validated as a single read-only statement
+                        connection.fetchval(f"EXPLAIN (FORMAT JSON) {sql}"),
+                        timeout=timeout,
+                    )
+                except TimeoutError as e:
+                    raise ExecutionTimeoutError(
+                        message=f"Query planning exceeded timeout of {timeout} seconds",
+                        details={"timeout_seconds": timeout, "sql": sql[:200]},
+                    ) from e
+        except (ExecutionTimeoutError, DatabaseError):
+            raise
+        except asyncpg.PostgresError as e:
+            raise DatabaseError(
+                message=f"Database query failed: {e!s}",
+                details={
+                    "error_code": e.sqlstate if hasattr(e, "sqlstate") else None,
+                    "error_message": str(e),
+                    "sql": sql[:200],
+                },
+            ) from e
+
+        plan = json.loads(raw_plan) if isinstance(raw_plan, str) else raw_plan
+        return dict(plan[0]["Plan"])
+
+    async def _fetch_bounded(
+        self,
+        conn: Connection,
+        sql: str,
+        max_rows: int,
+        count_total: bool,
+    ) -> tuple[tuple[Attribute, ...], list[asyncpg.Record], int | None]:
+        """Fetch at most max_rows rows through a server-side cursor.
+
+        One extra row is requested to detect truncation. When count_total is
+        set and the result is truncated, the cursor is moved over the
+        remaining rows, which the server counts without sending them.
+
+        Args:
+            conn: Database connection inside a transaction.
+            sql: SQL query to execute.
+            max_rows: Maximum rows to return.
+            count_total: Whether to count the rows of a truncated result.
+
+        Returns:
+            tuple: (attributes, records, total_row_count), where attributes
+                describe the result columns and total_row_count is as
+                documented in :meth:`execute`.
+        """
+        # Goes through asyncpg's statement cache of this connection
+        cursor = await conn.cursor(sql)
+        attributes = _cursor_attributes(cursor)
+        if self.statement_cache is not None:
+            cached = self.statement_cache.get(sql)
+            if cached is None:
+                self.statement_cache.put(sql, attributes)
+            elif attributes != cached.attributes:
+                # The result shape changed; describe the statement afresh next time
+                self.statement_cache.discard(sql)
+
+        records = await cursor.fetch(max_rows + 1)
+        if len(records) <= max_rows:
+            return attributes, records, len(records)
+
+        if not count_total:
+            return attributes, records[:max_rows], None
+
+        total_count = len(records)
+        while True:
+            moved = await cursor.forward(_MOVE_FORWARD_MAX)
+            total_count += moved
+            if moved < _MOVE_FORWARD_MAX:
+                break
+
+        return attributes, records[:max_rows], total_count
+
     async def _set_session_params(
         self,
         conn: Connection,
@@ -159,11 +588,16 @@ class SQLExecutor:
     ) -> None:
         """Set session parameters to ensure safe query execution.
 
-        This method configures the database session with:
+        This method configures the current transaction with:
         1. statement_timeout: Prevents long-running queries
         2. search_path: Prevents schema injection attacks
         3. SET ROLE: Switches to read-only role if configured
 
+        All settings are sent in a single round trip. On preconfigured pools
+        search_path and role are already in place, and the statement timeout
+        is only sent when it differs from the configured one, so the common
+        case needs no round trip at all.
+
         Args:
             conn: Database connection to configure.
             timeout: Query timeout in seconds (converted to milliseconds).
@@ -172,36 +606,28 @@ class SQLExecutor:
             DatabaseError: If setting session parameters fails.
 
         Note:
-            These settings apply only to the current transaction and are
-            automatically reset when the connection is returned to the pool.
+            SET LOCAL settings apply only to the current transaction and are
+            reverted when it ends, before the connection returns to the pool.
         """
-        try:
-            # Set statement timeout (PostgreSQL expects milliseconds)
-            timeout_ms = int(timeout * 1000)
-            await conn.execute(f"SET statement_timeout = {timeout_ms}")
-
-            # Set safe search_path to prevent schema injection
-            # Using execute with literal to avoid SQL injection
-            search_path = self.security_config.safe_search_path
-            # Validate search_path contains only safe characters
-            if not all(c.isalnum() or c in ("_", ",", " ") for c in search_path):
-                raise DatabaseError(
-                    message="Invalid search_path configuration",
-                    details={"search_path": search_path},
-                )
-            await conn.execute(f"SET search_path = '{search_path}'")
-
-            # Switch to read-only role if configured
-            if self.security_config.readonly_role:
-                readonly_role = self.security_config.readonly_role
-                # Validate role name contains only safe characters
-                if not all(c.isalnum() or c == "_" for c in readonly_role):
-                    raise DatabaseError(
-                        message="Invalid readonly_role configuration",
-                        details={"readonly_role": readonly_role},
-                    )
-                await conn.execute(f"SET ROLE {readonly_role}")
+        # PostgreSQL expects milliseconds
+        timeout_ms = int(timeout * 1000)
+
+        if self.session_preconfigured:
+            if timeout_ms == int(self.security_config.max_execution_time * 1000):
+                return
+            statements = [f"SET LOCAL statement_timeout = {timeout_ms}"]
+        else:
+            search_path, readonly_role = _validated_session_values(self.security_config)
+            statements = [
+                f"SET LOCAL statement_timeout = {timeout_ms}",
+                # Literal was validated above to avoid SQL injection
+                f"SET LOCAL search_path = '{search_path}'",
+            ]
+            if readonly_role:
+                statements.append(f"SET LOCAL ROLE {readonly_role}")
 
+        try:
+            await conn.execute("; ".join(statements))
         except asyncpg.PostgresError as e:
             raise DatabaseError(
                 message=f"Failed to set session parameters: {e!s}",
@@ -213,6 +639,49 @@ class SQLExecutor:
                 },
             ) from e
 
+    def _serialize_records(
+        self,
+        attributes: Sequence[Attribute],
+        records: Sequence[Sequence[Any]],
+    ) -> list[dict[str, Any]]:
+        """Serialize result records into JSON-compatible row dictionaries.
+
+        A converter is picked once per column from the column's type OID and
+        mapped down the column; columns of JSON-compatible types are not
+        touched at all. Rows are then assembled in a single pass, without the
+        intermediate per-record dictionaries of :meth:`_serialize_results`.
+
+        Args:
+            attributes: Result column descriptions from the prepared statement.
+            records: Result records.
+
+        Returns:
+            list: Row dictionaries keyed by column name.
+
+        Example:
+            >>> statement = await conn.prepare("SELECT now() AS ts")
+            >>> executor._serialize_records(statement.get_attributes(), await statement.fetch())
+            [{'ts': '2024-01-01T12:00:00+00:00'}]
+        """
+        if not records:
+            return []
+        names = [attribute.name for attribute in attributes]
+        if not names:
+            return [{} for _ in records]
+
+        columns: list[Sequence[Any]] = list(zip(*records, strict=True))
+        for i, attribute in enumerate(attributes):
+            convert = _TYPE_CONVERTERS.get(attribute.type.oid, _serialize_value)
+            if convert is None:
+                continue
+            try:
+                columns[i] = [v if v is None else convert(v) for v in columns[i]]
+            except (AttributeError, TypeError, ValueError):
+                # Cached attributes may predate a column type change
+                columns[i] = [_serialize_value(v) for v in columns[i]]
+
+        return [dict(zip(names, row, strict=True)) for row in zip(*columns, strict=True)]
+
     def _serialize_results(self, results: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """Serialize PostgreSQL-specific types to JSON-compatible types.
 
@@ -239,50 +708,5 @@ class SQLExecutor:
             >>> serialized[0]["created"]  # "2024-01-01T12:00:00"
             >>> serialized[1]["price"]  # 99.99
         """
-
-        def serialize_value(value: Any) -> Any:
-            """Recursively serialize a single value.
-
-            Args:
-                value: Value to serialize.
-
-            Returns:
-                Serialized value that is JSON-compatible.
-            """
-            # Handle None
-            if value is None:
-                return None
-
-            # Handle datetime types
-            if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
-                return value.isoformat()
-
-            # Handle timedelta
-            if isinstance(value, datetime.timedelta):
-                return str(value)
-
-            # Handle Decimal (convert to float)
-            if isinstance(value, decimal.Decimal):
-                return float(value)
-
-            # Handle UUID
-            if isinstance(value, uuid.UUID):
-                return str(value)
-
-            # Handle bytes (convert to hex string)
-            if isinstance(value, bytes):
-                return value.hex()
-
-            # Handle lists and tuples (recursively serialize)
-            if isinstance(value, (list, tuple)):
-                return [serialize_value(v) for v in value]
-
-            # Handle dicts (recursively serialize values)
-            if isinstance(value, dict):
-                return {k: serialize_value(v) for k, v in value.items()}
-
-            # Return other types as-is (str, int, float, bool, etc.)
-            return value
-
         # Serialize all values in all rows
-        return [{key: serialize_value(value) for key, value in row.items()} for row in results]
+        return [{key: _serialize_value(value) for key, value in row.items()} for row in results]
@@ -9,14 +9,17 @@ from typing import TYPE_CHECKING
 
 from openai import AsyncOpenAI
 
-from pg_mcp.config.settings import OpenAIConfig
+from pg_mcp.config.settings import OpenAIConfig, SchemaContextConfig
 from pg_mcp.models.errors import LLMError, LLMTimeoutError, LLMUnavailableError
 from pg_mcp.prompts.sql_generation import SQL_GENERATION_SYSTEM_PROMPT, build_user_prompt
+from pg_mcp.services.schema_retriever import SchemaRetriever
 
 if TYPE_CHECKING:
     from openai.types.chat import ChatCompletion
 
+    from pg_mcp.models.query import TokenUsage
     from pg_mcp.models.schema import DatabaseSchema
+    from pg_mcp.observability.metrics import MetricsCollector
 
 
 class SQLGenerator:
@@ -25,6 +28,8 @@ class SQLGenerator:
     This class handles the interaction with OpenAI's API to generate SQL queries
     from natural language questions. It includes robust error handling, SQL extraction
     from various response formats, and support for retry scenarios with error feedback.
+    On large databases only the tables relevant to the question are included in
+    the prompt (see :class:`SchemaRetriever`).
 
     Example:
         >>> config = OpenAIConfig(api_key="sk-...", model="gpt-4")
@@ -35,14 +40,25 @@ class SQLGenerator:
         ... )
     """
 
-    def __init__(self, config: OpenAIConfig) -> None:
+    def __init__(
+        self,
+        config: OpenAIConfig,
+        schema_context_config: SchemaContextConfig | None = None,
+        metrics: "MetricsCollector | None" = None,
+    ) -> None:
         """Initialize SQL generator with OpenAI configuration.
 
         Args:
             config: OpenAI configuration including API key and model settings.
+            schema_context_config: Schema context pruning configuration.
+                Defaults to SchemaContextConfig().
+            metrics: Optional metrics collector for prompt size metrics.
         """
         self.config = config
         self.client = AsyncOpenAI(api_key=config.api_key.get_secret_value(), timeout=config.timeout)
+        self.schema_retriever = SchemaRetriever(
+            schema_context_config or SchemaContextConfig(), metrics=metrics
+        )
 
     async def generate(
         self,
@@ -51,12 +67,17 @@ class SQLGenerator:
         context: str | None = None,
         previous_attempt: str | None = None,
         error_feedback: str | None = None,
+        temperature: float | None = None,
+        usage: "TokenUsage | None" = None,
     ) -> str:
         """Generate SQL statement from natural language question.
 
         This method sends the question and database schema to OpenAI's API
         and extracts the generated SQL query from the response. It supports
         retry scenarios by accepting previous failed attempts and error feedback.
+        The schema is pruned to the tables relevant to the question; on retries
+        the previous attempt and error are part of the relevance query so that
+        tables they mention are kept.
 
         Args:
             question: User's natural language question.
@@ -64,6 +85,10 @@ class SQLGenerator:
             context: Optional additional context to guide generation.
             previous_attempt: Previously generated SQL that failed (for retry).
             error_feedback: Error message from previous attempt (for retry).
+            temperature: Sampling temperature (uses the configured temperature
+                if None).
+            usage: Optional accumulator the token usage reported by the API is
+                added to, even if no SQL can be extracted from the response.
 
         Returns:
             str: Generated SQL query (without trailing semicolon).
@@ -87,9 +112,14 @@ class SQLGenerator:
             ...     error_feedback='relation "user" does not exist'
             ... )
         """
+        retrieval_query = " ".join(
+            part for part in (question, context, previous_attempt, error_feedback) if part
+        )
+        prompt_schema = self.schema_retriever.prune(retrieval_query, schema)
+
         user_prompt = build_user_prompt(
             question=question,
-            schema=schema,
+            schema=prompt_schema,
             context=context,
             previous_attempt=previous_attempt,
             error_feedback=error_feedback,
@@ -102,7 +132,7 @@ class SQLGenerator:
                     {"role": "system", "content": SQL_GENERATION_SYSTEM_PROMPT},
                     {"role": "user", "content": user_prompt},
                 ],
-                temperature=self.config.temperature,
+                temperature=(temperature if temperature is not None else self.config.temperature),
                 max_tokens=self.config.max_tokens,
             )
         except TimeoutError as e:
@@ -128,6 +158,9 @@ class SQLGenerator:
                 details={"error": error_msg},
             ) from e
 
+        if usage is not None and response.usage is not None:
+            usage.add(response.usage.prompt_tokens, response.usage.completion_tokens)
+
         # Extract SQL from response
         if not response.choices:
             raise LLMError(
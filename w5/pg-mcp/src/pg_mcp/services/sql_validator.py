@@ -2,18 +2,85 @@
 
 This module provides SQL validation and security checking using SQLGlot parser.
 It ensures that only safe, read-only queries are executed and blocks potentially
-dangerous operations.
+dangerous operations. Parse trees and validation verdicts are kept in bounded
+LRU caches, so repeated queries are parsed once.
 """
 
+import hashlib
 from typing import ClassVar
 
 import sqlglot
 from sqlglot import exp
 
+from pg_mcp.cache.query_cache import LRUCache
 from pg_mcp.config.settings import SecurityConfig
 from pg_mcp.models.errors import SecurityViolationError, SQLParseError
 
 
+class _QueryReferences:
+    """Functions, tables, columns and statements referenced by a parsed query.
+
+    Names are lower-cased and kept in breadth-first order of first
+    occurrence, so rules report the same offending name as a tree search.
+    """
+
+    __slots__ = ("columns", "forbidden_statements", "functions", "subqueries", "tables")
+
+    def __init__(self) -> None:
+        self.functions: list[str] = []
+        self.tables: list[str] = []
+        self.columns: list[tuple[str, str]] = []
+        self.subqueries: list[exp.Expression] = []
+        self.forbidden_statements: list[type[exp.Expression]] = []
+
+    @classmethod
+    def collect(
+        cls,
+        statement: exp.Expression,
+        forbidden_types: tuple[type[exp.Expression], ...],
+    ) -> "_QueryReferences":
+        """Collect the references of a statement in a single tree walk.
+
+        Args:
+            statement: Parsed SQL statement.
+            forbidden_types: Statement types to record wherever they occur.
+
+        Returns:
+            _QueryReferences: Collected references.
+        """
+        references = cls()
+        functions: dict[str, None] = {}
+        tables: dict[str, None] = {}
+        columns: dict[tuple[str, str], None] = {}
+
+        # Breadth-first like Expression.walk, without its per-node generators
+        queue: list[exp.Expression] = [statement]
+        for node in queue:
+            for child in node.args.values():
+                if isinstance(child, exp.Expression):
+                    queue.append(child)
+                elif isinstance(child, list):
+                    queue.extend(item for item in child if isinstance(item, exp.Expression))
+
+            if isinstance(node, exp.Column):
+                column_name = node.name.lower() if node.name else ""
+                columns[(node.table.lower(), column_name)] = None
+            elif isinstance(node, exp.Func):
+                functions[node.name.lower() if node.name else ""] = None
+            elif isinstance(node, exp.Table):
+                tables[node.name.lower() if node.name else ""] = None
+            elif isinstance(node, exp.Subquery):
+                if node.this:
+                    references.subqueries.append(node.this)
+            elif isinstance(node, forbidden_types):
+                references.forbidden_statements.append(type(node))
+
+        references.functions = list(functions)
+        references.tables = list(tables)
+        references.columns = list(columns)
+        return references
+
+
 class SQLValidator:
     """SQL security validator using SQLGlot for parsing and validation.
 
@@ -23,6 +90,10 @@ class SQLValidator:
     - Preventing access to blocked tables and columns
     - Rejecting multi-statement queries
     - Validating subquery safety
+
+    Parse trees are cached by a hash of the SQL text and shared by all
+    helper methods; verdicts are cached by the same hash plus the validator
+    configuration. Cached trees must not be modified.
     """
 
     # Allowed statement types at the top level (including set operations)
@@ -99,6 +170,16 @@ class SQLValidator:
             f.lower() for f in config.blocked_functions
         }
 
+        cache_size = config.validation_cache_size
+        self._parse_cache: LRUCache[bytes, list[exp.Expression | None]] | None = (
+            LRUCache(cache_size) if cache_size > 0 else None
+        )
+        # Values are 1-tuples so that a passing verdict (None) can be cached
+        self._verdict_cache: (
+            LRUCache[tuple[bytes, tuple], tuple[SecurityViolationError | SQLParseError | None]]
+            | None
+        ) = LRUCache(cache_size) if cache_size > 0 else None
+
     def validate(self, sql: str) -> tuple[bool, str | None]:
         """Validate SQL query for security compliance.
 
@@ -120,6 +201,58 @@ class SQLValidator:
         Args:
             sql: SQL query string to validate.
 
+        Raises:
+            SQLParseError: If SQL cannot be parsed.
+            SecurityViolationError: If SQL violates security constraints.
+        """
+        if self._verdict_cache is None:
+            self._validate(sql)
+            return
+
+        key = self._verdict_key(sql)
+        cached = self._verdict_cache.get(key)
+        if cached is None:
+            try:
+                self._validate(sql)
+            except (SecurityViolationError, SQLParseError) as e:
+                self._verdict_cache.put(key, (e,))
+                raise
+            self._verdict_cache.put(key, (None,))
+            return
+
+        error = cached[0]
+        if error is not None:
+            # Fresh instance so that tracebacks do not accumulate
+            raise type(error)(error.message, error.details)
+
+    def has_cached_verdict(self, sql: str) -> bool:
+        """Check whether validating a SQL query is answered from the cache.
+
+        Args:
+            sql: SQL query string.
+
+        Returns:
+            True if validate_or_raise would not parse the query.
+        """
+        return self._verdict_cache is not None and (
+            self._verdict_cache.get(self._verdict_key(sql)) is not None
+        )
+
+    def cache_verdict(
+        self, sql: str, error: SecurityViolationError | SQLParseError | None
+    ) -> None:
+        """Remember a verdict computed elsewhere, e.g. on a validation executor.
+
+        Args:
+            sql: SQL query string.
+            error: Validation error, or None if the query is valid.
+        """
+        if self._verdict_cache is not None:
+            self._verdict_cache.put(self._verdict_key(sql), (error,))
+
+    def _validate(self, sql: str) -> None:
+        """Validate SQL query without consulting the verdict cache.
+
         Raises:
             SQLParseError: If SQL cannot be parsed.
             SecurityViolationError: If SQL violates security constraints.
@@ -130,7 +263,7 @@ class SQLValidator:
 
         # Parse SQL using SQLGlot
         try:
-            parsed = sqlglot.parse(sql, read="postgres")
+            parsed = self._parse(sql)
         except Exception as e:
             raise SQLParseError(f"Failed to parse SQL: {e}") from e
 
@@ -177,21 +310,18 @@ class SQLValidator:
         else:
             main_query = statement
 
-        # Perform security checks
-        if error := self._check_statement_type(main_query):
-            raise SecurityViolationError(error)
-
-        if error := self._check_dangerous_functions(statement):
-            raise SecurityViolationError(error)
-
-        if error := self._check_blocked_tables(statement):
-            raise SecurityViolationError(error)
-
-        if error := self._check_blocked_columns(statement):
-            raise SecurityViolationError(error)
-
-        if error := self._check_subquery_safety(statement):
-            raise SecurityViolationError(error)
+        # Collect all references in one walk and check them against every rule
+        references = _QueryReferences.collect(statement, tuple(self.FORBIDDEN_STATEMENT_TYPES))
+        for check in (
+            self._check_statement_type(main_query),
+            self._check_dangerous_functions(references),
+            self._check_blocked_tables(references),
+            self._check_blocked_columns(references),
+            self._check_subquery_safety(references),
+            self._check_nested_statements(references),
+        ):
+            if check:
+                raise SecurityViolationError(check)
 
     def _check_statement_type(self, statement: exp.Expression) -> str | None:
         """Check if statement type is allowed.
@@ -215,29 +345,26 @@ class SQLValidator:
 
         return None
 
-    def _check_dangerous_functions(self, statement: exp.Expression) -> str | None:
+    def _check_dangerous_functions(self, references: _QueryReferences) -> str | None:
         """Check for use of blocked/dangerous functions.
 
         Args:
-            statement: Parsed SQL statement.
+            references: References collected from the parsed statement.
 
         Returns:
             Error message if check fails, None otherwise.
         """
-        # Find all function calls in the query
-        for func in statement.find_all(exp.Func):
-            func_name = func.name.lower() if func.name else ""
-
+        for func_name in references.functions:
             if func_name in self.blocked_functions:
                 return f"Function '{func_name}' is blocked for security reasons"
 
         return None
 
-    def _check_blocked_tables(self, statement: exp.Expression) -> str | None:
+    def _check_blocked_tables(self, references: _QueryReferences) -> str | None:
         """Check for access to blocked tables.
 
         Args:
-            statement: Parsed SQL statement.
+            references: References collected from the parsed statement.
 
         Returns:
             Error message if check fails, None otherwise.
@@ -245,20 +372,17 @@ class SQLValidator:
         if not self.blocked_tables:
             return None
 
-        # Find all table references
-        for table in statement.find_all(exp.Table):
-            table_name = table.name.lower() if table.name else ""
-
+        for table_name in references.tables:
             if table_name in self.blocked_tables:
                 return f"Access to table '{table_name}' is not allowed"
 
         return None
 
-    def _check_blocked_columns(self, statement: exp.Expression) -> str | None:
+    def _check_blocked_columns(self, references: _QueryReferences) -> str | None:
         """Check for access to blocked columns.
 
         Args:
-            statement: Parsed SQL statement.
+            references: References collected from the parsed statement.
 
         Returns:
             Error message if check fails, None otherwise.
@@ -266,45 +390,53 @@ class SQLValidator:
         if not self.blocked_columns:
             return None
 
-        # Find all column references
-        for column in statement.find_all(exp.Column):
-            column_name = column.name.lower() if column.name else ""
-
+        for table_name, column_name in references.columns:
             # Check for exact match
             if column_name in self.blocked_columns:
                 return f"Access to column '{column_name}' is not allowed"
 
             # Check for qualified column names (table.column)
-            if column.table:
-                qualified_name = f"{column.table.lower()}.{column_name}"
+            if table_name:
+                qualified_name = f"{table_name}.{column_name}"
                 if qualified_name in self.blocked_columns:
                     return f"Access to column '{qualified_name}' is not allowed"
 
         return None
 
-    def _check_subquery_safety(self, statement: exp.Expression) -> str | None:
+    def _check_subquery_safety(self, references: _QueryReferences) -> str | None:
         """Check that all subqueries only contain SELECT statements.
 
         Args:
-            statement: Parsed SQL statement.
+            references: References collected from the parsed statement.
 
         Returns:
             Error message if check fails, None otherwise.
         """
-        # Find all subqueries
-        for subquery in statement.find_all(exp.Subquery):
-            if subquery.this:
-                inner_stmt = subquery.this
+        for inner_stmt in references.subqueries:
+            # Check if the inner statement is a forbidden type
+            for forbidden_type in self.FORBIDDEN_STATEMENT_TYPES:
+                if isinstance(inner_stmt, forbidden_type):
+                    stmt_name = forbidden_type.__name__.upper()
+                    return f"{stmt_name} statements in subqueries are not allowed"
+
+            # Ensure it's a SELECT
+            if not isinstance(inner_stmt, (exp.Select, exp.With)):
+                return "Subqueries must contain only SELECT statements"
 
-                # Check if the inner statement is a forbidden type
-                for forbidden_type in self.FORBIDDEN_STATEMENT_TYPES:
-                    if isinstance(inner_stmt, forbidden_type):
-                        stmt_name = forbidden_type.__name__.upper()
-                        return f"{stmt_name} statements in subqueries are not allowed"
+        return None
+
+    def _check_nested_statements(self, references: _QueryReferences) -> str | None:
+        """Check that no forbidden statement is nested anywhere, e.g. in a CTE.
 
-                # Ensure it's a SELECT
-                if not isinstance(inner_stmt, (exp.Select, exp.With)):
-                    return "Subqueries must contain only SELECT statements"
+        Args:
+            references: References collected from the parsed statement.
+
+        Returns:
+            Error message if check fails, None otherwise.
+        """
+        if references.forbidden_statements:
+            stmt_name = references.forbidden_statements[0].__name__.upper()
+            return f"{stmt_name} statements are not allowed. Only SELECT queries are permitted."
 
         return None
 
@@ -324,7 +456,7 @@ class SQLValidator:
             SQLParseError: If SQL cannot be parsed.
         """
         try:
-            parsed = sqlglot.parse_one(sql, read="postgres")
+            parsed = self._parse_one(sql)
             # Generate normalized SQL
             return parsed.sql(dialect="postgres", pretty=False)
         except Exception as e:
@@ -343,7 +475,7 @@ class SQLValidator:
             SQLParseError: If SQL cannot be parsed.
         """
         try:
-            parsed = sqlglot.parse_one(sql, read="postgres")
+            parsed = self._parse_one(sql)
             tables = []
 
             for table in parsed.find_all(exp.Table):
@@ -353,3 +485,73 @@ class SQLValidator:
             return sorted(set(tables))
         except Exception as e:
             raise SQLParseError(f"Failed to extract tables: {e}") from e
+
+    def is_scalar_aggregate(self, sql: str) -> bool:
+        """Check whether a query aggregates everything into a single row.
+
+        True for a plain SELECT without GROUP BY whose every output column is
+        an aggregate (e.g. ``SELECT count(*), max(price) FROM orders``).
+
+        Args:
+            sql: SQL query string.
+
+        Returns:
+            bool: True for a scalar aggregate, False otherwise or if SQL cannot
+                be parsed.
+        """
+        try:
+            statement = self._parse_one(sql)
+        except Exception:
+            return False
+
+        if not isinstance(statement, exp.Select) or statement.args.get("group"):
+            return False
+        return bool(statement.expressions) and all(
+            projection.find(exp.AggFunc) is not None and projection.find(exp.Window) is None
+            for projection in statement.expressions
+        )
+
+    def _parse(self, sql: str) -> list[exp.Expression | None]:
+        """Parse SQL into statements, reusing a cached parse of the same text.
+
+        Raises:
+            sqlglot.errors.ParseError: If SQL cannot be parsed.
+        """
+        if self._parse_cache is None:
+            return sqlglot.parse(sql, read="postgres")
+
+        key = self._sql_digest(sql)
+        parsed = self._parse_cache.get(key)
+        if parsed is None:
+            parsed = sqlglot.parse(sql, read="postgres")
+            self._parse_cache.put(key, parsed)
+        return parsed
+
+    def _parse_one(self, sql: str) -> exp.Expression:
+        """Parse SQL like ``sqlglot.parse_one``, reusing a cached parse.
+
+        Raises:
+            sqlglot.errors.ParseError: If SQL cannot be parsed or is empty.
+        """
+        parsed = self._parse(sql)
+        if not parsed or parsed[0] is None:
+            raise sqlglot.errors.ParseError(f"No expression was parsed from '{sql}'")
+        return exp.Block(expressions=parsed) if len(parsed) > 1 else parsed[0]
+
+    def _verdict_key(self, sql: str) -> tuple[bytes, tuple]:
+        """Build the verdict cache key of a SQL query."""
+        return (self._sql_digest(sql), self._config_fingerprint())
+
+    @staticmethod
+    def _sql_digest(sql: str) -> bytes:
+        """Hash SQL text into a compact cache key."""
+        return hashlib.blake2b(sql.encode("utf-8"), digest_size=16).digest()
+
+    def _config_fingerprint(self) -> tuple:
+        """Get the validator settings that affect verdicts."""
+        return (
+            frozenset(self.blocked_functions),
+            frozenset(self.blocked_tables),
+            frozenset(self.blocked_columns),
+            self.allow_explain,
+        )
@@ -0,0 +1,155 @@
+"""Off-loop SQL validation.
+
+This module provides the ValidationExecutor class that runs SQLValidator
+checks on a thread or process pool, so that parsing large generated queries
+does not block other requests on the asyncio event loop.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Literal
+
+from pg_mcp.config.settings import SecurityConfig
+from pg_mcp.models.errors import SecurityViolationError, SQLParseError
+from pg_mcp.observability.metrics import MetricsCollector
+from pg_mcp.services.sql_validator import SQLValidator
+
+# Validator of the current worker thread or process
+_worker = threading.local()
+
+
+def _init_worker(
+    config: SecurityConfig,
+    blocked_tables: list[str],
+    blocked_columns: list[str],
+    allow_explain: bool,
+) -> None:
+    """Create the validator of a pool worker."""
+    _worker.validator = SQLValidator(
+        config=config,
+        blocked_tables=blocked_tables,
+        blocked_columns=blocked_columns,
+        allow_explain=allow_explain,
+    )
+
+
+def _validate_in_worker(
+    sql: str,
+) -> tuple[type[SecurityViolationError] | type[SQLParseError] | None, str, dict[str, Any], float]:
+    """Validate SQL on a pool worker.
+
+    Errors are returned rather than raised so that they cross process
+    boundaries as plain, picklable values.
+
+    Returns:
+        tuple: (error_type, message, details, seconds), where error_type is
+            None for a valid query.
+    """
+    start = time.perf_counter()
+    try:
+        _worker.validator.validate_or_raise(sql)
+    except (SecurityViolationError, SQLParseError) as e:
+        return type(e), e.message, e.details, time.perf_counter() - start
+    return None, "", {}, time.perf_counter() - start
+
+
+class ValidationExecutor:
+    """Runs SQL validation on a thread or process pool.
+
+    Every worker has its own SQLValidator with the settings of the given
+    validator. Verdicts are remembered in the given validator's cache, and
+    cached verdicts are answered on the event loop without a pool round trip.
+
+    Thread workers only release the event loop between bytecode switch
+    intervals, since parsing holds the GIL; process workers validate fully in
+    parallel at the cost of sending the SQL and verdict between processes.
+
+    Example:
+        >>> executor = ValidationExecutor(validator, kind="process", max_workers=2)
+        >>> await executor.validate_or_raise("SELECT * FROM users")
+        >>> executor.shutdown()
+    """
+
+    def __init__(
+        self,
+        validator: SQLValidator,
+        kind: Literal["thread", "process"] = "thread",
+        max_workers: int = 2,
+        metrics: MetricsCollector | None = None,
+    ) -> None:
+        """Initialize validation executor.
+
+        Args:
+            validator: Validator whose settings the workers use and whose
+                verdict cache is shared.
+            kind: Pool kind.
+            max_workers: Number of pool workers.
+            metrics: Optional metrics collector for queue depth and
+                execution time.
+        """
+        self.validator = validator
+        self.kind = kind
+        self.metrics = metrics
+        self._pending = 0
+
+        initargs = (
+            validator.config,
+            sorted(validator.blocked_tables),
+            sorted(validator.blocked_columns),
+            validator.allow_explain,
+        )
+        self._pool: Executor
+        if kind == "process":
+            self._pool = ProcessPoolExecutor(
+                max_workers=max_workers, initializer=_init_worker, initargs=initargs
+            )
+        else:
+            self._pool = ThreadPoolExecutor(
+                max_workers=max_workers,
+                thread_name_prefix="sql-validation",
+                initializer=_init_worker,
+                initargs=initargs,
+            )
+
+    async def validate_or_raise(self, sql: str) -> None:
+        """Validate SQL query on the pool and raise exception on violation.
+
+        Args:
+            sql: SQL query string to validate.
+
+        Raises:
+            SQLParseError: If SQL cannot be parsed.
+            SecurityViolationError: If SQL violates security constraints.
+        """
+        if self.validator.has_cached_verdict(sql):
+            self.validator.validate_or_raise(sql)
+            return
+
+        self._set_queue_depth(self._pending + 1)
+        try:
+            loop = asyncio.get_running_loop()
+            error_type, message, details, duration = await loop.run_in_executor(
+                self._pool, _validate_in_worker, sql
+            )
+        finally:
+            self._set_queue_depth(self._pending - 1)
+
+        if self.metrics is not None:
+            self.metrics.observe_validation_duration(self.kind, duration)
+
+        error = error_type(message, details) if error_type is not None else None
+        self.validator.cache_verdict(sql, error)
+        if error is not None:
+            raise error
+
+    def shutdown(self) -> None:
+        """Stop the pool, cancelling validations that have not started."""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _set_queue_depth(self, depth: int) -> None:
+        """Track the number of submitted, unfinished validations."""
+        self._pending = depth
+        if self.metrics is not None:
+            self.metrics.set_validation_queue_depth(self.kind, depth)
@@ -0,0 +1,224 @@
+"""Benchmarks for SQLExecutor.
+
+Runs against any reachable database (``BENCHMARK_DATABASE_NAME``, default
+``postgres``): a query producing millions of rows checks that the executor
+transfers and keeps in memory no more than ``max_rows + 1`` rows, and a
+trivial query measures the per-query overhead of session setup, and a
+catalog join measures prepared statement reuse. Connection
+parameters come from the usual ``DATABASE_*`` environment variables. The
+tests are skipped when the database is not reachable.
+
+Run with:
+    uv run pytest tests/integration/test_executor_benchmark.py -m integration -s
+"""
+
+import os
+import time
+import tracemalloc
+from collections.abc import AsyncIterator
+
+import asyncpg
+import pytest
+from asyncpg import Connection
+from asyncpg.types import Attribute
+
+from pg_mcp.config.settings import DatabaseConfig, SecurityConfig
+from pg_mcp.db.pool import create_pool
+from pg_mcp.services.sql_executor import SQLExecutor, StatementCache, build_session_settings
+from pg_mcp.services.sql_validator import SQLValidator
+
+pytestmark = pytest.mark.integration
+
+ROW_COUNT = 2_000_000
+LARGE_QUERY = "SELECT g AS id, md5(g::text) AS value FROM generate_series(1, 2000000) AS g"
+
+SESSION_QUERIES = 500
+
+# Equivalent spellings of a query whose planning cost dominates its execution
+JOIN_QUERIES = [
+    "SELECT c.relname, n.nspname, count(a.attnum) AS columns, max(d.description) AS comment "
+    "FROM pg_class c JOIN pg_namespace n ON n.oid = c.relnamespace "
+    "JOIN pg_attribute a ON a.attrelid = c.oid "
+    "LEFT JOIN pg_description d ON d.objoid = c.oid AND d.objsubid = 0 "
+    "WHERE c.relname IN ('pg_class', 'pg_type', 'pg_proc') GROUP BY c.relname, n.nspname",
+    "select c.relname, n.nspname, count(a.attnum) as columns, max(d.description) as comment\n"
+    "from pg_class c\n  join pg_namespace n on n.oid = c.relnamespace\n"
+    "  join pg_attribute a on a.attrelid = c.oid\n"
+    "  left join pg_description d on d.objoid = c.oid and d.objsubid = 0\n"
+    "where c.relname in ('pg_class', 'pg_type', 'pg_proc')\ngroup by c.relname, n.nspname",
+]
+
+
+class LegacySessionExecutor(SQLExecutor):
+    """Executor sending one SET statement per session parameter, as before."""
+
+    async def _set_session_params(self, conn: Connection, timeout: float) -> None:  # noqa: ASYNC109
+        await conn.execute(f"SET statement_timeout = {int(timeout * 1000)}")
+        await conn.execute(f"SET search_path = '{self.security_config.safe_search_path}'")
+
+
+class PreparePerQueryExecutor(SQLExecutor):
+    """Executor preparing every query without asyncpg's statement cache."""
+
+    async def _fetch_bounded(
+        self,
+        conn: Connection,
+        sql: str,
+        max_rows: int,
+        count_total: bool,
+    ) -> tuple[tuple[Attribute, ...], list[asyncpg.Record], int | None]:
+        statement = await conn.prepare(sql)
+        cursor = await statement.cursor()
+        records = await cursor.fetch(max_rows + 1)
+        return statement.get_attributes(), records[:max_rows], len(records)
+
+
+def _benchmark_db_config() -> DatabaseConfig:
+    """Configuration of the benchmark database with a single connection."""
+    return DatabaseConfig(
+        name=os.environ.get("BENCHMARK_DATABASE_NAME", "postgres"),
+        min_pool_size=1,
+        max_pool_size=1,
+    )
+
+
+async def _create_pool_or_skip(
+    config: DatabaseConfig, server_settings: dict[str, str] | None = None
+) -> asyncpg.Pool:
+    """Create a pool for the benchmark database, or skip."""
+    try:
+        return await create_pool(config, server_settings=server_settings)
+    except (OSError, asyncpg.PostgresError) as e:
+        pytest.skip(f"Benchmark database not available: {e}")
+
+
+@pytest.fixture
+async def executor() -> AsyncIterator[SQLExecutor]:
+    """SQL executor for the benchmark database, or skip."""
+    config = _benchmark_db_config()
+    pool = await _create_pool_or_skip(config)
+    try:
+        yield SQLExecutor(pool, SecurityConfig(max_rows=1000, max_execution_time=120), config)
+    finally:
+        await pool.close()
+
+
+async def _measure(executor: SQLExecutor, count_total: bool) -> tuple[int, int | None, float, int]:
+    """Execute the large query and return (rows, total, seconds, peak_bytes)."""
+    tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        results, total = await executor.execute(LARGE_QUERY, count_total=count_total)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return len(results), total, elapsed, peak
+
+
+@pytest.mark.asyncio
+async def test_bounded_fetch_benchmark(executor: SQLExecutor) -> None:
+    """Check that memory is bounded by max_rows regardless of result size."""
+    rows, total, elapsed, peak = await _measure(executor, count_total=False)
+    counted_rows, counted_total, counted_elapsed, counted_peak = await _measure(
+        executor, count_total=True
+    )
+
+    print(
+        f"\nFetching 1000 of {ROW_COUNT} rows:\n"
+        f"  bounded:        {elapsed * 1000:8.1f} ms, peak {peak / 1e6:6.1f} MB\n"
+        f"  bounded+count:  {counted_elapsed * 1000:8.1f} ms, peak {counted_peak / 1e6:6.1f} MB"
+    )
+
+    assert rows == counted_rows == 1000
+    assert total is None
+    assert counted_total == ROW_COUNT
+    # 1000 rows of two short columns; fetching everything would take hundreds of MB
+    assert peak < 10_000_000
+    assert counted_peak < 10_000_000
+
+
+async def _mean_latency(executor: SQLExecutor) -> float:
+    """Mean latency in seconds of a trivial query after warm-up."""
+    for _ in range(20):
+        await executor.execute("SELECT 1")
+    start = time.perf_counter()
+    for _ in range(SESSION_QUERIES):
+        await executor.execute("SELECT 1")
+    return (time.perf_counter() - start) / SESSION_QUERIES
+
+
+@pytest.mark.asyncio
+async def test_session_setup_benchmark() -> None:
+    """Compare per-query latency of session setup strategies."""
+    config = _benchmark_db_config()
+    security = SecurityConfig()
+    plain_pool = await _create_pool_or_skip(config)
+    preconfigured_pool = await _create_pool_or_skip(
+        config, server_settings=build_session_settings(security)
+    )
+    try:
+        legacy = await _mean_latency(LegacySessionExecutor(plain_pool, security, config))
+        combined = await _mean_latency(SQLExecutor(plain_pool, security, config))
+        preconfigured = await _mean_latency(
+            SQLExecutor(preconfigured_pool, security, config, session_preconfigured=True)
+        )
+    finally:
+        await plain_pool.close()
+        await preconfigured_pool.close()
+
+    print(
+        f"\nMean latency of SELECT 1 over {SESSION_QUERIES} queries:\n"
+        f"  separate SETs:        {legacy * 1e6:7.0f} us\n"
+        f"  single SET LOCAL:     {combined * 1e6:7.0f} us\n"
+        f"  preconfigured pool:   {preconfigured * 1e6:7.0f} us"
+    )
+
+    assert preconfigured < legacy
+
+
+async def _mean_join_latency(executor: SQLExecutor) -> tuple[float, list[dict]]:
+    """Mean latency in seconds of the join queries, and their last result."""
+    for sql in JOIN_QUERIES * 10:
+        results, _ = await executor.execute(sql)
+    start = time.perf_counter()
+    for i in range(SESSION_QUERIES):
+        results, _ = await executor.execute(JOIN_QUERIES[i % len(JOIN_QUERIES)])
+    return (time.perf_counter() - start) / SESSION_QUERIES, results
+
+
+@pytest.mark.asyncio
+async def test_statement_cache_benchmark() -> None:
+    """Compare per-query latency of preparing every query and asyncpg's cache."""
+    security = SecurityConfig()
+    config = _benchmark_db_config().model_copy(update={"statement_cache_size": 16})
+    pool = await _create_pool_or_skip(config, server_settings=build_session_settings(security))
+    statement_cache = StatementCache(
+        config.statement_cache_size, normalize=SQLValidator(config=security).normalize_sql
+    )
+    try:
+        uncached, uncached_results = await _mean_join_latency(
+            PreparePerQueryExecutor(pool, security, config, session_preconfigured=True)
+        )
+        cached, cached_results = await _mean_join_latency(
+            SQLExecutor(
+                pool,
+                security,
+                config,
+                session_preconfigured=True,
+                statement_cache=statement_cache,
+            )
+        )
+    finally:
+        await pool.close()
+
+    print(
+        f"\nMean latency of a catalog join over {SESSION_QUERIES} queries:\n"
+        f"  prepared per query:   {uncached * 1e6:7.0f} us\n"
+        f"  reused statement:     {cached * 1e6:7.0f} us"
+    )
+
+    assert cached_results == uncached_results
+    # Both spellings count as one repeated statement, each runs as its own prepared statement
+    assert len(statement_cache) == 1
+    assert cached < uncached
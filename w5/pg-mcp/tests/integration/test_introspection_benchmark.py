@@ -0,0 +1,160 @@
+"""Benchmark for bulk vs per-table schema introspection.
+
+Runs against the ``saas_crm_large`` database created from
+``fixtures/03_large_db.sql`` (``make -C fixtures create-large``). Connection
+parameters come from the usual ``DATABASE_*`` environment variables; the
+database name can be overridden with ``BENCHMARK_DATABASE_NAME``. The test is
+skipped when the database is not reachable.
+
+Run with:
+    uv run pytest tests/integration/test_introspection_benchmark.py -m integration -s
+"""
+
+import os
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+import asyncpg
+import pytest
+
+from pg_mcp.cache.schema_cache import SchemaCache
+from pg_mcp.config.settings import CacheConfig, DatabaseConfig
+from pg_mcp.db.introspection import SchemaIntrospector
+from pg_mcp.db.pool import create_pool
+
+pytestmark = pytest.mark.integration
+
+
+class CountingConnection:
+    """Connection proxy that counts query round trips."""
+
+    def __init__(self, conn: asyncpg.Connection) -> None:
+        self._conn = conn
+        self.round_trips = 0
+
+    async def fetch(self, *args: Any, **kwargs: Any) -> Any:
+        self.round_trips += 1
+        return await self._conn.fetch(*args, **kwargs)
+
+    async def fetchval(self, *args: Any, **kwargs: Any) -> Any:
+        self.round_trips += 1
+        return await self._conn.fetchval(*args, **kwargs)
+
+
+class CountingPool:
+    """Pool proxy handing out round-trip counting connections."""
+
+    def __init__(self, pool: asyncpg.Pool) -> None:
+        self._pool = pool
+        self.round_trips = 0
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[CountingConnection]:
+        async with self._pool.acquire() as conn:
+            counting = CountingConnection(conn)
+            try:
+                yield counting
+            finally:
+                self.round_trips += counting.round_trips
+
+
+@pytest.fixture
+async def large_db_pool() -> AsyncIterator[asyncpg.Pool]:
+    """Connection pool for the large fixture database, or skip."""
+    config = DatabaseConfig(
+        name=os.environ.get("BENCHMARK_DATABASE_NAME", "saas_crm_large"),
+        min_pool_size=1,
+        max_pool_size=4,
+    )
+    try:
+        pool = await create_pool(config)
+    except (OSError, asyncpg.PostgresError) as e:
+        pytest.skip(f"Benchmark database not available: {e}")
+
+    try:
+        yield pool
+    finally:
+        await pool.close()
+
+
+async def _run(pool: asyncpg.Pool, bulk: bool, concurrency: int = 1) -> tuple[Any, int, float]:
+    """Introspect once and return (schema, round_trips, seconds)."""
+    counting_pool = CountingPool(pool)
+    introspector = SchemaIntrospector(
+        counting_pool,  # type: ignore[arg-type]
+        "benchmark",
+        bulk=bulk,
+        concurrency=concurrency,
+    )
+    start = time.perf_counter()
+    schema = await introspector.introspect()
+    elapsed = time.perf_counter() - start
+    return schema, counting_pool.round_trips, elapsed
+
+
+@pytest.mark.asyncio
+async def test_bulk_introspection_benchmark(large_db_pool: asyncpg.Pool) -> None:
+    """Compare round trips and wall time of bulk and per-table introspection."""
+    legacy_schema, legacy_trips, legacy_time = await _run(large_db_pool, bulk=False)
+    bulk_schema, bulk_trips, bulk_time = await _run(large_db_pool, bulk=True)
+    parallel_schema, parallel_trips, parallel_time = await _run(
+        large_db_pool, bulk=True, concurrency=4
+    )
+
+    print(
+        f"\nIntrospection of {len(bulk_schema.tables)} relations:\n"
+        f"  per-table: {legacy_trips:6d} round trips, {legacy_time * 1000:9.1f} ms\n"
+        f"  bulk:      {bulk_trips:6d} round trips, {bulk_time * 1000:9.1f} ms\n"
+        f"  bulk x4:   {parallel_trips:6d} round trips, {parallel_time * 1000:9.1f} ms"
+    )
+
+    # All modes must describe the same schema
+    assert bulk_schema.model_dump() == legacy_schema.model_dump()
+    assert parallel_schema.model_dump() == bulk_schema.model_dump()
+    assert bulk_trips <= 6
+    assert bulk_trips < legacy_trips
+
+
+@pytest.mark.asyncio
+async def test_incremental_refresh_benchmark(large_db_pool: asyncpg.Pool) -> None:
+    """Compare incremental refresh traffic with a full reload after DDL."""
+    cache = SchemaCache(CacheConfig(incremental_refresh=True))
+    counting_pool = CountingPool(large_db_pool)
+    await cache.load("benchmark", counting_pool)  # type: ignore[arg-type]
+    full_trips = counting_pool.round_trips
+
+    counting_pool.round_trips = 0
+    await cache.refresh("benchmark", counting_pool)  # type: ignore[arg-type]
+    unchanged_trips = counting_pool.round_trips
+
+    await large_db_pool.execute("CREATE TABLE benchmark_incremental (id int PRIMARY KEY)")
+    try:
+        counting_pool.round_trips = 0
+        start = time.perf_counter()
+        await cache.refresh("benchmark", counting_pool)  # type: ignore[arg-type]
+        changed_time = time.perf_counter() - start
+        changed_trips = counting_pool.round_trips
+
+        expected, _, _ = await _run(large_db_pool, bulk=True)
+        patched = cache.get("benchmark")
+        assert patched is not None
+        assert patched.model_dump() == expected.model_dump()
+    finally:
+        await large_db_pool.execute("DROP TABLE benchmark_incremental")
+
+    await cache.refresh("benchmark", counting_pool)  # type: ignore[arg-type]
+    expected, _, _ = await _run(large_db_pool, bulk=True)
+    assert cache.get("benchmark").model_dump() == expected.model_dump()  # type: ignore[union-attr]
+
+    print(
+        f"\nSchema refresh round trips:\n"
+        f"  full load:           {full_trips:3d}\n"
+        f"  unchanged catalog:   {unchanged_trips:3d}\n"
+        f"  one table created:   {changed_trips:3d} ({changed_time * 1000:.1f} ms)"
+    )
+
+    # Catalog fingerprint and row estimates
+    assert unchanged_trips == 2
+    assert changed_trips <= 8
@@ -0,0 +1,77 @@
+"""Benchmark for RateLimiter acquire/release throughput.
+
+Compares the synchronous counter updates of RateLimiter with the previous
+accounting, which took a lock around every counter update and decremented the
+active count in a separate task. Needs no database.
+
+Run with:
+    uv run pytest tests/integration/test_rate_limiter_benchmark.py -m integration -s
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from pg_mcp.resilience.rate_limiter import RateLimiter
+
+pytestmark = pytest.mark.integration
+
+WORKERS = 20
+ROUNDS = 500
+
+
+class LegacyRateLimiter(RateLimiter):
+    """Limiter locking on every counter update, as before."""
+
+    def __init__(self, max_concurrent: int) -> None:
+        super().__init__(max_concurrent)
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, *, timeout: float | None = None) -> bool:  # noqa: ASYNC109
+        async with self._lock:
+            self._total_requests += 1
+        await self._semaphore.acquire()
+        async with self._lock:
+            self._active_count += 1
+        return True
+
+    def release(self) -> None:
+        self._semaphore.release()
+        asyncio.get_running_loop().create_task(self._decrement())
+
+    async def _decrement(self) -> None:
+        async with self._lock:
+            self._active_count = max(0, self._active_count - 1)
+
+
+async def _run(limiter: RateLimiter) -> float:
+    """Run WORKERS tasks of ROUNDS acquire/release pairs and return seconds."""
+
+    async def worker() -> None:
+        for _ in range(ROUNDS):
+            async with limiter():
+                await asyncio.sleep(0)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(WORKERS)))
+    # Let the legacy limiter's pending decrements finish
+    await asyncio.sleep(0)
+    return time.perf_counter() - start
+
+
+@pytest.mark.asyncio
+async def test_acquire_release_benchmark() -> None:
+    """Benchmark acquire/release throughput against lock and task based accounting."""
+    legacy_limiter = LegacyRateLimiter(max_concurrent=5)
+    limiter = RateLimiter(max_concurrent=5)
+    legacy = await _run(legacy_limiter)
+    synchronous = await _run(limiter)
+
+    print(
+        f"\n{WORKERS * ROUNDS:,} acquire/release pairs: "
+        f"lock and task {legacy * 1000:.1f} ms, synchronous {synchronous * 1000:.1f} ms"
+    )
+    assert limiter.get_stats()["total_requests"] == WORKERS * ROUNDS
+    assert limiter.active_count == 0
+    assert synchronous * 1.2 < legacy
@@ -0,0 +1,82 @@
+"""Benchmark for schema prompt context assembly.
+
+Compares rendering the prompt sections of a 1,000-table schema on every call
+with the memoized ``DatabaseSchema.to_prompt_context``. Needs no database.
+
+Run with:
+    uv run pytest tests/integration/test_schema_prompt_benchmark.py -m integration -s
+"""
+
+import time
+
+import pytest
+
+from pg_mcp.models.schema import (
+    ColumnInfo,
+    DatabaseSchema,
+    ForeignKeyInfo,
+    IndexInfo,
+    TableInfo,
+)
+
+pytestmark = pytest.mark.integration
+
+TABLE_COUNT = 1000
+COLUMNS_PER_TABLE = 10
+ROUNDS = 5
+
+
+def _make_tables() -> list[TableInfo]:
+    """Build TABLE_COUNT tables with columns, a foreign key and an index each."""
+    return [
+        TableInfo(
+            table_name=f"table_{i}",
+            comment=f"Table number {i}",
+            row_count_estimate=i * 100,
+            columns=[
+                ColumnInfo(
+                    name=f"column_{j}",
+                    data_type="varchar(255)",
+                    is_nullable=j % 2 == 0,
+                    is_primary_key=j == 0,
+                    comment=f"Column {j}",
+                )
+                for j in range(COLUMNS_PER_TABLE)
+            ],
+            foreign_keys=[
+                ForeignKeyInfo(
+                    constraint_name=f"fk_{i}",
+                    column_name="column_1",
+                    referenced_table=f"table_{(i + 1) % TABLE_COUNT}",
+                    referenced_column="column_0",
+                )
+            ],
+            indexes=[IndexInfo(name=f"idx_{i}", columns=["column_2"])],
+        )
+        for i in range(TABLE_COUNT)
+    ]
+
+
+def test_prompt_context_benchmark() -> None:
+    """Benchmark cached prompt assembly on a 1,000-table schema."""
+    tables = _make_tables()
+    schema = DatabaseSchema(database_name="benchmark", tables=tables)
+
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        rendered = "\n".join(table.to_prompt_section() for table in tables)
+    uncached = (time.perf_counter() - start) / ROUNDS
+
+    expected = schema.to_prompt_context()  # warm the memo
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        context = schema.to_prompt_context()
+    cached = (time.perf_counter() - start) / ROUNDS
+
+    print(
+        f"\nPrompt context for {TABLE_COUNT:,} tables: "
+        f"render {uncached * 1000:.2f} ms, cached {cached * 1000:.2f} ms"
+    )
+    assert context == expected
+    assert context.endswith(rendered)
+    assert cached * 5 < uncached
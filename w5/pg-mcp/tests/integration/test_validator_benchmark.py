@@ -0,0 +1,54 @@
+"""Benchmark for SQLValidator reference collection.
+
+Compares the single tree walk of ``_QueryReferences.collect`` with one
+sqlglot tree search per validation rule on a query of 12 nested CTEs. Needs
+no database.
+
+Run with:
+    uv run pytest tests/integration/test_validator_benchmark.py -m integration
+"""
+
+import time
+
+import pytest
+import sqlglot
+from sqlglot import exp
+
+from pg_mcp.services.sql_validator import SQLValidator, _QueryReferences
+
+pytestmark = pytest.mark.integration
+
+CTE_DEPTH = 12
+RUNS = 50
+
+
+def _nested_cte_query(depth: int) -> str:
+    """Build a query of depth chained CTEs, each with an IN subquery."""
+    ctes = ["c0 AS (SELECT id, amount, created_at FROM orders WHERE status = 'paid')"]
+    for i in range(1, depth):
+        ctes.append(
+            f"c{i} AS (SELECT id, sum(amount) AS amount, max(created_at) AS created_at "  # noqa: S608
+            f"FROM c{i - 1} WHERE amount > {i} AND id IN "
+            f"(SELECT user_id FROM users WHERE lower(name) LIKE 'a%') GROUP BY id)"
+        )
+    return f"WITH {', '.join(ctes)} SELECT * FROM c{depth - 1} ORDER BY amount DESC LIMIT 10"  # noqa: S608
+
+
+def test_nested_cte_benchmark() -> None:
+    """Benchmark the single walk against one tree search per rule."""
+    tree = sqlglot.parse_one(_nested_cte_query(CTE_DEPTH), read="postgres")
+    forbidden = tuple(SQLValidator.FORBIDDEN_STATEMENT_TYPES)
+    assert sum(1 for _ in tree.walk()) > 300
+
+    start = time.perf_counter()
+    for _ in range(RUNS):
+        for node_type in (exp.Func, exp.Table, exp.Column, exp.Subquery):
+            list(tree.find_all(node_type))
+    per_rule = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(RUNS):
+        _QueryReferences.collect(tree, forbidden)
+    single_pass = time.perf_counter() - start
+
+    assert single_pass * 1.5 < per_rule
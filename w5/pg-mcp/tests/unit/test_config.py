@@ -14,7 +14,11 @@ from pg_mcp.config.settings import (
     DatabaseConfig,
     ObservabilityConfig,
     OpenAIConfig,
+    PoolManagerConfig,
+    QueryCacheConfig,
+    RateLimitConfig,
     ResilienceConfig,
+    SchemaContextConfig,
     SecurityConfig,
     Settings,
     ValidationConfig,
@@ -35,6 +39,7 @@ class TestDatabaseConfig:
         assert config.user == "postgres"
         assert config.min_pool_size == 5
         assert config.max_pool_size == 20
+        assert config.statement_cache_size == 0
 
     def test_custom_values(self) -> None:
         """Test custom configuration values."""
@@ -93,6 +98,73 @@ class TestDatabaseConfig:
         with pytest.raises(ValidationError):
             DatabaseConfig(max_pool_size=101)
 
+    def test_additional_names_from_env(self) -> None:
+        """Test additional databases are parsed from a comma-separated list."""
+        os.environ["DATABASE_ADDITIONAL_NAMES"] = "sales, analytics,sales"
+        try:
+            config = DatabaseConfig(name="main")
+            assert config.additional_names == ["sales", "analytics", "sales"]
+            databases = config.all_databases()
+            assert [db.name for db in databases] == ["main", "sales", "analytics"]
+            assert all(db.additional_names == [] for db in databases)
+        finally:
+            del os.environ["DATABASE_ADDITIONAL_NAMES"]
+
+
+class TestPoolManagerConfig:
+    """Tests for PoolManagerConfig."""
+
+    def test_default_values(self) -> None:
+        """Test default configuration values."""
+        config = PoolManagerConfig()
+        assert config.prewarm is True
+        assert config.max_total_connections == 200
+        assert config.idle_ttl == 0.0
+
+    def test_invalid_values(self) -> None:
+        """Test invalid values are rejected."""
+        with pytest.raises(ValidationError):
+            PoolManagerConfig(max_total_connections=0)
+
+        with pytest.raises(ValidationError):
+            PoolManagerConfig(idle_ttl=-1)
+
+
+class TestRateLimitConfig:
+    """Tests for RateLimitConfig."""
+
+    def test_default_values(self) -> None:
+        """Test default configuration values."""
+        config = RateLimitConfig()
+        assert config.max_concurrent_queries == 10
+        assert config.max_concurrent_llm == 5
+        assert config.llm_requests_per_minute == 0.0
+        assert config.llm_tokens_per_minute == 0.0
+        assert config.adaptive_queries is False
+
+    def test_invalid_values(self) -> None:
+        """Test invalid values are rejected."""
+        with pytest.raises(ValidationError):
+            RateLimitConfig(max_concurrent_llm=0)
+
+        with pytest.raises(ValidationError):
+            RateLimitConfig(adaptive_backoff_ratio=1.0)
+
+        with pytest.raises(ValidationError, match="adaptive_min_queries"):
+            RateLimitConfig(adaptive_min_queries=20, adaptive_max_queries=10)
+
+        with pytest.raises(ValidationError, match="weights"):
+            RateLimitConfig(client_weights="alice=0")
+
+    def test_fair_queue_from_env(self) -> None:
+        """Test parsing priority order and weights from environment values."""
+        config = RateLimitConfig(
+            priority_order="result, sql", client_weights="alice=2, bob=0.5", database_weights=""
+        )
+        assert config.priority_order == ["result", "sql"]
+        assert config.client_weights == {"alice": 2.0, "bob": 0.5}
+        assert config.database_weights == {}
+
 
 class TestOpenAIConfig:
     """Tests for OpenAIConfig."""
@@ -159,7 +231,10 @@ class TestSecurityConfig:
         config = SecurityConfig()
         assert config.allow_write_operations is False
         assert config.max_rows == 10000
+        assert config.count_total_rows is False
         assert config.max_execution_time == 30.0
+        assert config.validation_cache_size == 512
+        assert config.validation_executor == "none"
         assert "pg_sleep" in config.blocked_functions
         assert "pg_read_file" in config.blocked_functions
 
@@ -201,6 +276,10 @@ class TestValidationConfig:
         config = ValidationConfig()
         assert config.max_question_length == 10000
         assert config.min_confidence_score == 70
+        assert config.background is False
+        assert config.background_max_results == 1000
+        assert config.background_result_ttl == 600.0
+        assert config.skip_scalar_aggregates is False
 
     def test_custom_values(self) -> None:
         """Test custom configuration values."""
@@ -229,6 +308,10 @@ class TestCacheConfig:
         assert config.schema_ttl == 3600
         assert config.max_size == 100
         assert config.enabled is True
+        assert config.bulk_introspection is True
+        assert config.introspection_concurrency == 1
+        assert config.incremental_refresh is True
+        assert config.snapshot_dir is None
 
     def test_custom_values(self) -> None:
         """Test custom configuration values."""
@@ -250,6 +333,49 @@ class TestCacheConfig:
             CacheConfig(schema_ttl=90000)
 
 
+class TestQueryCacheConfig:
+    """Tests for QueryCacheConfig."""
+
+    def test_default_values(self) -> None:
+        """Test default configuration values."""
+        config = QueryCacheConfig()
+        assert config.enabled is True
+        assert config.sql_max_size == 1000
+        assert config.sql_ttl == 3600.0
+        assert config.result_max_size == 100
+        assert config.result_ttl == 0.0
+        assert config.result_ttl_by_database == {}
+
+    def test_result_ttl_by_database_from_env(self) -> None:
+        """Test per-database result TTLs are parsed from JSON."""
+        os.environ["QUERY_CACHE_RESULT_TTL_BY_DATABASE"] = '{"analytics": 300}'
+        try:
+            config = QueryCacheConfig()
+            assert config.result_ttl_by_database == {"analytics": 300.0}
+        finally:
+            del os.environ["QUERY_CACHE_RESULT_TTL_BY_DATABASE"]
+
+
+class TestSchemaContextConfig:
+    """Tests for SchemaContextConfig."""
+
+    def test_default_values(self) -> None:
+        """Test default configuration values."""
+        config = SchemaContextConfig()
+        assert config.pruning_enabled is True
+        assert config.max_tokens == 8000
+        assert config.max_tables == 30
+        assert config.fk_expansion_depth == 1
+
+    def test_invalid_values(self) -> None:
+        """Test invalid values are rejected."""
+        with pytest.raises(ValidationError):
+            SchemaContextConfig(max_tokens=100)
+
+        with pytest.raises(ValidationError):
+            SchemaContextConfig(fk_expansion_depth=4)
+
+
 class TestResilienceConfig:
     """Tests for ResilienceConfig."""
 
@@ -259,6 +385,12 @@ class TestResilienceConfig:
         assert config.max_retries == 3
         assert config.circuit_breaker_threshold == 5
         assert config.circuit_breaker_timeout == 60.0
+        assert config.circuit_breaker_half_open_max_calls == 1
+        assert config.speculative_candidates == 1
+        assert config.speculative_temperature_step == 0.3
+        assert config.explain_dry_run is False
+        assert config.max_plan_cost == 0.0
+        assert config.max_plan_rows == 0.0
 
     def test_custom_values(self) -> None:
         """Test custom configuration values."""
@@ -277,6 +409,9 @@ class TestResilienceConfig:
         with pytest.raises(ValidationError):
             ResilienceConfig(circuit_breaker_threshold=0)
 
+        with pytest.raises(ValidationError):
+            ResilienceConfig(circuit_breaker_half_open_max_calls=0)
+
 
 class TestObservabilityConfig:
     """Tests for ObservabilityConfig."""
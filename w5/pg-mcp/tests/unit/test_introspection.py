@@ -0,0 +1,362 @@
+"""Unit tests for SchemaIntrospector.
+
+This module tests schema introspection against a mocked asyncpg connection,
+covering both the bulk catalog mode and the legacy per-table mode.
+"""
+
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from pg_mcp.db.introspection import CATALOG_FINGERPRINT_QUERY, SchemaIntrospector
+from pg_mcp.models.schema import TableInfo
+
+
+def make_relations(count: int) -> list[dict[str, Any]]:
+    """Build relation rows as returned by the bulk relations query."""
+    return [
+        {
+            "oid": 1000 + i,
+            "schema_name": "public",
+            "table_name": f"table_{i}",
+            "comment": None,
+            "row_count_estimate": i * 10,
+        }
+        for i in range(count)
+    ]
+
+
+def make_columns(relations: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Build two column rows (id, name) for every relation."""
+    rows = []
+    for rel in relations:
+        rows.append(
+            {
+                "oid": rel["oid"],
+                "column_name": "id",
+                "data_type": "integer",
+                "is_nullable": False,
+                "default_value": None,
+                "comment": None,
+                "is_primary_key": True,
+                "is_unique": False,
+            }
+        )
+        rows.append(
+            {
+                "oid": rel["oid"],
+                "column_name": "name",
+                "data_type": "text",
+                "is_nullable": True,
+                "default_value": None,
+                "comment": "Display name",
+                "is_primary_key": False,
+                "is_unique": True,
+            }
+        )
+    return rows
+
+
+@pytest.fixture
+def mock_connection() -> MagicMock:
+    """Create a mock asyncpg connection."""
+    conn = MagicMock()
+    conn.fetchval = AsyncMock(return_value="PostgreSQL 16.1, compiled by gcc")
+    conn.fetch = AsyncMock()
+    return conn
+
+
+@pytest.fixture
+def mock_pool(mock_connection: MagicMock) -> MagicMock:
+    """Create a mock asyncpg pool yielding the mock connection."""
+    pool = MagicMock()
+    acquire_mock = MagicMock()
+    acquire_mock.__aenter__ = AsyncMock(return_value=mock_connection)
+    acquire_mock.__aexit__ = AsyncMock(return_value=None)
+    pool.acquire = MagicMock(return_value=acquire_mock)
+    return pool
+
+
+def route_bulk_queries(
+    conn: MagicMock,
+    relations: list[dict[str, Any]],
+    columns: list[dict[str, Any]],
+    foreign_keys: list[dict[str, Any]] | None = None,
+    indexes: list[dict[str, Any]] | None = None,
+) -> None:
+    """Route bulk catalog queries on the mock connection to canned rows."""
+
+    async def fetch(query: str, *args: Any) -> list[dict[str, Any]]:
+        if "FROM pg_class c" in query and "relkind IN" in query:
+            return relations
+        if "contype = 'f'" in query:
+            return foreign_keys or []
+        if "FROM pg_index idx" in query:
+            return indexes or []
+        if "FROM pg_attribute a" in query:
+            return columns
+        if "FROM pg_type t" in query:
+            return []
+        raise AssertionError(f"Unexpected query: {query}")
+
+    conn.fetch.side_effect = fetch
+
+
+class TestBulkIntrospection:
+    """Test suite for bulk catalog introspection."""
+
+    @pytest.mark.asyncio
+    async def test_assembles_tables_from_bulk_rows(
+        self, mock_pool: MagicMock, mock_connection: MagicMock
+    ) -> None:
+        """Test that bulk rows are grouped into the right TableInfo objects."""
+        relations = make_relations(2)
+        route_bulk_queries(
+            mock_connection,
+            relations,
+            make_columns(relations),
+            foreign_keys=[
+                {
+                    "oid": 1001,
+                    "constraint_name": "fk_table_1_table_0",
+                    "column_name": "id",
+                    "referenced_table": "table_0",
+                    "referenced_column": "id",
+                }
+            ],
+            indexes=[
+                {
+                    "oid": 1000,
+                    "index_name": "idx_table_0_name",
+                    "is_unique": True,
+                    "index_type": "btree",
+                    "columns": ["name"],
+                }
+            ],
+        )
+
+        schema = await SchemaIntrospector(mock_pool, "test_db").introspect()
+
+        assert schema.version == "PostgreSQL 16.1"
+        assert [t.table_name for t in schema.tables] == ["table_0", "table_1"]
+
+        table_0, table_1 = schema.tables
+        assert [c.name for c in table_0.columns] == ["id", "name"]
+        assert table_0.columns[0].is_primary_key is True
+        assert table_0.columns[1].is_unique is True
+        assert table_0.columns[1].comment == "Display name"
+        assert table_0.row_count_estimate == 0
+        assert table_1.row_count_estimate == 10
+
+        assert table_0.foreign_keys == []
+        assert table_1.foreign_keys[0].referenced_table == "table_0"
+        assert table_0.indexes[0].name == "idx_table_0_name"
+        assert table_1.indexes == []
+
+    @pytest.mark.asyncio
+    async def test_round_trips_independent_of_table_count(
+        self, mock_pool: MagicMock, mock_connection: MagicMock
+    ) -> None:
+        """Test that bulk mode issues a fixed number of queries."""
+        round_trips = []
+        for count in (1, 50, 500):
+            mock_connection.fetch.reset_mock()
+            mock_connection.fetchval.reset_mock()
+            relations = make_relations(count)
+            route_bulk_queries(mock_connection, relations, make_columns(relations))
+
+            schema = await SchemaIntrospector(mock_pool, "test_db").introspect()
+
+            assert len(schema.tables) == count
+            round_trips.append(
+                mock_connection.fetch.call_count + mock_connection.fetchval.call_count
+            )
+
+        assert round_trips[0] == round_trips[1] == round_trips[2]
+        assert round_trips[0] <= 6
+
+    @pytest.mark.asyncio
+    async def test_empty_database_skips_detail_queries(
+        self, mock_pool: MagicMock, mock_connection: MagicMock
+    ) -> None:
+        """Test that no per-relation catalogs are queried when there are no relations."""
+        route_bulk_queries(mock_connection, [], [])
+
+        schema = await SchemaIntrospector(mock_pool, "test_db").introspect()
+
+        assert schema.tables == []
+        # relations + enum types only
+        assert mock_connection.fetch.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_legacy_mode_queries_per_table(
+        self, mock_pool: MagicMock, mock_connection: MagicMock
+    ) -> None:
+        """Test that bulk=False keeps the per-table introspection path."""
+
+        async def fetch(query: str, *args: Any) -> list[dict[str, Any]]:
+            if "relkind = 'r'" in query:
+                return [{"schema_name": "public", "table_name": "users", "comment": None}]
+            return []
+
+        mock_connection.fetch.side_effect = fetch
+        mock_connection.fetchval.side_effect = ["PostgreSQL 16.1, compiled by gcc", 42]
+
+        schema = await SchemaIntrospector(mock_pool, "test_db", bulk=False).introspect()
+
+        assert [t.table_name for t in schema.tables] == ["users"]
+        assert schema.tables[0].row_count_estimate == 42
+        queries = [call.args[0] for call in mock_connection.fetch.call_args_list]
+        assert any("WHERE c.relname = $1" in q for q in queries)
+
+
+class TestParallelIntrospection:
+    """Test suite for concurrent bulk introspection across pool connections."""
+
+    def test_invalid_concurrency(self, mock_pool: MagicMock) -> None:
+        """Test that concurrency below 1 is rejected."""
+        with pytest.raises(ValueError):
+            SchemaIntrospector(mock_pool, "test_db", concurrency=0)
+
+    def test_partition_by_schema(self, mock_pool: MagicMock) -> None:
+        """Test that relations from different schemas land in different chunks."""
+        relations = make_relations(4)
+        relations[2]["schema_name"] = "sales"
+        relations[3]["schema_name"] = "sales"
+        tables = {
+            rel["oid"]: TableInfo(schema_name=rel["schema_name"], table_name=rel["table_name"])
+            for rel in relations
+        }
+
+        chunks = SchemaIntrospector(mock_pool, "test_db", concurrency=2)._partition(tables)
+
+        assert [sorted(chunk) for chunk in chunks] == [[1000, 1001], [1002, 1003]]
+
+    def test_partition_splits_single_schema(self, mock_pool: MagicMock) -> None:
+        """Test that a single large schema is split into table chunks."""
+        tables = {rel["oid"]: TableInfo(table_name=rel["table_name"]) for rel in make_relations(10)}
+
+        chunks = SchemaIntrospector(mock_pool, "test_db", concurrency=4)._partition(tables)
+
+        assert len(chunks) == 4
+        assert sum(len(chunk) for chunk in chunks) == 10
+
+    @pytest.mark.asyncio
+    async def test_chunks_use_separate_connections(
+        self, mock_pool: MagicMock, mock_connection: MagicMock
+    ) -> None:
+        """Test that chunks are introspected on their own pool connections."""
+        relations = make_relations(8)
+        all_columns = make_columns(relations)
+        route_bulk_queries(mock_connection, relations, all_columns)
+
+        async def fetch(query: str, *args: Any) -> list[dict[str, Any]]:
+            if args and "FROM pg_attribute a" in query and "FROM pg_index idx" not in query:
+                # Only return columns for the requested relations
+                return [row for row in all_columns if row["oid"] in args[0]]
+            return await original_fetch(query, *args)
+
+        original_fetch = mock_connection.fetch.side_effect
+        mock_connection.fetch.side_effect = fetch
+
+        introspector = SchemaIntrospector(mock_pool, "test_db", concurrency=4)
+        schema = await introspector.introspect()
+
+        # one connection for listing + one per chunk
+        assert mock_pool.acquire.call_count == 5
+        assert len(schema.tables) == 8
+        assert all(len(table.columns) == 2 for table in schema.tables)
+        assert [t.table_name for t in schema.tables] == [f"table_{i}" for i in range(8)]
+
+
+class TestIncrementalIntrospection:
+    """Test suite for catalog fingerprint based change detection."""
+
+    @staticmethod
+    def signature_rows(signatures: dict[int, str]) -> list[dict[str, Any]]:
+        """Build rows as returned by the relation signatures query."""
+        return [
+            {
+                "oid": oid,
+                "schema_name": "public",
+                "table_name": f"table_{oid - 1000}",
+                "row_count_estimate": 0,
+                "signature": signature,
+            }
+            for oid, signature in signatures.items()
+        ]
+
+    @pytest.mark.asyncio
+    async def test_unchanged_fingerprint_returns_none(
+        self, mock_pool: MagicMock, mock_connection: MagicMock
+    ) -> None:
+        """Test that an unchanged fingerprint costs a single query."""
+        mock_connection.fetchval.return_value = "fp1"
+
+        changes = await SchemaIntrospector(mock_pool, "test_db").introspect_changes("fp1", {})
+
+        assert changes is None
+        assert mock_connection.fetchval.call_count == 1
+        mock_connection.fetch.assert_not_called()
+
+    def test_fingerprint_ignores_statistics(self) -> None:
+        """Test that ANALYZE and autovacuum do not change the fingerprint."""
+        assert "reltuples" not in CATALOG_FINGERPRINT_QUERY
+        assert "relnatts" in CATALOG_FINGERPRINT_QUERY
+
+    @pytest.mark.asyncio
+    async def test_row_estimates(self, mock_pool: MagicMock, mock_connection: MagicMock) -> None:
+        """Test that row estimates are read with a single query."""
+        mock_connection.fetch.return_value = [
+            {"oid": 1000, "row_count_estimate": 1500},
+            {"oid": 1001, "row_count_estimate": None},
+        ]
+
+        estimates = await SchemaIntrospector(mock_pool, "test_db").get_row_estimates()
+
+        assert estimates == {1000: 1500, 1001: 0}
+        mock_connection.fetch.assert_awaited_once()
+        mock_connection.fetchval.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_only_changed_relations_are_introspected(
+        self, mock_pool: MagicMock, mock_connection: MagicMock
+    ) -> None:
+        """Test that new and altered relations are the only ones re-introspected."""
+        relations = make_relations(4)
+        all_columns = make_columns(relations)
+        mock_connection.fetchval.return_value = "fp2"
+        requested: list[list[int]] = []
+
+        async def fetch(query: str, *args: Any) -> list[dict[str, Any]]:
+            if "AS signature" in query:
+                return self.signature_rows({1000: "a", 1001: "b2", 1003: "d"})
+            if "relkind IN" in query:
+                requested.append(list(args[0]))
+                return [rel for rel in relations if rel["oid"] in args[0]]
+            if "contype = 'f'" in query or "FROM pg_index idx" in query:
+                return []
+            if "FROM pg_attribute a" in query:
+                return [row for row in all_columns if row["oid"] in args[0]]
+            if "FROM pg_type t" in query:
+                return []
+            raise AssertionError(f"Unexpected query: {query}")
+
+        mock_connection.fetch.side_effect = fetch
+        old_state = await SchemaIntrospector(mock_pool, "test_db")._get_relation_signatures(
+            mock_connection
+        )
+        old_state[1001] = old_state[1001].model_copy(update={"signature": "b1"})
+        del old_state[1003]
+
+        changes = await SchemaIntrospector(mock_pool, "test_db").introspect_changes(
+            "fp1", old_state
+        )
+
+        assert changes is not None
+        assert changes.fingerprint == "fp2"
+        assert requested == [[1001, 1003]]
+        assert sorted(changes.changed) == [1001, 1003]
+        assert len(changes.changed[1001].columns) == 2
+        assert list(changes.signatures) == [1000, 1001, 1003]
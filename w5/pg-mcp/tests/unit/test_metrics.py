@@ -138,6 +138,15 @@ class TestLLMMetrics:
         new_value = metrics.llm_tokens_used.labels(operation="generate_sql")._value.get()
         assert new_value == initial_value + 350  # 150 + 200
 
+    def test_observe_llm_prompt_tokens(self) -> None:
+        """Test recording prompt tokens per query request."""
+        metrics = MetricsCollector()
+        initial_sum = metrics.llm_prompt_tokens._sum.get()
+
+        metrics.observe_llm_prompt_tokens(1200)
+
+        assert metrics.llm_prompt_tokens._sum.get() == initial_sum + 1200
+
 
 class TestSecurityMetrics:
     """Tests for security-related metrics."""
@@ -232,6 +241,19 @@ class TestCacheMetrics:
         assert db1_value == 100.0
         assert db2_value == 500.0
 
+    def test_set_circuit_breaker_state(self) -> None:
+        """Test exporting circuit breaker states per dependency."""
+        metrics = MetricsCollector()
+
+        metrics.set_circuit_breaker_state("database:db1", "open")
+        metrics.set_circuit_breaker_state("database:db2", "half_open")
+        metrics.set_circuit_breaker_state("llm_generation", "closed")
+
+        gauge = metrics.circuit_breaker_state
+        assert gauge.labels(dependency="database:db1")._value.get() == 2
+        assert gauge.labels(dependency="database:db2")._value.get() == 1
+        assert gauge.labels(dependency="llm_generation")._value.get() == 0
+
 
 class TestMetricsHelperMethods:
     """Tests for metrics helper methods."""
@@ -4,6 +4,8 @@ Tests for schema, query, and error models to ensure correct validation
 and behavior.
 """
 
+from unittest.mock import patch
+
 import pytest
 from pydantic import ValidationError
 
@@ -21,6 +23,7 @@ from pg_mcp.models.query import (
     QueryRequest,
     QueryResponse,
     QueryResult,
+    ResultFormat,
     ReturnType,
 )
 from pg_mcp.models.schema import (
@@ -269,6 +272,75 @@ class TestDatabaseSchema:
         assert "Custom Types" in context
         assert "Tables" in context
 
+    def test_prompt_sections_are_memoized(self) -> None:
+        """Test that table sections are rendered once per schema object."""
+        table = TableInfo(table_name="users", columns=[])
+        schema = DatabaseSchema(database_name="testdb", tables=[table])
+
+        with patch.object(
+            TableInfo, "to_prompt_section", autospec=True, return_value="\nTable: public.users"
+        ) as render:
+            first = schema.to_prompt_context()
+            second = schema.to_prompt_context()
+            # A pruned copy shares the memo
+            schema.model_copy(update={"tables": [table]}).to_prompt_context()
+
+            assert first == second
+            assert render.call_count == 1
+
+            # A reloaded schema renders again
+            DatabaseSchema(database_name="testdb", tables=[table]).to_prompt_context()
+            assert render.call_count == 2
+
+    def test_memo_does_not_affect_equality(self) -> None:
+        """Test that rendering does not change schema equality."""
+        table = TableInfo(table_name="users", columns=[])
+        rendered = DatabaseSchema(database_name="testdb", tables=[table])
+        rendered.to_prompt_context()
+
+        assert rendered == DatabaseSchema(database_name="testdb", tables=[table])
+
+    def test_prompt_context_1000_tables_renders_each_table_once(self) -> None:
+        """Test that repeated prompt assembly on a 1,000-table schema hits the memo."""
+        tables = [
+            TableInfo(
+                table_name=f"table_{i}",
+                comment=f"Table number {i}",
+                row_count_estimate=i * 100,
+                columns=[
+                    ColumnInfo(
+                        name=f"column_{j}",
+                        data_type="varchar(255)",
+                        is_nullable=j % 2 == 0,
+                        is_primary_key=j == 0,
+                        comment=f"Column {j}",
+                    )
+                    for j in range(10)
+                ],
+                foreign_keys=[
+                    ForeignKeyInfo(
+                        constraint_name=f"fk_{i}",
+                        column_name="column_1",
+                        referenced_table=f"table_{(i + 1) % 1000}",
+                        referenced_column="column_0",
+                    )
+                ],
+                indexes=[IndexInfo(name=f"idx_{i}", columns=["column_2"])],
+            )
+            for i in range(1000)
+        ]
+        expected = "\n".join(table.to_prompt_section() for table in tables)
+        schema = DatabaseSchema(database_name="benchmark", tables=tables)
+
+        with patch.object(
+            TableInfo, "to_prompt_section", autospec=True, side_effect=TableInfo.to_prompt_section
+        ) as render:
+            contexts = [schema.to_prompt_context() for _ in range(5)]
+
+        assert render.call_count == 1000
+        assert all(context == contexts[0] for context in contexts)
+        assert contexts[0].endswith(expected)
+
 
 class TestQueryRequest:
     """Tests for QueryRequest model."""
@@ -328,6 +400,63 @@ class TestQueryResult:
         assert len(result.rows) == 2
         assert result.execution_time_ms == 15.5
 
+    def test_columnar_format(self) -> None:
+        """Test that the columnar format lists column names once."""
+        result = QueryResult(
+            columns=["id", "name"],
+            rows=[{"id": 1, "name": "Alice"}, {"id": 2, "name": None}],
+            row_count=2,
+            execution_time_ms=1.5,
+        )
+
+        data = result.to_dict(ResultFormat.COLUMNAR)
+
+        assert data == {
+            "columns": ["id", "name"],
+            "row_count": 2,
+            "execution_time_ms": 1.5,
+            "format": "columnar",
+            "data": [[1, 2], ["Alice", None]],
+        }
+        assert result.to_dict() == result.model_dump()
+
+    def test_arrow_ipc_format(self) -> None:
+        """Test that the Arrow format round-trips through an IPC reader."""
+        pa = pytest.importorskip("pyarrow")
+        import base64
+
+        result = QueryResult(
+            columns=["id", "name"],
+            rows=[{"id": 1, "name": "Alice"}, {"id": 2, "name": None}],
+        )
+
+        data = result.to_dict(ResultFormat.ARROW_IPC_BASE64)
+
+        table = pa.ipc.open_stream(base64.b64decode(data["arrow_ipc_base64"])).read_all()
+        assert table.column_names == ["id", "name"]
+        assert table.to_pylist() == result.rows
+        assert "rows" not in data
+
+    def test_arrow_ipc_mixed_type_column(self) -> None:
+        """Test that a column without a common Arrow type is encoded as strings."""
+        pa = pytest.importorskip("pyarrow")
+
+        result = QueryResult(
+            columns=["id", "payload"],
+            rows=[
+                {"id": 1, "payload": {"a": 1}},
+                {"id": 2, "payload": 5},
+                {"id": 3, "payload": "text"},
+                {"id": 4, "payload": None},
+            ],
+        )
+
+        table = pa.ipc.open_stream(result.to_arrow_ipc()).read_all()
+
+        assert table.schema.field("payload").type == pa.string()
+        assert table.column("payload").to_pylist() == ['{"a": 1}', "5", "text", None]
+        assert table.column("id").to_pylist() == [1, 2, 3, 4]
+
 
 class TestQueryResponse:
     """Tests for QueryResponse model."""
@@ -349,6 +478,23 @@ class TestQueryResponse:
         assert response.data is not None
         assert response.confidence == 95
 
+    def test_to_dict_with_result_format(self) -> None:
+        """Test that the result format only changes the data section."""
+        response = QueryResponse(
+            success=True,
+            generated_sql="SELECT COUNT(*) FROM users",
+            data=QueryResult(columns=["count"], rows=[{"count": 10}]),
+        )
+
+        rows = response.to_dict()
+        columnar = response.to_dict(ResultFormat.COLUMNAR)
+
+        assert rows["data"]["rows"] == [{"count": 10}]
+        assert columnar["data"]["data"] == [[10]]
+        assert {k: v for k, v in columnar.items() if k != "data"} == {
+            k: v for k, v in rows.items() if k != "data"
+        }
+
     def test_error_response(self) -> None:
         """Test error response."""
         response = QueryResponse(
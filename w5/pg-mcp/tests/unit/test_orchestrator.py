@@ -4,14 +4,26 @@ This module tests the orchestrator's coordination of the query pipeline,
 including retry logic, error handling, and integration with all components.
 """
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from pg_mcp.config.settings import ResilienceConfig, ValidationConfig
+from pg_mcp.cache.query_cache import QueryCache
+from pg_mcp.config.settings import (
+    QueryCacheConfig,
+    ResilienceConfig,
+    SecurityConfig,
+    ValidationConfig,
+)
 from pg_mcp.models.errors import (
+    DatabaseConnectionError,
     DatabaseError,
+    ExecutionTimeoutError,
     LLMError,
+    LLMTimeoutError,
+    LLMUnavailableError,
+    QueryCostExceededError,
     RateLimitExceededError,
     SecurityViolationError,
     SQLParseError,
@@ -21,10 +33,13 @@ from pg_mcp.models.query import (
     QueryRequest,
     ResultValidationResult,
     ReturnType,
+    TokenUsage,
 )
 from pg_mcp.models.schema import ColumnInfo, DatabaseSchema, TableInfo
 from pg_mcp.resilience.circuit_breaker import CircuitState
+from pg_mcp.resilience.fair_queue import Flow, get_current_flow
 from pg_mcp.services.orchestrator import QueryOrchestrator
+from pg_mcp.services.sql_validator import SQLValidator
 
 
 class TestDatabaseResolution:
@@ -318,6 +333,358 @@ class TestSQLGenerationWithRetry:
         assert "unexpectedly" in str(exc_info.value).lower()
         assert orchestrator.circuit_breaker.failure_count == 1
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "error",
+        [
+            LLMError("LLM API error"),
+            LLMTimeoutError("LLM request timed out"),
+            LLMUnavailableError("LLM service unavailable"),
+        ],
+    )
+    async def test_llm_api_error_counted_against_llm(
+        self, mock_schema: DatabaseSchema, error: LLMError
+    ) -> None:
+        """Test that LLM API errors propagate and trip the LLM breaker."""
+        mock_generator = AsyncMock()
+        mock_generator.generate.side_effect = error
+
+        orchestrator = QueryOrchestrator(
+            sql_generator=mock_generator,
+            sql_validator=MagicMock(),
+            sql_executors={"test_db": MagicMock()},
+            result_validator=MagicMock(),
+            schema_cache=MagicMock(),
+            pools={"test_db": MagicMock()},
+            resilience_config=ResilienceConfig(circuit_breaker_threshold=1),
+            validation_config=ValidationConfig(),
+        )
+
+        with pytest.raises(type(error)):
+            await orchestrator._generate_sql_with_retry(
+                question="Get all users",
+                schema=mock_schema,
+                request_id="test-123",
+            )
+
+        assert mock_generator.generate.call_count == 1
+        assert orchestrator.circuit_breaker.failure_count == 1
+        assert orchestrator.circuit_breaker.state == CircuitState.OPEN
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_not_counted_against_llm(self, mock_schema: DatabaseSchema) -> None:
+        """Test that running out of LLM capacity does not trip the LLM breaker."""
+        mock_generator = AsyncMock()
+        mock_generator.generate.side_effect = RateLimitExceededError("LLM capacity exhausted")
+
+        orchestrator = QueryOrchestrator(
+            sql_generator=mock_generator,
+            sql_validator=MagicMock(),
+            sql_executors={"test_db": MagicMock()},
+            result_validator=MagicMock(),
+            schema_cache=MagicMock(),
+            pools={"test_db": MagicMock()},
+            resilience_config=ResilienceConfig(circuit_breaker_threshold=1),
+            validation_config=ValidationConfig(),
+        )
+
+        with pytest.raises(RateLimitExceededError):
+            await orchestrator._generate_sql_with_retry(
+                question="Get all users",
+                schema=mock_schema,
+                request_id="test-123",
+            )
+
+        assert orchestrator.circuit_breaker.failure_count == 0
+
+    @pytest.mark.asyncio
+    async def test_validation_runs_on_executor(self, mock_schema: DatabaseSchema) -> None:
+        """Test that a configured validation executor replaces inline validation."""
+        mock_generator = AsyncMock()
+        mock_generator.generate.side_effect = ["DELETE FROM users;", "SELECT * FROM users;"]
+        mock_validator = MagicMock()
+        validation_executor = MagicMock()
+        validation_executor.validate_or_raise = AsyncMock(
+            side_effect=[SecurityViolationError("DELETE not allowed"), None]
+        )
+
+        orchestrator = QueryOrchestrator(
+            sql_generator=mock_generator,
+            sql_validator=mock_validator,
+            sql_executors={"test_db": MagicMock()},
+            result_validator=MagicMock(),
+            schema_cache=MagicMock(),
+            pools={"test_db": MagicMock()},
+            resilience_config=ResilienceConfig(max_retries=3),
+            validation_config=ValidationConfig(),
+            validation_executor=validation_executor,
+        )
+
+        sql, validation_result, _tokens = await orchestrator._generate_sql_with_retry(
+            question="Get all users",
+            schema=mock_schema,
+            request_id="test-123",
+        )
+
+        assert sql == "SELECT * FROM users;"
+        assert validation_result.is_valid is True
+        assert validation_executor.validate_or_raise.await_count == 2
+        mock_validator.validate_or_raise.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_speculative_first_valid_candidate_wins(
+        self, mock_schema: DatabaseSchema
+    ) -> None:
+        """Test that concurrent candidates race and the losers are cancelled."""
+        cancelled: list[float] = []
+
+        async def generate(temperature: float, **kwargs: object) -> str:
+            if temperature == 0.0:
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.append(temperature)
+                    raise
+            if temperature == 0.5:
+                return "DELETE FROM users"
+            await asyncio.sleep(0.01)
+            return "SELECT * FROM users"
+
+        mock_generator = MagicMock()
+        mock_generator.config.temperature = 0.0
+        mock_generator.generate = AsyncMock(side_effect=generate)
+        mock_validator = MagicMock()
+        mock_validator.validate_or_raise.side_effect = lambda sql: (
+            _raise(SecurityViolationError("DELETE not allowed")) if "DELETE" in sql else None
+        )
+
+        orchestrator = QueryOrchestrator(
+            sql_generator=mock_generator,
+            sql_validator=mock_validator,
+            sql_executors={"test_db": MagicMock()},
+            result_validator=MagicMock(),
+            schema_cache=MagicMock(),
+            pools={"test_db": MagicMock()},
+            resilience_config=ResilienceConfig(
+                speculative_candidates=3, speculative_temperature_step=0.25
+            ),
+            validation_config=ValidationConfig(),
+        )
+
+        sql, validation_result, _tokens = await orchestrator._generate_sql_with_retry(
+            question="Get all users",
+            schema=mock_schema,
+            request_id="test-123",
+        )
+
+        assert sql == "SELECT * FROM users"
+        assert validation_result.is_valid is True
+        calls = mock_generator.generate.call_args_list
+        temperatures = sorted(call.kwargs["temperature"] for call in calls)
+        assert temperatures == [0.0, 0.25, 0.5]
+        assert cancelled == [0.0]
+
+    @pytest.mark.asyncio
+    async def test_speculative_rejections_feed_retry(self, mock_schema: DatabaseSchema) -> None:
+        """Test that a round without valid candidates retries with feedback."""
+        mock_generator = MagicMock()
+        mock_generator.config.temperature = 0.0
+        mock_generator.generate = AsyncMock(
+            side_effect=["DELETE FROM users", "DELETE FROM users", "SELECT 1", "SELECT 2"]
+        )
+        mock_validator = MagicMock()
+        mock_validator.validate_or_raise.side_effect = [
+            SecurityViolationError("DELETE not allowed"),
+            SecurityViolationError("DELETE not allowed"),
+            None,
+            None,
+        ]
+
+        orchestrator = QueryOrchestrator(
+            sql_generator=mock_generator,
+            sql_validator=mock_validator,
+            sql_executors={"test_db": MagicMock()},
+            result_validator=MagicMock(),
+            schema_cache=MagicMock(),
+            pools={"test_db": MagicMock()},
+            resilience_config=ResilienceConfig(max_retries=1, speculative_candidates=2),
+            validation_config=ValidationConfig(),
+        )
+
+        sql, _validation, _tokens = await orchestrator._generate_sql_with_retry(
+            question="Get all users",
+            schema=mock_schema,
+            request_id="test-123",
+        )
+
+        assert sql in ("SELECT 1", "SELECT 2")
+        retry_call = mock_generator.generate.call_args_list[2]
+        assert retry_call.kwargs["previous_attempt"] == "DELETE FROM users"
+        assert "DELETE not allowed" in retry_call.kwargs["error_feedback"]
+
+    @pytest.mark.asyncio
+    async def test_explain_dry_run_failure_feeds_retry(self, mock_schema: DatabaseSchema) -> None:
+        """Test that SQL the planner rejects is retried with the planner error."""
+        mock_generator = AsyncMock()
+        mock_generator.generate.side_effect = [
+            "SELECT nme FROM users",
+            "SELECT name FROM users",
+        ]
+        sql_executor = MagicMock()
+        sql_executor.explain = AsyncMock(
+            side_effect=[
+                DatabaseError(
+                    "Database query failed",
+                    details={"error_code": "42703", "error_message": 'column "nme" does not exist'},
+                ),
+                {"Total Cost": 1.0},
+            ]
+        )
+
+        orchestrator = QueryOrchestrator(
+            sql_generator=mock_generator,
+            sql_validator=MagicMock(),
+            sql_executors={"test_db": sql_executor},
+            result_validator=MagicMock(),
+            schema_cache=MagicMock(),
+            pools={"test_db": MagicMock()},
+            resilience_config=ResilienceConfig(explain_dry_run=True),
+            validation_config=ValidationConfig(),
+        )
+
+        sql, _validation, _tokens = await orchestrator._generate_sql_with_retry(
+            question="Get all user names",
+            schema=mock_schema,
+            request_id="test-123",
+            sql_executor=sql_executor,
+        )
+
+        assert sql == "SELECT name FROM users"
+        feedback = mock_generator.generate.call_args_list[1].kwargs["error_feedback"]
+        assert 'EXPLAIN dry run: column "nme" does not exist' in feedback
+
+        # Failures unrelated to the SQL are not retried
+        sql_executor.explain = AsyncMock(
+            side_effect=DatabaseError("connection lost", details={"error_code": "08006"})
+        )
+        mock_generator.generate.side_effect = None
+        mock_generator.generate.return_value = "SELECT name FROM users"
+        with pytest.raises(DatabaseError, match="connection lost"):
+            await orchestrator._generate_sql_with_retry(
+                question="Get all user names",
+                schema=mock_schema,
+                request_id="test-456",
+                sql_executor=sql_executor,
+            )
+
+    @pytest.mark.asyncio
+    async def test_explain_timeout_not_counted_against_llm(
+        self, mock_schema: DatabaseSchema
+    ) -> None:
+        """Test that a planning timeout propagates without tripping the LLM breaker."""
+        mock_generator = AsyncMock()
+        mock_generator.generate.return_value = "SELECT name FROM users"
+        sql_executor = MagicMock()
+        sql_executor.explain = AsyncMock(
+            side_effect=ExecutionTimeoutError("Query planning exceeded timeout of 5.0 seconds")
+        )
+
+        orchestrator = QueryOrchestrator(
+            sql_generator=mock_generator,
+            sql_validator=MagicMock(),
+            sql_executors={"test_db": sql_executor},
+            result_validator=MagicMock(),
+            schema_cache=MagicMock(),
+            pools={"test_db": MagicMock()},
+            resilience_config=ResilienceConfig(explain_dry_run=True),
+            validation_config=ValidationConfig(),
+        )
+
+        with pytest.raises(ExecutionTimeoutError):
+            await orchestrator._generate_sql_with_retry(
+                question="Get all user names",
+                schema=mock_schema,
+                request_id="test-123",
+                sql_executor=sql_executor,
+            )
+
+        assert orchestrator.circuit_breaker.failure_count == 0
+
+    @pytest.mark.asyncio
+    async def test_cost_gate_feeds_retry(self, mock_schema: DatabaseSchema) -> None:
+        """Test that SQL over the plan cost limits is retried with guidance."""
+        mock_generator = AsyncMock()
+        mock_generator.generate.side_effect = [
+            "SELECT * FROM users a, users b",
+            "SELECT count(*) FROM users",
+        ]
+        sql_executor = MagicMock()
+        sql_executor.explain = AsyncMock(
+            side_effect=[
+                {"Total Cost": 2741.28, "Plan Rows": 216225},
+                {"Total Cost": 12.5, "Plan Rows": 1},
+            ]
+        )
+
+        orchestrator = QueryOrchestrator(
+            sql_generator=mock_generator,
+            sql_validator=MagicMock(),
+            sql_executors={"test_db": sql_executor},
+            result_validator=MagicMock(),
+            schema_cache=MagicMock(),
+            pools={"test_db": MagicMock()},
+            resilience_config=ResilienceConfig(max_plan_cost=1000, max_plan_rows=100000),
+            validation_config=ValidationConfig(),
+        )
+
+        sql, _validation, _tokens = await orchestrator._generate_sql_with_retry(
+            question="Pair every user with every other user",
+            schema=mock_schema,
+            request_id="test-123",
+            sql_executor=sql_executor,
+        )
+
+        assert sql == "SELECT count(*) FROM users"
+        feedback = mock_generator.generate.call_args_list[1].kwargs["error_feedback"]
+        assert "estimated cost 2741 exceeds the limit of 1000" in feedback
+        assert "estimated 216225 rows exceed the limit of 100000" in feedback
+
+    @pytest.mark.asyncio
+    async def test_cost_gate_fails_after_max_retries(self, mock_schema: DatabaseSchema) -> None:
+        """Test that a query that stays too expensive is rejected."""
+        mock_generator = AsyncMock()
+        mock_generator.generate.return_value = "SELECT * FROM users a, users b"
+        sql_executor = MagicMock()
+        sql_executor.explain = AsyncMock(return_value={"Total Cost": 5000.0, "Plan Rows": 10})
+
+        orchestrator = QueryOrchestrator(
+            sql_generator=mock_generator,
+            sql_validator=MagicMock(),
+            sql_executors={"test_db": sql_executor},
+            result_validator=MagicMock(),
+            schema_cache=MagicMock(),
+            pools={"test_db": MagicMock()},
+            resilience_config=ResilienceConfig(max_retries=1, max_plan_cost=1000),
+            validation_config=ValidationConfig(),
+        )
+
+        with pytest.raises(QueryCostExceededError) as exc_info:
+            await orchestrator._generate_sql_with_retry(
+                question="Pair every user with every other user",
+                schema=mock_schema,
+                request_id="test-123",
+                sql_executor=sql_executor,
+            )
+
+        assert exc_info.value.details["estimated_cost"] == 5000.0
+        assert mock_generator.generate.call_count == 2
+        assert orchestrator.circuit_breaker.failure_count == 1
+
+
+def _raise(error: Exception) -> None:
+    """Raise an error from an expression."""
+    raise error
+
 
 class TestResultValidation:
     """Test result validation logic."""
@@ -411,6 +778,37 @@ class TestResultValidation:
         # Returns threshold (70) instead of 100 to avoid falsely reporting high confidence
         assert confidence == 70
 
+    @pytest.mark.asyncio
+    async def test_validation_circuit_breaker_skips_llm(self) -> None:
+        """Test that failing validations open their own breaker only."""
+        mock_validator = AsyncMock()
+        mock_validator.validate.side_effect = LLMError("Validation service down")
+
+        orchestrator = QueryOrchestrator(
+            sql_generator=MagicMock(),
+            sql_validator=MagicMock(),
+            sql_executors={"test_db": MagicMock()},
+            result_validator=mock_validator,
+            schema_cache=MagicMock(),
+            pools={"test_db": MagicMock()},
+            resilience_config=ResilienceConfig(circuit_breaker_threshold=1),
+            validation_config=ValidationConfig(enabled=True),
+        )
+
+        for _ in range(2):
+            confidence = await orchestrator._validate_results_safely(
+                question="Count users",
+                sql="SELECT COUNT(*) FROM users",
+                results=[{"count": 42}],
+                row_count=1,
+                request_id="test-123",
+            )
+            assert confidence == 70
+
+        # The second validation was rejected without calling the LLM
+        mock_validator.validate.assert_called_once()
+        assert orchestrator.circuit_breaker.state == CircuitState.CLOSED
+
 
 class TestExecuteQueryFlow:
     """Test complete query execution flow."""
@@ -773,6 +1171,229 @@ class TestExecuteQueryFlow:
         # Verify schema was fetched for auto-selected database
         mock_cache.get.assert_called_once_with("only_db")
 
+    @pytest.mark.asyncio
+    async def test_token_usage_summed_across_calls(self, mock_schema: DatabaseSchema) -> None:
+        """Test that tokens of retries and result validation are reported and counted."""
+        replies = iter([("SELECT * FROM secrets", 500, 20), ("SELECT 1", 600, 30)])
+
+        async def generate(usage: TokenUsage, **kwargs: object) -> str:
+            sql, prompt_tokens, completion_tokens = next(replies)
+            usage.add(prompt_tokens, completion_tokens)
+            return sql
+
+        async def validate(usage: TokenUsage, **kwargs: object) -> ResultValidationResult:
+            usage.add(300, 40)
+            return ResultValidationResult(
+                confidence=90, explanation="Looks right", suggestion=None, is_acceptable=True
+            )
+
+        mock_generator = MagicMock()
+        mock_generator.generate = AsyncMock(side_effect=generate)
+        mock_validator = MagicMock()
+        mock_validator.validate_or_raise.side_effect = [
+            SecurityViolationError("Blocked table: secrets"),
+            None,
+        ]
+        mock_validator.is_scalar_aggregate.return_value = False
+        mock_result_validator = MagicMock()
+        mock_result_validator.validate = AsyncMock(side_effect=validate)
+        mock_executor = AsyncMock()
+        mock_executor.execute.return_value = ([{"one": 1}], 1)
+        mock_cache = MagicMock()
+        mock_cache.get.return_value = mock_schema
+        metrics = MagicMock()
+
+        orchestrator = QueryOrchestrator(
+            sql_generator=mock_generator,
+            sql_validator=mock_validator,
+            sql_executors={"test_db": mock_executor},
+            result_validator=mock_result_validator,
+            schema_cache=mock_cache,
+            pools={"test_db": MagicMock()},
+            resilience_config=ResilienceConfig(),
+            validation_config=ValidationConfig(enabled=True),
+            metrics=metrics,
+        )
+
+        response = await orchestrator.execute_query(
+            QueryRequest(question="One?", database="test_db")
+        )
+
+        assert response.success is True
+        assert response.tokens_used == 520 + 630 + 340
+        assert [call.args for call in metrics.increment_llm_tokens.call_args_list] == [
+            ("sql_generation", 520),
+            ("sql_generation", 630),
+            ("result_validation", 340),
+        ]
+        metrics.observe_llm_prompt_tokens.assert_called_once_with(500 + 600 + 300)
+
+    @pytest.mark.asyncio
+    async def test_token_usage_reported_on_failure(self, mock_schema: DatabaseSchema) -> None:
+        """Test that tokens spent on a failed generation are still reported."""
+
+        async def generate(usage: TokenUsage, **kwargs: object) -> str:
+            usage.add(400, 25)
+            return "SELECT * FROM secrets"
+
+        mock_generator = MagicMock()
+        mock_generator.generate = AsyncMock(side_effect=generate)
+        mock_validator = MagicMock()
+        mock_validator.validate_or_raise.side_effect = SecurityViolationError(
+            "Blocked table: secrets"
+        )
+        mock_cache = MagicMock()
+        mock_cache.get.return_value = mock_schema
+        metrics = MagicMock()
+
+        orchestrator = QueryOrchestrator(
+            sql_generator=mock_generator,
+            sql_validator=mock_validator,
+            sql_executors={"test_db": MagicMock()},
+            result_validator=MagicMock(),
+            schema_cache=mock_cache,
+            pools={"test_db": MagicMock()},
+            resilience_config=ResilienceConfig(max_retries=1),
+            validation_config=ValidationConfig(),
+            metrics=metrics,
+        )
+
+        response = await orchestrator.execute_query(
+            QueryRequest(question="Secrets?", database="test_db")
+        )
+
+        assert response.success is False
+        assert response.tokens_used == 2 * 425
+        metrics.observe_llm_prompt_tokens.assert_called_once_with(800)
+
+
+class TestDeferredResultValidation:
+    """Test background and skipped result validation."""
+
+    @staticmethod
+    def make_orchestrator(
+        sql: str,
+        rows: list[dict[str, object]],
+        result_validator: MagicMock,
+        validation_config: ValidationConfig,
+        query_cache: QueryCache | None = None,
+    ) -> QueryOrchestrator:
+        """Create an orchestrator answering every question with the given SQL and rows."""
+        mock_generator = AsyncMock()
+        mock_generator.generate.return_value = sql
+        mock_executor = AsyncMock()
+        mock_executor.execute.return_value = (rows, len(rows))
+        mock_cache = MagicMock()
+        mock_cache.get.return_value = DatabaseSchema(
+            database_name="test_db", tables=[], version="15.0"
+        )
+        return QueryOrchestrator(
+            sql_generator=mock_generator,
+            sql_validator=SQLValidator(config=SecurityConfig()),
+            sql_executors={"test_db": mock_executor},
+            result_validator=result_validator,
+            schema_cache=mock_cache,
+            pools={"test_db": MagicMock()},
+            resilience_config=ResilienceConfig(),
+            validation_config=validation_config,
+            query_cache=query_cache,
+        )
+
+    @pytest.mark.asyncio
+    async def test_background_validation(self) -> None:
+        """Test that results return before validation and the confidence follows."""
+        validated = asyncio.Event()
+
+        async def validate(**kwargs: object) -> ResultValidationResult:
+            await validated.wait()
+            return ResultValidationResult(
+                confidence=85, explanation="Looks right", is_acceptable=True
+            )
+
+        result_validator = MagicMock()
+        result_validator.validate = AsyncMock(side_effect=validate)
+        query_cache = QueryCache(QueryCacheConfig(result_ttl=60))
+        orchestrator = self.make_orchestrator(
+            "SELECT id FROM users",
+            [{"id": 1}, {"id": 2}],
+            result_validator,
+            ValidationConfig(background=True, confidence_threshold=70),
+            query_cache=query_cache,
+        )
+
+        response = await orchestrator.execute_query(QueryRequest(question="List user ids"))
+
+        assert response.success is True
+        assert response.data is not None and response.data.row_count == 2
+        assert response.confidence_pending is True
+        assert response.confidence == 70
+        assert response.request_id is not None
+        assert orchestrator.get_result_validation(response.request_id) == {
+            "request_id": response.request_id,
+            "status": "pending",
+        }
+        # The result is cached only once its confidence is known
+        assert query_cache.get_result("test_db", "SELECT id FROM users") is None
+
+        validated.set()
+        await asyncio.gather(*orchestrator._running_validations)
+
+        assert orchestrator.get_result_validation(response.request_id) == {
+            "request_id": response.request_id,
+            "status": "complete",
+            "confidence": 85,
+            "is_acceptable": True,
+        }
+        cached = query_cache.get_result("test_db", "SELECT id FROM users")
+        assert cached is not None and cached.confidence == 85
+        assert orchestrator.get_result_validation("unknown") is None
+
+    @pytest.mark.asyncio
+    async def test_close_cancels_background_validations(self) -> None:
+        """Test that shutdown does not wait for running validations."""
+        result_validator = MagicMock()
+        result_validator.validate = AsyncMock(side_effect=lambda **kwargs: asyncio.sleep(10))
+        orchestrator = self.make_orchestrator(
+            "SELECT id FROM users",
+            [{"id": 1}],
+            result_validator,
+            ValidationConfig(background=True),
+        )
+
+        await orchestrator.execute_query(QueryRequest(question="List user ids"))
+        tasks = list(orchestrator._running_validations)
+        await orchestrator.close()
+
+        assert tasks and all(task.cancelled() for task in tasks)
+
+    @pytest.mark.asyncio
+    async def test_scalar_aggregates_skip_validation(self) -> None:
+        """Test that single-row aggregates are not sent to the result validator."""
+        result_validator = MagicMock()
+        result_validator.validate = AsyncMock()
+        orchestrator = self.make_orchestrator(
+            "SELECT count(*) FROM users",
+            [{"count": 42}],
+            result_validator,
+            ValidationConfig(skip_scalar_aggregates=True),
+        )
+
+        response = await orchestrator.execute_query(QueryRequest(question="How many users?"))
+
+        assert response.confidence == 100
+        assert response.confidence_pending is False
+        result_validator.validate.assert_not_called()
+
+        # Grouped results are still validated
+        orchestrator.sql_generator.generate.return_value = (  # type: ignore[attr-defined]
+            "SELECT name, count(*) FROM users GROUP BY name"
+        )
+        result_validator.validate.return_value = ResultValidationResult(
+            confidence=80, explanation="ok", is_acceptable=True
+        )
+        response = await orchestrator.execute_query(QueryRequest(question="Users per name"))
+        assert response.confidence == 80
+
 
 class TestInputValidation:
     """Test input validation including question length checks."""
@@ -901,6 +1522,147 @@ class TestRateLimiting:
         stats = rate_limiter.get_all_stats()
         assert stats["llm"]["total_requests"] > 0
 
+    @pytest.mark.asyncio
+    async def test_rate_limited_work_runs_in_request_flow(self) -> None:
+        """Test that generation is scheduled under the client, database and return type."""
+        flows: list[Flow] = []
+
+        async def generate(**kwargs: object) -> str:
+            flows.append(get_current_flow())
+            return "SELECT 1"
+
+        mock_generator = MagicMock()
+        mock_generator.generate = AsyncMock(side_effect=generate)
+        mock_cache = MagicMock()
+        mock_cache.get.return_value = DatabaseSchema(
+            database_name="test_db", tables=[], version="15.0"
+        )
+
+        orchestrator = QueryOrchestrator(
+            sql_generator=mock_generator,
+            sql_validator=MagicMock(),
+            sql_executors={"test_db": MagicMock()},
+            result_validator=MagicMock(),
+            schema_cache=mock_cache,
+            pools={"test_db": MagicMock()},
+            resilience_config=ResilienceConfig(),
+            validation_config=ValidationConfig(),
+        )
+
+        request = QueryRequest(question="Test", return_type=ReturnType.SQL, client_id="alice")
+        response = await orchestrator.execute_query(request)
+
+        assert response.success is True
+        assert flows == [Flow(client="alice", database="test_db", priority="sql")]
+        assert get_current_flow() == Flow()
+
+    @pytest.mark.asyncio
+    async def test_llm_token_quota_settled_with_reported_usage(self) -> None:
+        """Test that the LLM token quota is settled with the usage the API reported."""
+        from pg_mcp.resilience.rate_limiter import MultiRateLimiter, TokenBucketLimiter
+
+        async def generate(usage: TokenUsage, **kwargs: object) -> str:
+            usage.add(prompt_tokens=700, completion_tokens=20)
+            return "SELECT 1"
+
+        mock_generator = MagicMock()
+        mock_generator.generate = AsyncMock(side_effect=generate)
+        mock_cache = MagicMock()
+        mock_cache.get.return_value = DatabaseSchema(
+            database_name="test_db", tables=[], version="15.0"
+        )
+        budget = TokenBucketLimiter(tokens_per_minute=100000, default_tokens=2000)
+
+        orchestrator = QueryOrchestrator(
+            sql_generator=mock_generator,
+            sql_validator=MagicMock(),
+            sql_executors={"test_db": MagicMock()},
+            result_validator=MagicMock(),
+            schema_cache=mock_cache,
+            pools={"test_db": MagicMock()},
+            resilience_config=ResilienceConfig(),
+            validation_config=ValidationConfig(),
+            rate_limiter=MultiRateLimiter(llm_budget=budget),
+        )
+
+        request = QueryRequest(question="Test", database="test_db", return_type=ReturnType.SQL)
+        response = await orchestrator.execute_query(request)
+
+        assert response.success is True
+        stats = budget.get_stats()
+        assert stats["total_tokens"] == 720
+        assert stats["estimated_tokens_per_request"] == 1744
+
+    @pytest.mark.asyncio
+    async def test_failed_llm_call_settled_with_reported_usage(self) -> None:
+        """Test that a call failing after the API responded is not refunded."""
+        from pg_mcp.resilience.rate_limiter import MultiRateLimiter, TokenBucketLimiter
+
+        async def generate(usage: TokenUsage, **kwargs: object) -> str:
+            usage.add(prompt_tokens=700, completion_tokens=20)
+            raise LLMError("No SQL in response")
+
+        mock_generator = MagicMock()
+        mock_generator.generate = AsyncMock(side_effect=generate)
+        budget = TokenBucketLimiter(tokens_per_minute=100000, default_tokens=2000)
+
+        orchestrator = QueryOrchestrator(
+            sql_generator=mock_generator,
+            sql_validator=MagicMock(),
+            sql_executors={"test_db": MagicMock()},
+            result_validator=MagicMock(),
+            schema_cache=MagicMock(),
+            pools={"test_db": MagicMock()},
+            resilience_config=ResilienceConfig(),
+            validation_config=ValidationConfig(),
+            rate_limiter=MultiRateLimiter(llm_budget=budget),
+        )
+
+        with pytest.raises(LLMError):
+            await orchestrator._generate_candidate("Test", MagicMock(), None, None)
+
+        assert budget.get_stats()["total_tokens"] == 720
+
+    @pytest.mark.asyncio
+    async def test_result_validation_rate_limited(self) -> None:
+        """Test that result validation calls take LLM capacity and token quota."""
+        from pg_mcp.resilience.rate_limiter import MultiRateLimiter, TokenBucketLimiter
+
+        async def validate(usage: TokenUsage, **kwargs: object) -> ResultValidationResult:
+            usage.add(prompt_tokens=300, completion_tokens=30)
+            return ResultValidationResult(
+                confidence=90, explanation="OK", suggestion=None, is_acceptable=True
+            )
+
+        mock_validator = MagicMock()
+        mock_validator.validate = AsyncMock(side_effect=validate)
+        budget = TokenBucketLimiter(tokens_per_minute=100000, default_tokens=2000)
+        rate_limiter = MultiRateLimiter(llm_budget=budget)
+
+        orchestrator = QueryOrchestrator(
+            sql_generator=MagicMock(),
+            sql_validator=MagicMock(),
+            sql_executors={"test_db": MagicMock()},
+            result_validator=mock_validator,
+            schema_cache=MagicMock(),
+            pools={"test_db": MagicMock()},
+            resilience_config=ResilienceConfig(),
+            validation_config=ValidationConfig(enabled=True),
+            rate_limiter=rate_limiter,
+        )
+
+        confidence = await orchestrator._validate_results_safely(
+            question="List users",
+            sql="SELECT * FROM users",
+            results=[{"id": 1}, {"id": 2}],
+            row_count=2,
+            request_id="test-123",
+        )
+
+        assert confidence == 90
+        assert rate_limiter.get_all_stats()["llm"]["total_requests"] == 1
+        assert budget.get_stats()["total_tokens"] == 330
+
     @pytest.mark.asyncio
     async def test_db_rate_limiting_applied(self) -> None:
         """Test that DB queries are rate-limited."""
@@ -953,3 +1715,228 @@ class TestRateLimiting:
         stats = rate_limiter.get_all_stats()
         assert stats["llm"]["total_requests"] > 0
         assert stats["queries"]["total_requests"] > 0
+
+
+class TestQueryCaching:
+    """Test question→SQL and SQL→result caching."""
+
+    @pytest.fixture
+    def mock_schema(self) -> DatabaseSchema:
+        """Create mock database schema."""
+        return DatabaseSchema(database_name="test_db", tables=[], version="15.0")
+
+    def make_orchestrator(
+        self, mock_schema: DatabaseSchema, query_cache: QueryCache
+    ) -> tuple[QueryOrchestrator, AsyncMock, AsyncMock]:
+        """Create an orchestrator with a query cache and mocked components."""
+        from pg_mcp.resilience.rate_limiter import MultiRateLimiter
+
+        mock_cache = MagicMock()
+        mock_cache.get.return_value = mock_schema
+
+        mock_generator = AsyncMock()
+        mock_generator.generate.return_value = "SELECT 1;"
+
+        mock_validator = MagicMock()
+        mock_validator.validate_or_raise.return_value = None
+
+        mock_executor = AsyncMock()
+        mock_executor.execute.return_value = ([{"result": 1}], 1)
+
+        orchestrator = QueryOrchestrator(
+            sql_generator=mock_generator,
+            sql_validator=mock_validator,
+            sql_executors={"test_db": mock_executor},
+            result_validator=MagicMock(),
+            schema_cache=mock_cache,
+            pools={"test_db": MagicMock()},
+            resilience_config=ResilienceConfig(),
+            validation_config=ValidationConfig(enabled=False),
+            rate_limiter=MultiRateLimiter(query_limit=10, llm_limit=5),
+            query_cache=query_cache,
+        )
+        return orchestrator, mock_generator, mock_executor
+
+    @pytest.mark.asyncio
+    async def test_repeated_question_skips_llm(self, mock_schema: DatabaseSchema) -> None:
+        """Test that a repeated question reuses SQL without touching the LLM path."""
+        orchestrator, mock_generator, _ = self.make_orchestrator(
+            mock_schema, QueryCache(QueryCacheConfig())
+        )
+
+        first = await orchestrator.execute_query(
+            QueryRequest(question="Count users?", database="test_db", return_type=ReturnType.SQL)
+        )
+        # An open circuit would reject any further LLM call
+        orchestrator.circuit_breaker._state = CircuitState.OPEN
+        orchestrator.circuit_breaker._failure_count = 5
+        second = await orchestrator.execute_query(
+            QueryRequest(question="count users", database="test_db", return_type=ReturnType.SQL)
+        )
+
+        assert first.success is True
+        assert second.success is True
+        assert second.generated_sql == first.generated_sql
+        mock_generator.generate.assert_called_once()
+        assert orchestrator.rate_limiter.get_all_stats()["llm"]["total_requests"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cached_result_skips_execution(self, mock_schema: DatabaseSchema) -> None:
+        """Test that a cached result is served without executing the query."""
+        orchestrator, _, mock_executor = self.make_orchestrator(
+            mock_schema, QueryCache(QueryCacheConfig(result_ttl=60))
+        )
+        request = QueryRequest(
+            question="Count users", database="test_db", return_type=ReturnType.RESULT
+        )
+
+        first = await orchestrator.execute_query(request)
+        second = await orchestrator.execute_query(request)
+
+        assert second.success is True
+        assert second.data == first.data
+        assert second.confidence == first.confidence
+        mock_executor.execute.assert_called_once()
+        assert orchestrator.rate_limiter.get_all_stats()["queries"]["total_requests"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cached_result_served_while_database_down(
+        self, mock_schema: DatabaseSchema
+    ) -> None:
+        """Test that an open database breaker does not reject cached results."""
+        orchestrator, mock_generator, mock_executor = self.make_orchestrator(
+            mock_schema, QueryCache(QueryCacheConfig(result_ttl=60))
+        )
+        request = QueryRequest(
+            question="Count users", database="test_db", return_type=ReturnType.RESULT
+        )
+        first = await orchestrator.execute_query(request)
+
+        breaker = orchestrator.circuit_breakers.get("database:test_db")
+        breaker._state = CircuitState.OPEN
+        breaker._failure_count = 5
+        second = await orchestrator.execute_query(request)
+        uncached = await orchestrator.execute_query(
+            QueryRequest(question="List users", database="test_db")
+        )
+
+        assert second.success is True
+        assert second.data == first.data
+        assert uncached.error is not None
+        assert uncached.error.code == "database_connection_error"
+        mock_executor.execute.assert_called_once()
+        mock_generator.generate.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_results_not_cached_by_default(self, mock_schema: DatabaseSchema) -> None:
+        """Test that results are re-executed when no result TTL is configured."""
+        orchestrator, mock_generator, mock_executor = self.make_orchestrator(
+            mock_schema, QueryCache(QueryCacheConfig())
+        )
+        request = QueryRequest(
+            question="Count users", database="test_db", return_type=ReturnType.RESULT
+        )
+
+        await orchestrator.execute_query(request)
+        await orchestrator.execute_query(request)
+
+        mock_generator.generate.assert_called_once()
+        assert mock_executor.execute.call_count == 2
+
+
+class TestDatabaseCircuitBreakers:
+    """Test circuit breakers isolating databases."""
+
+    def make_orchestrator(
+        self, replica_error: Exception
+    ) -> tuple[QueryOrchestrator, AsyncMock, AsyncMock]:
+        """Create an orchestrator with a healthy primary and a failing replica."""
+        schema = DatabaseSchema(database_name="test_db", tables=[], version="15.0")
+        mock_generator = AsyncMock()
+        mock_generator.generate.return_value = "SELECT 1 AS one"
+
+        mock_cache = MagicMock()
+        mock_cache.get.return_value = schema
+
+        primary = AsyncMock()
+        primary.execute.return_value = ([{"one": 1}], 1)
+        replica = AsyncMock()
+        replica.execute.side_effect = replica_error
+
+        orchestrator = QueryOrchestrator(
+            sql_generator=mock_generator,
+            sql_validator=MagicMock(),
+            sql_executors={"primary": primary, "replica": replica},
+            result_validator=MagicMock(),
+            schema_cache=mock_cache,
+            pools={"primary": MagicMock(), "replica": MagicMock()},
+            resilience_config=ResilienceConfig(circuit_breaker_threshold=2),
+            validation_config=ValidationConfig(enabled=False),
+        )
+        return orchestrator, mock_generator, replica
+
+    @pytest.mark.asyncio
+    async def test_sick_database_fails_fast(self) -> None:
+        """Test that an open database breaker rejects requests before the LLM."""
+        orchestrator, mock_generator, replica = self.make_orchestrator(
+            DatabaseError("connection lost", details={"error_code": "08006"})
+        )
+
+        def request(database: str) -> QueryRequest:
+            return QueryRequest(question="One?", database=database)
+
+        for _ in range(2):
+            response = await orchestrator.execute_query(request("replica"))
+            assert response.error is not None
+            assert response.error.code == "database_error"
+
+        response = await orchestrator.execute_query(request("replica"))
+        assert response.error is not None
+        assert response.error.code == "database_connection_error"
+        assert replica.execute.call_count == 2
+        assert mock_generator.generate.call_count == 2
+
+        # Other databases and the LLM are unaffected
+        response = await orchestrator.execute_query(request("primary"))
+        assert response.success is True
+        assert orchestrator.circuit_breaker.state == CircuitState.CLOSED
+        stats = orchestrator.circuit_breakers.get_all_stats()
+        assert stats["database:replica"]["state"] == CircuitState.OPEN
+        assert stats["database:primary"]["state"] == CircuitState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_query_errors_do_not_open_breaker(self) -> None:
+        """Test that errors caused by the query leave the database breaker closed."""
+        orchestrator, _, replica = self.make_orchestrator(
+            DatabaseError("column does not exist", details={"error_code": "42703"})
+        )
+
+        for _ in range(3):
+            response = await orchestrator.execute_query(
+                QueryRequest(question="One?", database="replica")
+            )
+            assert response.error is not None
+            assert response.error.code == "database_error"
+
+        assert replica.execute.call_count == 3
+        breaker = orchestrator.circuit_breakers.get("database:replica")
+        assert breaker.state == CircuitState.CLOSED
+
+    @pytest.mark.parametrize(
+        ("error", "is_failure"),
+        [
+            (DatabaseError("connection lost", details={"error_code": "08006"}), True),
+            (DatabaseError("too many connections", details={"error_code": "53300"}), True),
+            (DatabaseError("shutting down", details={"error_code": "57P01"}), True),
+            (DatabaseError("internal error", details={"error_code": "XX000"}), True),
+            (DatabaseConnectionError("connection refused"), True),
+            (DatabaseError("statement timeout", details={"error_code": "57014"}), False),
+            (DatabaseError("syntax error", details={"error_code": "42601"}), False),
+            (DatabaseError("unexpected error", details={"error_type": "TypeError"}), False),
+            (ExecutionTimeoutError("query exceeded timeout"), False),
+            (RuntimeError("bug"), False),
+        ],
+    )
+    def test_database_failure_classification(self, error: Exception, is_failure: bool) -> None:
+        """Test that only errors of the database server count against its breaker."""
+        assert QueryOrchestrator._is_database_failure(error) is is_failure
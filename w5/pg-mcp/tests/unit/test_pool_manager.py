@@ -0,0 +1,337 @@
+"""Unit tests for PoolManager and pool shutdown.
+
+This module tests lazy and prewarmed pool creation, the total connection
+limit, idle pool eviction, the exported connection metrics and concurrent
+pool shutdown.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from pg_mcp.config.settings import DatabaseConfig, PoolManagerConfig
+from pg_mcp.db.pool import PoolManager, background_use, close_pools
+from pg_mcp.models.errors import DatabaseError
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakePoolFactory:
+    """Pool factory recording the configurations pools were created with."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.created: list[DatabaseConfig] = []
+        self.pools: dict[str, MagicMock] = {}
+
+    async def __call__(self, config: DatabaseConfig, **kwargs: Any) -> MagicMock:
+        await asyncio.sleep(self.delay)
+        self.created.append(config)
+
+        @asynccontextmanager
+        async def acquire() -> Any:
+            yield MagicMock(name=f"connection:{config.name}")
+
+        pool = MagicMock(name=f"pool:{config.name}")
+        pool.acquire = acquire
+        pool.close = AsyncMock()
+        self.pools[config.name] = pool
+        return pool
+
+
+def make_manager(
+    names: list[str],
+    factory: FakePoolFactory,
+    clock: FakeClock | None = None,
+    max_pool_size: int = 10,
+    **config: Any,
+) -> PoolManager:
+    """Create a manager over databases with equal pool sizes."""
+    database = DatabaseConfig(
+        name=names[0],
+        additional_names=names[1:],
+        min_pool_size=2,
+        max_pool_size=max_pool_size,
+    )
+    return PoolManager(
+        database.all_databases(),
+        PoolManagerConfig(**config),
+        metrics=MagicMock(),
+        pool_factory=factory,
+        clock=clock or FakeClock(),
+    )
+
+
+class TestPoolManager:
+    """Test suite for PoolManager."""
+
+    @pytest.mark.asyncio
+    async def test_pools_are_created_on_first_use(self) -> None:
+        """Test that a pool is only created when a connection is acquired."""
+        factory = FakePoolFactory()
+        manager = make_manager(["db1", "db2"], factory)
+        assert set(manager.pools) == {"db1", "db2"}
+        assert not manager.pools["db1"].is_open
+        assert manager.pools["db1"].get_size() == 0
+
+        async with manager.pools["db1"].acquire() as conn:
+            assert conn is not None
+
+        assert [c.name for c in factory.created] == ["db1"]
+        assert manager.is_open("db1")
+        assert not manager.is_open("db2")
+
+    @pytest.mark.asyncio
+    async def test_concurrent_first_use_creates_one_pool(self) -> None:
+        """Test that concurrent requests share a single pool creation."""
+        factory = FakePoolFactory(delay=0.01)
+        manager = make_manager(["db1"], factory)
+
+        pools = await asyncio.gather(*(manager.get_pool("db1") for _ in range(5)))
+
+        assert len(factory.created) == 1
+        assert all(pool is pools[0] for pool in pools)
+
+    @pytest.mark.asyncio
+    async def test_prewarm_creates_pools_concurrently(self) -> None:
+        """Test that prewarming opens all pools in parallel."""
+        factory = FakePoolFactory(delay=0.05)
+        manager = make_manager(["db1", "db2", "db3", "db4"], factory)
+
+        start = asyncio.get_running_loop().time()
+        await manager.prewarm()
+        elapsed = asyncio.get_running_loop().time() - start
+
+        assert {c.name for c in factory.created} == {"db1", "db2", "db3", "db4"}
+        assert elapsed < 0.15
+
+    @pytest.mark.asyncio
+    async def test_unknown_database(self) -> None:
+        """Test that an unknown database is rejected."""
+        manager = make_manager(["db1"], FakePoolFactory())
+
+        with pytest.raises(DatabaseError, match="not configured"):
+            await manager.get_pool("other")
+
+    @pytest.mark.asyncio
+    async def test_limit_closes_least_recently_used_idle_pool(self) -> None:
+        """Test that idle pools make room for a new pool."""
+        factory = FakePoolFactory()
+        clock = FakeClock()
+        manager = make_manager(
+            ["db1", "db2", "db3"], factory, clock=clock, max_total_connections=20
+        )
+        await manager.get_pool("db1")
+        clock.now = 1.0
+        await manager.get_pool("db2")
+        clock.now = 2.0
+        async with manager.acquire("db1"):
+            pass
+
+        await manager.get_pool("db3")
+
+        assert not manager.is_open("db2")
+        assert manager.is_open("db1") and manager.is_open("db3")
+        factory.pools["db2"].close.assert_awaited_once()
+        assert manager.total_reserved == 20
+
+    @pytest.mark.asyncio
+    async def test_evicted_pools_close_outside_the_lock(self) -> None:
+        """Test that a slow close of an evicted pool does not hold up the new pool."""
+        factory = FakePoolFactory()
+        manager = make_manager(["db1", "db2"], factory, max_total_connections=10)
+        await manager.get_pool("db1")
+        closing = asyncio.Event()
+        factory.pools["db1"].close = AsyncMock(side_effect=closing.wait)
+
+        creating = asyncio.create_task(manager.get_pool("db2"))
+        await asyncio.sleep(0.01)
+        assert not creating.done()  # Waiting for db1 to close
+
+        async with asyncio.timeout(1.0), manager.acquire("db2") as conn:
+            assert conn is not None
+
+        closing.set()
+        assert await creating is factory.pools["db2"]
+
+    @pytest.mark.asyncio
+    async def test_limit_shrinks_pool_when_others_are_busy(self) -> None:
+        """Test that a pool is created smaller when busy pools hold the limit."""
+        factory = FakePoolFactory()
+        manager = make_manager(["db1", "db2", "db3"], factory, max_total_connections=14)
+
+        async with manager.acquire("db1"):
+            await manager.get_pool("db2")
+            assert factory.created[-1].max_pool_size == 4
+            assert factory.created[-1].min_pool_size == 2
+
+            async with manager.acquire("db2"):
+                with pytest.raises(DatabaseError, match="Connection limit"):
+                    await manager.get_pool("db3")
+
+        assert manager.total_reserved == 14
+        assert not manager.is_open("db3")
+
+    @pytest.mark.asyncio
+    async def test_failed_creation_releases_reservation(self) -> None:
+        """Test that a pool that cannot be created does not hold connections."""
+        factory = AsyncMock(side_effect=OSError("connection refused"))
+        manager = PoolManager(
+            [DatabaseConfig(name="db1")], PoolManagerConfig(), pool_factory=factory
+        )
+
+        with pytest.raises(OSError):
+            await manager.get_pool("db1")
+
+        assert manager.total_reserved == 0
+        assert not manager.is_open("db1")
+
+    @pytest.mark.asyncio
+    async def test_idle_pools_are_closed_after_ttl(self) -> None:
+        """Test that pools unused for the TTL are closed and reopened on demand."""
+        factory = FakePoolFactory()
+        clock = FakeClock()
+        manager = make_manager(["db1", "db2"], factory, clock=clock, idle_ttl=60)
+        await manager.prewarm()
+
+        clock.now = 30.0
+        async with manager.acquire("db2"):
+            assert await manager.evict_idle() == []
+
+        clock.now = 70.0
+        assert await manager.evict_idle() == ["db1"]
+        assert not manager.is_open("db1")
+        assert manager.is_open("db2")
+
+        await manager.get_pool("db1")
+        assert [c.name for c in factory.created].count("db1") == 2
+
+    @pytest.mark.asyncio
+    async def test_background_use_does_not_keep_pools_open(self) -> None:
+        """Test that background connections do not count as use of the pool."""
+        factory = FakePoolFactory()
+        clock = FakeClock()
+        manager = make_manager(["db1"], factory, clock=clock, idle_ttl=60)
+        await manager.prewarm()
+
+        clock.now = 50.0
+        with background_use():
+            async with manager.acquire("db1"):
+                pass
+
+        clock.now = 70.0
+        assert await manager.evict_idle() == ["db1"]
+
+    @pytest.mark.asyncio
+    async def test_idle_eviction_disabled_by_default(self) -> None:
+        """Test that pools stay open without a TTL."""
+        clock = FakeClock()
+        manager = make_manager(["db1"], FakePoolFactory(), clock=clock)
+        await manager.prewarm()
+        manager.start_idle_eviction()
+
+        clock.now = 1e9
+        assert await manager.evict_idle() == []
+        assert manager._eviction_task is None
+
+    @pytest.mark.asyncio
+    async def test_active_connections_metric(self) -> None:
+        """Test that connections in use are exported per database."""
+        manager = make_manager(["db1"], FakePoolFactory())
+        metrics = manager.metrics
+        assert isinstance(metrics, MagicMock)
+
+        async with manager.acquire("db1"), manager.acquire("db1"):
+            pass
+
+        counts = [call.args for call in metrics.set_db_connections_active.call_args_list]
+        assert counts == [("db1", 1), ("db1", 2), ("db1", 1), ("db1", 0)]
+
+    @pytest.mark.asyncio
+    async def test_close(self) -> None:
+        """Test that closing stops eviction and closes every open pool."""
+        factory = FakePoolFactory()
+        manager = make_manager(["db1", "db2"], factory, idle_ttl=60)
+        await manager.get_pool("db1")
+        manager.start_idle_eviction()
+
+        await manager.close()
+
+        factory.pools["db1"].close.assert_awaited_once()
+        assert not manager.is_open("db1")
+        assert manager._eviction_task is None
+
+
+def closing_pool(delay: float = 0.0, error: Exception | None = None) -> MagicMock:
+    """Create a pool mock whose close takes a while or fails."""
+
+    async def close() -> None:
+        await asyncio.sleep(delay)
+        if error is not None:
+            raise error
+
+    pool = MagicMock()
+    pool.close = AsyncMock(side_effect=close)
+    return pool
+
+
+class TestClosePools:
+    """Test suite for close_pools."""
+
+    @pytest.mark.asyncio
+    async def test_pools_close_concurrently(self) -> None:
+        """Test that shutdown takes as long as the slowest pool."""
+        pools = {f"db{i}": closing_pool(delay=0.05) for i in range(5)}
+
+        start = asyncio.get_running_loop().time()
+        await close_pools(pools, timeout=1.0)  # type: ignore[arg-type]
+        elapsed = asyncio.get_running_loop().time() - start
+
+        assert elapsed < 0.15
+        for pool in pools.values():
+            pool.close.assert_awaited_once()
+            pool.terminate.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_slow_pools_are_terminated_at_deadline(self) -> None:
+        """Test that one global deadline bounds shutdown and terminates stragglers."""
+        pools = {
+            "fast": closing_pool(),
+            "slow1": closing_pool(delay=10),
+            "slow2": closing_pool(delay=10),
+        }
+
+        start = asyncio.get_running_loop().time()
+        await close_pools(pools, timeout=0.05)  # type: ignore[arg-type]
+        elapsed = asyncio.get_running_loop().time() - start
+
+        assert elapsed < 0.5
+        pools["fast"].terminate.assert_not_called()
+        pools["slow1"].terminate.assert_called_once()
+        pools["slow2"].terminate.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_failing_pool_is_terminated(self) -> None:
+        """Test that a close error terminates that pool only."""
+        pools = {"ok": closing_pool(), "broken": closing_pool(error=OSError("gone"))}
+
+        await close_pools(pools)  # type: ignore[arg-type]
+
+        pools["ok"].terminate.assert_not_called()
+        pools["broken"].terminate.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_no_pools(self) -> None:
+        """Test that closing nothing returns immediately."""
+        await close_pools({})
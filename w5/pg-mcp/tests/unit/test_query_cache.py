@@ -0,0 +1,194 @@
+"""Unit tests for the question and result cache."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from pg_mcp.cache.query_cache import LRUCache, QueryCache, normalize_question
+from pg_mcp.config.settings import QueryCacheConfig
+from pg_mcp.models.query import QueryResult, ValidationResult
+from pg_mcp.models.schema import ColumnInfo, DatabaseSchema, TableInfo
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """Create a fake clock."""
+    return FakeClock()
+
+
+@pytest.fixture
+def schema() -> DatabaseSchema:
+    """Create a small schema."""
+    return DatabaseSchema(
+        database_name="test_db",
+        tables=[
+            TableInfo(
+                table_name="users",
+                columns=[ColumnInfo(name="id", data_type="integer", is_nullable=False)],
+                row_count_estimate=10,
+            )
+        ],
+    )
+
+
+@pytest.fixture
+def validation() -> ValidationResult:
+    """Create a passing validation result."""
+    return ValidationResult(is_valid=True, is_select=True, allows_data_modification=False)
+
+
+@pytest.fixture
+def result() -> QueryResult:
+    """Create a query result."""
+    return QueryResult(columns=["count"], rows=[{"count": 10}], row_count=1, execution_time_ms=1.0)
+
+
+class TestLRUCache:
+    """Tests for LRUCache."""
+
+    def test_evicts_least_recently_used(self) -> None:
+        """Test that the least recently used entry is evicted when full."""
+        cache: LRUCache[str, int] = LRUCache(max_size=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        assert cache.get("a") == 1  # "b" is now least recently used
+        cache.put("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert len(cache) == 2
+
+    def test_entries_expire(self, clock: FakeClock) -> None:
+        """Test that entries expire after their TTL."""
+        cache: LRUCache[str, int] = LRUCache(max_size=10, clock=clock)
+        cache.put("a", 1, ttl=5)
+        cache.put("b", 2)
+
+        clock.now = 4.9
+        assert cache.get("a") == 1
+        clock.now = 5.0
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        assert len(cache) == 1
+
+    def test_invalid_max_size(self) -> None:
+        """Test that a max_size below 1 is rejected."""
+        with pytest.raises(ValueError):
+            LRUCache(max_size=0)
+
+
+class TestNormalizeQuestion:
+    """Tests for question normalization."""
+
+    @pytest.mark.parametrize(
+        "question",
+        [
+            "How many users?",
+            "  how   many USERS ",
+            "how many users.",
+            "\uff48\uff4f\uff57 many users\uff1f",
+        ],
+    )
+    def test_equivalent_questions(self, question: str) -> None:
+        """Test that trivially different phrasings normalize equally."""
+        assert normalize_question(question) == "how many users"
+
+
+class TestQueryCache:
+    """Tests for QueryCache."""
+
+    def test_sql_hit_for_normalized_question(
+        self, schema: DatabaseSchema, validation: ValidationResult
+    ) -> None:
+        """Test that cached SQL is found for an equivalent question."""
+        metrics = MagicMock()
+        cache = QueryCache(QueryCacheConfig(), metrics=metrics)
+
+        assert cache.get_sql("test_db", schema, "How many users?") is None
+        cache.put_sql("test_db", schema, "How many users?", "SELECT 1", validation)
+        cached = cache.get_sql("test_db", schema, "how many users")
+
+        assert cached is not None
+        assert cached.sql == "SELECT 1"
+        assert cached.validation == validation
+        assert cache.get_sql("other_db", schema, "how many users") is None
+        metrics.increment_query_cache_hit.assert_called_once_with("sql", "test_db")
+        assert metrics.increment_query_cache_miss.call_count == 2
+
+    def test_schema_change_invalidates_sql(
+        self, schema: DatabaseSchema, validation: ValidationResult
+    ) -> None:
+        """Test that cached SQL is keyed by schema content, not row estimates."""
+        cache = QueryCache(QueryCacheConfig())
+        cache.put_sql("test_db", schema, "How many users?", "SELECT 1", validation)
+
+        refreshed = schema.model_copy(
+            update={"tables": [schema.tables[0].model_copy(update={"row_count_estimate": 99})]}
+        )
+        assert cache.get_sql("test_db", refreshed, "How many users?") is not None
+
+        altered_table = schema.tables[0].model_copy(
+            update={
+                "columns": [
+                    *schema.tables[0].columns,
+                    ColumnInfo(name="email", data_type="text", is_nullable=True),
+                ]
+            }
+        )
+        altered = schema.model_copy(update={"tables": [altered_table]})
+        assert cache.get_sql("test_db", altered, "How many users?") is None
+
+    def test_sql_expires(
+        self, clock: FakeClock, schema: DatabaseSchema, validation: ValidationResult
+    ) -> None:
+        """Test that cached SQL expires after sql_ttl."""
+        cache = QueryCache(QueryCacheConfig(sql_ttl=60), clock=clock)
+        cache.put_sql("test_db", schema, "q", "SELECT 1", validation)
+
+        clock.now = 61
+        assert cache.get_sql("test_db", schema, "q") is None
+
+    def test_disabled(self, schema: DatabaseSchema, validation: ValidationResult) -> None:
+        """Test that a disabled cache never returns entries."""
+        cache = QueryCache(QueryCacheConfig(enabled=False, result_ttl=60))
+        cache.put_sql("test_db", schema, "q", "SELECT 1", validation)
+
+        assert cache.get_sql("test_db", schema, "q") is None
+        assert cache.get_result("test_db", "SELECT 1") is None
+
+    def test_result_cache_disabled_by_default(self, result: QueryResult) -> None:
+        """Test that results are not cached without a TTL."""
+        metrics = MagicMock()
+        cache = QueryCache(QueryCacheConfig(), metrics=metrics)
+        cache.put_result("test_db", "SELECT 1", result, 90)
+
+        assert cache.get_result("test_db", "SELECT 1") is None
+        metrics.increment_query_cache_miss.assert_not_called()
+
+    def test_result_ttl_by_database(self, clock: FakeClock, result: QueryResult) -> None:
+        """Test per-database result TTL overrides."""
+        config = QueryCacheConfig(
+            result_ttl=10, result_ttl_by_database={"analytics": 300, "live": 0}
+        )
+        cache = QueryCache(config, clock=clock)
+        for database in ("test_db", "analytics", "live"):
+            cache.put_result(database, "SELECT 1", result, 90)
+
+        assert cache.get_result("live", "SELECT 1") is None
+        clock.now = 20
+        assert cache.get_result("test_db", "SELECT 1") is None
+        cached = cache.get_result("analytics", "SELECT 1")
+        assert cached is not None
+        assert cached.result == result
+        assert cached.confidence == 90
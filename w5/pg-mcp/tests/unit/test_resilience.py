@@ -3,19 +3,34 @@
 Tests cover:
 - Circuit breaker state transitions
 - Circuit breaker failure threshold
-- Circuit breaker recovery timeout
+- Circuit breaker recovery timeout and half-open probing
+- Circuit breaker registry per dependency
 - Rate limiter concurrent control
 - Rate limiter timeout behavior
 - Multi-rate limiter coordination
+- Adaptive concurrency and token bucket limiting
+- Fair queue ordering
 """
 
 import asyncio
 import time
+from unittest.mock import MagicMock, patch
 
 import pytest
 
-from pg_mcp.resilience.circuit_breaker import CircuitBreaker, CircuitState
-from pg_mcp.resilience.rate_limiter import MultiRateLimiter, RateLimiter
+from pg_mcp.config.settings import RateLimitConfig
+from pg_mcp.resilience.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    CircuitState,
+)
+from pg_mcp.resilience.fair_queue import FairQueue, Flow, flow_context, get_current_flow
+from pg_mcp.resilience.rate_limiter import (
+    AdaptiveConcurrencyLimiter,
+    MultiRateLimiter,
+    RateLimiter,
+    TokenBucketLimiter,
+)
 
 
 class TestCircuitBreaker:
@@ -200,6 +215,93 @@ class TestCircuitBreaker:
         # Should have recorded all failures
         assert breaker.failure_count == failure_count * 4
 
+    def test_half_open_admits_limited_probes(self) -> None:
+        """HALF_OPEN should admit only the configured number of probes."""
+        now = 0.0
+        breaker = CircuitBreaker(
+            failure_threshold=1, recovery_timeout=10.0, half_open_max_calls=2, clock=lambda: now
+        )
+        breaker.record_failure()
+        now = 10.0
+
+        assert breaker.allow_request() is True
+        assert breaker.allow_request() is True
+        assert breaker.allow_request() is False
+
+        # The circuit closes only once every probe succeeded
+        breaker.record_success()
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert breaker.allow_request() is False
+        breaker.record_success()
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.allow_request() is True
+
+    def test_unreported_probes_are_given_up(self) -> None:
+        """Probes never reported should not block HALF_OPEN forever."""
+        now = 0.0
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10.0, clock=lambda: now)
+        breaker.record_failure()
+        now = 10.0
+        assert breaker.allow_request() is True
+        assert breaker.allow_request() is False
+
+        now = 20.0
+        assert breaker.allow_request() is True
+        assert breaker.get_stats()["half_open_calls"] == 1
+
+    def test_state_change_callback(self) -> None:
+        """State changes should be reported with the breaker name."""
+        now = 0.0
+        changes: list[tuple[str, CircuitState]] = []
+        breaker = CircuitBreaker(
+            failure_threshold=1,
+            recovery_timeout=10.0,
+            name="llm_generation",
+            on_state_change=lambda name, state: changes.append((name, state)),
+            clock=lambda: now,
+        )
+
+        breaker.record_failure()
+        now = 10.0
+        assert breaker.allow_request() is True
+        breaker.record_success()
+        breaker.reset()
+
+        assert changes == [
+            ("llm_generation", CircuitState.OPEN),
+            ("llm_generation", CircuitState.HALF_OPEN),
+            ("llm_generation", CircuitState.CLOSED),
+        ]
+
+
+class TestCircuitBreakerRegistry:
+    """Test cases for CircuitBreakerRegistry."""
+
+    def test_breakers_are_isolated(self) -> None:
+        """A failing dependency should not open other breakers."""
+        registry = CircuitBreakerRegistry(failure_threshold=2)
+        sick = registry.get(CircuitBreakerRegistry.database("replica"))
+        sick.record_failure()
+        sick.record_failure()
+
+        assert registry.get("database:replica") is sick
+        assert sick.allow_request() is False
+        assert registry.get(CircuitBreakerRegistry.database("primary")).allow_request() is True
+        assert registry.get(CircuitBreakerRegistry.LLM_GENERATION).allow_request() is True
+        assert registry.get_all_stats()["database:replica"]["state"] == CircuitState.OPEN
+
+    def test_states_are_exported(self) -> None:
+        """Breaker states should be reported to the metrics collector."""
+        metrics = MagicMock()
+        registry = CircuitBreakerRegistry(failure_threshold=1, metrics=metrics)
+
+        registry.get("database:replica").record_failure()
+
+        assert [call.args for call in metrics.set_circuit_breaker_state.call_args_list] == [
+            ("database:replica", CircuitState.CLOSED),
+            ("database:replica", CircuitState.OPEN),
+        ]
+
 
 class TestRateLimiter:
     """Test cases for RateLimiter implementation."""
@@ -357,6 +459,43 @@ class TestRateLimiter:
         assert len(completed) == operation_count
         assert sorted(completed) == list(range(operation_count))
 
+    @pytest.mark.asyncio
+    async def test_release_updates_counters_synchronously(self) -> None:
+        """Release should update counters without scheduling tasks."""
+        limiter = RateLimiter(max_concurrent=2)
+        tasks_before = len(asyncio.all_tasks())
+
+        async with limiter():
+            assert limiter.active_count == 1
+
+        assert len(asyncio.all_tasks()) == tasks_before
+        assert limiter.get_stats() == {
+            "max_concurrent": 2,
+            "active_count": 0,
+            "available": 2,
+            "total_requests": 1,
+            "total_rejections": 0,
+        }
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_keeps_counters_exact(self) -> None:
+        """A waiter cancelled before getting a slot should not be counted as active."""
+        limiter = RateLimiter(max_concurrent=1)
+        await limiter.acquire()
+
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        limiter.release()
+        stats = limiter.get_stats()
+        assert stats["active_count"] == 0
+        assert stats["total_requests"] == 2
+        assert stats["total_rejections"] == 0
+        assert await limiter.acquire(timeout=0.01) is True
+
 
 class TestMultiRateLimiter:
     """Test cases for MultiRateLimiter implementation."""
@@ -471,6 +610,353 @@ class TestMultiRateLimiter:
         assert len(query_results) == 5
         assert len(llm_results) == 5
 
+    def test_from_config(self) -> None:
+        """Configuration should select adaptive query and LLM quota limiters."""
+        limiter = MultiRateLimiter.from_config(RateLimitConfig())
+        assert isinstance(limiter.query_limiter, RateLimiter)
+        assert limiter.llm_budget is None
+        assert set(limiter.get_all_stats()) == {"queries", "llm"}
+
+        limiter = MultiRateLimiter.from_config(
+            RateLimitConfig(
+                max_concurrent_queries=8,
+                adaptive_queries=True,
+                llm_requests_per_minute=500,
+                llm_tokens_per_minute=90000,
+                llm_tokens_per_request=1500,
+            )
+        )
+        assert isinstance(limiter.query_limiter, AdaptiveConcurrencyLimiter)
+        assert limiter.query_limiter.max_concurrent == 8
+        stats = limiter.get_all_stats()
+        assert stats["queries"]["adaptive"] is True
+        assert stats["llm_budget"]["requests_per_minute"] == 500
+        assert stats["llm_budget"]["estimated_tokens_per_request"] == 1500
+
+    @pytest.mark.asyncio
+    async def test_for_llm_records_usage_on_budget(self) -> None:
+        """LLM calls should take from the quota and settle with recorded usage."""
+        budget = TokenBucketLimiter(tokens_per_minute=10000, default_tokens=1000)
+        limiter = MultiRateLimiter(llm_limit=1, llm_budget=budget)
+
+        async with limiter.for_llm(timeout=1.0) as reservation:
+            assert limiter.llm_limiter.active_count == 1
+            reservation.record(400)
+
+        stats = limiter.get_all_stats()["llm_budget"]
+        assert stats["total_tokens"] == 400
+        assert 9600 <= stats["available_tokens"] <= 10000
+
+    @pytest.mark.asyncio
+    async def test_for_llm_timeout_refunds_tokens(self) -> None:
+        """Waiting for a concurrency slot should share the timeout with the quota."""
+        budget = TokenBucketLimiter(tokens_per_minute=10000, default_tokens=1000)
+        limiter = MultiRateLimiter(llm_limit=1, llm_budget=budget)
+        await limiter.llm_limiter.acquire()
+
+        with pytest.raises(TimeoutError):
+            async with limiter.for_llm(timeout=0.05):
+                pass
+
+        assert budget.get_stats()["available_tokens"] == 10000
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """Test cases for AdaptiveConcurrencyLimiter implementation."""
+
+    def test_invalid_parameters(self) -> None:
+        """Should reject inconsistent bounds and ratios."""
+        with pytest.raises(ValueError, match="min_limit"):
+            AdaptiveConcurrencyLimiter(initial_limit=5, min_limit=10, max_limit=5)
+        with pytest.raises(ValueError, match="target_latency"):
+            AdaptiveConcurrencyLimiter(initial_limit=5, target_latency=0)
+        with pytest.raises(ValueError, match="backoff_ratio"):
+            AdaptiveConcurrencyLimiter(initial_limit=5, backoff_ratio=1.0)
+
+    @pytest.mark.asyncio
+    async def test_backs_off_once_per_window_and_recovers(self) -> None:
+        """Slow operations should shrink the limit, fast ones grow it to the maximum."""
+        clock = FakeClock()
+        limiter = AdaptiveConcurrencyLimiter(
+            initial_limit=10, min_limit=2, max_limit=11, target_latency=1.0, clock=clock
+        )
+
+        for _ in range(3):
+            await limiter.acquire()
+        limiter.release(latency=2.0)
+        limiter.release(latency=2.0)  # Same congestion window
+        assert limiter.max_concurrent == 9
+
+        clock.now = 1.5
+        limiter.release(latency=2.0)
+        assert limiter.max_concurrent == 8
+
+        for _ in range(30):
+            await limiter.acquire()
+            limiter.release(latency=0.1)
+        assert limiter.max_concurrent == 11
+        assert limiter.get_stats()["average_latency"] == pytest.approx(0.1, abs=0.01)
+
+    @pytest.mark.asyncio
+    async def test_lowered_limit_holds_back_waiters(self) -> None:
+        """Waiters should only be admitted while below the current limit."""
+        clock = FakeClock()
+        limiter = AdaptiveConcurrencyLimiter(
+            initial_limit=2, min_limit=1, max_limit=2, backoff_ratio=0.5, clock=clock
+        )
+        await limiter.acquire()
+        await limiter.acquire()
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+
+        limiter.release(latency=5.0)
+        await asyncio.sleep(0)
+        assert limiter.max_concurrent == 1
+        assert not waiter.done()
+
+        limiter.release()
+        assert await waiter is True
+        assert limiter.active_count == 1
+
+    @pytest.mark.asyncio
+    async def test_waiters_served_in_order_and_timeouts_rejected(self) -> None:
+        """Waiters should get slots in FIFO order; timed out waiters are counted."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1)
+        order: list[int] = []
+
+        async def operation(op_id: int) -> None:
+            async with limiter():
+                order.append(op_id)
+                await asyncio.sleep(0.01)
+
+        async with limiter():
+            tasks = [asyncio.create_task(operation(i)) for i in range(3)]
+            await asyncio.sleep(0)
+            assert await limiter.acquire(timeout=0.01) is False
+
+        await asyncio.gather(*tasks)
+        assert order == [0, 1, 2]
+        stats = limiter.get_stats()
+        assert stats["total_requests"] == 5
+        assert stats["total_rejections"] == 1
+        assert stats["active_count"] == 0
+
+    @pytest.mark.asyncio
+    async def test_waiter_cancelled_before_release(self) -> None:
+        """A waiter dropped by a release after its cancellation should unwind cleanly."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1)
+        await limiter.acquire()
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+
+        waiter.cancel()
+        limiter.release()  # Pops the cancelled waiter before its task resumes
+
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert limiter.active_count == 0
+        assert await limiter.acquire(timeout=0.01) is True
+
+
+class TestTokenBucketLimiter:
+    """Test cases for TokenBucketLimiter implementation."""
+
+    def test_invalid_parameters(self) -> None:
+        """Should reject negative rates and empty estimates."""
+        with pytest.raises(ValueError, match="rates"):
+            TokenBucketLimiter(requests_per_minute=-1)
+        with pytest.raises(ValueError, match="default_tokens"):
+            TokenBucketLimiter(default_tokens=0)
+
+    @pytest.mark.asyncio
+    async def test_settle_replaces_reservation_with_actual_usage(self) -> None:
+        """Settled usage should debit or refund the difference and update the estimate."""
+        limiter = TokenBucketLimiter(tokens_per_minute=1000, default_tokens=100, clock=FakeClock())
+
+        assert await limiter.acquire(100) is True
+        limiter.settle(100, 300)
+        assert limiter.get_stats()["available_tokens"] == 700
+        assert limiter.estimated_tokens == 140
+
+        async with limiter(tokens=200) as reservation:
+            assert limiter.get_stats()["available_tokens"] == 500
+            reservation.record(50)
+            reservation.record(1000)  # Only the first record counts
+        stats = limiter.get_stats()
+        assert stats["available_tokens"] == 650
+        assert stats["total_tokens"] == 350
+
+    @pytest.mark.asyncio
+    async def test_failed_call_is_refunded(self) -> None:
+        """Tokens of a call that raises before recording usage should be refunded."""
+        limiter = TokenBucketLimiter(tokens_per_minute=1000, clock=FakeClock())
+
+        with pytest.raises(RuntimeError):
+            async with limiter(tokens=400):
+                raise RuntimeError("API error")
+
+        assert limiter.get_stats()["available_tokens"] == 1000
+
+    @pytest.mark.asyncio
+    async def test_exhausted_bucket_times_out(self) -> None:
+        """Requests beyond the per-minute quota should wait and can time out."""
+        limiter = TokenBucketLimiter(requests_per_minute=2, clock=FakeClock())
+
+        assert await limiter.acquire(1) is True
+        assert await limiter.acquire(1) is True
+        assert await limiter.acquire(1, timeout=0.01) is False
+
+        stats = limiter.get_stats()
+        assert stats["available_requests"] == 0
+        assert stats["available_tokens"] is None
+        assert stats["total_rejections"] == 1
+
+    @pytest.mark.asyncio
+    async def test_waits_for_refill(self) -> None:
+        """A request should be admitted once the bucket has refilled."""
+        clock = FakeClock()
+        limiter = TokenBucketLimiter(requests_per_minute=60, clock=clock)
+        for _ in range(60):
+            await limiter.acquire(1)
+
+        async def advance(seconds: float) -> None:
+            clock.now += seconds
+
+        with patch.object(asyncio, "sleep", side_effect=advance) as sleep:
+            assert await limiter.acquire(1, timeout=5.0) is True
+
+        # One request refills every second
+        sleep.assert_awaited_once()
+        assert clock.now == pytest.approx(1.0)
+        assert limiter.get_stats()["available_requests"] == 0
+
+    @pytest.mark.asyncio
+    async def test_oversized_reservation_waits_for_full_bucket(self) -> None:
+        """A reservation above the bucket size should be admitted from a full bucket."""
+        limiter = TokenBucketLimiter(tokens_per_minute=100, clock=FakeClock())
+
+        assert await limiter.acquire(500) is True
+        assert limiter.get_stats()["available_tokens"] == -400
+        assert await limiter.acquire(1, timeout=0.01) is False
+
+
+async def serve_order(queue: FairQueue, requests: list[tuple[str, Flow]]) -> list[str]:
+    """Queue requests behind a held turn and return the order they get the turn."""
+    order: list[str] = []
+
+    async def request(name: str, flow: Flow) -> None:
+        async with queue.turn(flow):
+            order.append(name)
+
+    async with queue.turn(Flow(client="blocker")):
+        tasks = [asyncio.create_task(request(name, flow)) for name, flow in requests]
+        await asyncio.sleep(0)
+    await asyncio.gather(*tasks)
+    return order
+
+
+class TestFairQueue:
+    """Test cases for FairQueue implementation."""
+
+    @pytest.mark.asyncio
+    async def test_light_client_not_starved(self) -> None:
+        """A client's requests should interleave with a heavy client's backlog."""
+        queue = FairQueue("queries")
+        heavy = Flow(client="heavy", database="db")
+        light = Flow(client="light", database="db")
+
+        order = await serve_order(
+            queue, [(f"h{i}", heavy) for i in range(1, 5)] + [("l1", light), ("l2", light)]
+        )
+
+        assert order == ["h1", "l1", "h2", "l2", "h3", "h4"]
+
+    @pytest.mark.asyncio
+    async def test_priority_classes_served_first(self) -> None:
+        """Higher priority classes should be served before lower ones."""
+        queue = FairQueue("queries", priority_order=["sql", "result"])
+
+        order = await serve_order(
+            queue,
+            [
+                ("result", Flow(client="a", priority="result")),
+                ("unknown", Flow(client="b", priority="other")),
+                ("sql", Flow(client="c", priority="sql")),
+            ],
+        )
+
+        assert order == ["sql", "result", "unknown"]
+
+    @pytest.mark.asyncio
+    async def test_weights_share_turns(self) -> None:
+        """Flows should get turns in proportion to client and database weights."""
+        queue = FairQueue("queries", client_weights={"a": 2.0}, database_weights={"slow": 0.5})
+        a = Flow(client="a", database="fast")
+        b = Flow(client="b", database="fast")
+        c = Flow(client="b", database="slow")
+
+        order = await serve_order(
+            queue, [(f"a{i}", a) for i in range(4)] + [("b0", b), ("b1", b), ("c0", c)]
+        )
+
+        assert order == ["a0", "a1", "b0", "a2", "a3", "b1", "c0"]
+
+    @pytest.mark.asyncio
+    async def test_timed_out_waiter_leaves_queue(self) -> None:
+        """A waiter that times out should not block the turn for others."""
+        queue = FairQueue("queries")
+
+        async with queue.turn(Flow(client="a")):
+            with pytest.raises(TimeoutError):
+                async with queue.turn(Flow(client="b"), timeout=0.01):
+                    pass
+
+        async with asyncio.timeout(1.0), queue.turn(Flow(client="c")):
+            assert queue.waiting == 0
+
+    @pytest.mark.asyncio
+    async def test_wait_time_observed(self) -> None:
+        """Queue wait time should be reported per resource and priority."""
+        metrics = MagicMock()
+        queue = FairQueue("llm", metrics=metrics)
+
+        async with queue.turn(Flow(priority="sql")):
+            pass
+
+        (resource, priority, duration), _ = metrics.observe_queue_wait.call_args
+        assert (resource, priority) == ("llm", "sql")
+        assert duration >= 0
+
+    @pytest.mark.asyncio
+    async def test_limiter_admits_in_fair_order(self) -> None:
+        """Waiting queries should get limiter slots in fair queue order."""
+        limiter = MultiRateLimiter(query_limit=1, query_queue=FairQueue("queries"))
+        order: list[str] = []
+
+        async def query(name: str, client: str) -> None:
+            with flow_context(Flow(client=client)):
+                async with limiter.for_queries(timeout=1.0):
+                    order.append(name)
+                    await asyncio.sleep(0.01)
+
+        tasks = [asyncio.create_task(query(f"h{i}", "heavy")) for i in range(3)]
+        await asyncio.sleep(0)
+        tasks.append(asyncio.create_task(query("l0", "light")))
+        await asyncio.gather(*tasks)
+
+        assert order == ["h0", "h1", "l0", "h2"]
+        assert get_current_flow() == Flow()
+
 
 class TestIntegration:
     """Integration tests combining circuit breaker and rate limiter."""
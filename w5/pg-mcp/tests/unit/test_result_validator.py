@@ -10,7 +10,7 @@ import pytest
 
 from pg_mcp.config.settings import OpenAIConfig, ValidationConfig
 from pg_mcp.models.errors import LLMError, LLMTimeoutError, LLMUnavailableError
-from pg_mcp.models.query import ResultValidationResult
+from pg_mcp.models.query import ResultValidationResult, TokenUsage
 from pg_mcp.services.result_validator import ResultValidator
 
 
@@ -183,6 +183,32 @@ class TestResultValidatorSuccessfulValidation:
         assert result.suggestion is not None
 
 
+    @pytest.mark.asyncio
+    async def test_validation_reports_token_usage(self) -> None:
+        """Test that API token usage is added to the usage accumulator."""
+        validator = ResultValidator(OpenAIConfig(api_key="sk-test123"), ValidationConfig())
+
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock(message=MagicMock(content="not json"))]
+        mock_response.usage = MagicMock(prompt_tokens=300, completion_tokens=40)
+        usage = TokenUsage()
+
+        with patch.object(
+            validator.client.chat.completions, "create", new=AsyncMock(return_value=mock_response)
+        ):
+            result = await validator.validate(
+                question="How many users?",
+                sql="SELECT COUNT(*) FROM users",
+                results=[{"count": 42}],
+                row_count=1,
+                usage=usage,
+            )
+
+        # Usage counts even when the response cannot be parsed
+        assert result.confidence == 60
+        assert usage == TokenUsage(prompt_tokens=300, completion_tokens=40)
+
+
 class TestResultValidatorSampling:
     """Tests for result sampling behavior."""
 
@@ -224,6 +250,25 @@ class TestResultValidatorSampling:
         # Should not contain later results
         assert "User 50" not in prompt
 
+    @pytest.mark.asyncio
+    async def test_unknown_total_is_not_reported_as_count(self) -> None:
+        """Test that a truncated result without a total is described as such."""
+        validator = ResultValidator(OpenAIConfig(api_key="sk-test123"), ValidationConfig())
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock(message=MagicMock(content='{"confidence": 90}'))]
+
+        mock_create = AsyncMock(return_value=mock_response)
+        with patch.object(validator.client.chat.completions, "create", mock_create):
+            await validator.validate(
+                question="List all users",
+                sql="SELECT * FROM users",
+                results=[{"id": i} for i in range(3)],
+                row_count=None,
+            )
+
+        prompt = mock_create.call_args.kwargs["messages"][1]["content"]
+        assert "showing 3 of more than the returned rows" in prompt
+
 
 class TestResultValidatorErrorHandling:
     """Tests for error handling in validation."""
@@ -6,13 +6,15 @@ expiration, and auto-refresh capabilities.
 
 import asyncio
 from datetime import UTC, datetime, timedelta
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 
 from pg_mcp.cache.schema_cache import SchemaCache
 from pg_mcp.config.settings import CacheConfig
-from pg_mcp.models.schema import DatabaseSchema, TableInfo
+from pg_mcp.db.introspection import CatalogChanges, RelationSignature
+from pg_mcp.models.schema import ColumnInfo, DatabaseSchema, EnumTypeInfo, TableInfo
 
 
 class TestSchemaCache:
@@ -327,6 +329,30 @@ class TestSchemaCache:
             assert new_age is not None
             assert new_age < 30 * 60  # Should be fresher than the original 30 minutes
 
+    @pytest.mark.asyncio
+    async def test_auto_refresh_skips_closed_pools(
+        self,
+        cache: SchemaCache,
+        sample_schema: DatabaseSchema,
+    ):
+        """Test that auto-refresh does not reopen pools closed while idle."""
+        for name in ("open_db", "idle_db"):
+            cache._cache[name] = sample_schema
+            cache._cache_timestamps[name] = datetime.now(UTC)
+        pools = {"open_db": MagicMock(is_open=True), "idle_db": MagicMock(is_open=False)}
+
+        async def sleep(seconds: float) -> None:
+            # Run a single refresh cycle
+            cache._stop_refresh = refresh.await_count > 0
+
+        with (
+            patch.object(cache, "refresh", new_callable=AsyncMock) as refresh,
+            patch("pg_mcp.cache.schema_cache.asyncio.sleep", side_effect=sleep),
+        ):
+            await cache._auto_refresh_loop(1, pools)
+
+        refresh.assert_awaited_once_with("open_db", pools["open_db"])
+
     @pytest.mark.asyncio
     async def test_auto_refresh_handles_exceptions(
         self,
@@ -356,3 +382,268 @@ class TestSchemaCache:
             await cache.stop_auto_refresh()
 
             assert cache._stop_refresh is True
+
+
+class TestIncrementalRefresh:
+    """Test suite for catalog-fingerprint based incremental refresh."""
+
+    @pytest.fixture
+    def cache(self) -> SchemaCache:
+        """Create schema cache instance with incremental refresh enabled."""
+        return SchemaCache(CacheConfig(incremental_refresh=True))
+
+    @pytest.fixture
+    def signatures(self) -> dict[int, RelationSignature]:
+        """Create relation signatures matching the cached schema."""
+        return {
+            1: RelationSignature(schema_name="public", table_name="users", signature="u1"),
+            2: RelationSignature(schema_name="public", table_name="orders", signature="o1"),
+            3: RelationSignature(schema_name="public", table_name="legacy", signature="l1"),
+        }
+
+    @pytest.fixture
+    def cached_schema(self) -> DatabaseSchema:
+        """Create the currently cached schema."""
+        return DatabaseSchema(
+            database_name="test_db",
+            tables=[
+                TableInfo(table_name="users"),
+                TableInfo(table_name="orders"),
+                TableInfo(table_name="legacy"),
+            ],
+            version="PostgreSQL 16.0",
+        )
+
+    @pytest.fixture
+    def sample_schema(self) -> DatabaseSchema:
+        """Create the schema returned by a full reload."""
+        return DatabaseSchema(database_name="test_db", tables=[TableInfo(table_name="users")])
+
+    @pytest.fixture
+    def seeded_cache(
+        self,
+        cache: SchemaCache,
+        cached_schema: DatabaseSchema,
+        signatures: dict[int, RelationSignature],
+    ) -> SchemaCache:
+        """Populate the cache as if a full load had run."""
+        cache._cache["test_db"] = cached_schema
+        cache._cache_timestamps["test_db"] = datetime.now(UTC) - timedelta(minutes=30)
+        cache._catalog_states["test_db"] = ("fp1", signatures)
+        return cache
+
+    @pytest.mark.asyncio
+    async def test_load_captures_catalog_state(
+        self, cache: SchemaCache, cached_schema: DatabaseSchema
+    ):
+        """Test that a full load records the catalog state for later refreshes."""
+        with patch("pg_mcp.cache.schema_cache.SchemaIntrospector") as mock_introspector_class:
+            mock_introspector = AsyncMock()
+            mock_introspector.get_catalog_state.return_value = ("fp1", {})
+            mock_introspector.introspect.return_value = cached_schema
+            mock_introspector_class.return_value = mock_introspector
+
+            await cache.load("test_db", MagicMock())
+
+        assert cache._catalog_states["test_db"] == ("fp1", {})
+
+    @pytest.mark.asyncio
+    async def test_unchanged_catalog_keeps_schema(
+        self, seeded_cache: SchemaCache, cached_schema: DatabaseSchema
+    ):
+        """Test that an unchanged fingerprint skips introspection entirely."""
+        with patch("pg_mcp.cache.schema_cache.SchemaIntrospector") as mock_introspector_class:
+            mock_introspector = AsyncMock()
+            mock_introspector.introspect_changes.return_value = None
+            mock_introspector.get_row_estimates.return_value = {}
+            mock_introspector_class.return_value = mock_introspector
+
+            await seeded_cache.refresh("test_db", MagicMock())
+
+            mock_introspector.introspect.assert_not_called()
+
+        assert seeded_cache.get("test_db") is cached_schema
+        age = seeded_cache.get_cache_age("test_db")
+        assert age is not None and age < 60
+
+    @pytest.mark.asyncio
+    async def test_unchanged_catalog_refreshes_row_estimates(
+        self, seeded_cache: SchemaCache, cached_schema: DatabaseSchema
+    ):
+        """Test that statistics updates alone patch row estimates without introspection."""
+        with patch("pg_mcp.cache.schema_cache.SchemaIntrospector") as mock_introspector_class:
+            mock_introspector = AsyncMock()
+            mock_introspector.introspect_changes.return_value = None
+            mock_introspector.get_row_estimates.return_value = {1: 0, 2: 5000, 99: 7}
+            mock_introspector_class.return_value = mock_introspector
+
+            await seeded_cache.refresh("test_db", MagicMock())
+
+            mock_introspector.introspect.assert_not_called()
+
+        schema = seeded_cache.get("test_db")
+        assert schema is not None and schema is not cached_schema
+        assert [t.row_count_estimate for t in schema.tables] == [None, 5000, None]
+        assert schema.tables[0] is cached_schema.tables[0]
+        fingerprint, signatures = seeded_cache._catalog_states["test_db"]
+        assert fingerprint == "fp1"
+        assert signatures[2].row_count_estimate == 5000
+
+    @pytest.mark.asyncio
+    async def test_changed_relations_are_patched(
+        self,
+        seeded_cache: SchemaCache,
+        cached_schema: DatabaseSchema,
+        signatures: dict[int, RelationSignature],
+    ):
+        """Test that only changed relations are replaced in the cached schema."""
+        altered_orders = TableInfo(
+            table_name="orders",
+            columns=[ColumnInfo(name="total", data_type="numeric", is_nullable=False)],
+        )
+        new_table = TableInfo(table_name="invoices")
+        new_signatures = {
+            1: signatures[1].model_copy(update={"row_count_estimate": 500}),
+            2: signatures[2].model_copy(update={"signature": "o2"}),
+            4: RelationSignature(schema_name="public", table_name="invoices", signature="i1"),
+        }
+        changes = CatalogChanges(
+            fingerprint="fp2",
+            signatures=new_signatures,
+            changed={2: altered_orders, 4: new_table},
+            enum_types=[EnumTypeInfo(type_name="status", values=["open", "closed"])],
+        )
+
+        with patch("pg_mcp.cache.schema_cache.SchemaIntrospector") as mock_introspector_class:
+            mock_introspector = AsyncMock()
+            mock_introspector.introspect_changes.return_value = changes
+            mock_introspector_class.return_value = mock_introspector
+
+            await seeded_cache.refresh("test_db", MagicMock())
+
+            mock_introspector.introspect_changes.assert_awaited_once_with("fp1", signatures)
+            mock_introspector.introspect.assert_not_called()
+
+        schema = seeded_cache.get("test_db")
+        assert schema is not None
+        assert [t.table_name for t in schema.tables] == ["users", "orders", "invoices"]
+        assert schema.tables[0].row_count_estimate == 500
+        assert schema.tables[1] is altered_orders
+        assert schema.enum_types[0].type_name == "status"
+        assert schema.version == "PostgreSQL 16.0"
+        # The previously cached schema is left untouched
+        assert [t.table_name for t in cached_schema.tables] == ["users", "orders", "legacy"]
+        assert cached_schema.tables[0].row_count_estimate is None
+        assert seeded_cache._catalog_states["test_db"] == ("fp2", new_signatures)
+
+    @pytest.mark.asyncio
+    async def test_failure_falls_back_to_full_load(
+        self, seeded_cache: SchemaCache, sample_schema: DatabaseSchema
+    ):
+        """Test that a failed incremental refresh reloads the whole schema."""
+        with patch("pg_mcp.cache.schema_cache.SchemaIntrospector") as mock_introspector_class:
+            mock_introspector = AsyncMock()
+            mock_introspector.introspect_changes.side_effect = Exception("boom")
+            mock_introspector.get_catalog_state.return_value = ("fp9", {})
+            mock_introspector.introspect.return_value = sample_schema
+            mock_introspector_class.return_value = mock_introspector
+
+            await seeded_cache.refresh("test_db", MagicMock())
+
+        assert seeded_cache.get("test_db") is sample_schema
+        assert seeded_cache._catalog_states["test_db"] == ("fp9", {})
+
+
+class TestSchemaSnapshots:
+    """Test suite for snapshot-backed startup and background revalidation."""
+
+    @pytest.fixture
+    def cache(self, tmp_path: Path) -> SchemaCache:
+        """Create schema cache instance writing snapshots to a temp directory."""
+        return SchemaCache(CacheConfig(snapshot_dir=tmp_path))
+
+    @pytest.fixture
+    def sample_schema(self) -> DatabaseSchema:
+        """Create sample database schema for testing."""
+        return DatabaseSchema(database_name="test_db", tables=[TableInfo(table_name="users")])
+
+    @pytest.mark.asyncio
+    async def test_load_without_snapshot_dir_returns_none(self):
+        """Test that snapshots are disabled without a snapshot directory."""
+        assert await SchemaCache(CacheConfig()).load_snapshot("test_db") is None
+
+    @pytest.mark.asyncio
+    async def test_load_writes_snapshot_for_next_startup(
+        self, cache: SchemaCache, tmp_path: Path, sample_schema: DatabaseSchema
+    ):
+        """Test that a loaded schema is served from its snapshot after a restart."""
+        with patch("pg_mcp.cache.schema_cache.SchemaIntrospector") as mock_introspector_class:
+            mock_introspector = AsyncMock()
+            mock_introspector.get_catalog_state.return_value = ("fp1", {})
+            mock_introspector.introspect.return_value = sample_schema
+            mock_introspector_class.return_value = mock_introspector
+
+            await cache.load("test_db", MagicMock())
+
+        restarted = SchemaCache(CacheConfig(snapshot_dir=tmp_path))
+        schema = await restarted.load_snapshot("test_db")
+
+        assert schema == sample_schema
+        assert restarted.get("test_db") == sample_schema
+        assert restarted._catalog_states["test_db"] == ("fp1", {})
+
+    @pytest.mark.asyncio
+    async def test_revalidation_serves_snapshot_until_done(
+        self, cache: SchemaCache, sample_schema: DatabaseSchema
+    ):
+        """Test that the snapshot is served while revalidation runs in the background."""
+        cache._cache["test_db"] = sample_schema
+        cache._cache_timestamps["test_db"] = datetime.now(UTC)
+        cache._catalog_states["test_db"] = ("fp1", {})
+        refreshed = DatabaseSchema(database_name="test_db", tables=[])
+        release = asyncio.Event()
+
+        async def introspect_changes(*_args):
+            await release.wait()
+            return CatalogChanges(fingerprint="fp2", signatures={}, changed={}, enum_types=[])
+
+        with patch("pg_mcp.cache.schema_cache.SchemaIntrospector") as mock_introspector_class:
+            mock_introspector = AsyncMock()
+            mock_introspector.introspect_changes.side_effect = introspect_changes
+            mock_introspector_class.return_value = mock_introspector
+
+            cache.start_revalidation("test_db", MagicMock())
+            await asyncio.sleep(0)
+            assert cache.get("test_db") is sample_schema
+
+            release.set()
+            await cache._revalidation_tasks["test_db"]
+
+        assert cache.get("test_db") == refreshed
+        assert cache._catalog_states["test_db"] == ("fp2", {})
+
+    @pytest.mark.asyncio
+    async def test_stop_cancels_pending_revalidation(
+        self, cache: SchemaCache, sample_schema: DatabaseSchema
+    ):
+        """Test that shutdown cancels a revalidation that is still running."""
+        cache._cache["test_db"] = sample_schema
+        cache._cache_timestamps["test_db"] = datetime.now(UTC)
+        cache._catalog_states["test_db"] = ("fp1", {})
+
+        async def introspect_changes(*_args):
+            await asyncio.Event().wait()
+
+        with patch("pg_mcp.cache.schema_cache.SchemaIntrospector") as mock_introspector_class:
+            mock_introspector = AsyncMock()
+            mock_introspector.introspect_changes.side_effect = introspect_changes
+            mock_introspector_class.return_value = mock_introspector
+
+            cache.start_revalidation("test_db", MagicMock())
+            task = cache._revalidation_tasks["test_db"]
+            await asyncio.sleep(0)
+
+            await cache.stop_auto_refresh()
+
+        assert task.cancelled()
+        assert cache._revalidation_tasks == {}
@@ -0,0 +1,169 @@
+"""Unit tests for relevance-based schema pruning.
+
+This module tests tokenization, BM25 ranking, foreign key expansion and the
+token budget of the SchemaRetriever.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from pg_mcp.config.settings import SchemaContextConfig
+from pg_mcp.models.schema import ColumnInfo, DatabaseSchema, ForeignKeyInfo, TableInfo
+from pg_mcp.services.schema_retriever import SchemaRetriever, estimate_tokens, tokenize
+
+
+def make_table(
+    name: str,
+    columns: list[str],
+    references: list[str] | None = None,
+    comment: str | None = None,
+) -> TableInfo:
+    """Build a table with integer columns and foreign keys to other tables."""
+    return TableInfo(
+        table_name=name,
+        comment=comment,
+        columns=[ColumnInfo(name=col, data_type="integer", is_nullable=True) for col in columns],
+        foreign_keys=[
+            ForeignKeyInfo(
+                constraint_name=f"fk_{name}_{ref}",
+                column_name=f"{ref}_id",
+                referenced_table=ref,
+                referenced_column="id",
+            )
+            for ref in references or []
+        ],
+    )
+
+
+@pytest.fixture
+def large_schema() -> DatabaseSchema:
+    """Create a schema with a few meaningful tables and many unrelated ones."""
+    tables = [
+        make_table("customers", ["id", "name", "email"]),
+        make_table("orders", ["id", "customer_id", "total"], references=["customers"]),
+        make_table("order_items", ["id", "order_id", "quantity"], references=["orders"]),
+        make_table("invoices", ["id", "amount"], comment="发票记录"),
+    ]
+    tables.extend(make_table(f"audit_log_{i}", ["id", "payload", "logged_at"]) for i in range(200))
+    return DatabaseSchema(database_name="test_db", tables=tables)
+
+
+def table_names(schema: DatabaseSchema) -> list[str]:
+    """Return the table names of a schema."""
+    return [table.table_name for table in schema.tables]
+
+
+class TestTokenize:
+    """Test suite for search term extraction."""
+
+    def test_splits_identifiers(self) -> None:
+        """Test splitting on underscores and camelCase with singularization."""
+        assert tokenize("orderItems user_addresses") == ["order", "item", "user", "address"]
+        assert tokenize("categories") == ["category"]
+
+    def test_cjk_bigrams(self) -> None:
+        """Test that CJK text is split into overlapping bigrams."""
+        assert tokenize("发票记录") == ["发票", "票记", "记录"]
+
+    def test_estimate_tokens(self) -> None:
+        """Test the four characters per token approximation."""
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("abcd") == 1
+        assert estimate_tokens("abcde") == 2
+
+
+class TestSchemaRetriever:
+    """Test suite for SchemaRetriever."""
+
+    def test_small_schema_is_not_pruned(self) -> None:
+        """Test that a schema within budget is returned unchanged."""
+        schema = DatabaseSchema(
+            database_name="test_db",
+            tables=[make_table("users", ["id"]), make_table("posts", ["id"])],
+        )
+
+        assert SchemaRetriever(SchemaContextConfig()).prune("count users", schema) is schema
+
+    def test_prunes_to_relevant_tables_with_fk_neighbours(
+        self, large_schema: DatabaseSchema
+    ) -> None:
+        """Test ranking by relevance and pulling in foreign key neighbours."""
+        retriever = SchemaRetriever(SchemaContextConfig(max_tokens=1000, max_tables=3))
+
+        pruned = retriever.prune("total order value per customer", large_schema)
+
+        assert table_names(pruned) == ["customers", "orders", "order_items"]
+        assert pruned.database_name == "test_db"
+        # The cached schema is left untouched
+        assert len(large_schema.tables) == 204
+
+    def test_fk_expansion_can_be_disabled(self, large_schema: DatabaseSchema) -> None:
+        """Test that depth 0 keeps only lexically matching tables."""
+        expanding = SchemaRetriever(SchemaContextConfig(max_tokens=1000, max_tables=10))
+        lexical = SchemaRetriever(
+            SchemaContextConfig(max_tokens=1000, max_tables=10, fk_expansion_depth=0)
+        )
+
+        assert table_names(expanding.prune("list emails", large_schema)) == [
+            "customers",
+            "orders",
+        ]
+        assert table_names(lexical.prune("list emails", large_schema)) == ["customers"]
+
+    def test_matches_cjk_comments(self, large_schema: DatabaseSchema) -> None:
+        """Test that Chinese questions match Chinese comments."""
+        retriever = SchemaRetriever(SchemaContextConfig(max_tokens=1000))
+
+        pruned = retriever.prune("查询所有发票", large_schema)
+
+        assert table_names(pruned) == ["invoices"]
+
+    def test_respects_token_budget(self, large_schema: DatabaseSchema) -> None:
+        """Test that the selection stays within the token budget."""
+        budget = 500
+        retriever = SchemaRetriever(SchemaContextConfig(max_tokens=budget, max_tables=1000))
+
+        pruned = retriever.prune("audit log payload", large_schema)
+
+        tokens = sum(estimate_tokens(t.to_prompt_section()) for t in pruned.tables)
+        assert 0 < tokens <= budget
+        assert len(pruned.tables) < len(large_schema.tables)
+
+    def test_no_match_keeps_full_schema(self, large_schema: DatabaseSchema) -> None:
+        """Test that an unmatched question falls back to the full schema."""
+        retriever = SchemaRetriever(SchemaContextConfig(max_tokens=500))
+
+        assert retriever.prune("zzz qqq", large_schema) is large_schema
+
+    def test_disabled_keeps_full_schema(self, large_schema: DatabaseSchema) -> None:
+        """Test that pruning can be switched off."""
+        retriever = SchemaRetriever(SchemaContextConfig(pruning_enabled=False, max_tokens=500))
+
+        assert retriever.prune("customers", large_schema) is large_schema
+
+    def test_index_rebuilt_for_new_schema_object(self, large_schema: DatabaseSchema) -> None:
+        """Test that the index is reused per schema object and rebuilt on reload."""
+        retriever = SchemaRetriever(SchemaContextConfig(max_tokens=500))
+        retriever.prune("customers", large_schema)
+        index = retriever._indexes["test_db"][1]
+
+        retriever.prune("orders", large_schema)
+        assert retriever._indexes["test_db"][1] is index
+
+        reloaded = large_schema.model_copy(
+            update={"tables": [*large_schema.tables, make_table("refunds", ["id"])]}
+        )
+        assert table_names(retriever.prune("refunds", reloaded)) == ["refunds"]
+        assert retriever._indexes["test_db"][1] is not index
+
+    def test_records_prompt_size_metrics(self, large_schema: DatabaseSchema) -> None:
+        """Test that full and pruned context sizes are exported."""
+        metrics = MagicMock()
+        retriever = SchemaRetriever(SchemaContextConfig(max_tokens=1000), metrics=metrics)
+
+        retriever.prune("customers", large_schema)
+
+        calls = metrics.observe_schema_context_tokens.call_args_list
+        assert [call.args[0] for call in calls] == ["full", "pruned"]
+        assert calls[0].args[1] > calls[1].args[1] > 0
@@ -0,0 +1,93 @@
+"""Unit tests for on-disk schema snapshots.
+
+This module tests snapshot serialization, atomic writes and the handling of
+missing, corrupt and outdated snapshot files.
+"""
+
+import gzip
+from pathlib import Path
+
+import pytest
+
+from pg_mcp.cache.snapshot import (
+    SNAPSHOT_FORMAT_VERSION,
+    SchemaSnapshot,
+    read_snapshot,
+    snapshot_path,
+    write_snapshot,
+)
+from pg_mcp.db.introspection import RelationSignature
+from pg_mcp.models.schema import ColumnInfo, DatabaseSchema, TableInfo
+
+
+@pytest.fixture
+def snapshot() -> SchemaSnapshot:
+    """Create a snapshot with one table and its signature."""
+    return SchemaSnapshot(
+        fingerprint="fp1",
+        signatures={
+            16384: RelationSignature(
+                schema_name="public",
+                table_name="users",
+                signature="abc",
+                row_count_estimate=10,
+            )
+        },
+        database_schema=DatabaseSchema(
+            database_name="test_db",
+            tables=[
+                TableInfo(
+                    table_name="users",
+                    columns=[ColumnInfo(name="id", data_type="integer", is_nullable=False)],
+                    row_count_estimate=10,
+                )
+            ],
+            version="PostgreSQL 16.0",
+        ),
+    )
+
+
+class TestSnapshot:
+    """Test suite for snapshot read/write helpers."""
+
+    def test_round_trip(self, tmp_path: Path, snapshot: SchemaSnapshot) -> None:
+        """Test that a written snapshot reads back unchanged."""
+        path = snapshot_path(tmp_path, "test_db")
+
+        write_snapshot(path, snapshot)
+        loaded = read_snapshot(path)
+
+        assert loaded == snapshot
+        assert loaded is not None
+        assert list(loaded.signatures) == [16384]
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_missing_snapshot(self, tmp_path: Path) -> None:
+        """Test that a missing snapshot reads as None."""
+        assert read_snapshot(tmp_path / "missing.schema.json.gz") is None
+
+    def test_corrupt_snapshot(self, tmp_path: Path) -> None:
+        """Test that corrupt files are ignored."""
+        not_gzip = tmp_path / "a.schema.json.gz"
+        not_gzip.write_bytes(b"not gzip")
+        bad_json = tmp_path / "b.schema.json.gz"
+        bad_json.write_bytes(gzip.compress(b'{"database_schema": 1}'))
+
+        assert read_snapshot(not_gzip) is None
+        assert read_snapshot(bad_json) is None
+
+    def test_outdated_format_version(self, tmp_path: Path, snapshot: SchemaSnapshot) -> None:
+        """Test that snapshots from another format version are ignored."""
+        path = snapshot_path(tmp_path, "test_db")
+        outdated = snapshot.model_copy(update={"format_version": SNAPSHOT_FORMAT_VERSION + 1})
+
+        write_snapshot(path, outdated)
+
+        assert read_snapshot(path) is None
+
+    def test_snapshot_path_sanitizes_name(self, tmp_path: Path) -> None:
+        """Test that database names cannot escape the snapshot directory."""
+        path = snapshot_path(tmp_path, "../etc/passwd")
+
+        assert path.parent == tmp_path
+        assert path.name == ".._etc_passwd.schema.json.gz"
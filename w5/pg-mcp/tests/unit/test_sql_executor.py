@@ -13,10 +13,12 @@ from unittest.mock import AsyncMock, MagicMock
 
 import asyncpg
 import pytest
+from asyncpg.types import Attribute, Type
 
 from pg_mcp.config.settings import DatabaseConfig, SecurityConfig
-from pg_mcp.models.errors import DatabaseError, ExecutionTimeoutError
-from pg_mcp.services.sql_executor import SQLExecutor
+from pg_mcp.models.errors import DatabaseConnectionError, DatabaseError, ExecutionTimeoutError
+from pg_mcp.services.sql_executor import SQLExecutor, StatementCache, build_session_settings
+from pg_mcp.services.sql_validator import SQLValidator
 
 
 def create_mock_record(data: dict[str, Any]) -> MagicMock:
@@ -29,7 +31,7 @@ def create_mock_record(data: dict[str, Any]) -> MagicMock:
         MagicMock that behaves like an asyncpg.Record.
     """
     mock_record = MagicMock()
-    mock_record.__iter__ = MagicMock(return_value=iter(data.items()))
+    mock_record.__iter__ = MagicMock(side_effect=lambda: iter(data.values()))
     mock_record.keys = MagicMock(return_value=list(data.keys()))
     mock_record.values = MagicMock(return_value=list(data.values()))
     mock_record.items = MagicMock(return_value=list(data.items()))
@@ -38,6 +40,51 @@ def create_mock_record(data: dict[str, Any]) -> MagicMock:
     return mock_record
 
 
+def set_cursor_rows(
+    conn: MagicMock,
+    records: list[Any],
+    type_oids: dict[str, int] | None = None,
+) -> MagicMock:
+    """Make the mock connection open a cursor over the given records.
+
+    Args:
+        conn: Mock asyncpg connection.
+        records: Rows produced by the query.
+        type_oids: Optional PostgreSQL type OID per column; columns without
+            one are described with an unknown type.
+
+    Returns:
+        MagicMock that behaves like an asyncpg cursor.
+    """
+    position = 0
+
+    async def fetch(n: int) -> list[Any]:
+        nonlocal position
+        rows = records[position : position + n]
+        position += len(rows)
+        return rows
+
+    async def forward(n: int) -> int:
+        nonlocal position
+        moved = min(n, len(records) - position)
+        position += moved
+        return moved
+
+    type_oids = type_oids or {}
+    names = list(records[0].keys()) if records else []
+    attributes = tuple(
+        Attribute(name=name, type=Type(oid=type_oids.get(name, 0), name="", kind="", schema=""))
+        for name in names
+    )
+
+    cursor = MagicMock()
+    cursor._state._get_attributes = MagicMock(return_value=attributes)
+    cursor.fetch = AsyncMock(side_effect=fetch)
+    cursor.forward = AsyncMock(side_effect=forward)
+    conn.cursor = AsyncMock(return_value=cursor)
+    return cursor
+
+
 @pytest.fixture
 def security_config() -> SecurityConfig:
     """Create a default security configuration for testing."""
@@ -77,7 +124,7 @@ def mock_connection() -> MagicMock:
     """Create a mock asyncpg connection."""
     conn = MagicMock()
     conn.execute = AsyncMock()
-    conn.fetch = AsyncMock()
+    set_cursor_rows(conn, [])
 
     # Setup transaction context manager
     transaction_mock = MagicMock()
@@ -134,7 +181,7 @@ class TestSQLExecutor:
             create_mock_record({"id": 2, "name": "Bob"}),
         ]
 
-        mock_connection.fetch.return_value = mock_records
+        set_cursor_rows(mock_connection, mock_records)
 
         # Act
         results, count = await executor.execute(sql)
@@ -148,8 +195,8 @@ class TestSQLExecutor:
         assert results[1]["name"] == "Bob"
 
         # Verify session parameters were set
-        assert mock_connection.execute.call_count >= 2  # timeout and search_path
-        mock_connection.fetch.assert_called_once_with(sql)
+        assert mock_connection.execute.call_count == 1  # all settings in one round trip
+        mock_connection.cursor.assert_called_once_with(sql)
 
     @pytest.mark.asyncio
     async def test_execute_with_custom_timeout_and_max_rows(
@@ -166,7 +213,7 @@ class TestSQLExecutor:
 
         # Create 200 mock records
         mock_records = [create_mock_record({"id": i, "value": f"row_{i}"}) for i in range(200)]
-        mock_connection.fetch.return_value = mock_records
+        set_cursor_rows(mock_connection, mock_records)
 
         # Act
         results, count = await executor.execute(
@@ -174,7 +221,7 @@ class TestSQLExecutor:
         )
 
         # Assert
-        assert count == 200  # Total count before limiting
+        assert count is None  # Truncated and not counted, so the total is unknown
         assert len(results) == 100  # Limited to max_rows
         assert results[0]["id"] == 0
         assert results[99]["id"] == 99
@@ -194,7 +241,7 @@ class TestSQLExecutor:
         async def slow_fetch(*args: Any, **kwargs: Any) -> None:
             await asyncio.sleep(10)
 
-        mock_connection.fetch = slow_fetch
+        mock_connection.cursor.return_value.fetch = slow_fetch
 
         # Act & Assert
         with pytest.raises(ExecutionTimeoutError) as exc_info:
@@ -216,7 +263,7 @@ class TestSQLExecutor:
         pg_error = asyncpg.PostgresError("relation 'nonexistent_table' does not exist")
         pg_error.sqlstate = "42P01"
 
-        mock_connection.fetch.side_effect = pg_error
+        mock_connection.cursor.side_effect = pg_error
 
         # Act & Assert
         with pytest.raises(DatabaseError) as exc_info:
@@ -225,6 +272,22 @@ class TestSQLExecutor:
         assert "database query failed" in str(exc_info.value.message).lower()
         assert exc_info.value.details["error_code"] == "42P01"
 
+    @pytest.mark.asyncio
+    async def test_execute_unreachable_server(
+        self,
+        executor: SQLExecutor,
+        mock_pool: MagicMock,
+    ) -> None:
+        """Test that failing to reach the server raises a connection error."""
+        mock_pool.acquire.return_value.__aenter__.side_effect = ConnectionRefusedError(
+            "connection refused"
+        )
+
+        with pytest.raises(DatabaseConnectionError) as exc_info:
+            await executor.execute("SELECT 1")
+
+        assert exc_info.value.details["error_type"] == "ConnectionRefusedError"
+
     @pytest.mark.asyncio
     async def test_session_params_basic(
         self,
@@ -235,7 +298,7 @@ class TestSQLExecutor:
         """Test that basic session parameters are set correctly."""
         # Arrange
         sql = "SELECT 1"
-        mock_connection.fetch.return_value = [create_mock_record({"column": 1})]
+        set_cursor_rows(mock_connection, [create_mock_record({"column": 1})])
 
         # Act
         await executor.execute(sql, timeout=15.0)
@@ -245,10 +308,10 @@ class TestSQLExecutor:
         execute_commands = [str(call[0][0]) for call in execute_calls]
 
         # Check timeout was set (15 seconds = 15000 ms)
-        assert any("SET statement_timeout = 15000" in cmd for cmd in execute_commands)
+        assert any("SET LOCAL statement_timeout = 15000" in cmd for cmd in execute_commands)
 
         # Check search_path was set
-        assert any("SET search_path = 'public'" in cmd for cmd in execute_commands)
+        assert any("SET LOCAL search_path = 'public'" in cmd for cmd in execute_commands)
 
     @pytest.mark.asyncio
     async def test_session_params_with_readonly_role(
@@ -272,7 +335,7 @@ class TestSQLExecutor:
             db_config=db_config,
         )
         sql = "SELECT 1"
-        mock_connection.fetch.return_value = [create_mock_record({"column": 1})]
+        set_cursor_rows(mock_connection, [create_mock_record({"column": 1})])
 
         # Act
         await executor.execute(sql)
@@ -280,7 +343,7 @@ class TestSQLExecutor:
         # Assert - verify SET ROLE was called
         execute_calls = mock_connection.execute.call_args_list
         execute_commands = [str(call[0][0]) for call in execute_calls]
-        assert any("SET ROLE readonly_user" in cmd for cmd in execute_commands)
+        assert any("SET LOCAL ROLE readonly_user" in cmd for cmd in execute_commands)
 
     @pytest.mark.asyncio
     async def test_session_params_invalid_search_path(
@@ -351,6 +414,222 @@ class TestSQLExecutor:
         assert "invalid readonly_role" in str(exc_info.value.message).lower()
 
 
+class TestPreconfiguredSessions:
+    """Test suite for pools whose connections carry the session settings."""
+
+    def test_build_session_settings(self, security_config_with_role: SecurityConfig) -> None:
+        """Test the static settings applied to pooled connections."""
+        assert build_session_settings(security_config_with_role) == {
+            "statement_timeout": "30000",
+            "search_path": "public",
+            "role": "readonly_user",
+        }
+
+    def test_build_session_settings_rejects_unsafe_role(self) -> None:
+        """Test that unsafe role names are rejected when building settings."""
+        with pytest.raises(DatabaseError):
+            build_session_settings(SecurityConfig(readonly_role="reader; DROP TABLE x"))
+
+    @pytest.mark.asyncio
+    async def test_default_timeout_needs_no_round_trip(
+        self,
+        mock_pool: MagicMock,
+        mock_connection: MagicMock,
+        security_config_with_role: SecurityConfig,
+        db_config: DatabaseConfig,
+    ) -> None:
+        """Test that no session statements are sent with the configured timeout."""
+        executor = SQLExecutor(
+            mock_pool, security_config_with_role, db_config, session_preconfigured=True
+        )
+        set_cursor_rows(mock_connection, [create_mock_record({"column": 1})])
+
+        await executor.execute("SELECT 1")
+
+        mock_connection.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_custom_timeout_is_set_locally(
+        self,
+        mock_pool: MagicMock,
+        mock_connection: MagicMock,
+        security_config_with_role: SecurityConfig,
+        db_config: DatabaseConfig,
+    ) -> None:
+        """Test that only a differing statement timeout is sent."""
+        executor = SQLExecutor(
+            mock_pool, security_config_with_role, db_config, session_preconfigured=True
+        )
+        set_cursor_rows(mock_connection, [create_mock_record({"column": 1})])
+
+        await executor.execute("SELECT 1", timeout=5.0)
+
+        mock_connection.execute.assert_called_once_with("SET LOCAL statement_timeout = 5000")
+
+
+class TestExplain:
+    """Test suite for EXPLAIN dry runs."""
+
+    @pytest.mark.asyncio
+    async def test_explain_returns_top_plan(
+        self, executor: SQLExecutor, mock_connection: MagicMock
+    ) -> None:
+        """Test that the top-level plan node is parsed from the JSON output."""
+        plan_json = '[{"Plan": {"Node Type": "Seq Scan", "Total Cost": 35.5, "Plan Rows": 2550}}]'
+        mock_connection.fetchval = AsyncMock(return_value=plan_json)
+
+        plan = await executor.explain("SELECT * FROM users")
+
+        assert plan == {"Node Type": "Seq Scan", "Total Cost": 35.5, "Plan Rows": 2550}
+        mock_connection.fetchval.assert_awaited_once_with(
+            "EXPLAIN (FORMAT JSON) SELECT * FROM users"
+        )
+        mock_connection.transaction.assert_called_with(readonly=True)
+
+    @pytest.mark.asyncio
+    async def test_explain_wraps_postgres_errors(
+        self, executor: SQLExecutor, mock_connection: MagicMock
+    ) -> None:
+        """Test that planning errors carry the SQLSTATE."""
+        mock_connection.fetchval = AsyncMock(
+            side_effect=asyncpg.UndefinedTableError('relation "missing" does not exist')
+        )
+
+        with pytest.raises(DatabaseError) as exc_info:
+            await executor.explain("SELECT * FROM missing")
+
+        assert exc_info.value.details["error_code"] == "42P01"
+
+
+class TestStatementCache:
+    """Test suite for prepared statement reuse."""
+
+    @pytest.fixture
+    def statement_cache(self, security_config: SecurityConfig) -> StatementCache:
+        """Create a statement cache keyed by normalized SQL."""
+        validator = SQLValidator(config=security_config)
+        return StatementCache(2, normalize=validator.normalize_sql)
+
+    @pytest.mark.asyncio
+    async def test_repeated_query_reuses_statement(
+        self,
+        mock_pool: MagicMock,
+        mock_connection: MagicMock,
+        security_config: SecurityConfig,
+        db_config: DatabaseConfig,
+        statement_cache: StatementCache,
+    ) -> None:
+        """Test that equivalent SQL runs through asyncpg's cache as written."""
+        executor = SQLExecutor(
+            mock_pool, security_config, db_config, statement_cache=statement_cache
+        )
+        set_cursor_rows(mock_connection, [create_mock_record({"id": 1})], {"id": 23})
+        await executor.execute("SELECT id FROM users")
+
+        set_cursor_rows(mock_connection, [create_mock_record({"id": 2})], {"id": 23})
+        results, _ = await executor.execute("select  id\nfrom users")
+
+        assert results == [{"id": 2}]
+        mock_connection.cursor.assert_called_once_with("select  id\nfrom users")
+        assert len(statement_cache) == 1
+
+    @pytest.mark.asyncio
+    async def test_changed_result_shape_is_discarded(
+        self,
+        mock_pool: MagicMock,
+        mock_connection: MagicMock,
+        security_config: SecurityConfig,
+        db_config: DatabaseConfig,
+        statement_cache: StatementCache,
+    ) -> None:
+        """Test that a hit is described from the executed statement, not the cache."""
+        executor = SQLExecutor(
+            mock_pool, security_config, db_config, statement_cache=statement_cache
+        )
+        set_cursor_rows(mock_connection, [create_mock_record({"id": 1})], {"id": 23})
+        await executor.execute("SELECT * FROM users")
+
+        # A column was added and the id column changed to numeric
+        record = create_mock_record({"id": decimal.Decimal("2.5"), "name": "a"})
+        set_cursor_rows(mock_connection, [record], {"id": 1700, "name": 25})
+        results, _ = await executor.execute("SELECT * FROM users")
+
+        assert results == [{"id": 2.5, "name": "a"}]
+        assert len(statement_cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_disabled_cache_uses_connection_cache(
+        self,
+        executor: SQLExecutor,
+        mock_connection: MagicMock,
+    ) -> None:
+        """Test that without a cache every query still goes through asyncpg's cache."""
+        for _ in range(2):
+            set_cursor_rows(mock_connection, [create_mock_record({"id": 1})])
+            await executor.execute("SELECT 1")
+            mock_connection.cursor.assert_called_once_with("SELECT 1")
+
+    @pytest.mark.asyncio
+    async def test_invalidated_statement_is_discarded(
+        self,
+        mock_pool: MagicMock,
+        mock_connection: MagicMock,
+        security_config: SecurityConfig,
+        db_config: DatabaseConfig,
+        statement_cache: StatementCache,
+    ) -> None:
+        """Test that a statement invalidated by a schema change is described afresh."""
+        executor = SQLExecutor(
+            mock_pool, security_config, db_config, statement_cache=statement_cache
+        )
+        statement_cache.put("SELECT id FROM users", ())
+        cursor = set_cursor_rows(mock_connection, [])
+        cursor.fetch.side_effect = asyncpg.InvalidCachedStatementError("cached plan changed")
+
+        with pytest.raises(DatabaseError):
+            await executor.execute("SELECT id FROM users")
+
+        assert len(statement_cache) == 0
+
+    def test_lru_eviction(self, statement_cache: StatementCache) -> None:
+        """Test that the least recently used statement is evicted."""
+        statement_cache.put("SELECT 1", ())
+        statement_cache.put("SELECT 2", ())
+        assert statement_cache.get("SELECT 1") is not None
+        statement_cache.put("SELECT 3", ())
+
+        assert len(statement_cache) == 2
+        assert statement_cache.get("SELECT 2") is None
+        assert statement_cache.get("select 1") is not None
+
+    def test_unparseable_sql_keyed_by_text(self, statement_cache: StatementCache) -> None:
+        """Test that SQL the normalizer rejects is still cached by exact text."""
+        statement_cache.put("SELECT (", ())
+
+        assert statement_cache.get("SELECT (") is not None
+        assert statement_cache.get("SELECT  (") is None
+
+    def test_hit_and_miss_metrics(self) -> None:
+        """Test that lookups are counted per database."""
+        metrics = MagicMock()
+        cache = StatementCache(10, metrics=metrics, database="testdb")
+
+        cache.get("SELECT 1")
+        cache.put("SELECT 1", ())
+        cache.get("SELECT 1")
+
+        metrics.increment_statement_cache_miss.assert_called_once_with("testdb")
+        metrics.increment_statement_cache_hit.assert_called_once_with("testdb")
+
+    def test_stale_column_type_falls_back(self, executor: SQLExecutor) -> None:
+        """Test that values not matching a cached column type are still serialized."""
+        numeric = Attribute(name="v", type=Type(oid=1700, name="", kind="", schema=""))
+
+        results = executor._serialize_records((numeric,), [(datetime.date(2024, 1, 2),)])
+
+        assert results == [{"v": "2024-01-02"}]
+
+
 class TestResultSerialization:
     """Test suite for result serialization."""
 
@@ -563,6 +842,73 @@ class TestResultSerialization:
         assert serialized[0]["optional_field"] is None
 
 
+class TestColumnarSerialization:
+    """Test suite for type-driven column-wise serialization."""
+
+    # numeric, timestamptz, uuid, jsonb, int4, text, interval, bytea, int4[]
+    TYPE_OIDS = (1700, 1184, 2950, 3802, 23, 25, 1186, 17, 1007)
+
+    @staticmethod
+    def make_attributes(type_oids: tuple[int, ...]) -> tuple[Attribute, ...]:
+        """Build result column descriptions for the given type OIDs."""
+        return tuple(
+            Attribute(name=f"col_{i}", type=Type(oid=oid, name="", kind="", schema=""))
+            for i, oid in enumerate(type_oids)
+        )
+
+    @staticmethod
+    def make_row(i: int) -> tuple[Any, ...]:
+        """Build one record matching TYPE_OIDS, with NULLs in every tenth row."""
+        if i % 10 == 0:
+            return (None,) * 9
+        return (
+            decimal.Decimal(i) / 7,
+            datetime.datetime(2024, 1, 1, tzinfo=datetime.UTC) + datetime.timedelta(seconds=i),
+            uuid.UUID(int=i),
+            f'{{"key": {i}}}',
+            i,
+            f"name_{i}",
+            datetime.timedelta(minutes=i),
+            i.to_bytes(4, "big"),
+            [i, None],
+        )
+
+    def test_matches_generic_serializer(self, executor: SQLExecutor) -> None:
+        """Test that column converters produce the same rows as the generic path."""
+        attributes = self.make_attributes(self.TYPE_OIDS)
+        names = [attribute.name for attribute in attributes]
+        records = [self.make_row(i) for i in range(50)]
+
+        serialized = executor._serialize_records(attributes, records)
+
+        expected = executor._serialize_results([dict(zip(names, r, strict=True)) for r in records])
+        assert serialized == expected
+        assert serialized[1]["col_0"] == pytest.approx(1 / 7)
+        assert serialized[1]["col_2"] == "00000000-0000-0000-0000-000000000001"
+        assert serialized[1]["col_8"] == [1, None]
+
+    def test_empty_and_columnless_results(self, executor: SQLExecutor) -> None:
+        """Test results without rows or without columns."""
+        assert executor._serialize_records(self.make_attributes((23,)), []) == []
+        assert executor._serialize_records((), [(), ()]) == [{}, {}]
+
+    def test_empty_result_with_converted_columns(self, executor: SQLExecutor) -> None:
+        """Test an empty result whose columns have type converters."""
+        # timestamptz, numeric
+        assert executor._serialize_records(self.make_attributes((1184, 1700)), []) == []
+
+    def test_wide_rows_match_generic_serializer(self, executor: SQLExecutor) -> None:
+        """Test that column converters match the generic path on wide rows."""
+        attributes = self.make_attributes(self.TYPE_OIDS * 2)
+        names = [attribute.name for attribute in attributes]
+        records = [self.make_row(i) * 2 for i in range(1000)]
+
+        serialized = executor._serialize_records(attributes, records)
+
+        expected = executor._serialize_results([dict(zip(names, r, strict=True)) for r in records])
+        assert serialized == expected
+
+
 class TestRowLimiting:
     """Test suite for row limiting functionality."""
 
@@ -580,17 +926,41 @@ class TestRowLimiting:
 
         # Create 100 mock records
         mock_records = [create_mock_record({"id": i, "value": f"row_{i}"}) for i in range(100)]
-        mock_connection.fetch.return_value = mock_records
+        set_cursor_rows(mock_connection, mock_records)
 
         # Act
         results, count = await executor.execute(sql, max_rows=max_rows)
 
         # Assert
-        assert count == 100  # Total count
+        assert count is None  # Truncated and not counted, so the total is unknown
         assert len(results) == 10  # Limited results
         # Verify we got the first N rows
         for i in range(10):
             assert results[i]["id"] == i
+        mock_connection.cursor.return_value.fetch.assert_called_once_with(11)
+        mock_connection.cursor.return_value.forward.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_row_limiting_with_total_count(
+        self,
+        executor: SQLExecutor,
+        mock_pool: MagicMock,
+        mock_connection: MagicMock,
+    ) -> None:
+        """Test that the total is counted by moving the cursor when requested."""
+        # Arrange
+        mock_records = [create_mock_record({"id": i}) for i in range(100)]
+        cursor = set_cursor_rows(mock_connection, mock_records)
+
+        # Act
+        results, count = await executor.execute(
+            "SELECT * FROM large_table", max_rows=10, count_total=True
+        )
+
+        # Assert
+        assert count == 100
+        assert len(results) == 10
+        cursor.forward.assert_called()
 
     @pytest.mark.asyncio
     async def test_row_limiting_not_exceeded(
@@ -606,7 +976,7 @@ class TestRowLimiting:
 
         # Create only 10 records
         mock_records = [create_mock_record({"id": i, "value": f"row_{i}"}) for i in range(10)]
-        mock_connection.fetch.return_value = mock_records
+        set_cursor_rows(mock_connection, mock_records)
 
         # Act
         results, count = await executor.execute(sql, max_rows=max_rows)
@@ -9,8 +9,9 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from pydantic import SecretStr
 
-from pg_mcp.config.settings import OpenAIConfig
+from pg_mcp.config.settings import OpenAIConfig, SchemaContextConfig
 from pg_mcp.models.errors import LLMError, LLMTimeoutError, LLMUnavailableError
+from pg_mcp.models.query import TokenUsage
 from pg_mcp.models.schema import (
     ColumnInfo,
     DatabaseSchema,
@@ -304,6 +305,24 @@ class TestSQLGenerator:
             # Verify result
             assert result == "SELECT * FROM users;"
 
+    @pytest.mark.asyncio
+    async def test_generate_reports_token_usage(
+        self, generator: SQLGenerator, mock_schema: DatabaseSchema
+    ) -> None:
+        """Test that API token usage is added to the usage accumulator."""
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock(message=MagicMock(content="SELECT 1"))]
+        mock_response.usage = MagicMock(prompt_tokens=120, completion_tokens=8)
+        usage = TokenUsage(prompt_tokens=100, completion_tokens=10)
+
+        with patch.object(
+            generator.client.chat.completions, "create", new=AsyncMock(return_value=mock_response)
+        ):
+            await generator.generate("count", mock_schema, usage=usage)
+
+        assert usage == TokenUsage(prompt_tokens=220, completion_tokens=18)
+        assert usage.total_tokens == 238
+
     @pytest.mark.asyncio
     async def test_generate_with_context(
         self, generator: SQLGenerator, mock_schema: DatabaseSchema
@@ -509,6 +528,9 @@ LIMIT 10;"""
             assert call_kwargs["temperature"] == 0.5
             assert call_kwargs["max_tokens"] == 1000
 
+            await generator.generate("Test query", mock_schema, temperature=0.9)
+            assert mock_create.call_args.kwargs["temperature"] == 0.9
+
     @pytest.mark.asyncio
     async def test_generate_includes_schema_context(
         self, generator: SQLGenerator, mock_schema: DatabaseSchema
@@ -545,3 +567,40 @@ LIMIT 10;"""
 
             assert "OpenAI API request failed" in str(exc_info.value)
             assert exc_info.value.details["error"] == "Unknown error occurred"
+
+    @pytest.mark.asyncio
+    async def test_generate_prunes_schema_context(
+        self, config: OpenAIConfig, mock_schema: DatabaseSchema
+    ) -> None:
+        """Test that only relevant tables reach the prompt, retry context included."""
+        filler = [
+            TableInfo(
+                table_name=f"audit_log_{i}",
+                columns=[ColumnInfo(name="payload", data_type="jsonb", is_nullable=True)],
+            )
+            for i in range(100)
+        ]
+        schema = mock_schema.model_copy(update={"tables": [*mock_schema.tables, *filler]})
+        generator = SQLGenerator(
+            config, schema_context_config=SchemaContextConfig(max_tokens=500, max_tables=5)
+        )
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock(message=MagicMock(content="```sql\nSELECT 1;\n```"))]
+
+        with patch.object(
+            generator.client.chat.completions, "create", new=AsyncMock(return_value=mock_response)
+        ) as mock_create:
+            await generator.generate("Total order amount", schema)
+            user_prompt = mock_create.call_args.kwargs["messages"][1]["content"]
+            assert "Table: public.orders" in user_prompt
+            assert "Table: public.users" in user_prompt  # FK neighbour
+            assert "audit_log_" not in user_prompt
+
+            await generator.generate(
+                "Total order amount",
+                schema,
+                previous_attempt="SELECT payload FROM audit_log_7",
+                error_feedback="column amount does not exist",
+            )
+            user_prompt = mock_create.call_args.kwargs["messages"][1]["content"]
+            assert "Table: public.audit_log_7" in user_prompt
@@ -9,11 +9,27 @@ Tests cover:
 - Edge cases and malformed SQL
 """
 
+from unittest.mock import patch
+
 import pytest
+import sqlglot
+from sqlglot import exp
 
 from pg_mcp.config.settings import SecurityConfig
 from pg_mcp.models.errors import SecurityViolationError, SQLParseError
-from pg_mcp.services.sql_validator import SQLValidator
+from pg_mcp.services.sql_validator import SQLValidator, _QueryReferences
+
+
+def nested_cte_query(depth: int) -> str:
+    """Build a query of depth chained CTEs, each with an IN subquery."""
+    ctes = ["c0 AS (SELECT id, amount, created_at FROM orders WHERE status = 'paid')"]
+    for i in range(1, depth):
+        ctes.append(
+            f"c{i} AS (SELECT id, sum(amount) AS amount, max(created_at) AS created_at "  # noqa: S608
+            f"FROM c{i - 1} WHERE amount > {i} AND id IN "
+            f"(SELECT user_id FROM users WHERE lower(name) LIKE 'a%') GROUP BY id)"
+        )
+    return f"WITH {', '.join(ctes)} SELECT * FROM c{depth - 1} ORDER BY amount DESC LIMIT 10"  # noqa: S608
 
 
 class TestValidStatements:
@@ -529,6 +545,22 @@ class TestValidatorHelperMethods:
         with pytest.raises(SQLParseError):
             validator.normalize_sql(sql)
 
+    @pytest.mark.parametrize(
+        ("sql", "expected"),
+        [
+            ("SELECT count(*) FROM users", True),
+            ("SELECT count(*), max(total) + 1 AS m FROM orders WHERE total > 0", True),
+            ("SELECT status, count(*) FROM orders GROUP BY status", False),
+            ("SELECT count(*) OVER () FROM orders", False),
+            ("SELECT id FROM users", False),
+            ("SELECT count(*) FROM a UNION ALL SELECT count(*) FROM b", False),
+            ("SELECT * FROM WHERE", False),
+        ],
+    )
+    def test_is_scalar_aggregate(self, validator: SQLValidator, sql: str, expected: bool) -> None:
+        """Test detection of queries aggregating into a single row."""
+        assert validator.is_scalar_aggregate(sql) is expected
+
     def test_extract_tables_simple(self, validator: SQLValidator) -> None:
         """Test extracting tables from simple query."""
         sql = "SELECT * FROM users"
@@ -572,6 +604,119 @@ class TestValidatorHelperMethods:
             validator.extract_tables(sql)
 
 
+class TestValidationCache:
+    """Test caching of parse trees and validation verdicts."""
+
+    @pytest.fixture
+    def validator(self) -> SQLValidator:
+        """Create validator with a small cache."""
+        return SQLValidator(
+            config=SecurityConfig(validation_cache_size=2), blocked_tables=["secrets"]
+        )
+
+    def test_helpers_share_one_parse(self, validator: SQLValidator) -> None:
+        """Test that validation and helper methods parse a query only once."""
+        sql = "SELECT u.name FROM users u JOIN orders o ON u.id = o.user_id"
+        with patch("sqlglot.parse", wraps=sqlglot.parse) as parse:
+            for _ in range(3):
+                validator.validate_or_raise(sql)
+                assert validator.extract_tables(sql) == ["orders", "users"]
+                assert validator.normalize_sql(sql).startswith("SELECT u.name")
+
+        assert parse.call_count == 1
+
+    def test_cached_rejection_is_raised_again(self, validator: SQLValidator) -> None:
+        """Test that a cached verdict raises the same error type and message."""
+        sql = "SELECT * FROM secrets"
+        with pytest.raises(SecurityViolationError) as first:
+            validator.validate_or_raise(sql)
+        with patch("sqlglot.parse") as parse, pytest.raises(SecurityViolationError) as second:
+            validator.validate_or_raise(sql)
+
+        parse.assert_not_called()
+        assert second.value is not first.value
+        assert second.value.message == first.value.message
+        assert validator.validate("SELECT * FROM") == validator.validate("SELECT * FROM")
+
+    def test_configuration_change_revalidates(self, validator: SQLValidator) -> None:
+        """Test that verdicts are keyed by the validator configuration."""
+        sql = "SELECT * FROM accounts"
+        assert validator.validate(sql) == (True, None)
+
+        validator.blocked_tables = {"accounts"}
+
+        assert validator.validate(sql)[0] is False
+
+    def test_cache_is_bounded(self, validator: SQLValidator) -> None:
+        """Test that the least recently used parse is evicted."""
+        for sql in ("SELECT 1", "SELECT 2", "SELECT 3"):
+            validator.validate_or_raise(sql)
+
+        with patch("sqlglot.parse", wraps=sqlglot.parse) as parse:
+            validator.validate_or_raise("SELECT 3")
+            validator.validate_or_raise("SELECT 1")
+
+        assert parse.call_count == 1
+
+    def test_cache_disabled(self) -> None:
+        """Test that a cache size of 0 parses on every call."""
+        validator = SQLValidator(config=SecurityConfig(validation_cache_size=0))
+        with patch("sqlglot.parse", wraps=sqlglot.parse) as parse:
+            validator.validate_or_raise("SELECT 1")
+            validator.validate_or_raise("SELECT 1")
+
+        assert parse.call_count == 2
+
+
+class TestSinglePassChecks:
+    """Test that all rules are evaluated from a single walk of the tree."""
+
+    @pytest.mark.parametrize(
+        "sql",
+        [
+            nested_cte_query(5),
+            "SELECT upper(u.name), (SELECT count(*) FROM orders o WHERE o.user_id = u.id) "
+            "FROM users u WHERE u.id IN (SELECT user_id FROM logins) ORDER BY lower(u.email)",
+            "WITH d AS (DELETE FROM users RETURNING id) "
+            "SELECT * FROM d WHERE id IN (SELECT id FROM banned)",
+        ],
+    )
+    def test_collects_same_references_as_per_rule_searches(self, sql: str) -> None:
+        """Test that the single walk collects what each rule's tree search found."""
+        tree = sqlglot.parse_one(sql, read="postgres")
+        forbidden = tuple(SQLValidator.FORBIDDEN_STATEMENT_TYPES)
+
+        references = _QueryReferences.collect(tree, forbidden)
+
+        assert references.functions == list(
+            dict.fromkeys(f.name.lower() if f.name else "" for f in tree.find_all(exp.Func))
+        )
+        assert references.tables == list(
+            dict.fromkeys(t.name.lower() if t.name else "" for t in tree.find_all(exp.Table))
+        )
+        assert references.columns == list(
+            dict.fromkeys(
+                (c.table.lower(), c.name.lower() if c.name else "")
+                for c in tree.find_all(exp.Column)
+            )
+        )
+        assert references.subqueries == [s.this for s in tree.find_all(exp.Subquery) if s.this]
+        assert references.forbidden_statements == [type(node) for node in tree.find_all(*forbidden)]
+
+    def test_blocked_reference_deep_in_nested_ctes(self) -> None:
+        """Test that references deep inside nested CTEs are still checked."""
+        validator = SQLValidator(
+            config=SecurityConfig(), blocked_tables=["users"], blocked_columns=["c3.ssn"]
+        )
+
+        assert validator.validate(nested_cte_query(20)) == (
+            False,
+            "Access to table 'users' is not allowed",
+        )
+        sql = nested_cte_query(5).replace("SELECT *", "SELECT c4.id, c3.ssn", 1)
+        assert validator.validate(sql)[0] is False
+
+
 class TestCTEWithDangerousOperations:
     """Test CTE (Common Table Expressions) with dangerous operations."""
 
@@ -581,6 +726,19 @@ class TestCTEWithDangerousOperations:
         config = SecurityConfig()
         return SQLValidator(config=config)
 
+    @pytest.mark.parametrize(
+        "sql",
+        [
+            "WITH d AS (DELETE FROM users RETURNING id) SELECT * FROM d",
+            "WITH i AS (INSERT INTO logs VALUES (1) RETURNING id) SELECT * FROM i",
+            "WITH u AS (UPDATE users SET name = 'x' RETURNING id) SELECT * FROM u",
+        ],
+    )
+    def test_data_modifying_cte_rejected(self, validator: SQLValidator, sql: str) -> None:
+        """Test that data-modifying statements inside CTEs are rejected."""
+        with pytest.raises(SecurityViolationError, match="statements are not allowed"):
+            validator.validate_or_raise(sql)
+
     def test_cte_with_multiple_selects(self, validator: SQLValidator) -> None:
         """Test CTE with multiple SELECT CTEs is allowed."""
         sql = """
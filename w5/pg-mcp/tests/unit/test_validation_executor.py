@@ -0,0 +1,125 @@
+"""Unit tests for ValidationExecutor.
+
+This module tests SQL validation on thread and process pools, verdict
+sharing with the wrapped validator and the executor metrics.
+"""
+
+import asyncio
+from collections.abc import Iterator
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from pg_mcp.config.settings import SecurityConfig
+from pg_mcp.models.errors import SecurityViolationError, SQLParseError
+from pg_mcp.services.sql_validator import SQLValidator
+from pg_mcp.services.validation_executor import ValidationExecutor
+
+
+def large_query(tables: int) -> str:
+    """Build a long query joining many subqueries."""
+    joins = " ".join(
+        f"JOIN (SELECT id, sum(amount) AS s{i} FROM orders WHERE amount > {i} GROUP BY id) "  # noqa: S608
+        f"t{i} ON t{i}.id = u.id"
+        for i in range(tables)
+    )
+    return f"SELECT u.id FROM users u {joins}"  # noqa: S608
+
+
+@pytest.fixture
+def validator() -> SQLValidator:
+    """Create a validator blocking one table."""
+    return SQLValidator(config=SecurityConfig(), blocked_tables=["secrets"])
+
+
+@pytest.fixture(params=["thread", "process"])
+def executor(
+    request: pytest.FixtureRequest, validator: SQLValidator
+) -> Iterator[ValidationExecutor]:
+    """Create a validation executor of each kind."""
+    executor = ValidationExecutor(validator, kind=request.param, max_workers=1, metrics=MagicMock())
+    yield executor
+    executor.shutdown()
+
+
+class TestValidationExecutor:
+    """Test suite for ValidationExecutor."""
+
+    @pytest.mark.asyncio
+    async def test_valid_query(self, executor: ValidationExecutor) -> None:
+        """Test that a valid query passes."""
+        await executor.validate_or_raise("SELECT id FROM users")
+
+    @pytest.mark.asyncio
+    async def test_errors_are_raised_on_the_caller(self, executor: ValidationExecutor) -> None:
+        """Test that worker verdicts surface as the original error types."""
+        with pytest.raises(SecurityViolationError, match="secrets"):
+            await executor.validate_or_raise("SELECT * FROM secrets")
+        with pytest.raises(SQLParseError):
+            await executor.validate_or_raise("")
+
+    @pytest.mark.asyncio
+    async def test_error_details_are_kept(self, validator: SQLValidator) -> None:
+        """Test that errors rebuilt from a worker verdict keep their details."""
+        error = SecurityViolationError(
+            "Access to table 'secrets' is not allowed", details={"table": "secrets"}
+        )
+        executor = ValidationExecutor(validator, kind="thread", max_workers=1)
+        try:
+            with (
+                patch.object(SQLValidator, "validate_or_raise", side_effect=error),
+                pytest.raises(SecurityViolationError) as exc_info,
+            ):
+                await executor.validate_or_raise("SELECT * FROM secrets")
+        finally:
+            executor.shutdown()
+
+        assert exc_info.value.details == {"table": "secrets"}
+
+    @pytest.mark.asyncio
+    async def test_cached_verdict_skips_pool(
+        self, executor: ValidationExecutor, validator: SQLValidator
+    ) -> None:
+        """Test that verdicts are shared with the validator's cache."""
+        with pytest.raises(SecurityViolationError):
+            await executor.validate_or_raise("SELECT * FROM secrets")
+        executor.shutdown()
+
+        # The pool no longer accepts work, so these must come from the cache
+        with pytest.raises(SecurityViolationError):
+            await executor.validate_or_raise("SELECT * FROM secrets")
+        assert validator.validate("SELECT * FROM secrets")[0] is False
+
+    @pytest.mark.asyncio
+    async def test_metrics(self, executor: ValidationExecutor) -> None:
+        """Test that queue depth and execution time are reported."""
+        await executor.validate_or_raise("SELECT 1")
+
+        metrics = executor.metrics
+        assert isinstance(metrics, MagicMock)
+        depths = [call.args for call in metrics.set_validation_queue_depth.call_args_list]
+        assert depths == [(executor.kind, 1), (executor.kind, 0)]
+        (kind, duration), _ = metrics.observe_validation_duration.call_args
+        assert kind == executor.kind
+        assert duration > 0
+
+    @pytest.mark.asyncio
+    async def test_event_loop_keeps_running(self, validator: SQLValidator) -> None:
+        """Test that other tasks progress while a large query is validated."""
+        executor = ValidationExecutor(validator, kind="process", max_workers=1)
+        ticks = 0
+
+        async def ticker() -> None:
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(ticker())
+        try:
+            await executor.validate_or_raise(large_query(40))
+        finally:
+            task.cancel()
+            executor.shutdown()
+
+        assert ticks > 1